@@ -0,0 +1,145 @@
+"""Measure module serial traffic and temperature wait latency with the emulators.
+
+The temperature module, thermocycler, and heater-shaker emulators are started in
+the background and a module is built for each of them, the way the integration
+tests do. Each module is measured with a fixed poll interval, the way modules
+used to be polled, and with the adaptive poller, which backs off while a module
+is idle. For each, this reports:
+- serial commands sent per second while every module is idle
+- how long the temperature module takes to get to a new target, after having
+  been idle for a while
+
+Usage:
+    python benchmarks/module_polling.py [--interval S] [--idle-seconds S]
+"""
+import argparse
+import asyncio
+import threading
+import time
+from typing import Any, List, Tuple, Type
+
+from opentrons.drivers.asyncio.communication import SerialConnection
+from opentrons.drivers.rpi_drivers.types import PortGroup, USBPort
+from opentrons.hardware_control import ExecutionManager
+from opentrons.hardware_control.emulation.module_server import ModuleStatusClient
+from opentrons.hardware_control.emulation.module_server.helpers import wait_emulators
+from opentrons.hardware_control.emulation.scripts import run_app
+from opentrons.hardware_control.emulation.settings import Settings
+from opentrons.hardware_control.emulation.types import ModuleType
+from opentrons.hardware_control.modules import (
+    AbstractModule,
+    HeaterShaker,
+    TempDeck,
+    Thermocycler,
+)
+
+_MODULES = [ModuleType.Temperature, ModuleType.Thermocycler, ModuleType.Heatershaker]
+
+_sent_commands = 0
+
+
+def _count_commands() -> None:
+    """Count every command sent over a serial connection."""
+    send_command = SerialConnection.send_command
+
+    async def _send_command(self: SerialConnection, *args: Any, **kwargs: Any) -> str:
+        global _sent_commands
+        _sent_commands += 1
+        return await send_command(self, *args, **kwargs)
+
+    SerialConnection.send_command = _send_command  # type: ignore[method-assign]
+
+
+def _start_emulators(settings: Settings) -> None:
+    def _run() -> None:
+        asyncio.run(run_app.run(settings, modules=[m.value for m in _MODULES]))
+
+    threading.Thread(target=_run, daemon=True).start()
+
+    async def _wait_ready() -> None:
+        client = await ModuleStatusClient.connect(
+            host="localhost",
+            port=settings.module_server.port,
+            interval_seconds=0.1,
+        )
+        await wait_emulators(client=client, modules=_MODULES, timeout=5)
+        client.close()
+
+    asyncio.run(_wait_ready())
+
+
+async def _build_modules(settings: Settings, interval: float) -> List[AbstractModule]:
+    execution_manager = ExecutionManager()
+    usb_port = USBPort(
+        name="",
+        port_number=1,
+        port_group=PortGroup.UNKNOWN,
+        device_path="",
+        hub=False,
+        hub_port=None,
+    )
+    module_types: List[Tuple[Type[AbstractModule], int]] = [
+        (TempDeck, settings.temperature_proxy.driver_port),
+        (Thermocycler, settings.thermocycler_proxy.driver_port),
+        (HeaterShaker, settings.heatershaker_proxy.driver_port),
+    ]
+    return [
+        await module_cls.build(
+            port=f"socket://127.0.0.1:{port}",
+            execution_manager=execution_manager,
+            usb_port=usb_port,
+            hw_control_loop=asyncio.get_running_loop(),
+            poll_interval_seconds=interval,
+        )
+        for module_cls, port in module_types
+    ]
+
+
+async def _measure(
+    settings: Settings, interval: float, idle_seconds: float, adaptive: bool
+) -> None:
+    modules = await _build_modules(settings, interval)
+    try:
+        for module in modules:
+            await module.deactivate()
+            if not adaptive:
+                poller = module._poller  # type: ignore[attr-defined]
+                poller.idle_interval = poller.interval
+
+        start_commands = _sent_commands
+        await asyncio.sleep(idle_seconds)
+        idle_rate = (_sent_commands - start_commands) / idle_seconds
+
+        tempdeck = modules[0]
+        assert isinstance(tempdeck, TempDeck)
+        start = time.perf_counter()
+        await tempdeck.start_set_temperature(tempdeck.temperature + 10)
+        await tempdeck.await_temperature(None)
+        latency = time.perf_counter() - start
+    finally:
+        for module in modules:
+            await module.cleanup()
+
+    name = "adaptive" if adaptive else "fixed"
+    print(
+        f"{name:<9} idle {idle_rate:>6.1f} commands/s  "
+        f"temperature wait {latency * 1e3:>7.0f} ms"
+    )
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--interval", type=float, default=0.1)
+    parser.add_argument("--idle-seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    settings = Settings()
+    _count_commands()
+    _start_emulators(settings)
+    for adaptive in (False, True):
+        asyncio.run(_measure(settings, args.interval, args.idle_seconds, adaptive))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""Measure the host-side cost of a Flex move over the simulated CAN bus.
+
+The CAN bus simulator from opentrons_hardware.scripts.sim_socket_can is started
+in the background, along with a stand-in for the gantry and head motor boards
+that answers every move and position request right away. An OT3Controller and
+an OT3API talk to it over the socket, so everything but the motion itself is
+measured. For each move, this reports:
+- how long OT3Controller.move takes to run one move group
+- how long a motor position query takes, which is what re-reading positions
+  over CAN after every move would cost
+- how long OT3API.move_to takes, which keeps its positions up to date from the
+  move-completed acks
+
+Usage:
+    python benchmarks/move_overhead.py [--moves N] [--port N]
+"""
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+from typing import Dict, List, Set, Tuple
+from unittest import mock
+
+from opentrons.config.robot_configs import build_config_ot3
+from opentrons.hardware_control.backends.ot3controller import OT3Controller
+from opentrons.hardware_control.ot3api import OT3API
+from opentrons.hardware_control.types import Axis, HardwareFeatureFlags
+from opentrons.types import Mount, Point
+from opentrons_hardware.drivers.can_bus.socket_driver import SocketDriver
+from opentrons_hardware.drivers.eeprom import EEPROMDriver
+from opentrons_hardware.firmware_bindings import (
+    ArbitrationId,
+    ArbitrationIdParts,
+    CanMessage,
+)
+from opentrons_hardware.firmware_bindings.constants import (
+    FunctionCode,
+    MessageId,
+    NodeId,
+)
+from opentrons_hardware.firmware_bindings.messages import payloads
+from opentrons_hardware.firmware_bindings.messages.fields import (
+    MotorPositionFlagsField,
+)
+from opentrons_hardware.firmware_bindings.messages.messages import get_definition
+from opentrons_hardware.firmware_bindings.utils import (
+    Int32Field,
+    UInt8Field,
+    UInt32Field,
+)
+from opentrons_hardware.scripts import sim_socket_can
+
+_NODES = {NodeId.gantry_x, NodeId.gantry_y, NodeId.head_l, NodeId.head_r}
+_POSITION_OK = MotorPositionFlagsField(0x3)
+_TARGETS = [Point(100, 100, 300), Point(150, 120, 300)]
+
+
+class _MotorBoards:
+    """Answers move and position requests the way the motor boards would."""
+
+    def __init__(self, driver: SocketDriver) -> None:
+        self._driver = driver
+        self._positions: Dict[NodeId, float] = {node: 0.0 for node in _NODES}
+        self._moves: Dict[int, List[Tuple[NodeId, int, float]]] = {}
+
+    async def _reply(
+        self, node: NodeId, message_id: MessageId, payload: payloads.EmptyPayload
+    ) -> None:
+        if payload.message_index.value is None:
+            payload.message_index = UInt32Field(0)
+        arbitration_id = ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=message_id,
+                node_id=NodeId.host,
+                function_code=FunctionCode.network_management,
+                originating_node_id=node,
+            )
+        )
+        await self._driver.send(
+            CanMessage(arbitration_id=arbitration_id, data=payload.serialize())
+        )
+
+    async def _ack(self, nodes: Set[NodeId], request: payloads.EmptyPayload) -> None:
+        for node in nodes:
+            ack = payloads.EmptyPayload()
+            ack.message_index = request.message_index
+            await self._reply(node, MessageId.acknowledgement, ack)
+
+    async def _complete(self, group_id: int) -> None:
+        for node, seq_id, distance in self._moves.pop(group_id, []):
+            self._positions[node] += distance
+            position_um = int(self._positions[node] * 1000)
+            await self._reply(
+                node,
+                MessageId.move_completed,
+                payloads.MoveCompletedPayload(
+                    group_id=UInt8Field(group_id),
+                    seq_id=UInt8Field(seq_id),
+                    current_position_um=UInt32Field(position_um),
+                    encoder_position_um=Int32Field(position_um),
+                    position_flags=_POSITION_OK,
+                    ack_id=UInt8Field(1),
+                ),
+            )
+
+    async def _handle(self, message: CanMessage) -> None:
+        message_id = MessageId(message.arbitration_id.parts.message_id)
+        definition = get_definition(message_id)
+        if definition is None:
+            return
+        request = definition.payload_type.build(message.data)
+        assert isinstance(request, payloads.EmptyPayload)
+        if isinstance(request, payloads.AddLinearMoveRequestPayload):
+            # Velocity is in mm per tick and acceleration is in um per tick
+            # squared, both scaled by 2^31, and duration is in ticks.
+            ticks = request.duration.value
+            distance = (
+                request.velocity_mm.value * ticks
+                + request.acceleration_um.value / 1000 * ticks**2 / 2
+            ) / 2**31
+            node = NodeId(message.arbitration_id.parts.node_id)
+            self._moves.setdefault(request.group_id.value, []).append(
+                (node, request.seq_id.value, distance)
+            )
+        elif message_id == MessageId.clear_all_move_groups_request:
+            self._moves.clear()
+            await self._ack(_NODES, request)
+        elif isinstance(request, payloads.ExecuteMoveGroupRequestPayload):
+            group_id = request.group_id.value
+            await self._ack(
+                {node for node, _, _ in self._moves.get(group_id, [])}, request
+            )
+            await self._complete(group_id)
+        elif message_id == MessageId.motor_position_request:
+            for node in _NODES:
+                position_um = int(self._positions[node] * 1000)
+                await self._reply(
+                    node,
+                    MessageId.motor_position_response,
+                    payloads.MotorPositionResponse(
+                        current_position_um=UInt32Field(position_um),
+                        encoder_position_um=Int32Field(position_um),
+                        position_flags=_POSITION_OK,
+                    ),
+                )
+
+    async def run(self) -> None:
+        while True:
+            await self._handle(await self._driver.read())
+
+
+def _start_bus(port: int) -> None:
+    def _run() -> None:
+        asyncio.run(sim_socket_can.run(port))
+
+    threading.Thread(target=_run, daemon=True).start()
+
+
+async def _connect(port: int) -> SocketDriver:
+    for _ in range(50):
+        try:
+            return await SocketDriver.build("localhost", port)
+        except OSError:
+            await asyncio.sleep(0.1)
+    raise RuntimeError(f"Could not connect to the CAN bus simulator on {port}")
+
+
+def _report(name: str, times: List[float]) -> None:
+    print(f"{name:<16} median {statistics.median(times) * 1e3:>6.2f} ms per move")
+
+
+async def _measure(port: int, moves: int) -> None:
+    boards = _MotorBoards(await _connect(port))
+    boards_task = asyncio.create_task(boards.run())
+    config = build_config_ot3({})
+    with mock.patch("opentrons.hardware_control.backends.ot3controller.OT3GPIO"):
+        controller = OT3Controller(
+            config,
+            driver=await _connect(port),
+            eeprom_driver=mock.Mock(spec=EEPROMDriver),
+            check_updates=False,
+            feature_flags=HardwareFeatureFlags(require_estop=False),
+        )
+    controller._motor_nodes = lambda: _NODES  # type: ignore[method-assign]
+    await controller.update_motor_status()
+
+    move_times: List[float] = []
+    query_times: List[float] = []
+    for index in range(moves):
+        origin = await controller.update_position()
+        target = dict(origin)
+        target[Axis.X] = 100.0 + 50 * (index % 2)
+        start = time.perf_counter()
+        await controller.move(origin, target, 100)
+        move_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await controller.update_motor_status()
+        query_times.append(time.perf_counter() - start)
+
+    api = OT3API(
+        controller,
+        loop=asyncio.get_running_loop(),
+        config=config,
+        feature_flags=HardwareFeatureFlags(require_estop=False),
+    )
+    api_times: List[float] = []
+    for index in range(moves):
+        start = time.perf_counter()
+        await api.move_to(Mount.LEFT, _TARGETS[index % 2], speed=100)
+        api_times.append(time.perf_counter() - start)
+
+    boards_task.cancel()
+    _report("move group", move_times)
+    _report("position query", query_times)
+    _report("OT3API.move_to", api_times)
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--moves", type=int, default=200)
+    parser.add_argument("--port", type=int, default=9898)
+    args = parser.parse_args()
+
+    _start_bus(args.port)
+    asyncio.run(_measure(args.port, args.moves))
+
+
+if __name__ == "__main__":
+    main()
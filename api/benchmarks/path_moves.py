@@ -0,0 +1,111 @@
+"""Compare arc moves made one waypoint at a time with arc moves made as one path.
+
+An arc, the way protocol engine moves between wells, is a retract, a traverse,
+and a descend. For each way of moving through an arc, this reports:
+- how long a simulated Flex takes to make the arc, which is the time spent on
+  the host, since the simulator doesn't wait for motion
+- how many move groups the arc is sent to the motors as
+- how long the motion planner says the arc takes, and how fast the gantry is
+  moving at each corner
+
+Usage:
+    python benchmarks/path_moves.py [--arcs N]
+"""
+import argparse
+import asyncio
+import time
+from typing import Dict, List
+
+from opentrons.config.robot_configs import build_config_ot3
+from opentrons.config.types import GantryLoad
+from opentrons.hardware_control.ot3api import OT3API
+from opentrons.hardware_control.backends.ot3utils import get_system_constraints
+from opentrons.hardware_control.types import Axis, PathWaypoint
+from opentrons.types import Mount, Point
+from opentrons_hardware.hardware_control.motion_planning import (
+    Move,
+    MoveManager,
+    MoveTarget,
+)
+
+_SPEED = 100.0
+_ARC = [Point(100, 100, 400), Point(200, 150, 400), Point(200, 150, 300)]
+_ORIGIN = Point(100, 100, 300)
+
+
+def _machine(point: Point) -> Dict[Axis, float]:
+    return {Axis.X: point.x, Axis.Y: point.y, Axis.Z_L: point.z}
+
+
+def _describe(name: str, groups: int, moves: List[Move[Axis]]) -> None:
+    duration = sum(float(block.time) for move in moves for block in move.blocks)
+    corners = ", ".join(
+        f"{float(move.blocks[-1].final_speed):.1f}" for move in moves[:-1]
+    )
+    print(
+        f"{name:<10} {groups} move groups, planned {duration * 1e3:>6.0f} ms, "
+        f"corner speeds {corners} mm/s"
+    )
+
+
+def _plan() -> None:
+    constraints = get_system_constraints(
+        build_config_ot3({}).motion_settings, GantryLoad.LOW_THROUGHPUT
+    )
+    manager = MoveManager(constraints=constraints)
+    starts = [_ORIGIN] + _ARC[:-1]
+
+    moves: List[Move[Axis]] = []
+    for start, end in zip(starts, _ARC):
+        _, movelist = manager.plan_motion(
+            _machine(start), [MoveTarget.build(_machine(end), _SPEED)]
+        )
+        moves.extend(movelist[-1])
+    _describe("waypoints", len(_ARC), moves)
+
+    _, movelist = manager.plan_motion(
+        _machine(_ORIGIN),
+        [MoveTarget.build(_machine(point), _SPEED) for point in _ARC],
+    )
+    _describe("path", 1, movelist[-1])
+
+
+async def _run(arcs: int) -> None:
+    api = await OT3API.build_hardware_simulator()
+    try:
+        await api.home()
+        await api.move_to(Mount.LEFT, _ORIGIN)
+
+        start = time.perf_counter()
+        for _ in range(arcs):
+            for point in _ARC:
+                await api.move_to(Mount.LEFT, point, speed=_SPEED)
+            await api.move_to(Mount.LEFT, _ORIGIN, speed=_SPEED)
+        per_waypoint = (time.perf_counter() - start) / arcs
+
+        start = time.perf_counter()
+        for _ in range(arcs):
+            await api.move_along_path(
+                Mount.LEFT, [PathWaypoint(position=point) for point in _ARC], _SPEED
+            )
+            await api.move_to(Mount.LEFT, _ORIGIN, speed=_SPEED)
+        path = (time.perf_counter() - start) / arcs
+    finally:
+        await api.clean_up()
+
+    print(f"{'waypoints':<10} {per_waypoint * 1e3:>6.2f} ms per arc on the host")
+    print(f"{'path':<10} {path * 1e3:>6.2f} ms per arc on the host")
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--arcs", type=int, default=200)
+    args = parser.parse_args()
+
+    asyncio.run(_run(args.arcs))
+    _plan()
+
+
+if __name__ == "__main__":
+    main()
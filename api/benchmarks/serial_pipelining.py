@@ -0,0 +1,102 @@
+"""Measure heater-shaker command throughput with and without serial pipelining.
+
+The heater-shaker emulator is started in the background and a driver connects to
+it over its serial port proxy, the way the integration tests do. For each
+pipeline window, this reports:
+- how many temperature queries per second get answered when several callers
+  send them at once
+- how long a full heater-shaker poll takes, which reads the temperature, speed,
+  and labware latch at once
+
+A window of 1 is the compatible mode, where each command waits for the response
+to the one before it.
+
+Usage:
+    python benchmarks/serial_pipelining.py [--commands N] [--callers N]
+"""
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+from typing import List
+
+from opentrons.drivers.heater_shaker.driver import HeaterShakerDriver
+from opentrons.hardware_control.emulation.module_server import ModuleStatusClient
+from opentrons.hardware_control.emulation.module_server.helpers import wait_emulators
+from opentrons.hardware_control.emulation.scripts import run_app
+from opentrons.hardware_control.emulation.settings import Settings
+from opentrons.hardware_control.emulation.types import ModuleType
+from opentrons.hardware_control.modules.heater_shaker import HeaterShakerReader
+
+_WINDOWS = [1, 2, 4, 8]
+
+
+def _start_emulator(settings: Settings) -> None:
+    def _run() -> None:
+        asyncio.run(run_app.run(settings, modules=[ModuleType.Heatershaker.value]))
+
+    threading.Thread(target=_run, daemon=True).start()
+
+    async def _wait_ready() -> None:
+        client = await ModuleStatusClient.connect(
+            host="localhost",
+            port=settings.module_server.port,
+            interval_seconds=0.1,
+        )
+        await wait_emulators(
+            client=client, modules=[ModuleType.Heatershaker], timeout=5
+        )
+        client.close()
+
+    asyncio.run(_wait_ready())
+
+
+async def _measure(
+    settings: Settings, window: int, commands: int, callers: int
+) -> None:
+    driver = await HeaterShakerDriver.create(
+        port=f"socket://127.0.0.1:{settings.heatershaker_proxy.driver_port}",
+        loop=asyncio.get_running_loop(),
+        pipeline_window=window,
+    )
+    try:
+
+        async def _caller() -> None:
+            for _ in range(commands // callers):
+                await driver.get_temperature()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(_caller() for _ in range(callers)))
+        rate = commands // callers * callers / (time.perf_counter() - start)
+
+        reader = HeaterShakerReader(driver=driver, pipelined=window > 1)
+        polls: List[float] = []
+        for _ in range(commands // 10):
+            start = time.perf_counter()
+            await reader.read()
+            polls.append(time.perf_counter() - start)
+    finally:
+        await driver.disconnect()
+
+    print(
+        f"window {window:>2}  {rate:>7.0f} commands/s  "
+        f"poll median {statistics.median(polls) * 1e3:>6.2f} ms"
+    )
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commands", type=int, default=2000)
+    parser.add_argument("--callers", type=int, default=8)
+    args = parser.parse_args()
+
+    settings = Settings()
+    _start_emulator(settings)
+    for window in _WINDOWS:
+        asyncio.run(_measure(settings, window, args.commands, args.callers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Measure how many actions per second the ProtocolEngine StateStore can handle.
+
+This drives a StateStore through the queue/run/succeed lifecycle of a large
+synthetic protocol, the same way the engine does during analysis.
+
+Usage:
+    python benchmarks/state_store_throughput.py [--commands N] [--repeat R]
+"""
+import argparse
+import time
+from datetime import datetime
+from typing import Any, List
+
+from opentrons_shared_data.deck import load as load_deck
+from opentrons_shared_data.robot import load as load_robot
+
+from opentrons.protocol_engine import commands
+from opentrons.protocol_engine.actions import (
+    Action,
+    PlayAction,
+    QueueCommandAction,
+    RunCommandAction,
+    SucceedCommandAction,
+)
+from opentrons.protocol_engine.state.config import Config
+from opentrons.protocol_engine.state.state import StateStore
+from opentrons.protocol_engine.types import DeckType
+
+
+def _create_state_store() -> StateStore:
+    def _error_recovery_policy(*args: object, **kwargs: object) -> Any:
+        raise NotImplementedError()
+
+    return StateStore(
+        config=Config(
+            robot_type="OT-2 Standard",
+            deck_type=DeckType.OT2_STANDARD,
+        ),
+        deck_definition=load_deck(DeckType.OT2_STANDARD.value, 5),
+        robot_definition=load_robot("OT-2 Standard"),
+        deck_fixed_labware=[],
+        is_door_open=False,
+        error_recovery_policy=_error_recovery_policy,
+    )
+
+
+def _build_actions(command_count: int) -> List[Action]:
+    now = datetime.now()
+    actions: List[Action] = [PlayAction(requested_at=now)]
+
+    for index in range(command_count):
+        command_id = f"command-{index}"
+        params = commands.CommentParams(message=f"step {index}")
+        actions.append(
+            QueueCommandAction(
+                command_id=command_id,
+                created_at=now,
+                request=commands.CommentCreate(params=params),
+                request_hash=None,
+            )
+        )
+        actions.append(RunCommandAction(command_id=command_id, started_at=now))
+        actions.append(
+            SucceedCommandAction(
+                command=commands.Comment(
+                    id=command_id,
+                    key=command_id,
+                    createdAt=now,
+                    startedAt=now,
+                    completedAt=now,
+                    status=commands.CommandStatus.SUCCEEDED,
+                    params=params,
+                    result=commands.CommentResult(),
+                ),
+                private_result=None,
+            )
+        )
+
+    return actions
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--commands", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    actions = _build_actions(args.commands)
+    best = float("inf")
+
+    for _ in range(args.repeat):
+        subject = _create_state_store()
+        start = time.perf_counter()
+        for action in actions:
+            subject.handle_action(action)
+        best = min(best, time.perf_counter() - start)
+
+    print(
+        f"{args.commands} commands, {len(actions)} actions: "
+        f"{best:.3f} s, {len(actions) / best:,.0f} actions/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
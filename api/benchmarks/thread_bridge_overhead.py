@@ -0,0 +1,126 @@
+"""Measure the overhead of calling into the hardware thread through a ThreadManager.
+
+The reference bridger inspects the attribute and builds a new wrapper on every
+access, the way CallBridger used to work. It's compared with the current
+CallBridger, which works out how to bridge each method once per class and reuses
+the bridges, for:
+- looking up a bridged method without calling it
+- calling a trivial async method
+- making several calls in one hop with ThreadManager.call_batch
+
+A simulated hardware API is used, so the lookups see a real class.
+
+Usage:
+    python benchmarks/thread_bridge_overhead.py [--calls N] [--batch-size N]
+"""
+import argparse
+import asyncio
+import functools
+import inspect
+import time
+from typing import Any, Dict, Mapping, Sequence
+
+from opentrons.hardware_control import API, ThreadManager
+from opentrons.hardware_control.thread_manager import (
+    CallBridger,
+    call_coroutine_threadsafe,
+    execute_asyncgen_threadsafe,
+)
+
+
+class _ReferenceBridger:
+    """Bridges calls the way CallBridger used to, for comparison."""
+
+    def __init__(self, wrapped_obj: Any, loop: asyncio.AbstractEventLoop) -> None:
+        self.wrapped_obj = wrapped_obj
+        self._loop = loop
+
+    def __getattribute__(self, attr_name: str) -> Any:
+        managed_obj = object.__getattribute__(self, "wrapped_obj")
+        loop = object.__getattribute__(self, "_loop")
+        try:
+            attr = getattr(managed_obj, attr_name)
+        except AttributeError:
+            return object.__getattribute__(self, attr_name)
+
+        if asyncio.iscoroutinefunction(attr):
+
+            @functools.wraps(attr)
+            async def wrapper(*args: Sequence[Any], **kwargs: Mapping[str, Any]) -> Any:
+                return await call_coroutine_threadsafe(loop, attr, *args, **kwargs)
+
+            return wrapper
+
+        elif asyncio.iscoroutine(attr):
+            return asyncio.wrap_future(asyncio.run_coroutine_threadsafe(attr, loop))
+
+        elif inspect.isasyncgenfunction(attr):
+
+            @functools.wraps(attr)
+            async def agen_wrapper(
+                *args: Sequence[Any], **kwargs: Mapping[str, Any]
+            ) -> Any:
+                async for item in execute_asyncgen_threadsafe(
+                    loop, attr, *args, **kwargs
+                ):
+                    yield item
+
+            return agen_wrapper
+
+        return attr
+
+
+def _rate(count: int, start: float) -> str:
+    return f"{(time.perf_counter() - start) / count * 1e6:>8.2f} us/call"
+
+
+async def _run(thread_manager: ThreadManager[API], calls: int, batch_size: int) -> None:
+    api = thread_manager.managed_obj
+    loop = thread_manager._loop
+    assert api is not None and loop is not None
+    bridgers: Dict[str, Any] = {
+        "reference": _ReferenceBridger(api, loop),
+        "current": CallBridger(api, loop),
+    }
+
+    for name, bridger in bridgers.items():
+        start = time.perf_counter()
+        for _ in range(calls):
+            bridger.get_lights
+        lookup = _rate(calls, start)
+
+        start = time.perf_counter()
+        for _ in range(calls):
+            await bridger.get_lights()
+        call = _rate(calls, start)
+        print(f"{name:<10} lookup {lookup}  lookup and call {call}")
+
+    async def batch(hardware: API) -> None:
+        for _ in range(batch_size):
+            await hardware.get_lights()
+
+    start = time.perf_counter()
+    for _ in range(calls // batch_size):
+        await thread_manager.call_batch(batch)
+    print(
+        f"{'batched':<10} {batch_size} calls per hop, "
+        f"lookup and call {_rate(calls // batch_size * batch_size, start)}"
+    )
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=10)
+    args = parser.parse_args()
+
+    thread_manager = ThreadManager(API.build_hardware_simulator)
+    try:
+        asyncio.run(_run(thread_manager, args.calls, args.batch_size))
+    finally:
+        thread_manager.clean_up()
+
+
+if __name__ == "__main__":
+    main()
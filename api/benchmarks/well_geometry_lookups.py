@@ -0,0 +1,210 @@
+"""Compare well volume and height lookups against the per-call polynomial solver.
+
+The reference re-sorts a well's sections, recomputes their capacities, and
+solves each height with numpy.roots on every call, the way these lookups used
+to work. It's compared with the cached scalar lookups and the batch lookups,
+for accuracy and throughput.
+
+Usage:
+    python benchmarks/well_geometry_lookups.py [--lookups N]
+"""
+import argparse
+import random
+import time
+from typing import Callable, Dict, List
+
+from opentrons_shared_data.labware.labware_definition import (
+    ConicalFrustum,
+    CuboidalFrustum,
+    InnerWellGeometry,
+    SphericalSegment,
+)
+
+from opentrons.protocol_engine.state.frustum_helpers import (
+    find_height_at_well_volume,
+    find_heights_at_well_volumes,
+    find_volume_at_well_height,
+    find_volumes_at_well_heights,
+    get_well_volumetric_capacity,
+    height_at_volume_within_section,
+    volume_at_height_within_section,
+)
+
+_GEOMETRIES = {
+    "tapered well, spherical bottom": InnerWellGeometry(
+        sections=[
+            ConicalFrustum(
+                shape="conical",
+                bottomDiameter=5.5,
+                topDiameter=6.9,
+                topHeight=10.9,
+                bottomHeight=1.2,
+            ),
+            SphericalSegment(
+                shape="spherical",
+                radiusOfCurvature=2.9,
+                topHeight=1.2,
+                bottomHeight=0.0,
+            ),
+        ]
+    ),
+    "reservoir, stacked cuboids": InnerWellGeometry(
+        sections=[
+            CuboidalFrustum(
+                shape="cuboidal",
+                topXDimension=8.2,
+                topYDimension=71.2,
+                bottomXDimension=7.4,
+                bottomYDimension=70.4,
+                topHeight=39.2,
+                bottomHeight=2.0,
+            ),
+            CuboidalFrustum(
+                shape="cuboidal",
+                topXDimension=7.4,
+                topYDimension=70.4,
+                bottomXDimension=1.0,
+                bottomYDimension=64.0,
+                topHeight=2.0,
+                bottomHeight=0.0,
+            ),
+        ]
+    ),
+    "tube, conical bottom": InnerWellGeometry(
+        sections=[
+            ConicalFrustum(
+                shape="conical",
+                bottomDiameter=8.7,
+                topDiameter=9.2,
+                topHeight=39.3,
+                bottomHeight=17.6,
+            ),
+            ConicalFrustum(
+                shape="conical",
+                bottomDiameter=0.5,
+                topDiameter=8.7,
+                topHeight=17.6,
+                bottomHeight=0.0,
+            ),
+        ]
+    ),
+}
+
+
+def _reference_volume_at_height(
+    target_height: float, well_geometry: InnerWellGeometry
+) -> float:
+    sorted_well = sorted(well_geometry.sections, key=lambda section: section.topHeight)
+    volume = 0.0
+    for (top_height, capacity), section in zip(
+        get_well_volumetric_capacity(well_geometry), sorted_well
+    ):
+        if top_height >= target_height:
+            return volume + volume_at_height_within_section(
+                section=section,
+                target_height_relative=target_height - section.bottomHeight,
+                section_height=section.topHeight - section.bottomHeight,
+            )
+        volume += capacity
+    raise ValueError(target_height)
+
+
+def _reference_height_at_volume(
+    target_volume: float, well_geometry: InnerWellGeometry
+) -> float:
+    sorted_well = sorted(well_geometry.sections, key=lambda section: section.topHeight)
+    volume = 0.0
+    for (_, capacity), section in zip(
+        get_well_volumetric_capacity(well_geometry), sorted_well
+    ):
+        if volume + capacity >= target_volume:
+            return section.bottomHeight + height_at_volume_within_section(
+                section=section,
+                target_volume_relative=target_volume - volume,
+                section_height=section.topHeight - section.bottomHeight,
+            )
+        volume += capacity
+    raise ValueError(target_volume)
+
+
+def _rate(count: int, run: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    run()
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lookups", type=int, default=5000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    for name, geometry in _GEOMETRIES.items():
+        capacities = get_well_volumetric_capacity(geometry)
+        max_height = capacities[-1][0]
+        max_volume = sum(capacity for _, capacity in capacities)
+        heights = [rng.uniform(0.01, max_height) for _ in range(args.lookups)]
+        volumes = [rng.uniform(0.01, max_volume) for _ in range(args.lookups)]
+
+        reference_heights = [_reference_height_at_volume(v, geometry) for v in volumes]
+        reference_volumes = [_reference_volume_at_height(h, geometry) for h in heights]
+        height_error = max(
+            abs(expected - found)
+            for expected, found in zip(
+                reference_heights, find_heights_at_well_volumes(volumes, geometry)
+            )
+        )
+        volume_error = max(
+            abs(expected - found) / expected
+            for expected, found in zip(
+                reference_volumes, find_volumes_at_well_heights(heights, geometry)
+            )
+        )
+
+        rates: Dict[str, List[float]] = {
+            "reference": [
+                _rate(
+                    args.lookups,
+                    lambda: [_reference_height_at_volume(v, geometry) for v in volumes],
+                ),
+                _rate(
+                    args.lookups,
+                    lambda: [_reference_volume_at_height(h, geometry) for h in heights],
+                ),
+            ],
+            "scalar": [
+                _rate(
+                    args.lookups,
+                    lambda: [find_height_at_well_volume(v, geometry) for v in volumes],
+                ),
+                _rate(
+                    args.lookups,
+                    lambda: [find_volume_at_well_height(h, geometry) for h in heights],
+                ),
+            ],
+            "batch": [
+                _rate(
+                    args.lookups,
+                    lambda: find_heights_at_well_volumes(volumes, geometry),
+                ),
+                _rate(
+                    args.lookups,
+                    lambda: find_volumes_at_well_heights(heights, geometry),
+                ),
+            ],
+        }
+
+        print(
+            f"{name}: max height error {height_error:.2e} mm, "
+            f"max relative volume error {volume_error:.2e}"
+        )
+        for kind, (height_rate, volume_rate) in rates.items():
+            print(
+                f"    {kind:<10} height {height_rate:>12.0f}/s  "
+                f"volume {volume_rate:>12.0f}/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
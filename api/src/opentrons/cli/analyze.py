@@ -1,12 +1,15 @@
 """Opentrons analyze CLI."""
+import ast
 import click
 
 from anyio import run
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from enum import Enum
-from pathlib import Path
+from pathlib import Path, PurePath
 from pydantic import BaseModel
 from typing import (
     Any,
@@ -20,10 +23,14 @@ from typing import (
     IO,
     TypeVar,
     Iterator,
+    Tuple,
 )
 import logging
+import multiprocessing
+import os
 import sys
 import json
+import time
 
 from opentrons.protocol_engine.types import (
     RunTimeParameter,
@@ -45,6 +52,7 @@ from opentrons.protocol_runner.create_simulating_orchestrator import (
 )
 from opentrons.protocol_runner import RunResult
 from opentrons.protocol_runner.run_orchestrator import ParseMode
+from opentrons.protocol_runner.warm_up import warm_up
 
 from opentrons.protocol_engine import (
     Command,
@@ -75,6 +83,24 @@ class _Output:
     kind: OutputKind
 
 
+@dataclass(frozen=True)
+class _ProtocolSet:
+    """A protocol file and the support files to analyze it with."""
+
+    name: PurePath
+    """The protocol's path, starting from the directory it was found in."""
+    files: Tuple[Path, ...]
+
+
+@dataclass(frozen=True)
+class _BatchItemSummary:
+    protocol: str
+    output: str
+    seconds: float
+    result: Optional[str] = None
+    error: Optional[str] = None
+
+
 @click.command()
 @click.argument(
     "files",
@@ -122,6 +148,16 @@ class _Output:
     default="{}",
     type=str,
 )
+@click.option(
+    "--batch-output-dir",
+    help="Analyze every protocol found in the given files and directories separately, in parallel, instead of as a single protocol. Writes one JSON result per protocol, plus summary.json with the timing of each, to this directory. Within each directory, every Python or JSON protocol is analyzed together with the labware definitions next to it.",
+    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+)
+@click.option(
+    "--jobs",
+    help="Number of protocols to analyze at once with --batch-output-dir. Defaults to the number of CPUs.",
+    type=click.IntRange(min=1),
+)
 def analyze(
     files: Sequence[Path],
     rtp_values: str,
@@ -131,6 +167,8 @@ def analyze(
     log_output: str,
     log_level: str,
     check: bool,
+    batch_output_dir: Optional[Path],
+    jobs: Optional[int],
 ) -> int:
     """Analyze a protocol.
 
@@ -138,13 +176,23 @@ def analyze(
     equipment and commands.
     """
     outputs = _get_outputs(json=json_output, human_json=human_json_output)
-    if not outputs and not check:
+    if batch_output_dir is not None and outputs:
+        raise click.UsageError(
+            message="--batch-output-dir cannot be combined with the other output options."
+        )
+    if not outputs and not check and batch_output_dir is None:
         raise click.UsageError(
             message="Please specify at least --check or one of the output options."
         )
 
     try:
         with _capture_logs(log_output, log_level):
+            if batch_output_dir is not None:
+                sys.exit(
+                    _analyze_batch(
+                        files, rtp_values, rtp_files, batch_output_dir, jobs, check
+                    )
+                )
             sys.exit(run(_analyze, files, rtp_values, rtp_files, outputs, check))
     except click.ClickException:
         raise
@@ -365,6 +413,31 @@ async def _analyze(
     if not outputs:
         return return_code
 
+    results = _get_analyze_results(protocol_source, analysis)
+
+    _call_for_output_of_kind(
+        "json",
+        outputs,
+        lambda to_file: to_file.write(
+            results.json(exclude_none=True).encode("utf-8"),
+        ),
+    )
+    _call_for_output_of_kind(
+        "human-json",
+        outputs,
+        lambda to_file: to_file.write(
+            results.json(exclude_none=True, indent=2).encode("utf-8")
+        ),
+    )
+    if check:
+        return return_code
+    else:
+        return 0
+
+
+def _get_analyze_results(
+    protocol_source: ProtocolSource, analysis: RunResult
+) -> "AnalyzeResults":
     if len(analysis.state_summary.errors) > 0:
         if any(
             code_in_error_tree(
@@ -400,25 +473,229 @@ async def _analyze(
         modules=analysis.state_summary.modules,
         liquids=analysis.state_summary.liquids,
     )
+    return results
 
-    _call_for_output_of_kind(
-        "json",
-        outputs,
-        lambda to_file: to_file.write(
-            results.json(exclude_none=True).encode("utf-8"),
-        ),
+
+def _is_python_protocol(path: Path) -> bool:
+    """Whether a Python file looks like a protocol, not a helper module.
+
+    Like `opentrons.protocols.parse`, this looks for a `run` function or a
+    `metadata` or `requirements` dict. Files that don't parse are kept, so
+    their errors show up in the results.
+    """
+    try:
+        parsed = ast.parse(path.read_bytes(), filename=str(path))
+    except (SyntaxError, ValueError):
+        return True
+    for node in parsed.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if node.name == "run":
+                return True
+        elif isinstance(node, ast.Assign):
+            if any(
+                isinstance(target, ast.Name)
+                and target.id in ("metadata", "requirements")
+                for target in node.targets
+            ):
+                return True
+    return False
+
+
+def _is_protocol_file(path: Path) -> bool:
+    if path.suffix == ".py":
+        try:
+            return _is_python_protocol(path)
+        except OSError:
+            return False
+    if path.suffix == ".json":
+        try:
+            contents = json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return False
+        # Labware definitions have no commands; JSON protocols always do.
+        return isinstance(contents, dict) and "commands" in contents
+    return False
+
+
+def _output_root(files_and_dirs: Sequence[Path]) -> Optional[Path]:
+    """The deepest directory containing every given file and directory."""
+    try:
+        return Path(
+            os.path.commonpath([entry.resolve().parent for entry in files_and_dirs])
+        )
+    except ValueError:
+        # Like paths on different drives.
+        return None
+
+
+def _discover_protocol_sets(files_and_dirs: Sequence[Path]) -> List[_ProtocolSet]:
+    """Find the protocols to analyze, each named by its path from a common root.
+
+    Naming them from a common root keeps protocols with the same file name, in
+    different directories, from overwriting each other's results.
+    """
+    root = _output_root(files_and_dirs)
+
+    def _name(entry: Path, path: Path) -> PurePath:
+        if root is not None:
+            return PurePath(path.resolve().relative_to(root))
+        return PurePath(entry.name) / path.relative_to(entry)
+
+    protocol_sets: List[_ProtocolSet] = []
+
+    for entry in files_and_dirs:
+        if not entry.is_dir():
+            protocol_sets.append(_ProtocolSet(name=_name(entry, entry), files=(entry,)))
+            continue
+
+        for directory in sorted(
+            [entry, *(p for p in entry.glob("**/*") if p.is_dir())]
+        ):
+            files = sorted(p for p in directory.iterdir() if p.is_file())
+            protocols = [f for f in files if _is_protocol_file(f)]
+            labware = [f for f in files if f.suffix == ".json" and f not in protocols]
+            for protocol in protocols:
+                protocol_sets.append(
+                    _ProtocolSet(
+                        name=_name(entry, protocol),
+                        files=(protocol, *labware),
+                    )
+                )
+
+    name_counts = Counter(protocol_set.name for protocol_set in protocol_sets)
+    duplicates = sorted(str(name) for name, count in name_counts.items() if count > 1)
+    if duplicates:
+        raise click.ClickException(
+            f"More than one protocol would be saved as: {', '.join(duplicates)}."
+        )
+
+    return protocol_sets
+
+
+def _warm_up() -> None:
+    """Analyze a small protocol for each robot type to fill in-process caches.
+
+    Worker processes forked afterwards, or initialized with this, start with the
+    modules and definitions that analysis needs already loaded.
+    """
+    warm_up(_warm_up_with)
+
+
+async def _warm_up_with(protocol_file: Path) -> None:
+    await _analyze_protocol_set((protocol_file,), {}, {})
+
+
+async def _analyze_protocol_set(
+    files: Sequence[Path],
+    rtp_values: PrimitiveRunTimeParamValuesType,
+    rtp_paths: CSVRuntimeParamPaths,
+) -> "AnalyzeResults":
+    protocol_source = await ProtocolReader().read_saved(files=files, directory=None)
+    analysis = await _do_analyze(protocol_source, rtp_values, rtp_paths)
+    return _get_analyze_results(protocol_source, analysis)
+
+
+def _run_batch_item(
+    protocol_set: _ProtocolSet,
+    rtp_values: PrimitiveRunTimeParamValuesType,
+    rtp_paths: CSVRuntimeParamPaths,
+    output_path: Path,
+) -> _BatchItemSummary:
+    start = time.perf_counter()
+    try:
+        results = run(_analyze_protocol_set, protocol_set.files, rtp_values, rtp_paths)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(results.json(exclude_none=True).encode("utf-8"))
+    except Exception as error:
+        return _BatchItemSummary(
+            protocol=str(protocol_set.name),
+            output=str(output_path),
+            seconds=time.perf_counter() - start,
+            error=str(error),
+        )
+    return _BatchItemSummary(
+        protocol=str(protocol_set.name),
+        output=str(output_path),
+        seconds=time.perf_counter() - start,
+        result=results.result.value,
     )
-    _call_for_output_of_kind(
-        "human-json",
-        outputs,
-        lambda to_file: to_file.write(
-            results.json(exclude_none=True, indent=2).encode("utf-8")
+
+
+def _analyze_batch(
+    files_and_dirs: Sequence[Path],
+    rtp_values: str,
+    rtp_files: str,
+    output_dir: Path,
+    jobs: Optional[int],
+    check: bool,
+) -> int:
+    parsed_rtp_values = _get_runtime_parameter_values(rtp_values)
+    rtp_paths = _get_runtime_parameter_paths(rtp_files)
+    protocol_sets = _discover_protocol_sets(files_and_dirs)
+    if not protocol_sets:
+        raise click.ClickException("No protocols found.")
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    start = time.perf_counter()
+    # Forked workers inherit everything the parent has already imported and
+    # cached, so warm up once here. Where fork isn't available, each worker
+    # warms itself up instead.
+    if "fork" in multiprocessing.get_all_start_methods():
+        _warm_up()
+        pool = ProcessPoolExecutor(
+            max_workers=jobs, mp_context=multiprocessing.get_context("fork")
+        )
+    else:
+        pool = ProcessPoolExecutor(max_workers=jobs, initializer=_warm_up)
+
+    summaries: List[_BatchItemSummary] = []
+    with pool:
+        futures = [
+            pool.submit(
+                _run_batch_item,
+                protocol_set,
+                parsed_rtp_values,
+                rtp_paths,
+                output_dir / f"{protocol_set.name}.json",
+            )
+            for protocol_set in protocol_sets
+        ]
+        for future in as_completed(futures):
+            summary = future.result()
+            click.echo(
+                f"{summary.protocol}: {summary.result or 'failed'}"
+                f" in {summary.seconds:.2f}s",
+                err=True,
+            )
+            summaries.append(summary)
+
+    summaries.sort(key=lambda summary: summary.protocol)
+    total_seconds = time.perf_counter() - start
+    (output_dir / "summary.json").write_text(
+        json.dumps(
+            {
+                "totalSeconds": total_seconds,
+                "jobs": jobs or os.cpu_count(),
+                "protocols": [
+                    {
+                        key: value
+                        for key, value in asdict(summary).items()
+                        if value is not None
+                    }
+                    for summary in summaries
+                ],
+            },
+            indent=2,
         ),
+        encoding="utf-8",
     )
-    if check:
-        return return_code
-    else:
-        return 0
+    click.echo(f"Analyzed {len(summaries)} protocols in {total_seconds:.2f}s", err=True)
+
+    if check and any(
+        summary.result != AnalysisResult.OK.value for summary in summaries
+    ):
+        return -1
+    return 0
 
 
 class ProtocolFile(BaseModel):
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Optional, List
+import re
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Optional, List, Union
 
 from opentrons.drivers.command_builder import CommandBuilder
 
-from .errors import NoResponse, AlarmResponse, ErrorResponse
+from .errors import NoResponse, AlarmResponse, ErrorResponse, SerialException
 from .async_serial import AsyncSerial
 
 log = logging.getLogger(__name__)
@@ -277,6 +280,20 @@ class SerialConnection:
         return response.strip()
 
 
+@dataclass
+class _PipelinedRequest:
+    """A command waiting to be sent in a pipelined window."""
+
+    data: str
+    retries: int
+    timeout: Optional[float]
+    response: "asyncio.Future[str]"
+
+
+# Modules that can be pipelined start each response with the command's code.
+_RESPONSE_TAG = re.compile(r"[GM]\d+(\.\d+)?")
+
+
 class AsyncResponseSerialConnection(SerialConnection):
     @classmethod
     async def create(
@@ -292,6 +309,7 @@ class AsyncResponseSerialConnection(SerialConnection):
         alarm_keyword: Optional[str] = None,
         reset_buffer_before_write: bool = False,
         async_error_ack: Optional[str] = None,
+        pipeline_window: int = 1,
     ) -> AsyncResponseSerialConnection:
         """
         Create a connection.
@@ -314,6 +332,11 @@ class AsyncResponseSerialConnection(SerialConnection):
               every write
             async_error_ack: optional string that will indicate an asynchronous
                              error when detected (default: async)
+            pipeline_window: how many commands may be sent before reading
+                             their responses. Only use more than 1 (the
+                             default) with firmware that queues commands
+                             and starts each response with the command's
+                             code.
 
         Returns: AsyncResponseSerialConnection
         """
@@ -322,7 +345,9 @@ class AsyncResponseSerialConnection(SerialConnection):
             baud_rate=baud_rate,
             timeout=timeout,
             loop=loop,
-            reset_buffer_before_write=reset_buffer_before_write,
+            # A pipelined connection resets the buffer itself, once per window.
+            reset_buffer_before_write=reset_buffer_before_write
+            and pipeline_window <= 1,
         )
         name = name or port
         return cls(
@@ -334,6 +359,8 @@ class AsyncResponseSerialConnection(SerialConnection):
             error_keyword=error_keyword or "err",
             alarm_keyword=alarm_keyword or "alarm",
             async_error_ack=async_error_ack or "async",
+            pipeline_window=pipeline_window,
+            reset_buffer_before_write=reset_buffer_before_write,
         )
 
     def __init__(
@@ -346,6 +373,8 @@ class AsyncResponseSerialConnection(SerialConnection):
         error_keyword: str,
         alarm_keyword: str,
         async_error_ack: str,
+        pipeline_window: int = 1,
+        reset_buffer_before_write: bool = False,
     ) -> None:
         """
         Constructor
@@ -362,6 +391,11 @@ class AsyncResponseSerialConnection(SerialConnection):
                            exception when detected
             async_error_ack: string that will indicate an asynchronous
                              error when detected
+            pipeline_window: how many commands may be sent before reading
+                             their responses
+            reset_buffer_before_write: whether to reset the read buffer before
+              each pipelined window. Unpipelined connections leave this to
+              the AsyncSerial object.
         """
         super().__init__(
             serial=serial,
@@ -380,6 +414,9 @@ class AsyncResponseSerialConnection(SerialConnection):
         self._error_keyword = error_keyword.lower()
         self._alarm_keyword = alarm_keyword.lower()
         self._async_error_ack = async_error_ack.lower()
+        self._pipeline_window = pipeline_window
+        self._pipeline: Deque[_PipelinedRequest] = deque()
+        self._reset_buffer_before_write = reset_buffer_before_write
 
     async def send_command(
         self, command: CommandBuilder, retries: int = 0, timeout: Optional[float] = None
@@ -415,6 +452,10 @@ class AsyncResponseSerialConnection(SerialConnection):
 
         Raises: SerialException
         """
+        if self._pipeline_window > 1:
+            return await self._send_pipelined(
+                data=data, retries=retries, timeout=timeout
+            )
         async with super().send_data_lock, self._serial.timeout_override(
             "timeout", timeout
         ):
@@ -438,35 +479,168 @@ class AsyncResponseSerialConnection(SerialConnection):
             log.debug(f"{self._name}: Write -> {data_encode!r}")
             await self._serial.write(data=data_encode)
 
-            response: List[bytes] = []
+            str_response = await self._read_response(data=data)
+            if str_response is not None:
+                return str_response
+
+            log.info(f"{self._name}: retry number {retry}/{retries}")
+
+            await self.on_retry()
+
+        raise NoResponse(port=self._port, command=data)
+
+    async def _read_response(self, data: str) -> Optional[str]:
+        """
+        Read the response to a command that has been sent.
+
+        Args:
+            data: The data that was sent.
+
+        Returns: The command response, or None if no ack was read
+
+        Raises: SerialException if the response, or an asynchronous error
+            read before it, is an error
+        """
+        response: List[bytes] = []
+        response.append(await self._serial.read_until(match=self._ack))
+        log.debug(f"{self._name}: Read <- {response[-1]!r}")
+
+        while self._async_error_ack.encode() in response[-1].lower():
+            # check for multiple a priori async errors
             response.append(await self._serial.read_until(match=self._ack))
             log.debug(f"{self._name}: Read <- {response[-1]!r}")
 
-            while self._async_error_ack.encode() in response[-1].lower():
-                # check for multiple a priori async errors
-                response.append(await self._serial.read_until(match=self._ack))
-                log.debug(f"{self._name}: Read <- {response[-1]!r}")
-
-            for r in response:
-                if self._async_error_ack.encode() in r:
-                    # Remove ack from response
-                    ackless_response = r.replace(self._ack, b"")
-                    str_response = self.process_raw_response(
-                        command=data, response=ackless_response.decode()
-                    )
-                    self.raise_on_error(response=str_response)
-
-            if self._ack in response[-1]:
+        for r in response:
+            if self._async_error_ack.encode() in r:
                 # Remove ack from response
-                ackless_response = response[-1].replace(self._ack, b"")
+                ackless_response = r.replace(self._ack, b"")
                 str_response = self.process_raw_response(
                     command=data, response=ackless_response.decode()
                 )
                 self.raise_on_error(response=str_response)
-                return str_response
 
-            log.info(f"{self._name}: retry number {retry}/{retries}")
+        if self._ack in response[-1]:
+            # Remove ack from response
+            ackless_response = response[-1].replace(self._ack, b"")
+            str_response = self.process_raw_response(
+                command=data, response=ackless_response.decode()
+            )
+            self.raise_on_error(response=str_response)
+            return str_response
 
-            await self.on_retry()
+        return None
 
-        raise NoResponse(port=self._port, command=data)
+    async def _send_pipelined(
+        self, data: str, retries: int, timeout: Optional[float]
+    ) -> str:
+        """
+        Queue data to be sent in the next window and return its response.
+
+        Whoever holds the send data lock sends windows of queued commands
+        until their own command has been answered, so commands queued by
+        other callers in the meantime go out with it.
+        """
+        request = _PipelinedRequest(
+            data=data,
+            retries=retries,
+            timeout=timeout,
+            response=asyncio.get_running_loop().create_future(),
+        )
+        self._pipeline.append(request)
+        try:
+            # Give callers that were scheduled alongside this one a chance to
+            # queue their commands, so they can go out in the same window.
+            await asyncio.sleep(0)
+            async with super().send_data_lock:
+                while not request.response.done():
+                    await self._send_window()
+        finally:
+            # Don't send it if we stopped waiting before it was sent
+            request.response.cancel()
+        return await request.response
+
+    def _next_window(self) -> List[_PipelinedRequest]:
+        """Take the next queued commands that can be sent together."""
+        window: List[_PipelinedRequest] = []
+        while self._pipeline and len(window) < self._pipeline_window:
+            request = self._pipeline[0]
+            if request.response.done():
+                # The caller stopped waiting before it was sent
+                self._pipeline.popleft()
+            elif window and request.timeout != window[0].timeout:
+                break
+            else:
+                window.append(self._pipeline.popleft())
+        return window
+
+    async def _send_window(self) -> None:
+        """
+        Send a window of queued commands, then read their responses in order.
+
+        If a response doesn't come, or is for some other command, the
+        connection is reopened and the unanswered commands are queued again,
+        unless it's out of retries.
+        """
+        window = self._next_window()
+        if not window:
+            return
+        try:
+            async with self._serial.timeout_override("timeout", window[0].timeout):
+                data_encode = "".join(request.data for request in window).encode()
+                if self._reset_buffer_before_write:
+                    self._serial.reset_input_buffer()
+                log.debug(f"{self._name}: Write -> {data_encode!r}")
+                await self._serial.write(data=data_encode)
+                while window:
+                    request = window[0]
+                    try:
+                        str_response = await self._read_response(data=request.data)
+                    except SerialException as e:
+                        _set_response(request, e)
+                        window.pop(0)
+                        continue
+                    if str_response is None or not _is_response_to(
+                        request.data, str_response
+                    ):
+                        break
+                    _set_response(request, str_response)
+                    window.pop(0)
+            if window:
+                self._requeue(window)
+                await self.on_retry()
+        finally:
+            for request in window:
+                # Only left over if sending was interrupted
+                _set_response(
+                    request, NoResponse(port=self._port, command=request.data)
+                )
+
+    def _requeue(self, window: List[_PipelinedRequest]) -> None:
+        """Queue unanswered commands again, in front of anything newer."""
+        request = window.pop(0)
+        log.info(f"{self._name}: no response, {request.retries} retries left")
+        if request.retries > 0:
+            request.retries -= 1
+            window.insert(0, request)
+        else:
+            _set_response(request, NoResponse(port=self._port, command=request.data))
+        self._pipeline.extendleft(reversed(window))
+        window.clear()
+
+
+def _is_response_to(data: str, response: str) -> bool:
+    """Whether a pipelined response is tagged with the command's code."""
+    tag = response.split(maxsplit=1)[0] if response else ""
+    if not _RESPONSE_TAG.fullmatch(tag):
+        # Not every response is tagged
+        return True
+    return data.split(maxsplit=1)[0] == tag
+
+
+def _set_response(request: _PipelinedRequest, response: Union[str, Exception]) -> None:
+    if request.response.done():
+        return
+    if isinstance(response, Exception):
+        request.response.set_exception(response)
+    else:
+        request.response.set_result(response)
@@ -37,7 +37,10 @@ DEFAULT_COMMAND_RETRIES = 0
 class HeaterShakerDriver(AbstractHeaterShakerDriver):
     @classmethod
     async def create(
-        cls, port: str, loop: Optional[asyncio.AbstractEventLoop]
+        cls,
+        port: str,
+        loop: Optional[asyncio.AbstractEventLoop],
+        pipeline_window: int = 1,
     ) -> HeaterShakerDriver:
         """
         Create a heater-shaker driver.
@@ -45,6 +48,8 @@ class HeaterShakerDriver(AbstractHeaterShakerDriver):
         Args:
             port: port or url of heater shaker
             loop: optional event loop
+            pipeline_window: how many commands may be sent before reading
+                their responses
 
         Returns: driver
         """
@@ -56,6 +61,7 @@ class HeaterShakerDriver(AbstractHeaterShakerDriver):
             loop=loop,
             error_keyword=HS_ERROR_KEYWORD,
             async_error_ack=HS_ASYNC_ERROR_ACK,
+            pipeline_window=pipeline_window,
         )
         return cls(connection=connection)
 
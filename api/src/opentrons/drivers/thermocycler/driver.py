@@ -70,7 +70,9 @@ SerialKind = Union[AsyncResponseSerialConnection, SerialConnection]
 class ThermocyclerDriverFactory:
     @staticmethod
     async def create(
-        port: str, loop: Optional[asyncio.AbstractEventLoop]
+        port: str,
+        loop: Optional[asyncio.AbstractEventLoop],
+        pipeline_window: int = 1,
     ) -> ThermocyclerDriver:
         """
         Create a thermocycler driver.
@@ -78,6 +80,8 @@ class ThermocyclerDriverFactory:
         Args:
             port: port or url of thermocycler
             loop: optional event loop
+            pipeline_window: how many commands may be sent to a Gen2
+                thermocycler before reading their responses
 
         Returns: driver
         """
@@ -113,6 +117,7 @@ class ThermocyclerDriverFactory:
                 error_keyword=TC_GEN2_ERROR_WORD,
                 alarm_keyword="alarm",
                 async_error_ack=TC_GEN2_ASYNC_ERROR_ACK,
+                pipeline_window=pipeline_window,
             )
             return ThermocyclerDriverV2(async_connection)
         else:
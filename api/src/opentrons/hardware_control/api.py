@@ -42,6 +42,7 @@ from .instruments.ot2.pipette import (
 from .backends import Controller, Simulator
 from .execution_manager import ExecutionManagerProvider
 from .pause_manager import PauseManager
+from .virtual_clock import VirtualClock
 from .module_control import AttachedModulesControl
 from .types import (
     Axis,
@@ -262,11 +263,16 @@ class API(
         loop: Optional[asyncio.AbstractEventLoop] = None,
         strict_attached_instruments: bool = True,
         feature_flags: Optional[HardwareFeatureFlags] = None,
+        use_virtual_clock: bool = False,
     ) -> "API":
         """Build a simulating hardware controller.
 
         This method may be used both on a real robot and on dev machines.
         Multiple simulating hardware controllers may be active at one time.
+
+        If `use_virtual_clock` is set, the simulator keeps a
+        :py:attr:`virtual_clock` that moves forward by how long each move,
+        home, and delay would take on a real robot.
         """
 
         if None is attached_instruments:
@@ -287,6 +293,8 @@ class API(
             checked_loop,
             strict_attached_instruments,
         )
+        if use_virtual_clock:
+            backend.start_virtual_clock()
         api_instance = cls(
             backend,
             loop=checked_loop,
@@ -317,6 +325,13 @@ class API(
         """`True` if this is a simulator; `False` otherwise."""
         return isinstance(self._backend, Simulator)
 
+    @property
+    def virtual_clock(self) -> Optional[VirtualClock]:
+        """The simulator's virtual clock, if it was built with one."""
+        if isinstance(self._backend, Simulator):
+            return self._backend.virtual_clock
+        return None
+
     def register_callback(self, cb: HardwareEventHandler) -> Callable[[], None]:
         """Allows the caller to register a callback, and returns a closure
         that can be used to unregister the provided callback
@@ -396,6 +411,8 @@ class API(
     async def delay(self, duration_s: float) -> None:
         """Delay execution by pausing and sleeping."""
         self.pause(PauseType.DELAY)
+        if self.virtual_clock:
+            self.virtual_clock.advance(duration_s)
         try:
             await self.do_delay(duration_s)
         finally:
@@ -183,6 +183,25 @@ class FlexBackend(Protocol):
         """
         ...
 
+    async def move_path(
+        self,
+        origin: Dict[Axis, float],
+        targets: List[Tuple[Dict[Axis, float], float, HWStopCondition]],
+    ) -> None:
+        """Move through a sequence of positions in a single move group.
+
+        The segments are blended, so the gantry only slows down at corners
+        instead of stopping. Each segment keeps its own stop condition.
+
+        Args:
+            origin: The starting point of the path
+            targets: The position, speed, and stop condition of each segment.
+
+        Returns:
+            None
+        """
+        ...
+
     async def home(
         self, axes: Sequence[Axis], gantry_load: GantryLoad
     ) -> OT3AxisMap[float]:
@@ -27,6 +27,7 @@ from typing import (
 )
 from opentrons.config.types import OT3Config, GantryLoad
 from opentrons.config import gripper_config
+from opentrons.util.performance_helpers import trace_span
 from .ot3utils import (
     axis_convert,
     create_move_group,
@@ -75,6 +76,9 @@ from opentrons_hardware.hardware_control.motion_planning import (
     MoveTarget,
     ZeroLengthMoveError,
 )
+from opentrons_hardware.hardware_control.motion_planning.move_utils import (
+    targets_to_moves,
+)
 from opentrons_hardware.hardware_control.estop.detector import (
     EstopDetector,
 )
@@ -670,6 +674,77 @@ class OT3Controller(FlexBackend):
             origin, moves, ordered_nodes, MoveStopCondition[stop_condition.name]
         )
         move_group, _ = group
+        await self._run_move_group(move_group)
+
+    @requires_update
+    @requires_estop
+    async def move_path(
+        self,
+        origin: Dict[Axis, float],
+        targets: List[Tuple[Dict[Axis, float], float, HWStopCondition]],
+    ) -> None:
+        """Move through a sequence of positions in a single move group.
+
+        The segments are blended, so the gantry only slows down at corners
+        instead of stopping. Each segment keeps its own stop condition.
+
+        Args:
+            origin: The starting point of the path
+            targets: The position, speed, and stop condition of each segment.
+
+        Returns:
+            None
+        """
+        constraints = self._move_manager.get_constraints()
+        move_targets: List[MoveTarget[Axis]] = []
+        segments: List[Tuple[int, HWStopCondition]] = []
+        start = origin
+        for target, speed, stop_condition in targets:
+            move_target = MoveTarget.build(position=target, max_speed=speed)
+            try:
+                # A segment can be split into more than one move.
+                move_count = len(
+                    list(targets_to_moves(start, [move_target], constraints))
+                )
+            except ZeroLengthMoveError:
+                continue
+            move_targets.append(move_target)
+            segments.append((move_count, stop_condition))
+            start = target
+        if not move_targets:
+            log.debug(f"Not moving because path {targets} from {origin} is empty")
+            return
+
+        blended, movelist = self._move_manager.plan_motion(
+            origin=origin, target_list=move_targets
+        )
+        if not blended:
+            log.warning("Could not blend path, moving through it segment by segment")
+            start = origin
+            for target, speed, stop_condition in targets:
+                await self.move(start, target, speed, stop_condition)
+                start = target
+            return
+        moves = movelist[-1]
+        log.info(f"move path: machine {targets} from {origin} requires {moves}")
+
+        moving_axes = {
+            axis_to_node(ax) for move in moves for ax in move.unit_vector.keys()
+        }
+        ordered_nodes = self._motor_nodes().intersection(moving_axes)
+        move_group: MoveGroup = []
+        for move_count, stop_condition in segments:
+            segment_group, _ = create_move_group(
+                origin,
+                moves[:move_count],
+                ordered_nodes,
+                MoveStopCondition[stop_condition.name],
+            )
+            move_group.extend(segment_group)
+            moves = moves[move_count:]
+        await self._run_move_group(move_group)
+
+    async def _run_move_group(self, move_group: MoveGroup) -> None:
         runner = MoveGroupRunner(
             move_groups=[move_group],
             ignore_stalls=True
@@ -680,7 +755,8 @@ class OT3Controller(FlexBackend):
         pipettes_moving = moving_pipettes_in_move_group(move_group)
 
         async with self._monitor_overpressure(pipettes_moving):
-            positions = await runner.run(can_messenger=self._messenger)
+            with trace_span("MoveGroupRunner.run", "can"):
+                positions = await runner.run(can_messenger=self._messenger)
         self._handle_motor_status_response(positions)
 
     def _get_axis_home_distance(self, axis: Axis) -> float:
@@ -60,10 +60,17 @@ from opentrons.hardware_control.dev_types import (
     AttachedGripper,
     OT3AttachedInstruments,
 )
+from opentrons.hardware_control.virtual_clock import PathTarget, VirtualClock
 from opentrons.util.async_helpers import ensure_yield
+from .ot3utils import get_system_constraints
 from .types import HWStopCondition
 from .flex_protocol import FlexBackend
 from opentrons_hardware.firmware_bindings.constants import SensorId
+from opentrons_hardware.hardware_control.motion_planning import (
+    MoveManager,
+    MoveTarget,
+    ZeroLengthMoveError,
+)
 from opentrons_hardware.sensors.types import SensorDataType
 
 log = logging.getLogger(__name__)
@@ -213,10 +220,104 @@ class OT3Simulator(FlexBackend):
         self._sim_estop_state = EstopState.DISENGAGED
         self._sim_estop_left_state = EstopPhysicalStatus.DISENGAGED
         self._sim_estop_right_state = EstopPhysicalStatus.DISENGAGED
+        self._virtual_clock: Optional[VirtualClock] = None
+        self._path_planners: Dict[GantryLoad, Tuple[MoveManager[Axis], float]] = {}
 
     async def get_serial_number(self) -> Optional[str]:
         return "simulator"
 
+    @property
+    def virtual_clock(self) -> Optional[VirtualClock]:
+        return self._virtual_clock
+
+    def start_virtual_clock(self) -> VirtualClock:
+        """Start timing moves, homes, and delays on a virtual clock."""
+        self._virtual_clock = VirtualClock(self._path_seconds)
+        self._update_path_planner()
+        return self._virtual_clock
+
+    def _update_path_planner(self) -> None:
+        """Build the motion planner for the current gantry load, once per load."""
+        if not self._virtual_clock or self._sim_gantry_load in self._path_planners:
+            return
+        constraints = get_system_constraints(
+            self._configuration.motion_settings, self._sim_gantry_load
+        )
+        default_speed = float(
+            max(constraint.max_speed for constraint in constraints.values())
+        )
+        self._path_planners[self._sim_gantry_load] = (
+            MoveManager(constraints=constraints),
+            default_speed,
+        )
+
+    def _path_seconds(
+        self, origin: Dict[Axis, float], targets: Sequence[PathTarget]
+    ) -> float:
+        """Plan a path the way OT3Controller would and add up its block times."""
+        move_manager, default_speed = self._path_planners[self._sim_gantry_load]
+        constraints = move_manager.get_constraints()
+        # Axes that don't move along the path don't change its timing, so
+        # leave them out of the plan.
+        moving = {
+            ax
+            for target, _ in targets
+            for ax, pos in target.items()
+            if ax in constraints and pos != origin.get(ax)
+        }
+        if not moving:
+            return 0.0
+        start = {ax: origin.get(ax, 0.0) for ax in moving}
+        position = start
+        move_targets: List[MoveTarget[Axis]] = []
+        for target, speed in targets:
+            next_position = {
+                **position,
+                **{ax: pos for ax, pos in target.items() if ax in moving},
+            }
+            if next_position != position:
+                move_targets.append(
+                    MoveTarget.build(next_position, speed or default_speed)
+                )
+            position = next_position
+        if not move_targets:
+            return 0.0
+        try:
+            _, blend_log = move_manager.plan_motion(
+                origin=start,
+                target_list=move_targets,
+            )
+        except ZeroLengthMoveError:
+            return 0.0
+        return sum(float(block.time) for move in blend_log[-1] for block in move.blocks)
+
+    def _home_seconds(self, axes: Sequence[Axis]) -> float:
+        """Time homing at the speeds OT3Controller homes at.
+
+        The mounts home together, then X, then Y, while the plungers home
+        alongside them.
+        """
+        speeds = self._configuration.motion_settings.max_speed_discontinuity[
+            self._sim_gantry_load
+        ]
+
+        def _group_seconds(group: Sequence[Axis]) -> float:
+            return max(
+                (
+                    abs(self._position[ax]) / speeds[Axis.to_kind(ax)]
+                    for ax in group
+                    if ax in axes and ax in self._position
+                ),
+                default=0.0,
+            )
+
+        gantry = (
+            _group_seconds(Axis.ot3_mount_axes())
+            + _group_seconds([Axis.X])
+            + _group_seconds([Axis.Y])
+        )
+        return max(gantry, _group_seconds(Axis.pipette_axes()))
+
     @asynccontextmanager
     async def restore_system_constraints(self) -> AsyncIterator[None]:
         log.debug("Simulating saving system constraints")
@@ -227,17 +328,20 @@ class OT3Simulator(FlexBackend):
 
     def update_constraints_for_gantry_load(self, gantry_load: GantryLoad) -> None:
         self._sim_gantry_load = gantry_load
+        self._update_path_planner()
 
     def update_constraints_for_calibration_with_gantry_load(
         self,
         gantry_load: GantryLoad,
     ) -> None:
         self._sim_gantry_load = gantry_load
+        self._update_path_planner()
 
     def update_constraints_for_plunger_acceleration(
         self, mount: OT3Mount, acceleration: float, gantry_load: GantryLoad
     ) -> None:
         self._sim_gantry_load = gantry_load
+        self._update_path_planner()
 
     @property
     def initialized(self) -> bool:
@@ -380,11 +484,38 @@ class OT3Simulator(FlexBackend):
         Returns:
             None
         """
+        if self._virtual_clock:
+            self._virtual_clock.advance_for_path(origin, [(target, speed)])
         for ax in origin:
             self._engaged_axes[ax] = True
         self._position.update(target)
         self._encoder_position.update(target)
 
+    @ensure_yield
+    async def move_path(
+        self,
+        origin: Dict[Axis, float],
+        targets: List[Tuple[Dict[Axis, float], float, HWStopCondition]],
+    ) -> None:
+        """Move through a sequence of positions in a single move group.
+
+        Args:
+            origin: The starting point of the path
+            targets: The position, speed, and stop condition of each segment.
+
+        Returns:
+            None
+        """
+        if self._virtual_clock:
+            self._virtual_clock.advance_for_path(
+                origin, [(target, speed) for target, speed, _ in targets]
+            )
+        for ax in origin:
+            self._engaged_axes[ax] = True
+        for target, _, _ in targets:
+            self._position.update(target)
+            self._encoder_position.update(target)
+
     @ensure_yield
     async def home(
         self, axes: Sequence[Axis], gantry_load: GantryLoad
@@ -401,6 +532,8 @@ class OT3Simulator(FlexBackend):
             homed = axes
         else:
             homed = list(iter(self._position.keys()))
+        if self._virtual_clock:
+            self._virtual_clock.advance(self._home_seconds(homed))
         for h in homed:
             self._position[h] = self._get_home_position()[h]
             self._motor_status[h] = MotorStatus(True, True)
@@ -89,6 +89,29 @@ SUBSYSTEM_USB: Dict[SubSystem, USBTarget] = {SubSystem.rear_panel: USBTarget.rea
 
 USB_SUBSYSTEM = {target: subsystem for subsystem, target in SUBSYSTEM_USB.items()}
 
+AXIS_NODEID: Dict[Axis, NodeId] = {
+    Axis.X: NodeId.gantry_x,
+    Axis.Y: NodeId.gantry_y,
+    Axis.Z_L: NodeId.head_l,
+    Axis.Z_R: NodeId.head_r,
+    Axis.P_L: NodeId.pipette_left,
+    Axis.P_R: NodeId.pipette_right,
+    Axis.Z_G: NodeId.gripper_z,
+    Axis.G: NodeId.gripper_g,
+    Axis.Q: NodeId.pipette_left,
+}
+
+NODEID_AXIS: Dict[NodeId, Axis] = {
+    NodeId.gantry_x: Axis.X,
+    NodeId.gantry_y: Axis.Y,
+    NodeId.head_l: Axis.Z_L,
+    NodeId.head_r: Axis.Z_R,
+    NodeId.pipette_left: Axis.P_L,
+    NodeId.pipette_right: Axis.P_R,
+    NodeId.gripper_z: Axis.Z_G,
+    NodeId.gripper_g: Axis.G,
+}
+
 LOG = getLogger(__name__)
 
 
@@ -123,48 +146,19 @@ def home_axes() -> List[Axis]:
 
 
 def axis_to_node(axis: Axis) -> "NodeId":
-    anm = {
-        Axis.X: NodeId.gantry_x,
-        Axis.Y: NodeId.gantry_y,
-        Axis.Z_L: NodeId.head_l,
-        Axis.Z_R: NodeId.head_r,
-        Axis.P_L: NodeId.pipette_left,
-        Axis.P_R: NodeId.pipette_right,
-        Axis.Z_G: NodeId.gripper_z,
-        Axis.G: NodeId.gripper_g,
-        Axis.Q: NodeId.pipette_left,
-    }
-    return anm[axis]
+    return AXIS_NODEID[axis]
 
 
 def node_to_axis(node: "NodeId") -> Axis:
-    nam = {
-        NodeId.gantry_x: Axis.X,
-        NodeId.gantry_y: Axis.Y,
-        NodeId.head_l: Axis.Z_L,
-        NodeId.head_r: Axis.Z_R,
-        NodeId.pipette_left: Axis.P_L,
-        NodeId.pipette_right: Axis.P_R,
-        NodeId.gripper_z: Axis.Z_G,
-        NodeId.gripper_g: Axis.G,
-    }
-    return nam[node]
+    return NODEID_AXIS[node]
 
 
 def node_is_axis(node: "NodeId") -> bool:
-    try:
-        node_to_axis(node)
-        return True
-    except KeyError:
-        return False
+    return node in NODEID_AXIS
 
 
 def axis_is_node(axis: Axis) -> bool:
-    try:
-        axis_to_node(axis)
-        return True
-    except KeyError:
-        return False
+    return axis in AXIS_NODEID
 
 
 def sub_system_to_nodeid(sub_sys: SubSystem) -> "NodeId":
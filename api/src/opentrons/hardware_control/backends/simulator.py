@@ -2,6 +2,7 @@ from __future__ import annotations
 import asyncio
 import copy
 import logging
+import math
 from threading import Event
 from typing import Dict, Optional, List, Tuple, TYPE_CHECKING, Sequence, Iterator, cast
 from contextlib import contextmanager
@@ -16,6 +17,10 @@ from opentrons import types
 from opentrons.config.types import RobotConfig
 from opentrons.config import get_opentrons_path
 from opentrons.drivers.smoothie_drivers import SimulatingDriver
+from opentrons.drivers.smoothie_drivers.constants import (
+    DEFAULT_AXES_SPEED,
+    XY_HOMING_SPEED,
+)
 
 from opentrons.drivers.rpi_drivers.gpio_simulator import SimulatingGPIOCharDev
 from opentrons.util.async_helpers import ensure_yield
@@ -24,6 +29,7 @@ from .. import modules
 from ..types import BoardRevision, Axis
 from ..module_control import AttachedModulesControl
 from ..util import ot2_axis_to_string
+from ..virtual_clock import PathTarget, VirtualClock
 
 if TYPE_CHECKING:
     from opentrons_shared_data.pipette.types import PipetteName, PipetteModel
@@ -38,6 +44,18 @@ if TYPE_CHECKING:
 
 MODULE_LOG = logging.getLogger(__name__)
 
+# Axes the smoothie homes together, in the order it homes them.
+_HOME_SEQUENCE = ["ZA", "X", "Y", "BC"]
+
+
+def _trapezoid_seconds(distance: float, speed: float, acceleration: float) -> float:
+    """How long a move takes when it speeds up and slows down at a constant rate."""
+    if distance <= 0:
+        return 0.0
+    if distance >= speed**2 / acceleration:
+        return distance / speed + speed / acceleration
+    return 2 * math.sqrt(distance / acceleration)
+
 
 class Simulator:
     """This is a subclass of hardware_control that only simulates the
@@ -169,10 +187,71 @@ class Simulator:
         # manager responsbility into the controller/backend itself as opposed
         # to the hardware api controller.
         self._module_controls: Optional[AttachedModulesControl] = None
+        self._virtual_clock: Optional[VirtualClock] = None
 
     async def get_serial_number(self) -> Optional[str]:
         return "simulator"
 
+    @property
+    def virtual_clock(self) -> Optional[VirtualClock]:
+        return self._virtual_clock
+
+    def start_virtual_clock(self) -> VirtualClock:
+        """Start timing moves, homes, and delays on a virtual clock."""
+        self._virtual_clock = VirtualClock(self._path_seconds)
+        return self._virtual_clock
+
+    def _move_seconds(
+        self,
+        origin: Dict[str, float],
+        target: Dict[str, float],
+        speed: Optional[float],
+        axis_max_speeds: Optional[Dict[str, float]],
+    ) -> float:
+        deltas = {
+            ax: pos - origin[ax] for ax, pos in target.items() if pos != origin[ax]
+        }
+        distance = math.sqrt(sum(delta**2 for delta in deltas.values()))
+        if not distance:
+            return 0.0
+        max_speeds = {
+            **cast(Dict[str, float], self.config.default_max_speed),
+            **(axis_max_speeds or {}),
+        }
+        checked_speed = speed or DEFAULT_AXES_SPEED
+        acceleration = math.inf
+        for ax, delta in deltas.items():
+            component = abs(delta) / distance
+            checked_speed = min(checked_speed, max_speeds[ax] / component)
+            acceleration = min(acceleration, self.config.acceleration[ax] / component)
+        return _trapezoid_seconds(distance, checked_speed, acceleration)
+
+    def _path_seconds(
+        self, origin: Dict[Axis, float], targets: Sequence[PathTarget]
+    ) -> float:
+        position = {ot2_axis_to_string(ax): pos for ax, pos in origin.items()}
+        seconds = 0.0
+        for target, speed in targets:
+            checked_target = {ot2_axis_to_string(ax): pos for ax, pos in target.items()}
+            seconds += self._move_seconds(position, checked_target, speed, None)
+            position.update(checked_target)
+        return seconds
+
+    def _home_seconds(self, axes: str) -> float:
+        max_speeds = cast(Dict[str, float], self.config.default_max_speed)
+        seconds = 0.0
+        for group in _HOME_SEQUENCE:
+            seconds += max(
+                (
+                    abs(self._smoothie_driver.homed_position[ax] - self._position[ax])
+                    / (XY_HOMING_SPEED if ax in "XY" else max_speeds[ax])
+                    for ax in group
+                    if ax in axes
+                ),
+                default=0.0,
+            )
+        return seconds
+
     @property
     def gpio_chardev(self) -> GPIODriverLike:
         return self._gpio_chardev
@@ -209,6 +288,12 @@ class Simulator:
         speed: Optional[float] = None,
         axis_max_speeds: Optional[Dict[str, float]] = None,
     ) -> None:
+        if self._virtual_clock:
+            self._virtual_clock.advance(
+                self._move_seconds(
+                    self._position, target_position, speed, axis_max_speeds
+                )
+            )
         self._position.update(target_position)
         self._engaged_axes.update({ax: True for ax in target_position})
 
@@ -216,6 +301,8 @@ class Simulator:
     async def home(self, axes: Optional[List[str]] = None) -> Dict[str, float]:
         # driver_3_0-> HOMED_POSITION
         checked_axes = "".join(axes) if axes else "XYZABC"
+        if self._virtual_clock:
+            self._virtual_clock.advance(self._home_seconds(checked_axes))
         self._position.update(
             {ax: self._smoothie_driver.homed_position[ax] for ax in checked_axes}
         )
@@ -225,6 +312,8 @@ class Simulator:
 
     @ensure_yield
     async def fast_home(self, axis: Sequence[str], margin: float) -> Dict[str, float]:
+        if self._virtual_clock:
+            self._virtual_clock.advance(self._home_seconds("".join(axis)))
         for ax in axis:
             self._position[ax] = self._smoothie_driver.homed_position[ax]
             self._engaged_axes[ax] = True
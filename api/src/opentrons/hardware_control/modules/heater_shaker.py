@@ -11,7 +11,12 @@ from opentrons.drivers.heater_shaker.abstract import AbstractHeaterShakerDriver
 from opentrons.drivers.heater_shaker.simulator import SimulatingDriver
 from opentrons.drivers.types import Temperature, RPM, HeaterShakerLabwareLatchStatus
 from opentrons.hardware_control.execution_manager import ExecutionManager
-from opentrons.hardware_control.poller import Reader, Poller
+from opentrons.hardware_control.poller import (
+    IDLE_POLL_INTERVAL_FACTOR,
+    Reader,
+    Poller,
+    run_reads,
+)
 from opentrons.hardware_control.modules import mod_abc, update
 from opentrons.hardware_control.modules.types import (
     ModuleDisconnectedCallback,
@@ -79,7 +84,11 @@ class HeaterShaker(mod_abc.AbstractModule):
             poll_interval_seconds = poll_interval_seconds or SIMULATING_POLL_PERIOD
 
         reader = HeaterShakerReader(driver=driver)
-        poller = Poller(reader=reader, interval=poll_interval_seconds)
+        poller = Poller(
+            reader=reader,
+            interval=poll_interval_seconds,
+            idle_interval=poll_interval_seconds * IDLE_POLL_INTERVAL_FACTOR,
+        )
         module = cls(
             port=port,
             usb_port=usb_port,
@@ -389,22 +398,41 @@ class HeaterShakerReader(Reader):
     labware_latch: HeaterShakerLabwareLatchStatus
     error: Optional[str]
 
-    def __init__(self, driver: AbstractHeaterShakerDriver) -> None:
+    def __init__(
+        self, driver: AbstractHeaterShakerDriver, pipelined: bool = False
+    ) -> None:
         self.temperature = Temperature(current=25, target=None)
         self.rpm = RPM(current=0, target=None)
         self.labware_latch = HeaterShakerLabwareLatchStatus.IDLE_UNKNOWN
         self.error: Optional[str] = None
         self._driver = driver
+        self._pipelined = pipelined
 
     async def read(self) -> None:
-        await self.read_temperature()
-        await self.read_rpm()
-        await self.read_labware_latch()
+        await run_reads(
+            self.read_temperature,
+            self.read_rpm,
+            self.read_labware_latch,
+            together=self._pipelined,
+        )
         self._set_error(None)
 
     def on_error(self, exception: Exception) -> None:
         self._set_error(exception)
 
+    def is_idle(self) -> bool:
+        """Whether nothing is heating, shaking, or moving the labware latch."""
+        return (
+            self.temperature.target is None
+            and not self.rpm.target
+            and self.rpm.current == 0
+            and self.labware_latch
+            not in (
+                HeaterShakerLabwareLatchStatus.OPENING,
+                HeaterShakerLabwareLatchStatus.CLOSING,
+            )
+        )
+
     async def read_temperature(self) -> None:
         self.temperature = await self._driver.get_temperature()
 
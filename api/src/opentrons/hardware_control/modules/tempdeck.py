@@ -8,7 +8,7 @@ from opentrons.hardware_control.modules.types import (
     ModuleDisconnectedCallback,
     TemperatureStatus,
 )
-from opentrons.hardware_control.poller import Reader, Poller
+from opentrons.hardware_control.poller import IDLE_POLL_INTERVAL_FACTOR, Reader, Poller
 from typing_extensions import Final
 from opentrons.drivers.types import Temperature
 from opentrons.drivers.temp_deck import (
@@ -72,7 +72,11 @@ class TempDeck(mod_abc.AbstractModule):
             poll_interval_seconds = poll_interval_seconds or SIM_TEMP_POLL_INTERVAL_SECS
 
         reader = TempDeckReader(driver=driver)
-        poller = Poller(reader=reader, interval=poll_interval_seconds)
+        poller = Poller(
+            reader=reader,
+            interval=poll_interval_seconds,
+            idle_interval=poll_interval_seconds * IDLE_POLL_INTERVAL_FACTOR,
+        )
         module = cls(
             port=port,
             usb_port=usb_port,
@@ -293,3 +297,7 @@ class TempDeckReader(Reader):
     async def read(self) -> None:
         """Read the module's current and target temperatures."""
         self.temperature = await self._driver.get_temperature()
+
+    def is_idle(self) -> bool:
+        """Whether there's no target temperature."""
+        return self.temperature.target is None
@@ -11,7 +11,12 @@ from opentrons.hardware_control.modules.types import (
     ModuleDisconnectedCallback,
     TemperatureStatus,
 )
-from opentrons.hardware_control.poller import Reader, Poller
+from opentrons.hardware_control.poller import (
+    IDLE_POLL_INTERVAL_FACTOR,
+    Reader,
+    Poller,
+    run_reads,
+)
 
 from ..execution_manager import ExecutionManager
 from . import types, update, mod_abc
@@ -97,7 +102,11 @@ class Thermocycler(mod_abc.AbstractModule):
             poll_interval_seconds = poll_interval_seconds or SIM_POLLING_FREQUENCY_SEC
 
         reader = ThermocyclerReader(driver=driver)
-        poller = Poller(reader=reader, interval=poll_interval_seconds)
+        poller = Poller(
+            reader=reader,
+            interval=poll_interval_seconds,
+            idle_interval=poll_interval_seconds * IDLE_POLL_INTERVAL_FACTOR,
+        )
         module = cls(
             port=port,
             usb_port=usb_port,
@@ -679,6 +688,8 @@ class ThermocyclerReader(Reader):
 
     Args:
         driver: A connected Thermocycler driver.
+        pipelined: Whether the driver's connection is pipelined, so a poll's
+            reads can go out together.
     """
 
     lid_status: ThermocyclerLidStatus
@@ -688,6 +699,7 @@ class ThermocyclerReader(Reader):
     def __init__(
         self,
         driver: AbstractThermocyclerDriver,
+        pipelined: bool = False,
     ) -> None:
         self.lid_status = ThermocyclerLidStatus.UNKNOWN
         self.lid_temperature = Temperature(current=25.0, target=None)
@@ -695,6 +707,7 @@ class ThermocyclerReader(Reader):
         self._lid_temperature_status = LidTemperatureStatus()
         self._block_temperature_status = PlateTemperatureStatus()
         self._driver = driver
+        self._pipelined = pipelined
         self._handle_error: Optional[Callable[[Exception], None]] = None
 
     @property
@@ -714,9 +727,19 @@ class ThermocyclerReader(Reader):
 
     async def read(self) -> None:
         """Poll the thermocycler."""
-        await self.read_lid_status()
-        await self.read_lid_temperature()
-        await self.read_block_temperature()
+        await run_reads(
+            self.read_lid_status,
+            self.read_lid_temperature,
+            self.read_block_temperature,
+            together=self._pipelined,
+        )
+
+    def is_idle(self) -> bool:
+        """Whether neither the lid nor the block has a target temperature."""
+        return (
+            self.lid_temperature.target is None
+            and self.block_temperature.target is None
+        )
 
     async def read_lid_status(self) -> None:
         self.lid_status = await self._driver.get_lid_status()
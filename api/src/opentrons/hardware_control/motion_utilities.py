@@ -1,8 +1,10 @@
 """Utilities for calculating motion correctly."""
 from functools import lru_cache
-from typing import Callable, Dict, Union, Optional, cast
+from typing import Callable, Dict, Tuple, Union, Optional, cast
 from collections import OrderedDict
 
+from numpy.linalg import inv
+
 from opentrons_shared_data.robot.types import RobotType
 
 from opentrons.types import Mount, Point
@@ -124,12 +126,19 @@ def target_position_from_plunger(
     return all_axes_pos
 
 
+@lru_cache(4)
+def _reverse_attitude(attitude: Tuple[Tuple[float, ...], ...]) -> linal.DoubleArray:
+    # The attitude only changes when the deck is calibrated, but its inverse is
+    # needed every time a position is read back after a move.
+    return inv(attitude)
+
+
 def deck_point_from_machine_point(
     machine_point: Point, attitude: AttitudeMatrix, offset: Point
 ) -> Point:
     return Point(
-        *linal.apply_reverse(
-            attitude,
+        *linal.apply_transform(
+            _reverse_attitude(tuple(tuple(row) for row in attitude)),
             machine_point - offset,
         )
     )
@@ -196,28 +205,25 @@ def deck_from_machine(
         k: v for k, v in machine_pos.items() if k not in k.gantry_axes()
     }
     mount_axes: Dict[Axis, float]
-    to_mount: Callable[[Axis], Union[Mount, OT3Mount]]
     if robot_type == "OT-2 Standard":
         mount_axes = {k: v for k, v in machine_pos.items() if k in k.ot2_mount_axes()}
-        to_mount = Axis.to_ot2_mount
     else:
         mount_axes = {k: v for k, v in machine_pos.items() if k in k.ot3_mount_axes()}
-        to_mount = Axis.to_ot3_mount
-    deck_positions_by_mount = {
-        to_mount(axis): deck_point_from_machine_point(
+    deck_positions_by_axis = {
+        axis: deck_point_from_machine_point(
             Point(machine_pos[Axis.X], machine_pos[Axis.Y], value),
             attitude,
             offset,
         )
         for axis, value in mount_axes.items()
     }
-    position_for_gantry = next(iter(deck_positions_by_mount.values()))
+    position_for_gantry = next(iter(deck_positions_by_axis.values()))
     deck_pos = {
         Axis.X: position_for_gantry[0],
         Axis.Y: position_for_gantry[1],
     }
-    for mount, pos in deck_positions_by_mount.items():
-        deck_pos[Axis.by_mount(mount)] = pos[2]
+    for axis, pos in deck_positions_by_axis.items():
+        deck_pos[axis] = pos[2]
 
     deck_pos.update(plunger_axes)
     return deck_pos
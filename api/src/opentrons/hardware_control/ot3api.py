@@ -46,6 +46,7 @@ from opentrons.config.types import (
 )
 from opentrons.drivers.rpi_drivers.types import USBPort, PortGroup
 from opentrons.hardware_control.nozzle_manager import NozzleConfigurationType
+from opentrons.util.performance_helpers import trace_span
 from opentrons_shared_data.errors.exceptions import (
     EnumeratedError,
     PythonException,
@@ -72,6 +73,7 @@ from .pause_manager import PauseManager
 from .module_control import AttachedModulesControl
 from .types import (
     CriticalPoint,
+    PathWaypoint,
     DoorState,
     DoorStateNotification,
     ErrorMessageNotification,
@@ -143,6 +145,7 @@ from .backends.types import HWStopCondition
 from .backends.flex_protocol import FlexBackend
 from .backends.ot3simulator import OT3Simulator
 from .backends.errors import SubsystemUpdating
+from .virtual_clock import VirtualClock
 from opentrons_hardware.firmware_bindings.constants import SensorId
 from opentrons_hardware.sensors.types import SensorDataType
 
@@ -428,11 +431,16 @@ class OT3API(
         loop: Optional[asyncio.AbstractEventLoop] = None,
         strict_attached_instruments: bool = True,
         feature_flags: Optional[HardwareFeatureFlags] = None,
+        use_virtual_clock: bool = False,
     ) -> "OT3API":
         """Build a simulating hardware controller.
 
         This method may be used both on a real robot and on dev machines.
         Multiple simulating hardware controllers may be active at one time.
+
+        If `use_virtual_clock` is set, the simulator keeps a
+        :py:attr:`virtual_clock` that moves forward by how long each move,
+        home, and delay would take on a real robot.
         """
         if feature_flags is None:
             feature_flags = HardwareFeatureFlags()
@@ -455,6 +463,8 @@ class OT3API(
             strict_attached_instruments,
             feature_flags,
         )
+        if use_virtual_clock:
+            backend.start_virtual_clock()
         api_instance = cls(
             backend,
             loop=checked_loop,
@@ -483,6 +493,13 @@ class OT3API(
         """`True` if this is a simulator; `False` otherwise."""
         return isinstance(self._backend, OT3Simulator)
 
+    @property
+    def virtual_clock(self) -> Optional[VirtualClock]:
+        """The simulator's virtual clock, if it was built with one."""
+        if isinstance(self._backend, OT3Simulator):
+            return self._backend.virtual_clock
+        return None
+
     def register_callback(self, cb: HardwareEventHandler) -> Callable[[], None]:
         """Allows the caller to register a callback, and returns a closure
         that can be used to unregister the provided callback
@@ -579,6 +596,8 @@ class OT3API(
     async def delay(self, duration_s: float) -> None:
         """Delay execution by pausing and sleeping."""
         self.pause(PauseType.DELAY)
+        if self.virtual_clock:
+            self.virtual_clock.advance(duration_s)
         try:
             await self.do_delay(duration_s)
         finally:
@@ -1167,7 +1186,56 @@ class OT3API(
         """Move the critical point of the specified mount to a location
         relative to the deck, at the specified speed."""
         realmount = OT3Mount.from_mount(mount)
-        axes_moving = [Axis.X, Axis.Y, Axis.by_mount(mount)]
+        await self._prepare_to_move_mount(realmount)
+
+        target_position = self._target_position_from_absolute(
+            realmount, abs_position, critical_point
+        )
+        if max_speeds:
+            checked_max: Optional[OT3AxisMap[float]] = max_speeds
+        else:
+            checked_max = None
+
+        await self.prepare_for_mount_movement(realmount)
+        await self._move(
+            target_position,
+            speed=speed,
+            max_speeds=checked_max,
+            expect_stalls=_expect_stalls,
+        )
+
+    async def move_along_path(
+        self,
+        mount: Union[top_types.Mount, OT3Mount],
+        waypoints: Sequence[PathWaypoint],
+        speed: Optional[float] = None,
+    ) -> None:
+        """Move the critical point of the specified mount through a sequence
+        of locations relative to the deck, at the specified speed.
+
+        Unlike a move_to for each waypoint, the whole path is one blended
+        move, so the gantry only slows down at each waypoint instead of
+        stopping there.
+        """
+        realmount = OT3Mount.from_mount(mount)
+        await self._prepare_to_move_mount(realmount)
+
+        target_positions = [
+            self._target_position_from_absolute(
+                realmount, waypoint.position, waypoint.critical_point
+            )
+            for waypoint in waypoints
+        ]
+        await self.prepare_for_mount_movement(realmount)
+        await self._move_path(
+            target_positions,
+            speed=speed,
+            expect_stalls=[waypoint.expect_stalls for waypoint in waypoints],
+        )
+
+    async def _prepare_to_move_mount(self, realmount: OT3Mount) -> None:
+        """Make sure the gantry and the mount are ready to move."""
+        axes_moving = [Axis.X, Axis.Y, Axis.by_mount(realmount)]
 
         if (
             self.gantry_load == GantryLoad.HIGH_THROUGHPUT
@@ -1188,7 +1256,13 @@ class OT3API(
         else:
             self._assert_motor_ok(axes_moving)
 
-        target_position = target_position_from_absolute(
+    def _target_position_from_absolute(
+        self,
+        realmount: OT3Mount,
+        abs_position: top_types.Point,
+        critical_point: Optional[CriticalPoint],
+    ) -> "OrderedDict[Axis, float]":
+        return target_position_from_absolute(
             realmount,
             abs_position,
             partial(self.critical_point_for, cp_override=critical_point),
@@ -1196,18 +1270,6 @@ class OT3API(
             top_types.Point(*self._config.right_mount_offset),
             top_types.Point(*self._config.gripper_mount_offset),
         )
-        if max_speeds:
-            checked_max: Optional[OT3AxisMap[float]] = max_speeds
-        else:
-            checked_max = None
-
-        await self.prepare_for_mount_movement(realmount)
-        await self._move(
-            target_position,
-            speed=speed,
-            max_speeds=checked_max,
-            expect_stalls=_expect_stalls,
-        )
 
     async def move_axes(  # noqa: C901
         self,
@@ -1442,6 +1504,7 @@ class OT3API(
         async with contextlib.AsyncExitStack() as stack:
             if acquire_lock:
                 await stack.enter_async_context(self._motion_lock)
+            stack.enter_context(trace_span("OT3API._move", "hardware"))
             try:
                 await self._backend.move(
                     origin,
@@ -1457,6 +1520,52 @@ class OT3API(
                 await self._cache_current_position()
                 await self._cache_encoder_position()
 
+    @ExecutionManagerProvider.wait_for_running
+    async def _move_path(
+        self,
+        target_positions: Sequence["OrderedDict[Axis, float]"],
+        speed: Optional[float] = None,
+        expect_stalls: Optional[Sequence[bool]] = None,
+    ) -> None:
+        """Worker function to apply robot motion through several positions."""
+        targets: List[Tuple[Dict[Axis, float], float, HWStopCondition]] = []
+        for index, target_position in enumerate(target_positions):
+            machine_pos = machine_from_deck(
+                deck_pos=target_position,
+                attitude=self._robot_calibration.deck_calibration.attitude,
+                offset=self._robot_calibration.carriage_offset,
+                robot_type=cast(RobotType, "OT-3 Standard"),
+            )
+            check_motion_bounds(
+                {
+                    ax: machine_pos[ax]
+                    for ax in target_position.keys()
+                    if ax in Axis.gantry_axes()
+                },
+                target_position,
+                self._backend.axis_bounds,
+                MotionChecks.NONE,
+            )
+            stop_condition = (
+                HWStopCondition.stall
+                if expect_stalls and expect_stalls[index]
+                else HWStopCondition.none
+            )
+            targets.append((machine_pos, speed or 400.0, stop_condition))
+        self._log.info(f"Move path: deck {target_positions} becomes machine {targets}")
+        origin = await self._backend.update_position()
+        async with self._motion_lock:
+            with trace_span("OT3API._move_path", "hardware"):
+                try:
+                    await self._backend.move_path(origin, targets)
+                except Exception:
+                    self._log.exception("Move failed")
+                    self._current_position.clear()
+                    raise
+                else:
+                    await self._cache_current_position()
+                    await self._cache_encoder_position()
+
     async def _set_plunger_current_and_home(
         self,
         axis: Axis,
@@ -2,13 +2,16 @@ import asyncio
 import contextlib
 import logging
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator, List, Optional
+from typing import AsyncGenerator, Awaitable, Callable, List, Optional
 from opentrons.hardware_control.modules.errors import AbsorbanceReaderDisconnectedError
 from opentrons_shared_data.errors.exceptions import ModuleCommunicationError
 
 
 log = logging.getLogger(__name__)
 
+# How many times the poll interval that modules back off to while they're idle.
+IDLE_POLL_INTERVAL_FACTOR = 4
+
 
 class Reader(ABC):
     @abstractmethod
@@ -18,20 +21,58 @@ class Reader(ABC):
     def on_error(self, exception: Exception) -> None:
         """Handle an error from calling `read`."""
 
+    def is_idle(self) -> bool:
+        """Whether the last read showed nothing that's expected to change soon.
+
+        A poller with an idle interval polls less often while this is true.
+        """
+        return False
+
+
+async def run_reads(
+    *reads: Callable[[], Awaitable[None]], together: bool = False
+) -> None:
+    """Run a poll's reads, one after another or all at once.
+
+    Reads only go out together if `together` is set, like when the module's
+    serial connection is pipelined. Even then, every read finishes before the
+    first error, if any, is raised.
+    """
+    if not together:
+        for read in reads:
+            await read()
+        return
+    results = await asyncio.gather(*(read() for read in reads), return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
 
 class Poller:
     """A poller to call a given reader on an interval.
 
+    While the reader reports that it's idle, the time between polls doubles
+    after each poll, up to the idle interval. As soon as the reader isn't idle,
+    or someone is waiting for the next poll, polls are back to the normal
+    interval.
+
     Args:
         reader: An interface to read data.
         interval: The poll interval, in seconds.
+        idle_interval: The longest poll interval while the reader is idle,
+            in seconds. If not given, the interval is always used.
     """
 
     interval: float
+    idle_interval: float
 
-    def __init__(self, reader: Reader, interval: float) -> None:
+    def __init__(
+        self, reader: Reader, interval: float, idle_interval: Optional[float] = None
+    ) -> None:
         self.interval = interval
+        self.idle_interval = max(interval, idle_interval or interval)
         self._reader = reader
+        self._wake_event: Optional["asyncio.Event"] = None
         self._read_lock: Optional["asyncio.Lock"] = None
         self._poll_waiters: List["asyncio.Future[None]"] = []
         self._poll_forever_task: Optional["asyncio.Task[None]"] = None
@@ -64,6 +105,8 @@ class Poller:
 
         poll_future = asyncio.get_running_loop().create_future()
         self._poll_waiters.append(poll_future)
+        if self._wake_event is not None:
+            self._wake_event.set()
         await poll_future
 
     @contextlib.asynccontextmanager
@@ -75,9 +118,38 @@ class Poller:
 
     async def _poll_forever(self) -> None:
         """Polling loop."""
+        self._wake_event = asyncio.Event()
+        delay = self.interval
         while True:
             await self._poll_once()
-            await asyncio.sleep(self.interval)
+            if self._reader.is_idle():
+                delay = min(2 * delay, self.idle_interval)
+            else:
+                delay = self.interval
+            await self._sleep(delay)
+
+    async def _sleep(self, delay: float) -> None:
+        """Sleep until the next poll is due.
+
+        A sleep longer than the interval is cut short once the interval has
+        passed if someone starts waiting for the next poll, or the reader stops
+        being idle, which is checked at least once per interval.
+        """
+        assert self._wake_event is not None
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        deadline = start + delay
+        while True:
+            if self._poll_waiters or not self._reader.is_idle():
+                deadline = min(deadline, start + self.interval)
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            self._wake_event.clear()
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    self._wake_event.wait(), min(remaining, self.interval)
+                )
 
     @staticmethod
     def _set_waiter_complete(
@@ -18,6 +18,7 @@ from .identifiable import Identifiable
 from .gripper_controller import GripperController
 from .flex_calibratable import FlexCalibratable
 from .flex_instrument_configurer import FlexInstrumentConfigurer
+from .flex_motion_controller import FlexMotionController
 from .position_estimator import PositionEstimator
 
 from .types import (
@@ -72,6 +73,7 @@ class FlexHardwareControlInterface(
     GripperController,
     FlexCalibratable,
     FlexInstrumentConfigurer[MountArgType],
+    FlexMotionController[MountArgType],
     Identifiable[Type[FlexRobotType]],
     Protocol[CalibrationType, MountArgType, ConfigType],
 ):
@@ -103,4 +105,5 @@ __all__ = [
     "ModuleProvider",
     "Identifiable",
     "FlexCalibratable",
+    "FlexMotionController",
 ]
@@ -0,0 +1,25 @@
+"""Flex-specific extensions to motion control."""
+from typing import Optional, Sequence
+from typing_extensions import Protocol
+
+from .types import MountArgType
+
+from opentrons.hardware_control.types import PathWaypoint
+
+
+class FlexMotionController(Protocol[MountArgType]):
+    """A protocol specifying Flex-specific extensions to motion control."""
+
+    async def move_along_path(
+        self,
+        mount: MountArgType,
+        waypoints: Sequence[PathWaypoint],
+        speed: Optional[float] = None,
+    ) -> None:
+        """Move the critical point of the specified mount through a sequence
+        of locations relative to the deck, at the specified speed.
+
+        The whole path is one blended move, so the gantry only slows down at
+        each waypoint instead of stopping there.
+        """
+        ...
@@ -1,5 +1,9 @@
+from typing import Optional
+
 from typing_extensions import Protocol
 
+from ..virtual_clock import VirtualClock
+
 
 class Simulatable(Protocol):
     """Protocol specifying ability to simulate"""
@@ -8,3 +12,8 @@ class Simulatable(Protocol):
     def is_simulator(self) -> bool:
         """`True` if this is a simulator; `False` otherwise."""
         ...
+
+    @property
+    def virtual_clock(self) -> Optional[VirtualClock]:
+        """The clock a simulator advances instead of waiting, if it has one."""
+        ...
@@ -9,7 +9,10 @@ from typing import (
     Any,
     Awaitable,
     Callable,
+    Concatenate,
+    Dict,
     Generic,
+    Literal,
     Optional,
     TypeVar,
     cast,
@@ -118,6 +121,69 @@ async def execute_asyncgen_threadsafe(
 
 
 WrappedObj = TypeVar("WrappedObj", bound=AsyncioConfigurable, covariant=True)
+BatchReturn = TypeVar("BatchReturn")
+
+_MethodKind = Literal["coroutine", "asyncgen", "sync"]
+
+
+@functools.lru_cache(maxsize=None)
+def _method_kinds(cls: type) -> Mapping[str, _MethodKind]:
+    """Find how to bridge each plain method of a class.
+
+    This is the expensive part of bridging an attribute, so it's done once per class
+    instead of on every attribute access. Anything that isn't a plain function on the
+    class, like a property or a static method, is left out and bridged dynamically.
+    """
+    kinds: Dict[str, _MethodKind] = {}
+    for name in dir(cls):
+        try:
+            attr = inspect.getattr_static(cls, name)
+        except AttributeError:
+            continue
+        if not inspect.isfunction(attr):
+            continue
+        if asyncio.iscoroutinefunction(attr):
+            kinds[name] = "coroutine"
+        elif inspect.isasyncgenfunction(attr):
+            kinds[name] = "asyncgen"
+        else:
+            kinds[name] = "sync"
+    return kinds
+
+
+def _build_method_bridge(
+    obj: object, attr_name: str, kind: _MethodKind, loop: asyncio.AbstractEventLoop
+) -> Callable[..., Any]:
+    """Build a bridge to an async method of obj that runs it in loop.
+
+    The method is looked up again on every call, so the bridge can be kept around
+    and still pick up a method that's been replaced on the class.
+    """
+    method = getattr(obj, attr_name)
+
+    if kind == "coroutine":
+
+        @functools.wraps(method)
+        async def coroutine_bridge(
+            *args: Sequence[Any], **kwargs: Mapping[str, Any]
+        ) -> WrappedReturn:
+            return await call_coroutine_threadsafe(
+                loop, getattr(obj, attr_name), *args, **kwargs
+            )
+
+        return coroutine_bridge
+
+    @functools.wraps(method)
+    async def asyncgen_bridge(
+        *args: Sequence[Any], **kwargs: Mapping[str, Any]
+    ) -> AsyncGenerator[WrappedYield, None]:
+        item: WrappedYield
+        async for item in execute_asyncgen_threadsafe(
+            loop, getattr(obj, attr_name), *args, **kwargs
+        ):
+            yield item
+
+    return asyncgen_bridge
 
 
 class CallBridger(Generic[WrappedObj]):
@@ -126,11 +192,42 @@ class CallBridger(Generic[WrappedObj]):
     ) -> None:
         self.wrapped_obj = wrapped_obj
         self._loop = loop
+        # How to bridge each of the wrapped object's methods, worked out once for
+        # its class, and the bridges built so far, which are reused for as long as
+        # this object lives.
+        self._method_kinds = _method_kinds(type(wrapped_obj))
+        self._method_bridges: Dict[str, Callable[..., Any]] = {}
+        # Attributes set on the instance, like test mocks, hide its class's
+        # methods, so they're always bridged dynamically.
+        self._instance_attrs: Mapping[str, Any] = getattr(wrapped_obj, "__dict__", {})
 
     def __getattribute__(self, attr_name: str) -> Any:
         # Almost every attribute retrieved from us will be for people actually
         # looking for an attribute of the managed object, so check there first.
         managed_obj = object.__getattribute__(self, "wrapped_obj")
+        kind = object.__getattribute__(self, "_method_kinds").get(attr_name)
+        if kind is not None and attr_name not in object.__getattribute__(
+            self, "_instance_attrs"
+        ):
+            if kind == "sync":
+                return getattr(managed_obj, attr_name)
+            bridges = object.__getattribute__(self, "_method_bridges")
+            bridge = bridges.get(attr_name)
+            if bridge is None:
+                bridge = _build_method_bridge(
+                    managed_obj,
+                    attr_name,
+                    kind,
+                    object.__getattribute__(self, "_loop"),
+                )
+                bridges[attr_name] = bridge
+            return bridge
+
+        return object.__getattribute__(self, "_bridge_attribute")(attr_name)
+
+    def _bridge_attribute(self, attr_name: str) -> Any:
+        """Bridge an attribute that isn't one of the managed object's plain methods."""
+        managed_obj = object.__getattribute__(self, "wrapped_obj")
         loop = object.__getattribute__(self, "_loop")
         try:
             attr = getattr(managed_obj, attr_name)
@@ -161,7 +258,7 @@ class CallBridger(Generic[WrappedObj]):
             # in managed thread loop
 
             @functools.wraps(attr)
-            async def wrapper(
+            async def agen_wrapper(
                 *args: Sequence[Any], **kwargs: Mapping[str, Any]
             ) -> AsyncGenerator[WrappedYield, None]:
                 item: WrappedYield
@@ -170,7 +267,7 @@ class CallBridger(Generic[WrappedObj]):
                 ):
                     yield item
 
-            return wrapper
+            return agen_wrapper
 
         return attr
 
@@ -411,6 +508,27 @@ class ThreadManager(Generic[WrappedObj]):
             except AttributeError:
                 return object.__getattribute__(self, attr_name)
 
+    async def call_batch(
+        self,
+        batch: Callable[Concatenate[WrappedObj, P], Awaitable[BatchReturn]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> BatchReturn:
+        """Run a coroutine function on the managed object in the managed thread.
+
+        Every call through a ThreadManager crosses into the managed thread and back.
+        When several calls don't need the calling thread in between, put them in
+        one coroutine function and pass it here so they cross once, together.
+
+        batch is called with the managed object itself, not a bridge to it, and
+        the args and kwargs, so the calls it makes stay in the managed thread.
+        """
+        managed_obj = object.__getattribute__(self, "managed_obj")
+        loop = object.__getattribute__(self, "_loop")
+        return await call_coroutine_threadsafe(
+            loop, batch, managed_obj, *args, **kwargs
+        )
+
     def wrapped(self) -> WrappedObj:
         """Expose the type of the underlying wrapped object.
 
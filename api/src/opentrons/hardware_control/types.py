@@ -1,7 +1,7 @@
 import enum
 import logging
 from dataclasses import dataclass
-from typing import cast, Tuple, Union, List, Callable, Dict, TypeVar, Type
+from typing import cast, Tuple, Union, List, Callable, Dict, TypeVar, Type, Optional
 from typing_extensions import Literal
 from opentrons import types as top_types
 from opentrons_shared_data.pipette.types import PipetteChannelType
@@ -545,6 +545,16 @@ class CriticalPoint(enum.Enum):
     """
 
 
+@dataclass(frozen=True)
+class PathWaypoint:
+    """A position for a mount's critical point to move through as part of a path."""
+
+    position: top_types.Point
+    critical_point: Optional[CriticalPoint] = None
+    expect_stalls: bool = False
+    """Whether the move to this waypoint may stall without it being an error."""
+
+
 class ExecutionState(enum.Enum):
     RUNNING = enum.auto()
     PAUSED = enum.auto()
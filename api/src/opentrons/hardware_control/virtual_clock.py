@@ -0,0 +1,146 @@
+"""A clock for simulated runs, advanced by how long the hardware would take.
+
+A simulating backend returns from moves, homes, and delays right away. When it
+has a :py:class:`VirtualClock`, it also adds how long the real robot would
+have taken to the clock, so a simulated run can tell when each step would have
+started and finished.
+"""
+import math
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .types import Axis
+
+#: A target position for a move, and the speed to move there at.
+PathTarget = Tuple[Dict[Axis, float], Optional[float]]
+
+#: Works out how many seconds a robot takes to move from an origin through a
+#: sequence of targets.
+PathTimer = Callable[[Dict[Axis, float], Sequence[PathTarget]], float]
+
+#: The temperature a module is assumed to start from.
+AMBIENT_TEMPERATURE = 25.0
+
+#: How long the thermocycler lid takes to reach its target temperature.
+THERMOCYCLER_LID_RAMP_SECONDS = 60.0
+
+#: How long the thermocycler lid takes to open or close.
+THERMOCYCLER_LID_MOVE_SECONDS = 24.0
+
+# Ramp rates in °C/s, by the top of the temperature band they apply below.
+# The temperature module rates come from page 3 of the GEN2 Temperature Module
+# white paper, and the thermocycler rates from hardware testing; they match the
+# ones used by opentrons.protocols.duration.
+_TEMPERATURE_MODULE_RATES: List[Tuple[float, float]] = [
+    (25.0, 0.0875),
+    (37.0, 0.2),
+    (math.inf, 0.3611111111),
+]
+_THERMOCYCLER_HEATING_RATES: List[Tuple[float, float]] = [
+    (70.0, 4.0),
+    (math.inf, 2.0),
+]
+_THERMOCYCLER_COOLING_RATES: List[Tuple[float, float]] = [
+    (23.0, 0.1),
+    (70.0, 1.0),
+    (math.inf, 2.0),
+]
+
+
+def _ramp_seconds(
+    start: float, target: float, rates: Sequence[Tuple[float, float]]
+) -> float:
+    low, high = sorted((start, target))
+    seconds = 0.0
+    band_bottom = -math.inf
+    for band_top, rate in rates:
+        overlap = min(high, band_top) - max(low, band_bottom)
+        if overlap > 0:
+            seconds += overlap / rate
+        band_bottom = band_top
+    return seconds
+
+
+def temperature_module_ramp_seconds(start: float, target: float) -> float:
+    """How long a temperature module takes to go from one temperature to another."""
+    return _ramp_seconds(start, target, _TEMPERATURE_MODULE_RATES)
+
+
+def thermocycler_block_ramp_seconds(start: float, target: float) -> float:
+    """How long a thermocycler block takes to go from one temperature to another."""
+    if target > start:
+        return _ramp_seconds(start, target, _THERMOCYCLER_HEATING_RATES)
+    return _ramp_seconds(start, target, _THERMOCYCLER_COOLING_RATES)
+
+
+def thermocycler_profile_seconds(
+    start: float, steps: Sequence[Tuple[float, float]]
+) -> float:
+    """How long a thermocycler takes to run a profile.
+
+    :param start: The block temperature before the profile.
+    :param steps: The temperature and hold time in seconds of each step.
+    """
+    seconds = 0.0
+    for temperature, hold_seconds in steps:
+        seconds += thermocycler_block_ramp_seconds(start, temperature) + hold_seconds
+        start = temperature
+    return seconds
+
+
+class VirtualClock:
+    """Simulated time that starts when the clock is made and only moves when
+    it is advanced.
+
+    Timers let a simulated module start a temperature ramp in one step and wait
+    for it in a later one; waiting only advances the clock by whatever part of
+    the ramp is left.
+    """
+
+    def __init__(self, path_timer: PathTimer, start: Optional[datetime] = None):
+        self._path_timer = path_timer
+        self._start = start or datetime.now(tz=timezone.utc)
+        self._elapsed = 0.0
+        self._timers: Dict[str, float] = {}
+
+    @property
+    def elapsed(self) -> float:
+        """Simulated seconds since the clock started."""
+        return self._elapsed
+
+    def now(self) -> datetime:
+        """The current simulated time."""
+        return self._start + timedelta(seconds=self._elapsed)
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward."""
+        if seconds > 0:
+            self._elapsed += seconds
+
+    def advance_for_path(
+        self, origin: Dict[Axis, float], targets: Sequence[PathTarget]
+    ) -> float:
+        """Move the clock forward by how long a path of moves takes.
+
+        Returns the length of the path in seconds.
+        """
+        seconds = self._path_timer(origin, targets)
+        self.advance(seconds)
+        return seconds
+
+    def start_timer(self, name: str, seconds: float) -> None:
+        """Start a timer that runs out after a number of simulated seconds.
+
+        Starting a timer that is already running restarts it.
+        """
+        self._timers[name] = self._elapsed + max(seconds, 0.0)
+
+    def wait_for_timer(self, name: str) -> None:
+        """Move the clock forward to when a timer runs out.
+
+        Does nothing if the timer was never started or has already been
+        waited for.
+        """
+        deadline = self._timers.pop(name, None)
+        if deadline is not None:
+            self.advance(deadline - self._elapsed)
@@ -5,12 +5,20 @@ from typing_extensions import Literal, Type
 
 from pydantic import BaseModel, Field
 
+from opentrons.hardware_control.virtual_clock import (
+    AMBIENT_TEMPERATURE,
+    temperature_module_ramp_seconds,
+)
+
 from ..command import AbstractCommandImpl, BaseCommand, BaseCommandCreate, SuccessData
 from ...errors.error_occurrence import ErrorOccurrence
 
 if TYPE_CHECKING:
     from opentrons.protocol_engine.state.state import StateView
-    from opentrons.protocol_engine.execution import EquipmentHandler
+    from opentrons.protocol_engine.execution import (
+        EquipmentHandler,
+        RunControlHandler,
+    )
 
 SetTargetTemperatureCommandType = Literal["temperatureModule/setTargetTemperature"]
 
@@ -43,10 +51,12 @@ class SetTargetTemperatureImpl(
         self,
         state_view: StateView,
         equipment: EquipmentHandler,
+        run_control: RunControlHandler,
         **unused_dependencies: object,
     ) -> None:
         self._state_view = state_view
         self._equipment = equipment
+        self._run_control = run_control
 
     async def execute(
         self, params: SetTargetTemperatureParams
@@ -67,6 +77,14 @@ class SetTargetTemperatureImpl(
 
         if temp_hardware_module is not None:
             await temp_hardware_module.start_set_temperature(celsius=validated_temp)
+        else:
+            self._run_control.start_virtual_timer(
+                module_substate.module_id,
+                temperature_module_ramp_seconds(
+                    module_substate.plate_target_temperature or AMBIENT_TEMPERATURE,
+                    validated_temp,
+                ),
+            )
         return SuccessData(
             public=SetTargetTemperatureResult(targetTemperature=validated_temp),
             private=None,
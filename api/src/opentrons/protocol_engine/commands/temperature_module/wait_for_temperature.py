@@ -10,7 +10,10 @@ from ...errors.error_occurrence import ErrorOccurrence
 
 if TYPE_CHECKING:
     from opentrons.protocol_engine.state.state import StateView
-    from opentrons.protocol_engine.execution import EquipmentHandler
+    from opentrons.protocol_engine.execution import (
+        EquipmentHandler,
+        RunControlHandler,
+    )
 
 WaitForTemperatureCommandType = Literal["temperatureModule/waitForTemperature"]
 
@@ -45,10 +48,12 @@ class WaitForTemperatureImpl(
         self,
         state_view: StateView,
         equipment: EquipmentHandler,
+        run_control: RunControlHandler,
         **unused_dependencies: object,
     ) -> None:
         self._state_view = state_view
         self._equipment = equipment
+        self._run_control = run_control
 
     async def execute(
         self, params: WaitForTemperatureParams
@@ -74,6 +79,8 @@ class WaitForTemperatureImpl(
             await temp_hardware_module.await_temperature(
                 awaiting_temperature=target_temp
             )
+        else:
+            self._run_control.wait_for_virtual_timer(module_substate.module_id)
         return SuccessData(public=WaitForTemperatureResult(), private=None)
 
 
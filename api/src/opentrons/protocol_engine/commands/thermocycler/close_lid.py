@@ -5,6 +5,8 @@ from typing_extensions import Literal, Type
 
 from pydantic import BaseModel, Field
 
+from opentrons.hardware_control.virtual_clock import THERMOCYCLER_LID_MOVE_SECONDS
+
 from ..command import AbstractCommandImpl, BaseCommand, BaseCommandCreate, SuccessData
 from ...errors.error_occurrence import ErrorOccurrence
 from ...state import update_types
@@ -12,7 +14,11 @@ from opentrons.protocol_engine.types import MotorAxis
 
 if TYPE_CHECKING:
     from opentrons.protocol_engine.state.state import StateView
-    from opentrons.protocol_engine.execution import EquipmentHandler, MovementHandler
+    from opentrons.protocol_engine.execution import (
+        EquipmentHandler,
+        MovementHandler,
+        RunControlHandler,
+    )
 
 
 CloseLidCommandType = Literal["thermocycler/closeLid"]
@@ -38,11 +44,13 @@ class CloseLidImpl(
         state_view: StateView,
         equipment: EquipmentHandler,
         movement: MovementHandler,
+        run_control: RunControlHandler,
         **unused_dependencies: object,
     ) -> None:
         self._state_view = state_view
         self._equipment = equipment
         self._movement = movement
+        self._run_control = run_control
 
     async def execute(
         self, params: CloseLidParams
@@ -68,6 +76,8 @@ class CloseLidImpl(
 
         if thermocycler_hardware is not None:
             await thermocycler_hardware.close()
+        else:
+            self._run_control.advance_virtual_clock(THERMOCYCLER_LID_MOVE_SECONDS)
 
         return SuccessData(
             public=CloseLidResult(), private=None, state_update=state_update
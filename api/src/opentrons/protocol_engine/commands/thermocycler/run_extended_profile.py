@@ -1,18 +1,25 @@
 """Command models to execute a Thermocycler profile."""
 from __future__ import annotations
-from typing import List, Optional, TYPE_CHECKING, overload, Union
+from typing import List, Optional, TYPE_CHECKING, Tuple, overload, Union
 from typing_extensions import Literal, Type
 
 from pydantic import BaseModel, Field
 
 from opentrons.hardware_control.modules.types import ThermocyclerStep, ThermocyclerCycle
+from opentrons.hardware_control.virtual_clock import (
+    AMBIENT_TEMPERATURE,
+    thermocycler_profile_seconds,
+)
 
 from ..command import AbstractCommandImpl, BaseCommand, BaseCommandCreate, SuccessData
 from ...errors.error_occurrence import ErrorOccurrence
 
 if TYPE_CHECKING:
     from opentrons.protocol_engine.state.state import StateView
-    from opentrons.protocol_engine.execution import EquipmentHandler
+    from opentrons.protocol_engine.execution import (
+        EquipmentHandler,
+        RunControlHandler,
+    )
     from opentrons.protocol_engine.state.module_substates.thermocycler_module_substate import (
         ThermocyclerModuleSubState,
     )
@@ -107,10 +114,12 @@ class RunExtendedProfileImpl(
         self,
         state_view: StateView,
         equipment: EquipmentHandler,
+        run_control: RunControlHandler,
         **unused_dependencies: object,
     ) -> None:
         self._state_view = state_view
         self._equipment = equipment
+        self._run_control = run_control
 
     async def execute(
         self, params: RunExtendedProfileParams
@@ -141,6 +150,22 @@ class RunExtendedProfileImpl(
             await thermocycler_hardware.execute_profile(
                 profile=profile, volume=target_volume
             )
+        else:
+            steps: List[Tuple[float, float]] = []
+            for element in params.profileElements:
+                if isinstance(element, ProfileStep):
+                    steps.append((element.celsius, element.holdSeconds))
+                else:
+                    steps.extend(
+                        (step.celsius, step.holdSeconds)
+                        for step in element.steps * element.repetitions
+                    )
+            self._run_control.advance_virtual_clock(
+                thermocycler_profile_seconds(
+                    thermocycler_state.target_block_temperature or AMBIENT_TEMPERATURE,
+                    steps,
+                )
+            )
 
         return SuccessData(public=RunExtendedProfileResult(), private=None)
 
@@ -6,13 +6,20 @@ from typing_extensions import Literal, Type
 from pydantic import BaseModel, Field
 
 from opentrons.hardware_control.modules.types import ThermocyclerStep
+from opentrons.hardware_control.virtual_clock import (
+    AMBIENT_TEMPERATURE,
+    thermocycler_profile_seconds,
+)
 
 from ..command import AbstractCommandImpl, BaseCommand, BaseCommandCreate, SuccessData
 from ...errors.error_occurrence import ErrorOccurrence
 
 if TYPE_CHECKING:
     from opentrons.protocol_engine.state.state import StateView
-    from opentrons.protocol_engine.execution import EquipmentHandler
+    from opentrons.protocol_engine.execution import (
+        EquipmentHandler,
+        RunControlHandler,
+    )
 
 
 RunProfileCommandType = Literal["thermocycler/runProfile"]
@@ -55,10 +62,12 @@ class RunProfileImpl(
         self,
         state_view: StateView,
         equipment: EquipmentHandler,
+        run_control: RunControlHandler,
         **unused_dependencies: object,
     ) -> None:
         self._state_view = state_view
         self._equipment = equipment
+        self._run_control = run_control
 
     async def execute(
         self, params: RunProfileParams
@@ -95,6 +104,13 @@ class RunProfileImpl(
             await thermocycler_hardware.cycle_temperatures(
                 steps=steps, repetitions=1, volume=target_volume
             )
+        else:
+            self._run_control.advance_virtual_clock(
+                thermocycler_profile_seconds(
+                    thermocycler_state.target_block_temperature or AMBIENT_TEMPERATURE,
+                    [(step.celsius, step.holdSeconds) for step in params.profile],
+                )
+            )
 
         return SuccessData(public=RunProfileResult(), private=None)
 
@@ -5,12 +5,20 @@ from typing_extensions import Literal, Type
 
 from pydantic import BaseModel, Field
 
+from opentrons.hardware_control.virtual_clock import (
+    AMBIENT_TEMPERATURE,
+    thermocycler_block_ramp_seconds,
+)
+
 from ..command import AbstractCommandImpl, BaseCommand, BaseCommandCreate, SuccessData
 from ...errors.error_occurrence import ErrorOccurrence
 
 if TYPE_CHECKING:
     from opentrons.protocol_engine.state.state import StateView
-    from opentrons.protocol_engine.execution import EquipmentHandler
+    from opentrons.protocol_engine.execution import (
+        EquipmentHandler,
+        RunControlHandler,
+    )
 
 
 SetTargetBlockTemperatureCommandType = Literal["thermocycler/setTargetBlockTemperature"]
@@ -55,10 +63,12 @@ class SetTargetBlockTemperatureImpl(
         self,
         state_view: StateView,
         equipment: EquipmentHandler,
+        run_control: RunControlHandler,
         **unused_dependencies: object,
     ) -> None:
         self._state_view = state_view
         self._equipment = equipment
+        self._run_control = run_control
 
     async def execute(
         self,
@@ -92,6 +102,15 @@ class SetTargetBlockTemperatureImpl(
             await thermocycler_hardware.set_target_block_temperature(
                 target_temperature, volume=target_volume, hold_time_seconds=hold_time
             )
+        else:
+            self._run_control.start_virtual_timer(
+                f"{thermocycler_state.module_id}/block",
+                thermocycler_block_ramp_seconds(
+                    thermocycler_state.target_block_temperature or AMBIENT_TEMPERATURE,
+                    target_temperature,
+                )
+                + (hold_time or 0.0),
+            )
 
         return SuccessData(
             public=SetTargetBlockTemperatureResult(
@@ -5,12 +5,17 @@ from typing_extensions import Literal, Type
 
 from pydantic import BaseModel, Field
 
+from opentrons.hardware_control.virtual_clock import THERMOCYCLER_LID_RAMP_SECONDS
+
 from ..command import AbstractCommandImpl, BaseCommand, BaseCommandCreate, SuccessData
 from ...errors.error_occurrence import ErrorOccurrence
 
 if TYPE_CHECKING:
     from opentrons.protocol_engine.state.state import StateView
-    from opentrons.protocol_engine.execution import EquipmentHandler
+    from opentrons.protocol_engine.execution import (
+        EquipmentHandler,
+        RunControlHandler,
+    )
 
 
 SetTargetLidTemperatureCommandType = Literal["thermocycler/setTargetLidTemperature"]
@@ -43,10 +48,12 @@ class SetTargetLidTemperatureImpl(
         self,
         state_view: StateView,
         equipment: EquipmentHandler,
+        run_control: RunControlHandler,
         **unused_dependencies: object,
     ) -> None:
         self._state_view = state_view
         self._equipment = equipment
+        self._run_control = run_control
 
     async def execute(
         self,
@@ -65,6 +72,10 @@ class SetTargetLidTemperatureImpl(
 
         if thermocycler_hardware is not None:
             await thermocycler_hardware.set_target_lid_temperature(target_temperature)
+        else:
+            self._run_control.start_virtual_timer(
+                f"{thermocycler_state.module_id}/lid", THERMOCYCLER_LID_RAMP_SECONDS
+            )
 
         return SuccessData(
             public=SetTargetLidTemperatureResult(
@@ -10,7 +10,10 @@ from ...errors.error_occurrence import ErrorOccurrence
 
 if TYPE_CHECKING:
     from opentrons.protocol_engine.state.state import StateView
-    from opentrons.protocol_engine.execution import EquipmentHandler
+    from opentrons.protocol_engine.execution import (
+        EquipmentHandler,
+        RunControlHandler,
+    )
 
 
 WaitForLidTemperatureCommandType = Literal["thermocycler/waitForLidTemperature"]
@@ -37,10 +40,12 @@ class WaitForLidTemperatureImpl(
         self,
         state_view: StateView,
         equipment: EquipmentHandler,
+        run_control: RunControlHandler,
         **unused_dependencies: object,
     ) -> None:
         self._state_view = state_view
         self._equipment = equipment
+        self._run_control = run_control
 
     async def execute(
         self,
@@ -60,6 +65,10 @@ class WaitForLidTemperatureImpl(
 
         if thermocycler_hardware is not None:
             await thermocycler_hardware.wait_for_lid_target()
+        else:
+            self._run_control.wait_for_virtual_timer(
+                f"{thermocycler_state.module_id}/lid"
+            )
 
         return SuccessData(public=WaitForLidTemperatureResult(), private=None)
 
@@ -10,7 +10,7 @@ from opentrons.util.async_helpers import async_context_manager_in_thread
 from opentrons_shared_data.robot import load as load_robot
 
 from .protocol_engine import ProtocolEngine
-from .resources import DeckDataProvider, ModuleDataProvider, FileProvider
+from .resources import DeckDataProvider, ModuleDataProvider, FileProvider, ModelUtils
 from .state.config import Config
 from .state.state import StateStore
 from .types import PostRunHardwareState, DeckConfigurationType
@@ -62,10 +62,14 @@ async def create_protocol_engine(
         notify_publishers=notify_publishers,
     )
 
+    # Only analyses, which don't wait, take their timestamps from the virtual clock.
+    virtual_clock = hardware_api.virtual_clock if config.ignore_pause else None
+
     return ProtocolEngine(
         state_store=state_store,
         hardware_api=hardware_api,
         file_provider=file_provider,
+        model_utils=ModelUtils(virtual_clock=virtual_clock),
     )
 
 
@@ -12,6 +12,7 @@ from opentrons_shared_data.errors.exceptions import (
 )
 
 from opentrons.protocol_engine.commands.command import SuccessData
+from opentrons.util.performance_helpers import trace_span
 
 from ..state.state import StateStore
 from ..resources import ModelUtils, FileProvider
@@ -144,9 +145,10 @@ class CommandExecutor:
             f"Executing {running_command.id}, {running_command.commandType}, {running_command.params}"
         )
         try:
-            result = await command_impl.execute(
-                running_command.params  # type: ignore[arg-type]
-            )
+            with trace_span(running_command.commandType, "command"):
+                result = await command_impl.execute(
+                    running_command.params  # type: ignore[arg-type]
+                )
 
         except (Exception, asyncio.CancelledError) as error:
             # The command encountered an undefined error.
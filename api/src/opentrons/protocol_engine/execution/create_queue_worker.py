@@ -6,7 +6,7 @@ from opentrons.protocol_engine.execution.rail_lights import RailLightsHandler
 
 from ..state.state import StateStore
 from ..actions import ActionDispatcher
-from ..resources import FileProvider
+from ..resources import FileProvider, ModelUtils
 from .equipment import EquipmentHandler
 from .movement import MovementHandler
 from .gantry_mover import create_gantry_mover
@@ -25,6 +25,7 @@ def create_queue_worker(
     state_store: StateStore,
     action_dispatcher: ActionDispatcher,
     command_generator: Callable[[], AsyncGenerator[str, None]],
+    model_utils: ModelUtils,
 ) -> QueueWorker:
     """Create a ready-to-use QueueWorker instance.
 
@@ -35,6 +36,7 @@ def create_queue_worker(
         action_dispatcher: ActionDispatcher to pass down to dependencies.
         error_recovery_policy: ErrorRecoveryPolicy to pass down to dependencies.
         command_generator: Command generator to get the next command to execute.
+        model_utils: Provides IDs and timestamps to pass down to dependencies.
     """
     gantry_mover = create_gantry_mover(
         hardware_api=hardware_api,
@@ -72,6 +74,7 @@ def create_queue_worker(
     run_control_handler = RunControlHandler(
         state_store=state_store,
         action_dispatcher=action_dispatcher,
+        virtual_clock=hardware_api.virtual_clock,
     )
     rail_lights_handler = RailLightsHandler(
         hardware_api=hardware_api,
@@ -93,6 +96,7 @@ def create_queue_worker(
         run_control=run_control_handler,
         rail_lights=rail_lights_handler,
         status_bar=status_bar_handler,
+        model_utils=model_utils,
     )
 
     return QueueWorker(
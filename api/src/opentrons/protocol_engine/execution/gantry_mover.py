@@ -5,7 +5,8 @@ from typing_extensions import Protocol as TypingProtocol
 from opentrons.types import Point, Mount
 
 from opentrons.hardware_control import HardwareControlAPI
-from opentrons.hardware_control.types import Axis as HardwareAxis
+from opentrons.hardware_control.types import Axis as HardwareAxis, PathWaypoint
+from opentrons.hardware_control.virtual_clock import VirtualClock
 from opentrons_shared_data.errors.exceptions import PositionUnknownError
 
 from opentrons.motion_planning import Waypoint
@@ -13,6 +14,7 @@ from opentrons.motion_planning import Waypoint
 from ..state.state import StateView
 from ..types import MotorAxis, CurrentWell
 from ..errors import MustHomeError, InvalidAxisForRobotType
+from ..resources.ot3_validation import ensure_ot3_hardware
 
 
 _MOTOR_AXIS_TO_HARDWARE_AXIS: Dict[MotorAxis, HardwareAxis] = {
@@ -140,6 +142,23 @@ class HardwareGantryMover(GantryMover):
 
         hw_mount = self._state_view.pipettes.get_mount(pipette_id).to_hw_mount()
 
+        if len(waypoints) > 1 and self._state_view.config.robot_type == "OT-3 Standard":
+            # Run the whole arc as one blended move instead of stopping at each
+            # waypoint.
+            ot3api = ensure_ot3_hardware(hardware_api=self._hardware_api)
+            await ot3api.move_along_path(
+                mount=hw_mount,
+                waypoints=[
+                    PathWaypoint(
+                        position=waypoint.position,
+                        critical_point=waypoint.critical_point,
+                    )
+                    for waypoint in waypoints
+                ],
+                speed=speed,
+            )
+            return waypoints[-1].position
+
         for waypoint in waypoints:
             await self._hardware_api.move_to(
                 mount=hw_mount,
@@ -230,10 +249,41 @@ class HardwareGantryMover(GantryMover):
 
 
 class VirtualGantryMover(GantryMover):
-    """State store based gantry movement handler for simulation/analysis."""
+    """State store based gantry movement handler for simulation/analysis.
 
-    def __init__(self, state_view: StateView) -> None:
+    If it has a virtual clock, moves advance the clock by how long they would
+    take on the robot.
+    """
+
+    def __init__(
+        self, state_view: StateView, virtual_clock: Optional[VirtualClock] = None
+    ) -> None:
         self._state_view = state_view
+        self._virtual_clock = virtual_clock
+
+    def _advance_virtual_clock(
+        self,
+        pipette_id: str,
+        targets: List[Point],
+        speed: Optional[float],
+    ) -> None:
+        if self._virtual_clock is None:
+            return
+        origin = self._state_view.pipettes.get_deck_point(pipette_id)
+        if origin is None:
+            # The gantry was just homed, so where it is isn't known.
+            return
+        z_axis = HardwareAxis.by_mount(
+            self._state_view.pipettes.get_mount(pipette_id).to_hw_mount()
+        )
+
+        def _axes(point: Point) -> Dict[HardwareAxis, float]:
+            return {HardwareAxis.X: point.x, HardwareAxis.Y: point.y, z_axis: point.z}
+
+        self._virtual_clock.advance_for_path(
+            _axes(Point(x=origin.x, y=origin.y, z=origin.z)),
+            [(_axes(target), speed) for target in targets],
+        )
 
     def motor_axis_to_hardware_axis(self, motor_axis: MotorAxis) -> HardwareAxis:
         """Transform an engine motor axis into a hardware axis."""
@@ -283,6 +333,9 @@ class VirtualGantryMover(GantryMover):
     ) -> Point:
         """Move the hardware gantry to a waypoint. No-op in virtual implementation."""
         assert len(waypoints) > 0, "Must have at least one waypoint"
+        self._advance_virtual_clock(
+            pipette_id, [waypoint.position for waypoint in waypoints], speed
+        )
         return waypoints[-1].position
 
     async def move_relative(
@@ -296,9 +349,10 @@ class VirtualGantryMover(GantryMover):
         Args:
             pipette_id: Pipette ID to get position of for virtual move.
             delta: Relative X/Y/Z distance to move gantry.
-            speed: Not used in virtual implementation.
+            speed: Speed to time the move at, if there is a virtual clock.
         """
         origin = await self.get_position(pipette_id)
+        self._advance_virtual_clock(pipette_id, [origin + delta], speed)
         return origin + delta
 
     async def home(self, axes: Optional[List[MotorAxis]]) -> None:
@@ -321,5 +375,7 @@ def create_gantry_mover(
     return (
         HardwareGantryMover(hardware_api=hardware_api, state_view=state_view)
         if state_view.config.use_virtual_pipettes is False
-        else VirtualGantryMover(state_view=state_view)
+        else VirtualGantryMover(
+            state_view=state_view, virtual_clock=hardware_api.virtual_clock
+        )
     )
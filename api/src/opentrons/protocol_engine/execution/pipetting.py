@@ -4,6 +4,7 @@ from typing_extensions import Protocol as TypingProtocol
 from contextlib import contextmanager
 
 from opentrons.hardware_control import HardwareControlAPI
+from opentrons.hardware_control.virtual_clock import VirtualClock
 
 from ..state.state import StateView
 from ..state.pipettes import HardwarePipette
@@ -228,9 +229,15 @@ class VirtualPipettingHandler(PipettingHandler):
     def __init__(
         self,
         state_view: StateView,
+        virtual_clock: Optional[VirtualClock] = None,
     ) -> None:
-        """Initialize a PipettingHandler instance."""
+        """Initialize a PipettingHandler instance.
+
+        If there is a virtual clock, aspirating and dispensing advance it by
+        how long the plunger takes to move the volume at the flow rate.
+        """
         self._state_view = state_view
+        self._virtual_clock = virtual_clock
 
     def get_is_ready_to_aspirate(self, pipette_id: str) -> bool:
         """Get whether a pipette is ready to aspirate."""
@@ -248,12 +255,14 @@ class VirtualPipettingHandler(PipettingHandler):
     ) -> float:
         """Virtually aspirate (no-op)."""
         self._validate_tip_attached(pipette_id=pipette_id, command_name="aspirate")
-        return _validate_aspirate_volume(
+        validated_volume = _validate_aspirate_volume(
             state_view=self._state_view,
             pipette_id=pipette_id,
             aspirate_volume=volume,
             command_note_adder=command_note_adder,
         )
+        self._advance_virtual_clock(validated_volume, flow_rate)
+        return validated_volume
 
     async def dispense_in_place(
         self,
@@ -269,9 +278,11 @@ class VirtualPipettingHandler(PipettingHandler):
                 "push out value cannot have a negative value."
             )
         self._validate_tip_attached(pipette_id=pipette_id, command_name="dispense")
-        return _validate_dispense_volume(
+        validated_volume = _validate_dispense_volume(
             state_view=self._state_view, pipette_id=pipette_id, dispense_volume=volume
         )
+        self._advance_virtual_clock(validated_volume, flow_rate)
+        return validated_volume
 
     async def blow_out_in_place(
         self,
@@ -299,6 +310,10 @@ class VirtualPipettingHandler(PipettingHandler):
                 f"Cannot perform {command_name} without a tip attached"
             )
 
+    def _advance_virtual_clock(self, volume: float, flow_rate: float) -> None:
+        if self._virtual_clock is not None and flow_rate > 0:
+            self._virtual_clock.advance(volume / flow_rate)
+
 
 def create_pipetting_handler(
     state_view: StateView, hardware_api: HardwareControlAPI
@@ -307,7 +322,9 @@ def create_pipetting_handler(
     return (
         HardwarePipettingHandler(state_view=state_view, hardware_api=hardware_api)
         if state_view.config.use_virtual_pipettes is False
-        else VirtualPipettingHandler(state_view=state_view)
+        else VirtualPipettingHandler(
+            state_view=state_view, virtual_clock=hardware_api.virtual_clock
+        )
     )
 
 
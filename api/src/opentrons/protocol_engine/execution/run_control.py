@@ -1,5 +1,8 @@
 """Run control command side-effect logic."""
 import asyncio
+from typing import Optional
+
+from opentrons.hardware_control.virtual_clock import VirtualClock
 
 from ..state.state import StateStore
 from ..actions import ActionDispatcher, PauseAction, PauseSource
@@ -14,10 +17,12 @@ class RunControlHandler:
         self,
         state_store: StateStore,
         action_dispatcher: ActionDispatcher,
+        virtual_clock: Optional[VirtualClock] = None,
     ) -> None:
         """Initialize a RunControlHandler instance."""
         self._state_store = state_store
         self._action_dispatcher = action_dispatcher
+        self._virtual_clock = virtual_clock
 
     async def wait_for_resume(self) -> None:
         """Issue a PauseAction to the store, pausing the run."""
@@ -31,3 +36,20 @@ class RunControlHandler:
         """Delay protocol execution for a duration."""
         if not self._state_store.config.ignore_pause:
             await asyncio.sleep(seconds)
+        else:
+            self.advance_virtual_clock(seconds)
+
+    def advance_virtual_clock(self, seconds: float) -> None:
+        """Count time that simulated hardware would have spent, if simulating."""
+        if self._virtual_clock is not None:
+            self._virtual_clock.advance(seconds)
+
+    def start_virtual_timer(self, name: str, seconds: float) -> None:
+        """Start a simulated timer, like a module's temperature ramp, if simulating."""
+        if self._virtual_clock is not None:
+            self._virtual_clock.start_timer(name, seconds)
+
+    def wait_for_virtual_timer(self, name: str) -> None:
+        """Count the time left on a simulated timer, if simulating."""
+        if self._virtual_clock is not None:
+            self._virtual_clock.wait_for_timer(name)
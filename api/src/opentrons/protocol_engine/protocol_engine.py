@@ -622,6 +622,7 @@ class ProtocolEngine:
             state_store=self._state_store,
             action_dispatcher=self._action_dispatcher,
             command_generator=command_generator,
+            model_utils=self._model_utils,
         )
         self._queue_worker.start()
 
@@ -3,9 +3,19 @@ from datetime import datetime, timezone
 from uuid import uuid4
 from typing import Optional
 
+from opentrons.hardware_control.virtual_clock import VirtualClock
+
 
 class ModelUtils:
-    """Common resource model utilities provider."""
+    """Common resource model utilities provider.
+
+    Params:
+        virtual_clock: If given, timestamps come from this simulated clock
+            instead of the system clock.
+    """
+
+    def __init__(self, virtual_clock: Optional[VirtualClock] = None) -> None:
+        self._virtual_clock = virtual_clock
 
     @staticmethod
     def generate_id(prefix: str = "") -> str:
@@ -26,7 +36,8 @@ class ModelUtils:
         """
         return maybe_id if maybe_id is not None else ModelUtils.generate_id()
 
-    @staticmethod
-    def get_timestamp() -> datetime:
+    def get_timestamp(self) -> datetime:
         """Get a timestamp of the current time."""
+        if self._virtual_clock is not None:
+            return self._virtual_clock.now()
         return datetime.now(tz=timezone.utc)
@@ -22,6 +22,12 @@ class HandlesActions(ABC):
     """Abstract interface for an object that reacts to actions."""
 
     @abstractmethod
-    def handle_action(self, action: Action) -> None:
-        """React to a state-change action."""
+    def handle_action(self, action: Action) -> bool:
+        """React to a state-change action.
+
+        Returns:
+            Whether this store's state may have changed in reaction to the action.
+            Stores may report `True` conservatively, but must never report `False`
+            if their state did change, since views will not be refreshed.
+        """
         ...
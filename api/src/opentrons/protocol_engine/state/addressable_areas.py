@@ -191,12 +191,12 @@ class AddressableAreaStore(HasState[AddressableAreaState], HandlesActions):
             robot_definition=robot_definition,
         )
 
-    def handle_action(self, action: Action) -> None:
+    def handle_action(self, action: Action) -> bool:
         """Modify state in reaction to an action."""
         if isinstance(action, SucceedCommandAction):
-            self._handle_command(action.command)
+            return self._handle_command(action.command)
         elif isinstance(action, AddAddressableAreaAction):
-            self._check_location_is_addressable_area(action.addressable_area)
+            return self._check_location_is_addressable_area(action.addressable_area)
         elif isinstance(action, SetDeckConfigurationAction):
             current_state = self._state
             if (
@@ -210,28 +210,33 @@ class AddressableAreaStore(HasState[AddressableAreaState], HandlesActions):
                         deck_definition=current_state.deck_definition,
                     )
                 )
+                return True
 
-    def _handle_command(self, command: Command) -> None:
+        return False
+
+    def _handle_command(self, command: Command) -> bool:
         """Modify state in reaction to a command."""
         if isinstance(command.result, LoadLabwareResult):
             location = command.params.location
             if isinstance(location, (DeckSlotLocation, AddressableAreaLocation)):
-                self._check_location_is_addressable_area(location)
+                return self._check_location_is_addressable_area(location)
 
         elif isinstance(command.result, MoveLabwareResult):
             location = command.params.newLocation
             if isinstance(location, (DeckSlotLocation, AddressableAreaLocation)):
-                self._check_location_is_addressable_area(location)
+                return self._check_location_is_addressable_area(location)
 
         elif isinstance(command.result, LoadModuleResult):
-            self._check_location_is_addressable_area(command.params.location)
+            return self._check_location_is_addressable_area(command.params.location)
 
         elif isinstance(
             command.result,
             (MoveToAddressableAreaResult, MoveToAddressableAreaForDropTipResult),
         ):
             addressable_area_name = command.params.addressableAreaName
-            self._check_location_is_addressable_area(addressable_area_name)
+            return self._check_location_is_addressable_area(addressable_area_name)
+
+        return False
 
     @staticmethod
     def _get_addressable_areas_from_deck_configuration(
@@ -262,7 +267,8 @@ class AddressableAreaStore(HasState[AddressableAreaState], HandlesActions):
 
     def _check_location_is_addressable_area(
         self, location: Union[DeckSlotLocation, AddressableAreaLocation, str]
-    ) -> None:
+    ) -> bool:
+        """Load the addressable area for a location, returning whether it was new."""
         if isinstance(location, DeckSlotLocation):
             addressable_area_name = location.slotName.id
         elif isinstance(location, AddressableAreaLocation):
@@ -290,6 +296,9 @@ class AddressableAreaStore(HasState[AddressableAreaState], HandlesActions):
             self._state.loaded_addressable_areas_by_name[
                 addressable_area.area_name
             ] = addressable_area
+            return True
+
+        return False
 
     def _validate_addressable_area_for_simulation(
         self, addressable_area_name: str
@@ -263,7 +263,7 @@ class CommandStore(HasState[CommandState], HandlesActions):
             has_entered_error_recovery=False,
         )
 
-    def handle_action(self, action: Action) -> None:
+    def handle_action(self, action: Action) -> bool:
         """Modify state in reaction to an action."""
         match action:
             case QueueCommandAction():
@@ -291,7 +291,8 @@ class CommandStore(HasState[CommandState], HandlesActions):
             case SetErrorRecoveryPolicyAction():
                 self._handle_set_error_recovery_policy_action(action)
             case _:
-                pass
+                return False
+        return True
 
     def _handle_queue_command_action(self, action: QueueCommandAction) -> None:
         # TODO(mc, 2021-06-22): mypy has trouble with this automatic
@@ -584,6 +585,28 @@ class CommandView(HasState[CommandState]):
         """
         return self._state.command_history.get_all_commands()
 
+    def get_completed_commands_from(self, start_index: int) -> List[Command]:
+        """Get the unbroken run of completed commands starting at the given index.
+
+        A command is completed when its status is `SUCCEEDED` or `FAILED`.
+        The returned list stops just before the first command that is still queued
+        or running, so none of the returned commands will change afterwards.
+
+        Arguments:
+            start_index: Index of the first command to return, in the order of
+                `get_all()`.
+        """
+        command_history = self._state.command_history
+        completed_commands: List[Command] = []
+
+        for command_id in command_history.get_all_ids()[start_index:]:
+            command = command_history.get(command_id).command
+            if command.status not in (CommandStatus.SUCCEEDED, CommandStatus.FAILED):
+                break
+            completed_commands.append(command)
+
+        return completed_commands
+
     def get_slice(
         self, cursor: Optional[int], length: int, include_fixit_commands: bool
     ) -> CommandSlice:
@@ -26,15 +26,20 @@ class FileStore(HasState[FileState], HandlesActions):
         """Initialize a File store and its state."""
         self._state = FileState(file_ids=[])
 
-    def handle_action(self, action: Action) -> None:
+    def handle_action(self, action: Action) -> bool:
         """Modify state in reaction to an action."""
         if isinstance(action, SucceedCommandAction):
-            self._handle_command(action.command)
+            return self._handle_command(action.command)
 
-    def _handle_command(self, command: Command) -> None:
+        return False
+
+    def _handle_command(self, command: Command) -> bool:
         if isinstance(command.result, absorbance_reader.ReadAbsorbanceResult):
             if command.result.fileIds is not None:
                 self._state.file_ids.extend(command.result.fileIds)
+                return True
+
+        return False
 
 
 class FileView(HasState[FileState]):
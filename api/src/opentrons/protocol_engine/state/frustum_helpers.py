@@ -1,7 +1,13 @@
 """Helper functions for liquid-level related calculations inside a given frustum."""
-from typing import List, Tuple
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
 from numpy import pi, iscomplex, roots, real
+from numpy.typing import NDArray
 from math import isclose
+import numpy as np
 
 from ..errors.exceptions import InvalidLiquidHeightFound
 
@@ -282,8 +288,8 @@ def height_at_volume_within_section(
         case ConicalFrustum():
             return _height_from_volume_circular(
                 volume=target_volume_relative,
-                top_radius=(section.bottomDiameter / 2),
-                bottom_radius=(section.topDiameter / 2),
+                top_radius=(section.topDiameter / 2),
+                bottom_radius=(section.bottomDiameter / 2),
                 total_frustum_height=section_height,
             )
         case CuboidalFrustum():
@@ -341,100 +347,312 @@ def volume_at_height_within_section(
             )
 
 
-def _find_volume_in_partial_frustum(
-    sorted_well: List[WellSegment],
-    target_height: float,
-) -> float:
-    """Look through a sorted list of frusta for a target height, and find the volume at that height."""
-    for segment in sorted_well:
-        if segment.bottomHeight < target_height < segment.topHeight:
-            relative_target_height = target_height - segment.bottomHeight
-            section_height = segment.topHeight - segment.bottomHeight
-            return volume_at_height_within_section(
-                section=segment,
-                target_height_relative=relative_target_height,
-                section_height=section_height,
+# Newton's method converges in a handful of iterations from the initial guess;
+# this only bounds the bisection fallback.
+_MAX_SOLVER_ITERATIONS = 60
+_VOLUME_TOLERANCE = 1e-9
+_WELL_PROFILE_CACHE_SIZE = 64
+
+
+def _get_volume_polynomial(
+    segment: WellSegment, section_height: float
+) -> Optional[Tuple[float, float, float]]:
+    """Get the coefficients (a, b, c) of a segment's volume as ax^3 + bx^2 + cx.
+
+    x is the height relative to the bottom of the segment. Returns None for
+    segments whose volume is looked up in a table instead.
+    """
+    match segment:
+        case SphericalSegment():
+            return -pi / 3, pi * segment.radiusOfCurvature, 0.0
+        case CuboidalFrustum():
+            return _rectangular_frustum_polynomial_roots(
+                bottom_length=segment.bottomYDimension,
+                bottom_width=segment.bottomXDimension,
+                top_length=segment.topYDimension,
+                top_width=segment.topXDimension,
+                total_frustum_height=section_height,
             )
-    # if we've looked through all sections and can't find the target volume, raise an error
-    raise InvalidLiquidHeightFound(
-        f"Unable to find volume at given well-height {target_height}."
-    )
+        case ConicalFrustum():
+            return _circular_frustum_polynomial_roots(
+                bottom_radius=(segment.bottomDiameter / 2),
+                top_radius=(segment.topDiameter / 2),
+                total_frustum_height=section_height,
+            )
+        case _:
+            return None
 
 
-def find_volume_at_well_height(
-    target_height: float, well_geometry: InnerWellGeometry
+def _solve_volume_polynomial(
+    a: float, b: float, c: float, volume: float, max_height: float
 ) -> float:
-    """Find the volume within a well, at a known height."""
-    volumetric_capacity = get_well_volumetric_capacity(well_geometry)
-    max_height = volumetric_capacity[-1][0]
-    if target_height < 0 or target_height > max_height:
-        raise InvalidLiquidHeightFound("Invalid target height.")
-    # volumes in volumetric_capacity are relative to each frustum,
-    # so we have to find the volume of all the full sections enclosed
-    # beneath the target height
-    closed_section_volume = 0.0
-    for boundary_height, section_volume in volumetric_capacity:
-        if boundary_height > target_height:
+    """Find the height at which a segment's volume polynomial reaches a volume.
+
+    The polynomial must be increasing between 0 and max_height, as the volume
+    of any segment is.
+    """
+    capacity = ((a * max_height + b) * max_height + c) * max_height
+    height = max_height * volume / capacity if capacity > 0 else 0.0
+    low, high = 0.0, max_height
+    for _ in range(_MAX_SOLVER_ITERATIONS):
+        error = ((a * height + b) * height + c) * height - volume
+        if abs(error) <= _VOLUME_TOLERANCE:
             break
-        closed_section_volume += section_volume
-        # if target height is a boundary cross-section, we already know the volume
-        if target_height == boundary_height:
-            return closed_section_volume
-    # find the section the target height is in and compute the volume
+        if error < 0:
+            low = height
+        else:
+            high = height
+        slope = (3 * a * height + 2 * b) * height + c
+        next_height = height - error / slope if slope > 0 else low
+        # fall back to bisection whenever Newton's method overshoots
+        height = next_height if low < next_height < high else (low + high) / 2
+    return height
 
-    sorted_well = sorted(well_geometry.sections, key=lambda section: section.topHeight)
-    partial_volume = _find_volume_in_partial_frustum(
-        sorted_well=sorted_well,
-        target_height=target_height,
-    )
-    return partial_volume + closed_section_volume
 
+def _solve_volume_polynomials(
+    coefficients: NDArray[np.double],
+    volumes: NDArray[np.double],
+    max_heights: NDArray[np.double],
+) -> NDArray[np.double]:
+    """Vectorized _solve_volume_polynomial, with one row of coefficients per volume."""
+    a, b, c = coefficients[:, 0], coefficients[:, 1], coefficients[:, 2]
+    capacities = ((a * max_heights + b) * max_heights + c) * max_heights
+    safe_capacities = np.where(capacities > 0, capacities, 1.0)
+    heights = np.where(capacities > 0, max_heights * volumes / safe_capacities, 0.0)
+    low = np.zeros_like(heights)
+    high = max_heights.copy()
+    for _ in range(_MAX_SOLVER_ITERATIONS):
+        errors = ((a * heights + b) * heights + c) * heights - volumes
+        unsolved = np.abs(errors) > _VOLUME_TOLERANCE
+        if not unsolved.any():
+            break
+        low = np.where(errors < 0, heights, low)
+        high = np.where(errors > 0, heights, high)
+        slopes = (3 * a * heights + 2 * b) * heights + c
+        safe_slopes = np.where(slopes > 0, slopes, 1.0)
+        next_heights = np.where(slopes > 0, heights - errors / safe_slopes, low)
+        next_heights = np.where(
+            (low < next_heights) & (next_heights < high),
+            next_heights,
+            (low + high) / 2,
+        )
+        heights = np.where(unsolved, next_heights, heights)
+    return heights
+
+
+@dataclass(frozen=True)
+class _WellProfile:
+    """The sections of a well, indexed by the height and volume at their boundaries."""
+
+    sections: List[WellSegment]
+    # each segment's volume polynomial, or None if it is looked up in a table
+    polynomials: List[Optional[Tuple[float, float, float]]]
+    bottom_heights: List[float]
+    top_heights: List[float]
+    # the total volume of all the sections beneath each section, and including it
+    volumes_below: List[float]
+    volumes_through: List[float]
+    # the same as arrays, for batch lookups; polynomial rows are NaN for table segments
+    polynomial_array: NDArray[np.double]
+    bottom_height_array: NDArray[np.double]
+    top_height_array: NDArray[np.double]
+    volumes_below_array: NDArray[np.double]
+    volumes_through_array: NDArray[np.double]
+
+    @classmethod
+    def build(cls, well_geometry: InnerWellGeometry) -> "_WellProfile":
+        sections = sorted(well_geometry.sections, key=lambda section: section.topHeight)
+        capacities = [
+            capacity for _, capacity in get_well_volumetric_capacity(well_geometry)
+        ]
+        polynomials = [
+            _get_volume_polynomial(section, section.topHeight - section.bottomHeight)
+            for section in sections
+        ]
+        volumes_below = []
+        volumes_through = []
+        total_volume = 0.0
+        for capacity in capacities:
+            volumes_below.append(total_volume)
+            total_volume += capacity
+            volumes_through.append(total_volume)
+        bottom_heights = [section.bottomHeight for section in sections]
+        top_heights = [section.topHeight for section in sections]
+        return cls(
+            sections=sections,
+            polynomials=polynomials,
+            bottom_heights=bottom_heights,
+            top_heights=top_heights,
+            volumes_below=volumes_below,
+            volumes_through=volumes_through,
+            polynomial_array=np.array(
+                [
+                    polynomial if polynomial is not None else (np.nan,) * 3
+                    for polynomial in polynomials
+                ],
+                dtype=np.double,
+            ).reshape(-1, 3),
+            bottom_height_array=np.array(bottom_heights, dtype=np.double),
+            top_height_array=np.array(top_heights, dtype=np.double),
+            volumes_below_array=np.array(volumes_below, dtype=np.double),
+            volumes_through_array=np.array(volumes_through, dtype=np.double),
+        )
 
-def _find_height_in_partial_frustum(
-    sorted_well: List[WellSegment],
-    volumetric_capacity: List[Tuple[float, float]],
-    target_volume: float,
-) -> float:
-    """Look through a sorted list of frusta for a target volume, and find the height at that volume."""
-    bottom_section_volume = 0.0
-    for section, capacity in zip(sorted_well, volumetric_capacity):
-        section_top_height, section_volume = capacity
-        if (
-            bottom_section_volume
-            < target_volume
-            < (bottom_section_volume + section_volume)
-        ):
-            relative_target_volume = target_volume - bottom_section_volume
-            section_height = section.topHeight - section.bottomHeight
+    def volume_at_height(self, target_height: float) -> float:
+        if target_height < 0 or target_height > self.top_heights[-1]:
+            raise InvalidLiquidHeightFound("Invalid target height.")
+        index = bisect_left(self.top_heights, target_height)
+        # if target height is a boundary cross-section, we already know the volume
+        if self.top_heights[index] == target_height:
+            return self.volumes_through[index]
+        section = self.sections[index]
+        if not section.bottomHeight < target_height:
+            raise InvalidLiquidHeightFound(
+                f"Unable to find volume at given well-height {target_height}."
+            )
+        relative_target_height = target_height - section.bottomHeight
+        polynomial = self.polynomials[index]
+        if polynomial is None:
+            partial_volume = volume_at_height_within_section(
+                section=section,
+                target_height_relative=relative_target_height,
+                section_height=section.topHeight - section.bottomHeight,
+            )
+        else:
+            a, b, c = polynomial
+            partial_volume = (
+                (a * relative_target_height + b) * relative_target_height + c
+            ) * relative_target_height
+        return partial_volume + self.volumes_below[index]
+
+    def volumes_at_heights(self, target_heights: Sequence[float]) -> List[float]:
+        heights = np.asarray(target_heights, dtype=np.double)
+        if ((heights < 0) | (heights > self.top_heights[-1])).any():
+            raise InvalidLiquidHeightFound("Invalid target height.")
+        indices = np.searchsorted(self.top_height_array, heights, side="left")
+        volumes = self.volumes_through_array[indices]
+        partial = self.top_height_array[indices] != heights
+        if (partial & (self.bottom_height_array[indices] >= heights)).any():
+            raise InvalidLiquidHeightFound(
+                "Unable to find volume at one of the given well-heights."
+            )
+        relative_heights = heights - self.bottom_height_array[indices]
+        polynomials = self.polynomial_array[indices]
+        a, b, c = polynomials[:, 0], polynomials[:, 1], polynomials[:, 2]
+        volumes = np.where(
+            partial,
+            ((a * relative_heights + b) * relative_heights + c) * relative_heights
+            + self.volumes_below_array[indices],
+            volumes,
+        )
+        for i in np.flatnonzero(partial & np.isnan(a)):
+            volumes[i] = self.volume_at_height(float(heights[i]))
+        return [float(volume) for volume in volumes]
+
+    def height_at_volume(self, target_volume: float) -> float:
+        if target_volume < 0 or target_volume > self.volumes_through[-1]:
+            raise InvalidLiquidHeightFound("Invalid target volume.")
+        index = bisect_left(self.volumes_through, target_volume)
+        # if target volume fills a section exactly, we already know the height
+        if self.volumes_through[index] == target_volume:
+            return self.top_heights[index]
+        section = self.sections[index]
+        relative_target_volume = target_volume - self.volumes_below[index]
+        section_height = section.topHeight - section.bottomHeight
+        polynomial = self.polynomials[index]
+        if polynomial is None:
             partial_height = height_at_volume_within_section(
                 section=section,
                 target_volume_relative=relative_target_volume,
                 section_height=section_height,
             )
-            return partial_height + section.bottomHeight
-        # bottom section volume should always be the volume enclosed in the previously
-        # viewed section
-        bottom_section_volume += section_volume
-
-    # if we've looked through all sections and can't find the target volume, raise an error
-    raise InvalidLiquidHeightFound(
-        f"Unable to find height at given volume {target_volume}."
-    )
+        else:
+            partial_height = round(
+                _solve_volume_polynomial(
+                    *polynomial, relative_target_volume, section_height
+                ),
+                4,
+            )
+        return partial_height + section.bottomHeight
+
+    def heights_at_volumes(self, target_volumes: Sequence[float]) -> List[float]:
+        volumes = np.asarray(target_volumes, dtype=np.double)
+        if ((volumes < 0) | (volumes > self.volumes_through[-1])).any():
+            raise InvalidLiquidHeightFound("Invalid target volume.")
+        indices = np.searchsorted(self.volumes_through_array, volumes, side="left")
+        heights = self.top_height_array[indices]
+        partial = self.volumes_through_array[indices] != volumes
+        polynomials = self.polynomial_array[indices]
+        solvable = partial & ~np.isnan(polynomials[:, 0])
+        bottom_heights = self.bottom_height_array[indices[solvable]]
+        heights[solvable] = (
+            np.round(
+                _solve_volume_polynomials(
+                    polynomials[solvable],
+                    volumes[solvable] - self.volumes_below_array[indices[solvable]],
+                    self.top_height_array[indices[solvable]] - bottom_heights,
+                ),
+                4,
+            )
+            + bottom_heights
+        )
+        for i in np.flatnonzero(partial & ~solvable):
+            heights[i] = self.height_at_volume(float(volumes[i]))
+        return [float(height) for height in heights]
+
+
+_well_profiles: "OrderedDict[int, Tuple[InnerWellGeometry, _WellProfile]]" = (
+    OrderedDict()
+)
+_well_profiles_lock = threading.Lock()
+
+
+def _get_well_profile(well_geometry: InnerWellGeometry) -> _WellProfile:
+    """Get the profile of a well, building it the first time a geometry is seen.
+
+    Profiles are cached by the identity of the geometry object, which is expected
+    not to change once it's part of a loaded labware definition.
+    """
+    key = id(well_geometry)
+    with _well_profiles_lock:
+        cached = _well_profiles.get(key)
+        # Holding on to the geometry keeps its ID from being reused while cached.
+        if cached is not None and cached[0] is well_geometry:
+            _well_profiles.move_to_end(key)
+            return cached[1]
+
+    profile = _WellProfile.build(well_geometry)
+    with _well_profiles_lock:
+        _well_profiles[key] = (well_geometry, profile)
+        _well_profiles.move_to_end(key)
+        if len(_well_profiles) > _WELL_PROFILE_CACHE_SIZE:
+            _well_profiles.popitem(last=False)
+    return profile
+
+
+def find_volume_at_well_height(
+    target_height: float, well_geometry: InnerWellGeometry
+) -> float:
+    """Find the volume within a well, at a known height."""
+    return _get_well_profile(well_geometry).volume_at_height(target_height)
+
+
+def find_volumes_at_well_heights(
+    target_heights: Sequence[float], well_geometry: InnerWellGeometry
+) -> List[float]:
+    """Find the volumes within a well at many known heights at once."""
+    return _get_well_profile(well_geometry).volumes_at_heights(target_heights)
 
 
 def find_height_at_well_volume(
     target_volume: float, well_geometry: InnerWellGeometry
 ) -> float:
     """Find the height within a well, at a known volume."""
-    volumetric_capacity = get_well_volumetric_capacity(well_geometry)
-    max_volume = sum(row[1] for row in volumetric_capacity)
-    if target_volume < 0 or target_volume > max_volume:
-        raise InvalidLiquidHeightFound("Invalid target volume.")
+    return _get_well_profile(well_geometry).height_at_volume(target_volume)
 
-    sorted_well = sorted(well_geometry.sections, key=lambda section: section.topHeight)
-    # find the section the target volume is in and compute the height
-    return _find_height_in_partial_frustum(
-        sorted_well=sorted_well,
-        volumetric_capacity=volumetric_capacity,
-        target_volume=target_volume,
-    )
+
+def find_heights_at_well_volumes(
+    target_volumes: Sequence[float], well_geometry: InnerWellGeometry
+) -> List[float]:
+    """Find the heights within a well at many known volumes at once."""
+    return _get_well_profile(well_geometry).heights_at_volumes(target_volumes)
@@ -2,7 +2,18 @@
 import enum
 from numpy import array, dot, double as npdouble
 from numpy.typing import NDArray
-from typing import Optional, List, Tuple, Union, cast, TypeVar, Dict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 from dataclasses import dataclass
 from functools import cached_property
 
@@ -96,6 +107,7 @@ class _AbsoluteRobotExtents:
 
 
 _LabwareLocation = TypeVar("_LabwareLocation", bound=LabwareLocation)
+_CachedT = TypeVar("_CachedT")
 
 
 # TODO(mc, 2021-06-03): continue evaluation of which selectors should go here
@@ -111,8 +123,21 @@ class GeometryView:
         module_view: ModuleView,
         pipette_view: PipetteView,
         addressable_area_view: AddressableAreaView,
+        get_deck_state_version: Optional[Callable[[], int]] = None,
     ) -> None:
-        """Initialize a GeometryView instance."""
+        """Initialize a GeometryView instance.
+
+        Arguments:
+            config: Top-level engine configuration.
+            labware_view: Labware state view.
+            well_view: Well state view.
+            module_view: Module state view.
+            pipette_view: Pipette state view.
+            addressable_area_view: Addressable area state view.
+            get_deck_state_version: Returns a number that changes whenever labware,
+                module, or addressable area state changes. If provided, deck geometry
+                results are memoized until that number changes.
+        """
         self._config = config
         self._labware = labware_view
         self._wells = well_view
@@ -120,6 +145,31 @@ class GeometryView:
         self._pipettes = pipette_view
         self._addressable_areas = addressable_area_view
         self._last_drop_tip_location_spot: Dict[str, _TipDropSection] = {}
+        self._get_deck_state_version = get_deck_state_version
+        self._cache_version: Optional[int] = None
+        self._cache: Dict[Tuple[Hashable, ...], Any] = {}
+
+    def _get_cached(
+        self, key: Tuple[Hashable, ...], compute: Callable[[], _CachedT]
+    ) -> _CachedT:
+        """Get a memoized deck geometry result, computing it if needed.
+
+        Results are dropped as soon as the deck state version changes.
+        """
+        if self._get_deck_state_version is None:
+            return compute()
+
+        version = self._get_deck_state_version()
+        if version != self._cache_version:
+            self._cache.clear()
+            self._cache_version = version
+
+        try:
+            return cast(_CachedT, self._cache[key])
+        except KeyError:
+            result = compute()
+            self._cache[key] = result
+            return result
 
     @cached_property
     def absolute_deck_extents(self) -> _AbsoluteRobotExtents:
@@ -153,6 +203,11 @@ class GeometryView:
 
     def get_all_obstacle_highest_z(self) -> float:
         """Get the highest Z-point across all obstacles that the instruments need to fly over."""
+        return self._get_cached(
+            ("all_obstacle_highest_z",), self._get_all_obstacle_highest_z
+        )
+
+    def _get_all_obstacle_highest_z(self) -> float:
         highest_labware_z = max(
             (
                 self._get_highest_z_from_labware_data(lw_data)
@@ -208,6 +263,14 @@ class GeometryView:
         This height includes the height of any module that occupies the given slot
         even if it wasn't loaded in that slot (e.g., thermocycler).
         """
+        return self._get_cached(
+            ("highest_z_in_slot", slot.slotName),
+            lambda: self._get_highest_z_in_slot(slot),
+        )
+
+    def _get_highest_z_in_slot(
+        self, slot: Union[DeckSlotLocation, StagingSlotLocation]
+    ) -> float:
         slot_item = self.get_slot_item(slot.slotName)
         if isinstance(slot_item, LoadedModule):
             # get height of module + all labware on it
@@ -414,6 +477,12 @@ class GeometryView:
 
     def get_labware_position(self, labware_id: str) -> Point:
         """Get the calibrated origin of the labware."""
+        return self._get_cached(
+            ("labware_position", labware_id),
+            lambda: self._get_labware_position(labware_id),
+        )
+
+    def _get_labware_position(self, labware_id: str) -> Point:
         origin_pos = self.get_labware_origin_position(labware_id)
         cal_offset = self._labware.get_labware_offset_vector(labware_id)
 
@@ -470,6 +539,28 @@ class GeometryView:
         pipette_id: Optional[str] = None,
     ) -> Point:
         """Given relative well location in a labware, get absolute position."""
+        if well_location is None:
+            return self._get_cached(
+                ("well_top_position", labware_id, well_name),
+                lambda: self._get_well_position(labware_id, well_name),
+            )
+
+        return self._get_well_position(
+            labware_id=labware_id,
+            well_name=well_name,
+            well_location=well_location,
+            operation_volume=operation_volume,
+            pipette_id=pipette_id,
+        )
+
+    def _get_well_position(
+        self,
+        labware_id: str,
+        well_name: str,
+        well_location: Optional[WellLocations] = None,
+        operation_volume: Optional[float] = None,
+        pipette_id: Optional[str] = None,
+    ) -> Point:
         labware_pos = self.get_labware_position(labware_id)
         well_def = self._labware.get_well_definition(labware_id, well_name)
         well_depth = well_def.depth
@@ -147,12 +147,13 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
             deck_definition=deck_definition,
         )
 
-    def handle_action(self, action: Action) -> None:
+    def handle_action(self, action: Action) -> bool:
         """Modify state in reaction to an action."""
+        changed = False
         state_update = get_state_update(action)
         if state_update is not None:
-            self._add_loaded_labware(state_update)
-            self._set_labware_location(state_update)
+            changed |= self._add_loaded_labware(state_update)
+            changed |= self._set_labware_location(state_update)
 
         if isinstance(action, AddLabwareOffsetAction):
             labware_offset = LabwareOffset.construct(
@@ -163,6 +164,7 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
                 vector=action.request.vector,
             )
             self._add_labware_offset(labware_offset)
+            changed = True
 
         elif isinstance(action, AddLabwareDefinitionAction):
             uri = uri_from_details(
@@ -171,6 +173,9 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
                 version=action.definition.version,
             )
             self._state.definitions_by_uri[uri] = action.definition
+            changed = True
+
+        return changed
 
     def _add_labware_offset(self, labware_offset: LabwareOffset) -> None:
         """Add a new labware offset to state.
@@ -183,7 +188,7 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
 
         self._state.labware_offsets_by_id[labware_offset.id] = labware_offset
 
-    def _add_loaded_labware(self, state_update: update_types.StateUpdate) -> None:
+    def _add_loaded_labware(self, state_update: update_types.StateUpdate) -> bool:
         loaded_labware_update = state_update.loaded_labware
         if loaded_labware_update != update_types.NO_CHANGE:
             # If the labware load refers to an offset, that offset must actually exist.
@@ -216,8 +221,11 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
                 offsetId=loaded_labware_update.offset_id,
                 displayName=display_name,
             )
+            return True
+
+        return False
 
-    def _set_labware_location(self, state_update: update_types.StateUpdate) -> None:
+    def _set_labware_location(self, state_update: update_types.StateUpdate) -> bool:
         labware_location_update = state_update.labware_location
         if labware_location_update != update_types.NO_CHANGE:
             labware_id = labware_location_update.labware_id
@@ -238,6 +246,10 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
 
                 self._state.labware_by_id[labware_id].location = new_location
 
+            return True
+
+        return False
+
 
 class LabwareView(HasState[LabwareState]):
     """Read-only labware state view."""
@@ -220,10 +220,10 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
         )
         self._robot_type = config.robot_type
 
-    def handle_action(self, action: Action) -> None:
+    def handle_action(self, action: Action) -> bool:
         """Modify state in reaction to an action."""
         if isinstance(action, SucceedCommandAction):
-            self._handle_command(action.command)
+            return self._handle_command(action.command)
 
         elif isinstance(action, AddModuleAction):
             self._add_module_substate(
@@ -240,7 +240,14 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
                 lid_id=action.lid_id,
             )
 
-    def _handle_command(self, command: Command) -> None:
+        else:
+            return False
+
+        return True
+
+    def _handle_command(self, command: Command) -> bool:
+        changed = False
+
         if isinstance(command.result, LoadModuleResult):
             slot_name = command.params.location.slotName
             self._add_module_substate(
@@ -251,6 +258,7 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
                 requested_model=command.params.model,
                 module_live_data=None,
             )
+            changed = True
 
         if isinstance(command.result, CalibrateModuleResult):
             self._update_module_calibration(
@@ -258,6 +266,7 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
                 module_offset=command.result.moduleOffset,
                 location=command.result.location,
             )
+            changed = True
 
         if isinstance(
             command.result,
@@ -271,6 +280,7 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
             ),
         ):
             self._handle_heater_shaker_commands(command)
+            changed = True
 
         if isinstance(
             command.result,
@@ -280,6 +290,7 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
             ),
         ):
             self._handle_temperature_module_commands(command)
+            changed = True
 
         if isinstance(
             command.result,
@@ -293,6 +304,7 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
             ),
         ):
             self._handle_thermocycler_module_commands(command)
+            changed = True
 
         if isinstance(
             command.result,
@@ -304,6 +316,9 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
             ),
         ):
             self._handle_absorbance_reader_commands(command)
+            changed = True
+
+        return changed
 
     def _update_absorbance_reader_lid_id(
         self,
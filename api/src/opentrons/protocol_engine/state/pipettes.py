@@ -139,7 +139,7 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
             liquid_presence_detection_by_id={},
         )
 
-    def handle_action(self, action: Action) -> None:
+    def handle_action(self, action: Action) -> bool:
         """Modify state in reaction to an action."""
         state_update = get_state_update(action)
         if state_update is not None:
@@ -155,6 +155,11 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
         elif isinstance(action, SetPipetteMovementSpeedAction):
             self._state.movement_speed_by_id[action.pipette_id] = action.speed
 
+        else:
+            return False
+
+        return True
+
     def _set_load_pipette(self, state_update: update_types.StateUpdate) -> None:
         if state_update.loaded_pipette != update_types.NO_CHANGE:
             pipette_id = state_update.loaded_pipette.pipette_id
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional, Sequence, TypeVar
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar, cast
 from typing_extensions import ParamSpec
 
 from opentrons_shared_data.deck.types import DeckDefinitionV5
@@ -228,6 +228,12 @@ class StateStore(StateView, ActionHandler):
             self._well_store,
             self._file_store,
         ]
+        self._deck_substores: List[HandlesActions] = [
+            self._addressable_area_store,
+            self._labware_store,
+            self._module_store,
+        ]
+        self._deck_state_version = 0
         self._config = config
         self._change_notifier = change_notifier or ChangeNotifier()
         self._notify_robot_server = notify_publishers
@@ -240,10 +246,14 @@ class StateStore(StateView, ActionHandler):
             action: An action object representing a state change. Will be
                 passed to all substores so they can react accordingly.
         """
+        changed_substores: List[HandlesActions] = []
+
         for substore in self._substores:
-            substore.handle_action(action)
+            if substore.handle_action(action):
+                changed_substores.append(substore)
 
-        self._update_state_views()
+        if changed_substores:
+            self._update_state_views(changed_substores)
 
     async def wait_for(
         self,
@@ -363,6 +373,18 @@ class StateStore(StateView, ActionHandler):
         self._wells = WellView(state.wells)
         self._files = FileView(state.files)
 
+        self._views_by_substore: Dict[HandlesActions, HasState[Any]] = {
+            self._command_store: self._commands,
+            self._pipette_store: self._pipettes,
+            self._addressable_area_store: self._addressable_areas,
+            self._labware_store: self._labware,
+            self._module_store: self._modules,
+            self._liquid_store: self._liquid,
+            self._tip_store: self._tips,
+            self._well_store: self._wells,
+            self._file_store: self._files,
+        }
+
         # Derived states
         self._geometry = GeometryView(
             config=self._config,
@@ -371,6 +393,7 @@ class StateStore(StateView, ActionHandler):
             module_view=self._modules,
             pipette_view=self._pipettes,
             addressable_area_view=self._addressable_areas,
+            get_deck_state_version=self._get_deck_state_version,
         )
         self._motion = MotionView(
             config=self._config,
@@ -381,18 +404,27 @@ class StateStore(StateView, ActionHandler):
             module_view=self._modules,
         )
 
-    def _update_state_views(self) -> None:
-        """Update state view interfaces to use latest underlying values."""
-        next_state = self._get_next_state()
-        self._state = next_state
-        self._commands._state = next_state.commands
-        self._addressable_areas._state = next_state.addressable_areas
-        self._labware._state = next_state.labware
-        self._pipettes._state = next_state.pipettes
-        self._modules._state = next_state.modules
-        self._liquid._state = next_state.liquids
-        self._tips._state = next_state.tips
-        self._wells._state = next_state.wells
+    def _get_deck_state_version(self) -> int:
+        """Get a number that changes whenever labware, module, or area state changes."""
+        return self._deck_state_version
+
+    def _update_state_views(self, changed_substores: List[HandlesActions]) -> None:
+        """Update state view interfaces to use latest underlying values.
+
+        Only the views of substores that reported a change are rewired. Unchanged
+        substore state objects are shared as-is by the next `State` snapshot.
+        Derived views (geometry, motion) read through the base views, so they
+        pick up changes without being rebuilt; the geometry view's memoized
+        results are invalidated by bumping the deck state version.
+        """
+        self._state = self._get_next_state()
+
+        for substore in changed_substores:
+            view = self._views_by_substore[substore]
+            view._state = cast(HasState[Any], substore).state
+            if substore in self._deck_substores:
+                self._deck_state_version += 1
+
         self._change_notifier.notify()
         if self._notify_robot_server is not None:
             self._notify_robot_server()
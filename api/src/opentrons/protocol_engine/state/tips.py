@@ -61,7 +61,7 @@ class TipStore(HasState[TipState], HandlesActions):
             pipette_info_by_pipette_id={},
         )
 
-    def handle_action(self, action: Action) -> None:
+    def handle_action(self, action: Action) -> bool:
         """Modify state in reaction to an action."""
         state_update = get_state_update(action)
         if state_update is not None:
@@ -87,6 +87,11 @@ class TipStore(HasState[TipState], HandlesActions):
                     well_name
                 ] = TipRackWellState.CLEAN
 
+        else:
+            return state_update is not None
+
+        return True
+
     def _handle_succeeded_command(self, command: Command) -> None:
         if (
             isinstance(command.result, LoadLabwareResult)
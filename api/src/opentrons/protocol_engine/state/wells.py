@@ -31,12 +31,16 @@ class WellStore(HasState[WellState], HandlesActions):
         """Initialize a well store and its state."""
         self._state = WellState(measured_liquid_heights={})
 
-    def handle_action(self, action: Action) -> None:
+    def handle_action(self, action: Action) -> bool:
         """Modify state in reaction to an action."""
         if isinstance(action, SucceedCommandAction):
             self._handle_succeeded_command(action.command)
-        if isinstance(action, FailCommandAction):
+        elif isinstance(action, FailCommandAction):
             self._handle_failed_command(action)
+        else:
+            return False
+
+        return True
 
     def _handle_succeeded_command(self, command: Command) -> None:
         if isinstance(command.result, LiquidProbeResult):
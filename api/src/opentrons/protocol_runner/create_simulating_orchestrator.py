@@ -19,10 +19,16 @@ from .protocol_runner import create_protocol_runner, LiveRunner
 
 
 async def create_simulating_orchestrator(
-    robot_type: RobotType, protocol_config: ProtocolConfig
+    robot_type: RobotType,
+    protocol_config: ProtocolConfig,
+    use_virtual_clock: bool = False,
 ) -> RunOrchestrator:
     """Create a RunOrchestrator wired to a simulating HardwareControlAPI.
 
+    With `use_virtual_clock`, the simulator runs on a virtual clock, so each
+    command's timestamps are when it would start and finish on a real robot.
+    Timing moves costs some simulation time, so it's off by default.
+
     Example:
         ```python
         from pathlib import Path
@@ -44,7 +50,7 @@ async def create_simulating_orchestrator(
         ```
     """
     simulating_hardware_api = await _build_hardware_simulator_for_robot_type(
-        robot_type=robot_type
+        robot_type=robot_type, use_virtual_clock=use_virtual_clock
     )
 
     # TODO(mm, 2024-08-06): This home has theoretically been replaced by Protocol Engine
@@ -108,11 +114,16 @@ async def create_simulating_orchestrator(
 
 async def _build_hardware_simulator_for_robot_type(
     robot_type: RobotType,
+    use_virtual_clock: bool,
 ) -> HardwareControlAPI:
     if robot_type == "OT-2 Standard":
-        return await OT2API.build_hardware_simulator()
+        return await OT2API.build_hardware_simulator(
+            use_virtual_clock=use_virtual_clock
+        )
     elif robot_type == "OT-3 Standard":
         # Inline import because OT3API is not present to import on an OT-2 system.
         from opentrons.hardware_control.ot3api import OT3API
 
-        return await OT3API.build_hardware_simulator()
+        return await OT3API.build_hardware_simulator(
+            use_virtual_clock=use_virtual_clock
+        )
@@ -31,6 +31,7 @@ from opentrons.util.broker import Broker
 from .task_queue import TaskQueue
 from .json_file_reader import JsonFileReader
 from .json_translator import JsonTranslator
+from .legacy_command_mapper import LegacyCommandMapper
 from .legacy_context_plugin import LegacyContextPlugin
 from .python_protocol_wrappers import (
     LEGACY_PYTHON_API_VERSION_CUTOFF,
@@ -40,6 +41,7 @@ from .python_protocol_wrappers import (
     PythonProtocolExecutor,
 )
 from ..protocol_engine.errors import ProtocolCommandFailedError
+from ..protocol_engine.resources import ModelUtils
 from ..protocol_engine.types import (
     PostRunHardwareState,
     DeckConfigurationType,
@@ -219,11 +221,19 @@ class PythonAndLegacyRunner(AbstractRunner):
 
         if protocol.api_level < LEGACY_PYTHON_API_VERSION_CUTOFF:
             equipment_broker = Broker[LoadInfo]()
+            virtual_clock = (
+                self._hardware_api.virtual_clock
+                if self._protocol_engine.state_view.config.ignore_pause
+                else None
+            )
             self._protocol_engine.add_plugin(
                 LegacyContextPlugin(
                     engine_loop=asyncio.get_running_loop(),
                     broker=self._broker,
                     equipment_broker=equipment_broker,
+                    legacy_command_mapper=LegacyCommandMapper(
+                        model_utils=ModelUtils(virtual_clock=virtual_clock)
+                    ),
                 )
             )
             self._hardware_api.should_taskify_movement_execution(taskify=True)
@@ -316,6 +316,12 @@ class RunOrchestrator:
         """Get all run commands."""
         return self._protocol_engine.state_view.commands.get_all()
 
+    def get_completed_commands_from(self, start_index: int) -> List[Command]:
+        """Get the unbroken run of completed commands starting at the given index."""
+        return self._protocol_engine.state_view.commands.get_completed_commands_from(
+            start_index=start_index
+        )
+
     def get_command_errors(self) -> List[ErrorOccurrence]:
         """Get all run command errors."""
         return self._protocol_engine.state_view.commands.get_all_errors()
@@ -0,0 +1,66 @@
+"""Warm up a process to simulate protocols."""
+import asyncio
+import logging
+import tempfile
+from pathlib import Path
+from typing import Awaitable, Callable
+
+log = logging.getLogger(__name__)
+
+_WARM_UP_PROTOCOL = """\
+requirements = {{"apiLevel": "2.20", "robotType": "{robot_type}"}}
+
+def run(protocol):
+    {setup}
+    tip_rack = protocol.load_labware("{tip_rack}", "{slot}")
+    plate = protocol.load_labware("nest_96_wellplate_200ul_flat", "{other_slot}")
+    pipette = protocol.load_instrument("{pipette}", "left", tip_racks=[tip_rack])
+    pipette.transfer(10, plate["A1"], plate["B1"])
+"""
+
+_WARM_UP_PROTOCOLS = {
+    "flex.py": _WARM_UP_PROTOCOL.format(
+        robot_type="Flex",
+        setup='protocol.load_trash_bin("A3")',
+        tip_rack="opentrons_flex_96_tiprack_1000ul",
+        pipette="flex_1channel_1000",
+        slot="C1",
+        other_slot="C2",
+    ),
+    "ot2.py": _WARM_UP_PROTOCOL.format(
+        robot_type="OT-2",
+        setup="pass",
+        tip_rack="opentrons_96_tiprack_300ul",
+        pipette="p300_single_gen2",
+        slot="1",
+        other_slot="2",
+    ),
+}
+
+
+def warm_up(simulate: Callable[[Path], Awaitable[object]]) -> None:
+    """Simulate a small protocol for each robot type to fill in-process caches.
+
+    This imports the modules that simulation needs and loads the definitions that
+    almost every protocol uses, so that processes forked afterwards, or the
+    process itself, start simulating with them already loaded.
+
+    Params:
+        simulate: Simulates the protocol file it's given, the way this process
+            will simulate protocols. It runs in its own event loop. Errors are
+            logged and otherwise ignored.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        for name, contents in _WARM_UP_PROTOCOLS.items():
+            protocol_file = Path(directory) / name
+            protocol_file.write_text(contents, encoding="utf-8")
+            try:
+                asyncio.run(_simulate(simulate, protocol_file))
+            except Exception:
+                log.debug("Simulation warm-up failed.", exc_info=True)
+
+
+async def _simulate(
+    simulate: Callable[[Path], Awaitable[object]], protocol_file: Path
+) -> None:
+    await simulate(protocol_file)
@@ -1,5 +1,6 @@
 """Performance helpers for tracking robot activity."""
 
+import contextlib
 import functools
 from pathlib import Path
 
@@ -22,9 +23,12 @@ _UnderlyingFunction = typing.Callable[
 ]
 
 
-_should_track = ff.enable_performance_metrics(
-    RobotTypeEnum.robot_literal_to_enum(robot_configs.load().model)
-)
+def _should_track() -> bool:
+    # Evaluated on first use rather than at import, since the protocol engine
+    # and hardware controller import this module to open spans.
+    return ff.enable_performance_metrics(
+        RobotTypeEnum.robot_literal_to_enum(robot_configs.load().model)
+    )
 
 
 class _StubbedTracker:
@@ -55,6 +59,10 @@ class _StubbedTracker:
 
         return inner_decorator
 
+    def span(self, name: str, category: str) -> typing.ContextManager[None]:
+        """Return a context manager that does nothing."""
+        return contextlib.nullcontext()
+
     def store(self) -> None:
         """Do nothing."""
         pass
@@ -94,7 +102,7 @@ def _get_robot_activity_tracker() -> "SupportsTracking":
     global _robot_activity_tracker
     if _robot_activity_tracker is None:
         _robot_activity_tracker = _package_to_use(
-            get_performance_metrics_data_dir(), _should_track
+            get_performance_metrics_data_dir(), _should_track()
         )
     return _robot_activity_tracker
 
@@ -135,6 +143,18 @@ def _track_a_function(
     return wrapper
 
 
+def trace_span(name: str, category: str) -> typing.ContextManager[None]:
+    """Time the enclosed code as a span, nested under any span already open.
+
+    Does nothing unless performance metrics are enabled.
+
+    Args:
+        name: What the span measures, e.g. a command type.
+        category: The kind of work the span measures, e.g. "command".
+    """
+    return _get_robot_activity_tracker().span(name, category)
+
+
 class TrackingFunctions:
     """A class for tracking functions."""
 
@@ -570,3 +570,125 @@ def test_analyze_json_protocol(
     assert op is not None
     assert len(op["commands"]) == 27
     assert op["result"] == AnalysisResult.OK.value
+
+
+def test_analyze_batch(tmp_path: Path) -> None:
+    """It should analyze each discovered protocol separately and summarize them."""
+    protocols_dir = tmp_path / "protocols"
+    (protocols_dir / "sub").mkdir(parents=True)
+    (protocols_dir / "ok.py").write_text(
+        textwrap.dedent(
+            """
+            requirements = {"apiLevel": "2.15", "robotType": "OT-2"}
+
+            def run(protocol):
+                protocol.comment("hello")
+            """
+        ),
+        encoding="utf-8",
+    )
+    (protocols_dir / "sub" / "broken.py").write_text(
+        textwrap.dedent(
+            """
+            requirements = {"apiLevel": "2.15", "robotType": "OT-2"}
+
+            def run(protocol):
+                raise RuntimeError("oh no")
+            """
+        ),
+        encoding="utf-8",
+    )
+    output_dir = tmp_path / "results"
+
+    result = CliRunner().invoke(
+        analyze,
+        [
+            "--batch-output-dir",
+            str(output_dir),
+            "--jobs",
+            "2",
+            "--check",
+            str(protocols_dir),
+        ],
+    )
+
+    assert result.exit_code != 0
+    ok_result = json.loads((output_dir / "protocols" / "ok.py.json").read_bytes())
+    assert ok_result["result"] == AnalysisResult.OK
+    assert [
+        c["params"]["message"]
+        for c in ok_result["commands"]
+        if c["commandType"] == "comment"
+    ] == ["hello"]
+    broken_result = json.loads(
+        (output_dir / "protocols" / "sub" / "broken.py.json").read_bytes()
+    )
+    assert broken_result["result"] == AnalysisResult.NOT_OK
+
+    summary = json.loads((output_dir / "summary.json").read_bytes())
+    assert [(p["protocol"], p["result"]) for p in summary["protocols"]] == [
+        ("protocols/ok.py", "ok"),
+        ("protocols/sub/broken.py", "not-ok"),
+    ]
+    assert all(p["seconds"] > 0 for p in summary["protocols"])
+
+
+def test_analyze_batch_names(tmp_path: Path) -> None:
+    """It should keep same-named protocols apart and skip helper modules."""
+    protocol = textwrap.dedent(
+        """
+        requirements = {"apiLevel": "2.15", "robotType": "OT-2"}
+
+        def run(protocol):
+            protocol.comment("hello")
+        """
+    )
+    for directory in ("a", "b"):
+        (tmp_path / directory).mkdir()
+        (tmp_path / directory / "protocol.py").write_text(protocol, encoding="utf-8")
+    (tmp_path / "a" / "helpers.py").write_text(
+        "def volume():\n    return 10\n", encoding="utf-8"
+    )
+    output_dir = tmp_path / "results"
+
+    result = CliRunner().invoke(
+        analyze,
+        [
+            "--batch-output-dir",
+            str(output_dir),
+            str(tmp_path / "a"),
+            str(tmp_path / "b" / "protocol.py"),
+        ],
+    )
+
+    assert result.exit_code == 0
+    summary = json.loads((output_dir / "summary.json").read_bytes())
+    assert [(p["protocol"], p["result"]) for p in summary["protocols"]] == [
+        ("a/protocol.py", "ok"),
+        ("b/protocol.py", "ok"),
+    ]
+    assert (output_dir / "a" / "protocol.py.json").exists()
+    assert (output_dir / "b" / "protocol.py.json").exists()
+
+
+def test_analyze_batch_duplicate_names(tmp_path: Path) -> None:
+    """It should refuse to save two protocols' results to the same file."""
+    protocol_file = tmp_path / "protocol.py"
+    protocol_file.write_text(
+        'requirements = {"apiLevel": "2.15"}\n\ndef run(protocol):\n    pass\n',
+        encoding="utf-8",
+    )
+
+    result = CliRunner().invoke(
+        analyze,
+        [
+            "--batch-output-dir",
+            str(tmp_path / "results"),
+            str(protocol_file),
+            str(protocol_file),
+        ],
+    )
+
+    assert result.exit_code != 0
+    assert "protocol.py" in result.output
+    assert not (tmp_path / "results").exists()
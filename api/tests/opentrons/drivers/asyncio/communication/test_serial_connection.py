@@ -1,3 +1,4 @@
+import asyncio
 from typing import Type, Union, AsyncGenerator
 import pytest
 from _pytest.fixtures import SubRequest
@@ -242,3 +243,151 @@ async def test_send_data_with_async_error_after(
             call(response=successful_response),
         ]
     )
+
+
+@pytest.fixture
+async def pipelined_subject(
+    mock_serial_port: AsyncMock, ack: str
+) -> AsyncResponseSerialConnection:
+    """Create an async subject that sends up to 3 commands at once."""
+    return AsyncResponseSerialConnection(
+        serial=mock_serial_port,
+        ack=ack,
+        name="name",
+        port="port",
+        retry_wait_time_seconds=0,
+        error_keyword="err",
+        alarm_keyword="alarm",
+        async_error_ack="async",
+        pipeline_window=3,
+    )
+
+
+async def test_send_data_pipelined(
+    mock_serial_port: AsyncMock,
+    pipelined_subject: AsyncResponseSerialConnection,
+    ack: str,
+) -> None:
+    """It should send concurrent commands together and match responses in order."""
+    mock_serial_port.read_until.side_effect = [
+        f"M105 C:30 {ack}".encode(),
+        f"M123 C:0 {ack}".encode(),
+        f"M241 STATUS:IDLE_OPEN {ack}".encode(),
+        f"M105 C:31 {ack}".encode(),
+    ]
+
+    responses = await asyncio.gather(
+        pipelined_subject.send_data(data="M105\n"),
+        pipelined_subject.send_data(data="M123\n"),
+        pipelined_subject.send_data(data="M241\n"),
+        pipelined_subject.send_data(data="M105\n"),
+    )
+
+    assert list(responses) == [
+        "M105 C:30",
+        "M123 C:0",
+        "M241 STATUS:IDLE_OPEN",
+        "M105 C:31",
+    ]
+    mock_serial_port.write.assert_has_calls(
+        calls=[call(data=b"M105\nM123\nM241\n"), call(data=b"M105\n")]
+    )
+
+
+async def test_send_data_pipelined_error(
+    mock_serial_port: AsyncMock,
+    pipelined_subject: AsyncResponseSerialConnection,
+    ack: str,
+) -> None:
+    """An error response should only fail its own command."""
+    mock_serial_port.read_until.side_effect = [
+        f"M105 C:30 {ack}".encode(),
+        f"ERR003:bad {ack}".encode(),
+    ]
+
+    responses = await asyncio.gather(
+        pipelined_subject.send_data(data="M105\n"),
+        pipelined_subject.send_data(data="M3 S9000\n"),
+        return_exceptions=True,
+    )
+
+    assert responses[0] == "M105 C:30"
+    assert isinstance(responses[1], ErrorResponse)
+
+
+async def test_send_data_pipelined_resync(
+    mock_serial_port: AsyncMock,
+    pipelined_subject: AsyncResponseSerialConnection,
+    ack: str,
+) -> None:
+    """It should reopen and resend after a missing or mismatched response."""
+    mock_serial_port.read_until.side_effect = [
+        f"M123 C:0 {ack}".encode(),
+        f"M105 C:30 {ack}".encode(),
+        f"M123 C:0 {ack}".encode(),
+    ]
+
+    responses = await asyncio.gather(
+        pipelined_subject.send_data(data="M105\n", retries=1),
+        pipelined_subject.send_data(data="M123\n"),
+        return_exceptions=True,
+    )
+
+    assert list(responses) == ["M105 C:30", "M123 C:0"]
+    mock_serial_port.close.assert_called_once()
+    mock_serial_port.open.assert_called_once()
+    mock_serial_port.write.assert_has_calls(
+        calls=[call(data=b"M105\nM123\n"), call(data=b"M105\nM123\n")]
+    )
+
+
+async def test_send_data_pipelined_no_response(
+    mock_serial_port: AsyncMock,
+    pipelined_subject: AsyncResponseSerialConnection,
+) -> None:
+    """It should raise once a pipelined command is out of retries."""
+    mock_serial_port.read_until.side_effect = (b"", b"")
+
+    with pytest.raises(NoResponse):
+        await pipelined_subject.send_data(data="M105\n", retries=1)
+
+
+async def test_send_data_pipelined_resets_buffer(
+    mock_serial_port: AsyncMock,
+    ack: str,
+) -> None:
+    """It should reset the read buffer before each window, if asked to."""
+    subject = AsyncResponseSerialConnection(
+        serial=mock_serial_port,
+        ack=ack,
+        name="name",
+        port="port",
+        retry_wait_time_seconds=0,
+        error_keyword="err",
+        alarm_keyword="alarm",
+        async_error_ack="async",
+        pipeline_window=2,
+        reset_buffer_before_write=True,
+    )
+    mock_serial_port.read_until.side_effect = [
+        f"M105 C:30 {ack}".encode(),
+        f"M123 C:0 {ack}".encode(),
+        f"M241 STATUS:IDLE_OPEN {ack}".encode(),
+    ]
+
+    await asyncio.gather(
+        subject.send_data(data="M105\n"),
+        subject.send_data(data="M123\n"),
+        subject.send_data(data="M241\n"),
+    )
+
+    assert [
+        name for name, _, _ in mock_serial_port.method_calls if name != "read_until"
+    ] == [
+        "timeout_override",
+        "reset_input_buffer",
+        "write",
+        "timeout_override",
+        "reset_input_buffer",
+        "write",
+    ]
@@ -21,6 +21,7 @@ from typing import (
 )
 
 from opentrons.hardware_control.backends.ot3controller import OT3Controller
+from opentrons.hardware_control.backends.types import HWStopCondition
 from opentrons.hardware_control.backends.ot3utils import (
     node_to_axis,
     axis_to_node,
@@ -634,6 +635,40 @@ async def test_gripper_jaw_width(
         assert step.move_type == MoveType.linear
 
 
+async def test_move_path(
+    controller: OT3Controller,
+    mock_move_group_run: mock.AsyncMock,
+    mock_present_devices: None,
+    mock_check_overpressure: None,
+) -> None:
+    """It should run a whole path as one move group."""
+    origin = {Axis.X: 100.0, Axis.Y: 100.0, Axis.Z_L: 50.0}
+    retract = {Axis.X: 100.0, Axis.Y: 100.0, Axis.Z_L: 10.0}
+    traverse = {Axis.X: 200.0, Axis.Y: 150.0, Axis.Z_L: 10.0}
+    descend = {Axis.X: 200.0, Axis.Y: 150.0, Axis.Z_L: 60.0}
+
+    await controller.move_path(
+        origin,
+        [
+            (retract, 100.0, HWStopCondition.none),
+            (retract, 100.0, HWStopCondition.none),
+            (traverse, 100.0, HWStopCondition.none),
+            (descend, 100.0, HWStopCondition.stall),
+        ],
+    )
+
+    mock_move_group_run.assert_called_once()
+    move_groups = mock_move_group_run.call_args[0][0]._move_groups
+    assert len(move_groups) == 1
+    z_steps = [step[NodeId.head_l] for step in move_groups[0]]
+    moving_z_steps = [step for step in z_steps if step.distance_mm != 0]
+    # Each segment keeps its stop condition
+    assert moving_z_steps[0].distance_mm < 0
+    assert moving_z_steps[0].stop_condition == MoveStopCondition.none
+    assert moving_z_steps[-1].distance_mm > 0
+    assert moving_z_steps[-1].stop_condition == MoveStopCondition.stall
+
+
 async def test_get_limit_switches(
     controller: OT3Controller,
     mock_subsystem_manager: SubsystemManager,
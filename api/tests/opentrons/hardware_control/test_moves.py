@@ -433,6 +433,29 @@ async def test_attitude_deck_cal_applied(monkeypatch: pytest.MonkeyPatch) -> Non
     assert round(called_with["Z"], 2) == -30.0
 
 
+async def test_attitude_deck_cal_applied_to_position(hardware_api: API) -> None:
+    """Positions read back after a move should use the current deck calibration."""
+    new_gantry_cal = [[1.0047, -0.0046, 0.0], [0.0011, 1.0038, 0.0], [0.0, 0.0, 1.0]]
+    await hardware_api.home()
+    await hardware_api.move_to(types.Mount.LEFT, types.Point(100, 100, 100))
+
+    hardware_api.set_robot_calibration(
+        RobotCalibration(
+            deck_calibration=DeckCalibration(
+                attitude=new_gantry_cal,
+                source=SourceType.user,
+                status=CalibrationStatus(),
+            )
+        )
+    )
+    await hardware_api.move_to(types.Mount.LEFT, types.Point(50, 60, 70))
+
+    position = await hardware_api.gantry_position(types.Mount.LEFT)
+    assert position.x == pytest.approx(50)
+    assert position.y == pytest.approx(60)
+    assert position.z == pytest.approx(70)
+
+
 async def test_other_mount_retracted(hardware_api: API) -> None:
     await hardware_api.home()
     await hardware_api.move_to(types.Mount.RIGHT, types.Point(0, 0, 0))
@@ -58,6 +58,7 @@ from opentrons.hardware_control.types import (
     EstopState,
     EstopStateNotification,
     TipStateType,
+    PathWaypoint,
 )
 from opentrons.hardware_control.nozzle_manager import NozzleConfigurationType
 from opentrons.hardware_control.errors import InvalidCriticalPoint
@@ -1803,6 +1804,34 @@ async def test_move_expect_stall_flag(
     assert condition == expected
 
 
+async def test_move_along_path(
+    ot3_hardware: ThreadManager[OT3API], mock_backend_move: AsyncMock
+) -> None:
+    """It should move through every waypoint in one backend move."""
+    await ot3_hardware.home()
+    waypoints = [
+        PathWaypoint(position=Point(100, 100, 400)),
+        PathWaypoint(position=Point(200, 150, 400)),
+        PathWaypoint(position=Point(200, 150, 300), expect_stalls=True),
+    ]
+    with patch.object(
+        ot3_hardware._backend,
+        "move_path",
+        AsyncMock(wraps=ot3_hardware._backend.move_path),
+    ) as mock_move_path:
+        await ot3_hardware.move_along_path(Mount.LEFT, waypoints)
+
+    mock_backend_move.assert_not_called()
+    mock_move_path.assert_called_once()
+    _, targets = mock_move_path.call_args[0]
+    assert [stop for _, _, stop in targets] == [
+        HWStopCondition.none,
+        HWStopCondition.none,
+        HWStopCondition.stall,
+    ]
+    assert await ot3_hardware.gantry_position(Mount.LEFT) == Point(200, 150, 300)
+
+
 @pytest.mark.parametrize(
     "mount",
     (
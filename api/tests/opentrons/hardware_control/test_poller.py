@@ -1,9 +1,9 @@
 import asyncio
-from typing import AsyncGenerator
+from typing import AsyncGenerator, List
 
 import pytest
 from decoy import Decoy, matchers
-from opentrons.hardware_control.poller import Poller, Reader
+from opentrons.hardware_control.poller import Poller, Reader, run_reads
 
 
 POLLING_INTERVAL = 0.1
@@ -179,3 +179,96 @@ async def test_poller_cancelled_wait(
 
     await asyncio.sleep(2 * subject.interval)
     assert wait_task_2.done() is True
+
+
+class _CountingReader(Reader):
+    """A reader that counts its reads and can be made idle."""
+
+    def __init__(self) -> None:
+        self.reads = 0
+        self.idle = True
+
+    async def read(self) -> None:
+        self.reads += 1
+
+    def is_idle(self) -> bool:
+        return self.idle
+
+
+async def test_poller_backs_off_while_idle() -> None:
+    """It should poll less often while the reader is idle."""
+    reader = _CountingReader()
+    subject = Poller(
+        reader=reader, interval=POLLING_INTERVAL, idle_interval=8 * POLLING_INTERVAL
+    )
+    await subject.start()
+    await asyncio.sleep(16 * POLLING_INTERVAL)
+    idle_reads = reader.reads
+
+    reader.idle = False
+    await asyncio.sleep(16 * POLLING_INTERVAL)
+    await subject.stop()
+
+    # Idle polls come after 0.2, 0.4, 0.8, 0.8... seconds.
+    assert idle_reads <= 4
+    assert reader.reads - idle_reads >= 12
+
+
+async def test_poller_wait_while_idle() -> None:
+    """A waiter shouldn't have to wait for an idle poller's longer interval."""
+    reader = _CountingReader()
+    subject = Poller(
+        reader=reader, interval=POLLING_INTERVAL, idle_interval=20 * POLLING_INTERVAL
+    )
+    await subject.start()
+    await asyncio.sleep(8 * POLLING_INTERVAL)
+    reads = reader.reads
+
+    await asyncio.wait_for(subject.wait_next_poll(), timeout=2 * POLLING_INTERVAL)
+    await subject.stop()
+
+    assert reader.reads == reads + 1
+
+
+async def test_run_reads_in_order() -> None:
+    """Reads should run one after another, stopping at the first error."""
+    started: List[str] = []
+
+    async def _read(name: str) -> None:
+        started.append(name)
+        await asyncio.sleep(0)
+        if name == "b":
+            raise RuntimeError(name)
+
+    with pytest.raises(RuntimeError, match="b"):
+        await run_reads(lambda: _read("a"), lambda: _read("b"), lambda: _read("c"))
+
+    assert started == ["a", "b"]
+
+
+async def test_run_reads_together() -> None:
+    """Reads should run at once, all finishing before an error is raised."""
+    started: List[str] = []
+    finished: List[str] = []
+    all_started = asyncio.Event()
+
+    async def _read(name: str) -> None:
+        started.append(name)
+        if len(started) == 3:
+            all_started.set()
+        await all_started.wait()
+        if name == "a":
+            raise RuntimeError(name)
+        await asyncio.sleep(0)
+        finished.append(name)
+
+    with pytest.raises(RuntimeError, match="a"):
+        await run_reads(
+            lambda: _read("a"),
+            lambda: _read("b"),
+            lambda: _read("c"),
+            together=True,
+        )
+
+    assert started == ["a", "b", "c"]
+    assert sorted(finished) == ["b", "c"]
@@ -1,6 +1,6 @@
 import asyncio
 import weakref
-from typing import NoReturn, Optional
+from typing import AsyncIterator, List, NoReturn, Optional
 import threading
 
 import pytest
@@ -130,3 +130,78 @@ def test_nonblocking_via_attr() -> None:
     thread_manager._loop.call_soon_threadsafe(wait_event.set)
     thread_manager.managed_thread_ready_blocking()
     thread_manager.clean_up()
+
+
+class Bridged:
+    """Test object for bridging calls into the managed thread."""
+
+    @classmethod
+    async def build(cls, loop: Optional[asyncio.AbstractEventLoop] = None) -> "Bridged":
+        """Build an instance."""
+        return cls(loop)
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """Initialize an instance."""
+        self._loop = loop
+        self.calls: List[str] = []
+
+    async def get_thread(self) -> threading.Thread:
+        """Return the thread this runs in."""
+        self.calls.append("get_thread")
+        return threading.current_thread()
+
+    async def count_to(self, number: int) -> AsyncIterator[int]:
+        """Yield numbers from the thread this runs in."""
+        for i in range(number):
+            yield i
+
+    def get_name(self) -> str:
+        """Return a name, from the calling thread."""
+        return "bridged"
+
+    async def clean_up(self) -> None:
+        """Allows cleanup."""
+        pass
+
+
+async def test_bridges_methods() -> None:
+    """It should run async methods in the managed thread and reuse the bridges."""
+    thread_manager = ThreadManager(Bridged.build)  # type: ignore[type-var]
+    try:
+        assert await thread_manager.get_thread() is thread_manager._thread
+        assert [i async for i in thread_manager.count_to(3)] == [0, 1, 2]
+        assert thread_manager.get_name() == "bridged"
+        assert thread_manager.get_thread is thread_manager.get_thread
+    finally:
+        thread_manager.clean_up()
+
+
+async def test_bridges_instance_attributes_dynamically() -> None:
+    """An attribute set on the managed object should hide its class's method."""
+    thread_manager = ThreadManager(Bridged.build)  # type: ignore[type-var]
+    try:
+        assert await thread_manager.get_thread() is thread_manager._thread
+        current_thread = threading.current_thread()
+
+        async def replacement() -> threading.Thread:
+            return current_thread
+
+        setattr(thread_manager.managed_obj, "get_thread", replacement)
+        assert await thread_manager.get_thread() is current_thread
+    finally:
+        thread_manager.clean_up()
+
+
+async def test_call_batch() -> None:
+    """It should run several calls in the managed thread in one hop."""
+    thread_manager = ThreadManager(Bridged.build)  # type: ignore[type-var]
+
+    async def batch(bridged: Bridged, count: int) -> List[threading.Thread]:
+        return [await bridged.get_thread() for _ in range(count)]
+
+    try:
+        result = await thread_manager.call_batch(batch, 3)
+        assert result == [thread_manager._thread] * 3
+        assert thread_manager.managed_obj.calls == ["get_thread"] * 3  # type: ignore[union-attr]
+    finally:
+        thread_manager.clean_up()
@@ -0,0 +1,148 @@
+"""Tests for the virtual clock used by simulated runs."""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Sequence
+
+import pytest
+
+from opentrons.config.types import GantryLoad
+from opentrons.hardware_control import API
+from opentrons.hardware_control.backends import ot3simulator, ot3utils
+from opentrons.hardware_control.ot3api import OT3API
+from opentrons.hardware_control.types import Axis
+from opentrons.hardware_control.virtual_clock import (
+    PathTarget,
+    VirtualClock,
+    temperature_module_ramp_seconds,
+    thermocycler_block_ramp_seconds,
+    thermocycler_profile_seconds,
+)
+from opentrons.types import Mount, Point
+
+
+def _one_second_per_target(
+    origin: Dict[Axis, float], targets: Sequence[PathTarget]
+) -> float:
+    return float(len(targets))
+
+
+def test_clock_advances() -> None:
+    """The clock only moves when it is advanced, and never backwards."""
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    subject = VirtualClock(_one_second_per_target, start=start)
+    assert subject.now() == start
+
+    subject.advance(1.5)
+    subject.advance(-1)
+    assert subject.elapsed == 1.5
+    assert subject.now() == start + timedelta(seconds=1.5)
+
+    assert subject.advance_for_path({}, [({Axis.X: 1}, None)] * 2) == 2
+    assert subject.elapsed == 3.5
+
+
+def test_clock_timers() -> None:
+    """Waiting for a timer only advances by what is left of it."""
+    subject = VirtualClock(_one_second_per_target)
+    subject.start_timer("block", 10)
+    subject.advance(4)
+    subject.wait_for_timer("block")
+    assert subject.elapsed == 10
+
+    subject.wait_for_timer("block")
+    subject.wait_for_timer("never-started")
+    assert subject.elapsed == 10
+
+    subject.start_timer("lid", 2)
+    subject.advance(5)
+    subject.wait_for_timer("lid")
+    assert subject.elapsed == 15
+
+
+def test_ramp_seconds() -> None:
+    """Ramps add up the time spent in each band of ramp rates."""
+    assert temperature_module_ramp_seconds(25, 37) == pytest.approx(60)
+    assert temperature_module_ramp_seconds(37, 25) == pytest.approx(60)
+    assert temperature_module_ramp_seconds(20, 30) == pytest.approx(5 / 0.0875 + 25)
+    assert thermocycler_block_ramp_seconds(60, 80) == pytest.approx(2.5 + 5)
+    assert thermocycler_block_ramp_seconds(80, 60) == pytest.approx(5 + 10)
+    assert thermocycler_block_ramp_seconds(4, 4) == 0
+    assert thermocycler_profile_seconds(
+        60, [(80, 10), (60, 20), (60, 5)]
+    ) == pytest.approx(7.5 + 10 + 15 + 20 + 5)
+
+
+async def test_ot2_simulator_times_moves() -> None:
+    """An OT-2 simulator with a virtual clock times moves, homes, and delays."""
+    hardware = await API.build_hardware_simulator(
+        loop=asyncio.get_running_loop(), use_virtual_clock=True
+    )
+    clock = hardware.virtual_clock
+    assert clock is not None
+
+    await hardware.home()
+    await hardware.move_to(Mount.RIGHT, Point(100, 100, 150), speed=50)
+    moved = clock.elapsed
+    assert moved > 0
+
+    await hardware.home()
+    homed = clock.elapsed
+    assert homed > moved
+
+    await hardware.delay(30)
+    assert clock.elapsed == pytest.approx(homed + 30)
+
+
+async def test_ot2_simulator_without_clock() -> None:
+    """Simulators don't keep a virtual clock unless asked to."""
+    hardware = await API.build_hardware_simulator(loop=asyncio.get_running_loop())
+    assert hardware.virtual_clock is None
+
+
+@pytest.mark.ot3_only
+async def test_ot3_simulator_times_moves() -> None:
+    """A Flex simulator with a virtual clock times moves from the motion plan."""
+    hardware = await OT3API.build_hardware_simulator(
+        loop=asyncio.get_running_loop(), use_virtual_clock=True
+    )
+    try:
+        clock = hardware.virtual_clock
+        assert clock is not None
+
+        await hardware.home()
+        await hardware.move_to(Mount.LEFT, Point(100, 100, 300), speed=50)
+        moved = clock.elapsed
+        assert moved > 0
+
+        await hardware.move_to(Mount.LEFT, Point(100, 100, 300), speed=50)
+        assert clock.elapsed == pytest.approx(moved)
+
+        await hardware.home()
+        assert clock.elapsed > moved
+    finally:
+        await hardware.clean_up()
+
+
+@pytest.mark.ot3_only
+async def test_ot3_simulator_plans_once_per_gantry_load(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Timing a move shouldn't rebuild the system constraints for it."""
+    built: List[GantryLoad] = []
+    get_system_constraints = ot3utils.get_system_constraints
+
+    def _get_system_constraints(config: Any, gantry_load: GantryLoad) -> Any:
+        built.append(gantry_load)
+        return get_system_constraints(config, gantry_load)
+
+    monkeypatch.setattr(ot3simulator, "get_system_constraints", _get_system_constraints)
+    hardware = await OT3API.build_hardware_simulator(
+        loop=asyncio.get_running_loop(), use_virtual_clock=True
+    )
+    try:
+        await hardware.home()
+        for x in range(100, 150):
+            await hardware.move_to(Mount.LEFT, Point(x, 100, 300), speed=50)
+        assert built == [GantryLoad.LOW_THROUGHPUT]
+    finally:
+        await hardware.clean_up()
@@ -2,13 +2,17 @@
 from decoy import Decoy
 
 from opentrons.hardware_control.modules import TempDeck
+from opentrons.hardware_control.virtual_clock import (
+    AMBIENT_TEMPERATURE,
+    temperature_module_ramp_seconds,
+)
 
 from opentrons.protocol_engine.state.state import StateView
 from opentrons.protocol_engine.state.module_substates import (
     TemperatureModuleSubState,
     TemperatureModuleId,
 )
-from opentrons.protocol_engine.execution import EquipmentHandler
+from opentrons.protocol_engine.execution import EquipmentHandler, RunControlHandler
 from opentrons.protocol_engine.commands import temperature_module
 from opentrons.protocol_engine.commands.command import SuccessData
 from opentrons.protocol_engine.commands.temperature_module.set_target_temperature import (
@@ -20,9 +24,12 @@ async def test_set_target_temperature(
     decoy: Decoy,
     state_view: StateView,
     equipment: EquipmentHandler,
+    run_control: RunControlHandler,
 ) -> None:
     """It should be able to set the specified module's target temperature."""
-    subject = SetTargetTemperatureImpl(state_view=state_view, equipment=equipment)
+    subject = SetTargetTemperatureImpl(
+        state_view=state_view, equipment=equipment, run_control=run_control
+    )
 
     data = temperature_module.SetTargetTemperatureParams(
         moduleId="tempdeck-id",
@@ -54,3 +61,44 @@ async def test_set_target_temperature(
         public=temperature_module.SetTargetTemperatureResult(targetTemperature=1),
         private=None,
     )
+
+
+async def test_set_target_temperature_virtual(
+    decoy: Decoy,
+    state_view: StateView,
+    equipment: EquipmentHandler,
+    run_control: RunControlHandler,
+) -> None:
+    """It should start a virtual timer for the ramp when there is no hardware."""
+    subject = SetTargetTemperatureImpl(
+        state_view=state_view, equipment=equipment, run_control=run_control
+    )
+
+    data = temperature_module.SetTargetTemperatureParams(
+        moduleId="tempdeck-id",
+        celsius=37,
+    )
+
+    module_substate = decoy.mock(cls=TemperatureModuleSubState)
+
+    decoy.when(
+        state_view.modules.get_temperature_module_substate(module_id="tempdeck-id")
+    ).then_return(module_substate)
+    decoy.when(module_substate.module_id).then_return(
+        TemperatureModuleId("tempdeck-id")
+    )
+    decoy.when(module_substate.plate_target_temperature).then_return(None)
+    decoy.when(module_substate.validate_target_temperature(celsius=37)).then_return(37)
+    decoy.when(
+        equipment.get_module_hardware_api(TemperatureModuleId("tempdeck-id"))
+    ).then_return(None)
+
+    await subject.execute(data)
+
+    decoy.verify(
+        run_control.start_virtual_timer(
+            "tempdeck-id",
+            temperature_module_ramp_seconds(AMBIENT_TEMPERATURE, 37),
+        ),
+        times=1,
+    )
@@ -8,7 +8,7 @@ from opentrons.protocol_engine.state.module_substates import (
     TemperatureModuleSubState,
     TemperatureModuleId,
 )
-from opentrons.protocol_engine.execution import EquipmentHandler
+from opentrons.protocol_engine.execution import EquipmentHandler, RunControlHandler
 from opentrons.protocol_engine.commands import temperature_module
 from opentrons.protocol_engine.commands.command import SuccessData
 from opentrons.protocol_engine.commands.temperature_module.wait_for_temperature import (
@@ -20,9 +20,12 @@ async def test_wait_for_temperature(
     decoy: Decoy,
     state_view: StateView,
     equipment: EquipmentHandler,
+    run_control: RunControlHandler,
 ) -> None:
     """It should be able to wait for the module's target temperature."""
-    subject = WaitForTemperatureImpl(state_view=state_view, equipment=equipment)
+    subject = WaitForTemperatureImpl(
+        state_view=state_view, equipment=equipment, run_control=run_control
+    )
 
     data = temperature_module.WaitForTemperatureParams(moduleId="tempdeck-id")
 
@@ -56,9 +59,12 @@ async def test_wait_for_temperature_requested_celsius(
     decoy: Decoy,
     state_view: StateView,
     equipment: EquipmentHandler,
+    run_control: RunControlHandler,
 ) -> None:
     """It should be able to wait for the module's target temperature."""
-    subject = WaitForTemperatureImpl(state_view=state_view, equipment=equipment)
+    subject = WaitForTemperatureImpl(
+        state_view=state_view, equipment=equipment, run_control=run_control
+    )
 
     data = temperature_module.WaitForTemperatureParams(
         moduleId="tempdeck-id", celsius=12.3
@@ -10,7 +10,11 @@ from opentrons.protocol_engine.state.module_substates import (
     ThermocyclerModuleSubState,
     ThermocyclerModuleId,
 )
-from opentrons.protocol_engine.execution import EquipmentHandler, MovementHandler
+from opentrons.protocol_engine.execution import (
+    EquipmentHandler,
+    MovementHandler,
+    RunControlHandler,
+)
 from opentrons.protocol_engine.commands import thermocycler as tc_commands
 from opentrons.protocol_engine.commands.command import SuccessData
 from opentrons.protocol_engine.commands.thermocycler.close_lid import (
@@ -23,10 +27,14 @@ async def test_close_lid(
     state_view: StateView,
     equipment: EquipmentHandler,
     movement: MovementHandler,
+    run_control: RunControlHandler,
 ) -> None:
     """It should be able to close the specified module's lid."""
     subject = CloseLidImpl(
-        state_view=state_view, equipment=equipment, movement=movement
+        state_view=state_view,
+        equipment=equipment,
+        run_control=run_control,
+        movement=movement,
     )
 
     data = tc_commands.CloseLidParams(moduleId="input-thermocycler-id")
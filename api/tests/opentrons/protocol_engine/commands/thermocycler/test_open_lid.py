@@ -10,7 +10,11 @@ from opentrons.protocol_engine.state.module_substates import (
     ThermocyclerModuleSubState,
     ThermocyclerModuleId,
 )
-from opentrons.protocol_engine.execution import EquipmentHandler, MovementHandler
+from opentrons.protocol_engine.execution import (
+    EquipmentHandler,
+    MovementHandler,
+    RunControlHandler,
+)
 from opentrons.protocol_engine.commands import thermocycler as tc_commands
 from opentrons.protocol_engine.commands.command import SuccessData
 from opentrons.protocol_engine.commands.thermocycler.open_lid import (
@@ -23,9 +27,15 @@ async def test_open_lid(
     state_view: StateView,
     equipment: EquipmentHandler,
     movement: MovementHandler,
+    run_control: RunControlHandler,
 ) -> None:
     """It should be able to open the specified module's lid."""
-    subject = OpenLidImpl(state_view=state_view, equipment=equipment, movement=movement)
+    subject = OpenLidImpl(
+        state_view=state_view,
+        equipment=equipment,
+        run_control=run_control,
+        movement=movement,
+    )
 
     data = tc_commands.OpenLidParams(moduleId="input-thermocycler-id")
     expected_module_id = ThermocyclerModuleId("thermocycler-id")
@@ -10,7 +10,7 @@ from opentrons.protocol_engine.state.module_substates import (
     ThermocyclerModuleSubState,
     ThermocyclerModuleId,
 )
-from opentrons.protocol_engine.execution import EquipmentHandler
+from opentrons.protocol_engine.execution import EquipmentHandler, RunControlHandler
 from opentrons.protocol_engine.commands import thermocycler as tc_commands
 from opentrons.protocol_engine.commands.command import SuccessData
 from opentrons.protocol_engine.commands.thermocycler.run_extended_profile import (
@@ -24,9 +24,12 @@ async def test_run_extended_profile(
     decoy: Decoy,
     state_view: StateView,
     equipment: EquipmentHandler,
+    run_control: RunControlHandler,
 ) -> None:
     """It should be able to execute the specified module's profile run."""
-    subject = RunExtendedProfileImpl(state_view=state_view, equipment=equipment)
+    subject = RunExtendedProfileImpl(
+        state_view=state_view, equipment=equipment, run_control=run_control
+    )
 
     step_data: List[Union[ProfileStep, ProfileCycle]] = [
         ProfileStep(celsius=12.3, holdSeconds=45),
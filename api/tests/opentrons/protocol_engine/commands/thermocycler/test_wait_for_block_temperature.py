@@ -8,7 +8,7 @@ from opentrons.protocol_engine.state.module_substates import (
     ThermocyclerModuleSubState,
     ThermocyclerModuleId,
 )
-from opentrons.protocol_engine.execution import EquipmentHandler
+from opentrons.protocol_engine.execution import EquipmentHandler, RunControlHandler
 from opentrons.protocol_engine.commands import thermocycler as tc_commands
 from opentrons.protocol_engine.commands.command import SuccessData
 from opentrons.protocol_engine.commands.thermocycler.wait_for_block_temperature import (
@@ -20,9 +20,12 @@ async def test_set_target_block_temperature(
     decoy: Decoy,
     state_view: StateView,
     equipment: EquipmentHandler,
+    run_control: RunControlHandler,
 ) -> None:
     """It should be able to wait for the specified module's target temperature."""
-    subject = WaitForBlockTemperatureImpl(state_view=state_view, equipment=equipment)
+    subject = WaitForBlockTemperatureImpl(
+        state_view=state_view, equipment=equipment, run_control=run_control
+    )
 
     data = tc_commands.WaitForBlockTemperatureParams(
         moduleId="input-thermocycler-id",
@@ -10,7 +10,9 @@ from opentrons.hardware_control import API as HardwareAPI
 from opentrons.hardware_control.types import (
     CriticalPoint,
     Axis as HardwareAxis,
+    PathWaypoint,
 )
+from opentrons.hardware_control.virtual_clock import VirtualClock
 from opentrons_shared_data.errors.exceptions import PositionUnknownError
 
 from opentrons.motion_planning import Waypoint
@@ -179,6 +181,7 @@ async def test_move_to(
     hardware_subject: HardwareGantryMover,
 ) -> None:
     """It should move the gantry with the hardware API."""
+    decoy.when(mock_state_view.config.robot_type).then_return("OT-2 Standard")
     decoy.when(mock_state_view.pipettes.get_mount("abc123")).then_return(
         MountType.RIGHT
     )
@@ -210,6 +213,55 @@ async def test_move_to(
     )
 
 
+@pytest.mark.ot3_only
+async def test_move_to_on_ot3(
+    decoy: Decoy,
+    ot3_hardware_api: OT3API,
+    mock_state_view: StateView,
+) -> None:
+    """It should move the gantry through all the waypoints as one path on OT3."""
+    subject = HardwareGantryMover(
+        state_view=mock_state_view, hardware_api=ot3_hardware_api
+    )
+    decoy.when(mock_state_view.config.robot_type).then_return("OT-3 Standard")
+    decoy.when(mock_state_view.pipettes.get_mount("abc123")).then_return(
+        MountType.RIGHT
+    )
+
+    result = await subject.move_to(
+        pipette_id="abc123",
+        waypoints=[
+            Waypoint(position=Point(1, 2, 3), critical_point=CriticalPoint.TIP),
+            Waypoint(position=Point(4, 5, 6), critical_point=CriticalPoint.XY_CENTER),
+        ],
+        speed=9001,
+    )
+
+    assert result == Point(4, 5, 6)
+
+    decoy.verify(
+        await ot3_hardware_api.move_along_path(
+            mount=Mount.RIGHT,
+            waypoints=[
+                PathWaypoint(position=Point(1, 2, 3), critical_point=CriticalPoint.TIP),
+                PathWaypoint(
+                    position=Point(4, 5, 6), critical_point=CriticalPoint.XY_CENTER
+                ),
+            ],
+            speed=9001,
+        ),
+    )
+    decoy.verify(
+        await ot3_hardware_api.move_to(
+            mount=Mount.RIGHT,
+            abs_position=Point(4, 5, 6),
+            critical_point=CriticalPoint.XY_CENTER,
+            speed=9001,
+        ),
+        times=0,
+    )
+
+
 async def test_move_relative(
     decoy: Decoy,
     mock_hardware_api: HardwareAPI,
@@ -562,3 +614,39 @@ async def test_virtual_move_to(
     )
 
     assert result == Point(4, 5, 6)
+
+
+async def test_virtual_move_to_virtual_clock(
+    decoy: Decoy, mock_state_view: StateView
+) -> None:
+    """It should time the move on the virtual clock, from the last deck point."""
+    virtual_clock = decoy.mock(cls=VirtualClock)
+    subject = VirtualGantryMover(
+        state_view=mock_state_view, virtual_clock=virtual_clock
+    )
+    decoy.when(mock_state_view.pipettes.get_deck_point("pipette-id")).then_return(
+        DeckPoint(x=1, y=2, z=3)
+    )
+    decoy.when(mock_state_view.pipettes.get_mount("pipette-id")).then_return(
+        MountType.LEFT
+    )
+
+    await subject.move_to(
+        pipette_id="pipette-id",
+        waypoints=[
+            Waypoint(position=Point(1, 2, 30), critical_point=None),
+            Waypoint(position=Point(4, 5, 6), critical_point=None),
+        ],
+        speed=42,
+    )
+
+    decoy.verify(
+        virtual_clock.advance_for_path(
+            {HardwareAxis.X: 1, HardwareAxis.Y: 2, HardwareAxis.Z: 3},
+            [
+                ({HardwareAxis.X: 1, HardwareAxis.Y: 2, HardwareAxis.Z: 30}, 42),
+                ({HardwareAxis.X: 4, HardwareAxis.Y: 5, HardwareAxis.Z: 6}, 42),
+            ],
+        ),
+        times=1,
+    )
@@ -4,6 +4,7 @@ from time import monotonic as time_monotonic
 import pytest
 from decoy import Decoy, matchers
 
+from opentrons.hardware_control.virtual_clock import VirtualClock
 from opentrons.protocol_engine.actions import ActionDispatcher, PauseAction, PauseSource
 from opentrons.protocol_engine.execution.run_control import RunControlHandler
 from opentrons.protocol_engine.state.config import Config
@@ -119,3 +120,22 @@ async def test_wait_for_duration_ignore_pause(
     # NOTE: margin of error selected empirically
     # this is flakey test risk in CI
     assert end - start <= 0.1
+
+
+async def test_wait_for_duration_virtual_clock(
+    decoy: Decoy,
+    mock_state_store: StateStore,
+    mock_action_dispatcher: ActionDispatcher,
+) -> None:
+    """It should advance the virtual clock instead of waiting during analysis."""
+    virtual_clock = decoy.mock(cls=VirtualClock)
+    subject = RunControlHandler(
+        state_store=mock_state_store,
+        action_dispatcher=mock_action_dispatcher,
+        virtual_clock=virtual_clock,
+    )
+    decoy.when(mock_state_store.config).then_return(_make_config(ignore_pause=True))
+
+    await subject.wait_for_duration(seconds=42.0)
+
+    decoy.verify(virtual_clock.advance(42.0), times=1)
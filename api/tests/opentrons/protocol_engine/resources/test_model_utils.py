@@ -1,5 +1,8 @@
 """Simple functional tests for the ModelUtils provider."""
 import re
+from datetime import datetime, timedelta, timezone
+
+from opentrons.hardware_control.virtual_clock import VirtualClock
 from opentrons.protocol_engine.resources import ModelUtils
 
 
@@ -35,3 +38,14 @@ def test_model_utils_ensures_id() -> None:
     assert subject.ensure_id("hello world") == "hello world"
     assert RE_UUID.match(subject.ensure_id())
     assert RE_UUID.match(subject.ensure_id(None))
+
+
+def test_model_utils_timestamp_from_virtual_clock() -> None:
+    """It should read timestamps from a virtual clock when it has one."""
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    virtual_clock = VirtualClock(lambda origin, targets: 0.0, start=start)
+    subject = ModelUtils(virtual_clock=virtual_clock)
+
+    assert subject.get_timestamp() == start
+    virtual_clock.advance(90)
+    assert subject.get_timestamp() == start + timedelta(seconds=90)
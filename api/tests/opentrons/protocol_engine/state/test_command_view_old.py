@@ -148,6 +148,24 @@ def test_get_all() -> None:
     assert subject.get_all() == [command_1, command_2, command_3]
 
 
+def test_get_completed_commands_from() -> None:
+    """It should get the completed commands up to the first unfinished one."""
+    command_1 = create_succeeded_command(command_id="command-id-1")
+    command_2 = create_failed_command(command_id="command-id-2")
+    command_3 = create_running_command(command_id="command-id-3")
+    command_4 = create_succeeded_command(command_id="command-id-4")
+
+    subject = get_command_view(commands=[command_1, command_2, command_3, command_4])
+
+    assert subject.get_completed_commands_from(start_index=0) == [
+        command_1,
+        command_2,
+    ]
+    assert subject.get_completed_commands_from(start_index=1) == [command_2]
+    assert subject.get_completed_commands_from(start_index=2) == []
+    assert subject.get_completed_commands_from(start_index=3) == [command_4]
+
+
 def test_get_next_to_execute_returns_first_queued() -> None:
     """It should return the next queued command ID."""
     subject = get_command_view(
@@ -1003,7 +1021,7 @@ def test_get_slice_default_cursor_failed_command() -> None:
 def test_get_slice_default_cursor_running() -> None:
     """It should select a cursor based on the running command, if present."""
     command_1 = create_succeeded_command(command_id="command-id-1")
-    command_2 = create_succeeded_command(command_id="command-id-2")
+    command_2 = create_failed_command(command_id="command-id-2")
     command_3 = create_running_command(command_id="command-id-3")
     command_4 = create_queued_command(command_id="command-id-4")
     command_5 = create_queued_command(command_id="command-id-5")
@@ -1061,7 +1079,7 @@ def test_get_errors_slice() -> None:
 def test_get_slice_without_fixit() -> None:
     """It should select a cursor based on the running command, if present."""
     command_1 = create_succeeded_command(command_id="command-id-1")
-    command_2 = create_succeeded_command(command_id="command-id-2")
+    command_2 = create_failed_command(command_id="command-id-2")
     command_3 = create_running_command(command_id="command-id-3")
     command_4 = create_queued_command(command_id="command-id-4")
     command_5 = create_queued_command(command_id="command-id-5")
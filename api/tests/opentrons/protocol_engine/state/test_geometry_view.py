@@ -1233,6 +1233,63 @@ def test_get_labware_position(
     )
 
 
+def test_get_labware_position_memoized(
+    decoy: Decoy,
+    well_plate_def: LabwareDefinition,
+    mock_labware_view: LabwareView,
+    mock_well_view: WellView,
+    mock_module_view: ModuleView,
+    mock_pipette_view: PipetteView,
+    mock_addressable_area_view: AddressableAreaView,
+    state_config: Config,
+) -> None:
+    """It should reuse deck geometry results until the deck state version changes."""
+    deck_state_version = 0
+    subject = GeometryView(
+        config=state_config,
+        labware_view=mock_labware_view,
+        well_view=mock_well_view,
+        module_view=mock_module_view,
+        pipette_view=mock_pipette_view,
+        addressable_area_view=mock_addressable_area_view,
+        get_deck_state_version=lambda: deck_state_version,
+    )
+    labware_data = LoadedLabware(
+        id="labware-id",
+        loadName="load-name",
+        definitionUri="definition-uri",
+        location=DeckSlotLocation(slotName=DeckSlotName.SLOT_4),
+        offsetId=None,
+    )
+
+    decoy.when(mock_labware_view.get("labware-id")).then_return(labware_data)
+    decoy.when(mock_labware_view.get_definition("labware-id")).then_return(
+        well_plate_def
+    )
+    decoy.when(mock_labware_view.get_labware_offset_vector("labware-id")).then_return(
+        LabwareOffsetVector(x=0, y=0, z=0)
+    )
+    decoy.when(
+        mock_addressable_area_view.get_addressable_area_position(DeckSlotName.SLOT_4.id)
+    ).then_return(Point(1, 2, 3))
+
+    first = subject.get_labware_position(labware_id="labware-id")
+
+    decoy.when(
+        mock_addressable_area_view.get_addressable_area_position(DeckSlotName.SLOT_4.id)
+    ).then_return(Point(10, 20, 30))
+
+    assert subject.get_labware_position(labware_id="labware-id") == first
+
+    deck_state_version += 1
+
+    assert subject.get_labware_position(labware_id="labware-id") == Point(
+        x=10 + well_plate_def.cornerOffsetFromSlot.x,
+        y=20 + well_plate_def.cornerOffsetFromSlot.y,
+        z=30 + well_plate_def.cornerOffsetFromSlot.z,
+    )
+
+
 def test_get_well_position(
     decoy: Decoy,
     well_plate_def: LabwareDefinition,
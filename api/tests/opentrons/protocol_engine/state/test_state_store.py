@@ -8,7 +8,7 @@ from decoy import Decoy
 from opentrons_shared_data.deck.types import DeckDefinitionV5
 from opentrons.util.change_notifier import ChangeNotifier
 
-from opentrons.protocol_engine.actions import PlayAction
+from opentrons.protocol_engine.actions import PlayAction, SetDeckConfigurationAction
 from opentrons.protocol_engine.state.config import Config
 from opentrons.protocol_engine.state.state import State, StateStore
 from opentrons.protocol_engine.types import DeckType
@@ -91,6 +91,30 @@ def test_notify_on_state_change(
     decoy.verify(change_notifier.notify(), times=1)
 
 
+def test_unchanged_substores_are_shared(subject: StateStore) -> None:
+    """It should reuse the state of substores that did not change."""
+    result_1 = subject.state
+    subject.handle_action(PlayAction(requested_at=datetime(year=2021, month=1, day=1)))
+    result_2 = subject.state
+
+    assert result_1.labware is result_2.labware
+    assert subject.labware.state is result_2.labware
+
+
+def test_no_notify_without_state_change(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    subject: StateStore,
+) -> None:
+    """It should skip view updates and notifications if no substore changed."""
+    result_1 = subject.state
+    subject.handle_action(SetDeckConfigurationAction(deck_configuration=None))
+    result_2 = subject.state
+
+    assert result_1 is result_2
+    decoy.verify(change_notifier.notify(), times=0)
+
+
 async def test_wait_for(
     decoy: Decoy,
     change_notifier: ChangeNotifier,
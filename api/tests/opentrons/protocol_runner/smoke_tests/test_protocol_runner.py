@@ -8,10 +8,13 @@ disk into the runner, and the protocols are run to completion. From
 there, the ProtocolEngine state is inspected to check that
 everything was loaded and run as expected.
 """
+import textwrap
 from datetime import datetime
 from decoy import matchers
 from pathlib import Path
 
+import pytest
+
 from opentrons_shared_data.pipette.types import PipetteNameType
 from opentrons.types import MountType, DeckSlotName
 from opentrons.protocol_engine import (
@@ -381,3 +384,131 @@ async def test_runner_with_python_and_run_time_parameters(
     )
 
     assert expected_command in commands_result
+
+
+async def test_runner_times_commands_on_virtual_clock(tmp_path: Path) -> None:
+    """It should give commands the start and end times the robot would take."""
+    protocol_file = tmp_path / "protocol-name.py"
+    protocol_file.write_text(
+        textwrap.dedent(
+            """
+            metadata = {
+                "apiLevel": "2.14",
+            }
+            def run(ctx):
+                temp_module = ctx.load_module(
+                    module_name="temperature module gen2",
+                    location="3"
+                )
+                temp_module.set_temperature(37)
+                ctx.delay(minutes=2)
+            """
+        )
+    )
+    protocol_source = await ProtocolReader().read_saved(
+        files=[protocol_file],
+        directory=None,
+    )
+
+    subject = await create_simulating_orchestrator(
+        robot_type="OT-2 Standard",
+        protocol_config=protocol_source.config,
+        use_virtual_clock=True,
+    )
+    result = await subject.run(
+        deck_configuration=[],
+        protocol_source=protocol_source,
+        run_time_param_values=None,
+    )
+
+    durations = {
+        command.commandType: (command.completedAt - command.startedAt).total_seconds()
+        for command in result.commands
+        if command.startedAt is not None and command.completedAt is not None
+    }
+    assert durations["temperatureModule/waitForTemperature"] == pytest.approx(60)
+    assert durations["waitForDuration"] == pytest.approx(120)
+
+
+async def test_runner_with_python_command_error_caught(tmp_path: Path) -> None:
+    """A protocol should catch a failed command where it was called."""
+    protocol_file = tmp_path / "protocol-name.py"
+    protocol_file.write_text(
+        textwrap.dedent(
+            """
+            requirements = {"apiLevel": "2.20", "robotType": "OT-2"}
+
+            def run(ctx):
+                heater_shaker = ctx.load_module("heaterShakerModuleV1", "1")
+                heater_shaker.open_labware_latch()
+                try:
+                    heater_shaker.set_and_wait_for_shake_speed(500)
+                except Exception as error:
+                    ctx.comment(f"Caught {type(error).__name__}")
+                heater_shaker.close_labware_latch()
+                heater_shaker.set_and_wait_for_shake_speed(500)
+            """
+        )
+    )
+    protocol_source = await ProtocolReader().read_saved(
+        files=[protocol_file],
+        directory=None,
+    )
+
+    subject = await create_simulating_orchestrator(
+        robot_type="OT-2 Standard", protocol_config=protocol_source.config
+    )
+    result = await subject.run(
+        deck_configuration=[],
+        protocol_source=protocol_source,
+        run_time_param_values=None,
+    )
+
+    assert result.state_summary.errors == []
+    assert [command.commandType for command in result.commands] == [
+        "home",
+        "loadModule",
+        "heaterShaker/openLabwareLatch",
+        "heaterShaker/setAndWaitForShakeSpeed",
+        "comment",
+        "heaterShaker/closeLabwareLatch",
+        "heaterShaker/setAndWaitForShakeSpeed",
+    ]
+
+
+async def test_runner_with_python_command_error_line(tmp_path: Path) -> None:
+    """A failed command's error should give the protocol line that called it."""
+    protocol_file = tmp_path / "protocol-name.py"
+    protocol_file.write_text(
+        textwrap.dedent(
+            """\
+            requirements = {"apiLevel": "2.20", "robotType": "OT-2"}
+
+            def run(ctx):
+                heater_shaker = ctx.load_module("heaterShakerModuleV1", "1")
+                heater_shaker.open_labware_latch()
+                heater_shaker.set_and_wait_for_shake_speed(500)
+                ctx.comment("Not reached")
+            """
+        )
+    )
+    protocol_source = await ProtocolReader().read_saved(
+        files=[protocol_file],
+        directory=None,
+    )
+
+    subject = await create_simulating_orchestrator(
+        robot_type="OT-2 Standard", protocol_config=protocol_source.config
+    )
+    result = await subject.run(
+        deck_configuration=[],
+        protocol_source=protocol_source,
+        run_time_param_values=None,
+    )
+
+    assert [command.commandType for command in result.commands][-1] == (
+        "heaterShaker/setAndWaitForShakeSpeed"
+    )
+    [error] = result.state_summary.errors
+    assert error.errorType == "ExceptionInProtocolError"
+    assert error.detail.startswith("ProtocolCommandFailedError [line 6]:")
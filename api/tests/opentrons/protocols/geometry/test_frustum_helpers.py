@@ -5,6 +5,7 @@ from typing import Any, List
 from opentrons_shared_data.labware.labware_definition import (
     ConicalFrustum,
     CuboidalFrustum,
+    InnerWellGeometry,
     SphericalSegment,
 )
 from opentrons.protocol_engine.state.frustum_helpers import (
@@ -21,6 +22,11 @@ from opentrons.protocol_engine.state.frustum_helpers import (
     _height_from_volume_spherical,
     height_at_volume_within_section,
     _get_segment_capacity,
+    find_height_at_well_volume,
+    find_heights_at_well_volumes,
+    find_volume_at_well_height,
+    find_volumes_at_well_heights,
+    get_well_volumetric_capacity,
 )
 from opentrons.protocol_engine.errors.exceptions import InvalidLiquidHeightFound
 
@@ -338,3 +344,57 @@ def test_height_at_volume_within_section(well: List[Any]) -> None:
             segment, _get_segment_capacity(segment), segment_height
         )
         assert isclose(height, segment_height)
+
+
+@pytest.mark.parametrize("well", fake_frusta())
+def test_find_height_at_well_volume(well: List[Any]) -> None:
+    """Test that heights and volumes within a whole well are each other's inverse."""
+    well_geometry = InnerWellGeometry(sections=well)
+    target_heights = [
+        segment.bottomHeight + (segment.topHeight - segment.bottomHeight) * i / 10
+        for segment in reversed(well)
+        for i in range(1, 11)
+    ]
+
+    volumes = [
+        find_volume_at_well_height(target_height, well_geometry)
+        for target_height in target_heights
+    ]
+    heights = [find_height_at_well_volume(volume, well_geometry) for volume in volumes]
+
+    for height, target_height in zip(heights, target_heights):
+        assert isclose(height, target_height, abs_tol=1e-4)
+    assert find_volumes_at_well_heights(target_heights, well_geometry) == volumes
+    assert find_heights_at_well_volumes(volumes, well_geometry) == heights
+
+
+@pytest.mark.parametrize("well", fake_frusta())
+def test_find_height_at_well_volume_boundaries(well: List[Any]) -> None:
+    """Test heights at the volume of each section boundary, and outside the well."""
+    well_geometry = InnerWellGeometry(sections=well)
+    volumetric_capacity = get_well_volumetric_capacity(well_geometry)
+    boundary_volumes = [
+        sum(capacity for _, capacity in volumetric_capacity[: i + 1])
+        for i in range(len(volumetric_capacity))
+    ]
+    boundary_heights = [height for height, _ in volumetric_capacity]
+
+    assert find_height_at_well_volume(0, well_geometry) == 0
+    assert [
+        find_height_at_well_volume(volume, well_geometry) for volume in boundary_volumes
+    ] == boundary_heights
+    assert (
+        find_heights_at_well_volumes(boundary_volumes, well_geometry)
+        == boundary_heights
+    )
+
+    for invalid_volume in (-1, boundary_volumes[-1] + 1):
+        with pytest.raises(InvalidLiquidHeightFound):
+            find_height_at_well_volume(invalid_volume, well_geometry)
+        with pytest.raises(InvalidLiquidHeightFound):
+            find_heights_at_well_volumes([1, invalid_volume], well_geometry)
+    for invalid_height in (-1, boundary_heights[-1] + 1):
+        with pytest.raises(InvalidLiquidHeightFound):
+            find_volume_at_well_height(invalid_height, well_geometry)
+        with pytest.raises(InvalidLiquidHeightFound):
+            find_volumes_at_well_heights([1, invalid_height], well_geometry)
@@ -22,3 +22,13 @@ def test_singleton_tracker() -> None:
     tracker = _get_robot_activity_tracker()
     tracker2 = _get_robot_activity_tracker()
     assert tracker is tracker2
+
+
+def test_stubbed_span_does_nothing() -> None:
+    """Test that spans from _StubbedTracker run the enclosed code."""
+    tracker = _StubbedTracker(Path("/path/to/storage"), True)
+
+    with tracker.span("home", "command"):
+        ran = True
+
+    assert ran
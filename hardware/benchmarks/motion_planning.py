@@ -0,0 +1,121 @@
+"""Measure motion planning throughput with the per-move and vectorized planners.
+
+A target list is made by moving over a 96 well plate in a zigzag, going up and
+down between wells, with constraints like those of a Flex gantry. For lists of
+1, 10, and 1000 segments, this reports:
+- how long MoveManager.plan_motion takes, planning one move at a time
+- how long it takes with vectorized planning, which plans every move at once
+- the largest difference between the speeds, distances, and times the two plan
+
+Run with:
+    python -m benchmarks.motion_planning
+"""
+import argparse
+import time
+from typing import Callable, List
+
+import numpy as np
+
+from opentrons_hardware.hardware_control.motion_planning import (
+    AxisConstraints,
+    Move,
+    MoveManager,
+    MoveTarget,
+    SystemConstraints,
+)
+
+_SEGMENTS = [1, 10, 1000]
+
+_CONSTRAINTS: SystemConstraints[str] = {
+    "X": AxisConstraints.build(
+        max_acceleration=1000,
+        max_speed_discont=40,
+        max_direction_change_speed_discont=10,
+        max_speed=500,
+    ),
+    "Y": AxisConstraints.build(
+        max_acceleration=1000,
+        max_speed_discont=40,
+        max_direction_change_speed_discont=10,
+        max_speed=500,
+    ),
+    "Z": AxisConstraints.build(
+        max_acceleration=150,
+        max_speed_discont=15,
+        max_direction_change_speed_discont=5,
+        max_speed=65,
+    ),
+}
+
+
+def _targets(segments: int) -> List[MoveTarget[str]]:
+    targets: List[MoveTarget[str]] = []
+    for index in range(segments):
+        well = index // 2 % 96
+        row, column = divmod(well, 12)
+        if row % 2:
+            column = 11 - column
+        z = 100.0 if index % 2 else 10.0
+        targets.append(
+            MoveTarget.build({"X": 10 + 9 * column, "Y": 10 + 9 * row, "Z": z}, 200)
+        )
+    return targets
+
+
+def _time(plan: Callable[[], List[Move[str]]], repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        plan()
+    return (time.perf_counter() - start) / repeats
+
+
+def _difference(first: List[Move[str]], second: List[Move[str]]) -> float:
+    difference = 0.0
+    for a, b in zip(first, second):
+        for block_a, block_b in zip(a.blocks, b.blocks):
+            for field in ("distance", "initial_speed", "final_speed", "time"):
+                difference = max(
+                    difference,
+                    abs(
+                        float(getattr(block_a, field)) - float(getattr(block_b, field))
+                    ),
+                )
+    return difference
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=20,
+        help="Number of times each target list is planned",
+    )
+    args = parser.parse_args()
+
+    origin = {"X": np.float64(0), "Y": np.float64(0), "Z": np.float64(100)}
+    for segments in _SEGMENTS:
+        targets = _targets(segments)
+        planned: List[List[Move[str]]] = []
+        rates: List[float] = []
+        for vectorized in (False, True):
+            manager = MoveManager(constraints=_CONSTRAINTS, vectorized=vectorized)
+
+            def _plan() -> List[Move[str]]:
+                converged, blend_log = manager.plan_motion(origin, targets)
+                assert converged
+                return blend_log[-1]
+
+            planned.append(_plan())
+            rates.append(_time(_plan, args.repeats))
+        print(
+            f"{segments:>5} segments  per-move {rates[0] * 1e3:>8.2f} ms  "
+            f"vectorized {rates[1] * 1e3:>8.2f} ms  "
+            f"speedup {rates[0] / rates[1]:>5.1f}x  "
+            f"max difference {_difference(*planned):.1e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
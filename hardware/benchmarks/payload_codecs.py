@@ -0,0 +1,81 @@
+"""Measure encode and decode throughput of every CAN message payload type.
+
+Each payload is decoded from a zero-filled buffer (padded the way CANFD
+frames are) and then encoded back, repeatedly.
+
+Run with:
+    python -m benchmarks.payload_codecs
+"""
+import argparse
+import inspect
+import time
+from dataclasses import is_dataclass
+from typing import List, Tuple, Type
+
+from opentrons_hardware.firmware_bindings import utils
+from opentrons_hardware.firmware_bindings.messages import payloads
+
+
+def _payload_types() -> List[Type[utils.BinarySerializable]]:
+    return [
+        t
+        for _, t in inspect.getmembers(payloads, inspect.isclass)
+        if is_dataclass(t)
+        and issubclass(t, utils.BinarySerializable)
+        and t.__module__ == payloads.__name__
+    ]
+
+
+def _measure(
+    payload_type: Type[utils.BinarySerializable], iterations: int
+) -> Tuple[float, float]:
+    data = bytes(64)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        payload = payload_type.build(data)
+    decode_rate = iterations / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        payload.serialize()
+    encode_rate = iterations / (time.perf_counter() - start)
+    return decode_rate, encode_rate
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=10000,
+        help="Number of decodes and encodes per payload type",
+    )
+    args = parser.parse_args()
+
+    total_decode = 0.0
+    total_encode = 0.0
+    measured = 0
+    for payload_type in _payload_types():
+        try:
+            decode_rate, encode_rate = _measure(payload_type, args.iterations)
+        except Exception as e:
+            print(f"{payload_type.__name__:<50} skipped: {e}")
+            continue
+        print(
+            f"{payload_type.__name__:<50} "
+            f"decode {decode_rate:>10.0f}/s  encode {encode_rate:>10.0f}/s"
+        )
+        total_decode += decode_rate
+        total_encode += encode_rate
+        measured += 1
+
+    print(
+        f"\n{measured} payload types, mean "
+        f"decode {total_decode / measured:.0f}/s, "
+        f"encode {total_encode / measured:.0f}/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,9 @@ from typing import (
     TypeVar,
     Type,
     Set,
+    Iterable,
+    FrozenSet,
+    NamedTuple,
 )
 
 import logging
@@ -55,6 +58,13 @@ MessageListenerCallbackFilter = Callable[[ArbitrationId], bool]
 """A function used to filter incoming messages. Returns true to accept message."""
 
 
+class _ListenerEntry(NamedTuple):
+    listener: MessageListenerCallback
+    filter: Optional[MessageListenerCallbackFilter]
+    message_ids: Optional[FrozenSet[int]]
+    originating_node_ids: Optional[FrozenSet[int]]
+
+
 _AckResponses = Union[ErrorMessage, Acknowledgement]
 _AckPacket = Tuple[ArbitrationId, _AckResponses]
 _Acks = List[_AckPacket]
@@ -135,12 +145,7 @@ class AcknowledgeListener:
     async def send_and_verify_recieved(self) -> ErrorCode:
         """Send the message and wait for an Ack."""
         try:
-            self._can_messenger.add_listener(
-                self,
-                lambda arbitration_id: bool(
-                    arbitration_id.parts.message_id in _AckIdFilter
-                ),
-            )
+            self._can_messenger.add_listener(self, message_ids=_AckIdFilter)
             self._event.clear()
             if self._exclusive:
                 await self._can_messenger.send_exclusive(self._node_id, self._message)
@@ -186,9 +191,12 @@ class CanMessenger:
             driver: The can bus driver to use.
         """
         self._drive = driver
-        self._listeners: Dict[
-            MessageListenerCallback,
-            Tuple[MessageListenerCallback, Optional[MessageListenerCallbackFilter]],
+        self._listeners: Dict[MessageListenerCallback, _ListenerEntry] = {}
+        # Listeners that only want certain message ids are indexed by those ids
+        # so that dispatch doesn't have to check every registered listener.
+        self._unindexed_listeners: Dict[MessageListenerCallback, _ListenerEntry] = {}
+        self._listeners_by_message_id: Dict[
+            int, Dict[MessageListenerCallback, _ListenerEntry]
         ] = {}
         self._task: Optional[asyncio.Task[None]] = None
         self._access_lock = asyncio.Lock()
@@ -230,8 +238,9 @@ class CanMessenger:
         )
         data = message.payload.serialize()
         log.debug(
-            f"Sending -->\n\tarbitration_id: {arbitration_id},\n\t"
-            f"payload: {message.payload}"
+            "Sending -->\n\tarbitration_id: %s,\n\tpayload: %s",
+            arbitration_id,
+            message.payload,
         )
         try:
             await self._drive.send(
@@ -344,14 +353,75 @@ class CanMessenger:
         self,
         listener: MessageListenerCallback,
         filter: Optional[MessageListenerCallbackFilter] = None,
+        *,
+        message_ids: Optional[Iterable[MessageId]] = None,
+        originating_node_ids: Optional[Iterable[NodeId]] = None,
     ) -> None:
-        """Add a message listener."""
-        self._listeners[listener] = listener, filter
+        """Add a message listener.
+
+        Args:
+            listener: The callback to call with accepted messages.
+            filter: Optional function to accept or reject each message.
+            message_ids: If specified, only messages with these ids are
+                delivered. Unlike an equivalent filter, these are indexed,
+                so other messages cost this listener nothing.
+            originating_node_ids: If specified, only messages from these
+                nodes are delivered.
+        """
+        self.remove_listener(listener)
+        entry = _ListenerEntry(
+            listener=listener,
+            filter=filter,
+            message_ids=frozenset(message_ids) if message_ids is not None else None,
+            originating_node_ids=(
+                frozenset(originating_node_ids)
+                if originating_node_ids is not None
+                else None
+            ),
+        )
+        self._listeners[listener] = entry
+        if entry.message_ids is None:
+            self._unindexed_listeners[listener] = entry
+        else:
+            for message_id in entry.message_ids:
+                self._listeners_by_message_id.setdefault(message_id, {})[
+                    listener
+                ] = entry
 
     def remove_listener(self, listener: MessageListenerCallback) -> None:
         """Remove a message listener."""
-        if listener in self._listeners:
-            self._listeners.pop(listener)
+        entry = self._listeners.pop(listener, None)
+        if entry is None:
+            return
+        if entry.message_ids is None:
+            self._unindexed_listeners.pop(listener)
+        else:
+            for message_id in entry.message_ids:
+                indexed = self._listeners_by_message_id[message_id]
+                indexed.pop(listener)
+                if not indexed:
+                    del self._listeners_by_message_id[message_id]
+
+    def _listeners_for(
+        self, arbitration_id: ArbitrationId
+    ) -> List[MessageListenerCallback]:
+        """Get the listeners that accept a message with this arbitration id."""
+        indexed = self._listeners_by_message_id.get(arbitration_id.parts.message_id)
+        entries = (
+            [*self._unindexed_listeners.values(), *indexed.values()]
+            if indexed
+            else self._unindexed_listeners.values()
+        )
+        return [
+            entry.listener
+            for entry in entries
+            if (
+                entry.originating_node_ids is None
+                or arbitration_id.parts.originating_node_id
+                in entry.originating_node_ids
+            )
+            and (entry.filter is None or entry.filter(arbitration_id))
+        ]
 
     async def _read_task_shield(self) -> None:
         while True:
@@ -366,30 +436,27 @@ class CanMessenger:
     async def _read_task(self) -> None:
         """Read task."""
         async for message in self._drive:
-            message_definition = get_definition(
-                MessageId(message.arbitration_id.parts.message_id)
-            )
+            message_definition = get_definition(message.arbitration_id.parts.message_id)
             if message_definition:
                 try:
                     build = message_definition.payload_type.build(message.data)
                     log.debug(
-                        f"Received <--\n\tarbitration_id: {message.arbitration_id},\n\t"
-                        f"payload: {build}"
+                        "Received <--\n\tarbitration_id: %s,\n\tpayload: %s",
+                        message.arbitration_id,
+                        build,
                     )
-                    handled = False
-                    for listener, filter in self._listeners.values():
-                        if filter and not filter(message.arbitration_id):
-                            continue
-                        listener(message_definition(payload=build), message.arbitration_id)  # type: ignore[arg-type]
-                        handled = True
-                    if not handled:
-                        if (
-                            message.arbitration_id.parts.message_id
-                            == MessageId.error_message
-                        ):
-                            log.error(f"Asynchronous error message ignored: {message}")
-                        else:
-                            log.info(f"Message ignored: {message}")
+                    listeners = self._listeners_for(message.arbitration_id)
+                    if listeners:
+                        received = message_definition(payload=build)  # type: ignore[arg-type]
+                        for listener in listeners:
+                            listener(received, message.arbitration_id)
+                    elif (
+                        message.arbitration_id.parts.message_id
+                        == MessageId.error_message
+                    ):
+                        log.error("Asynchronous error message ignored: %s", message)
+                    else:
+                        log.info("Message ignored: %s", message)
                 except BinarySerializableException:
                     log.exception(f"Failed to build from {message}")
             else:
@@ -1,11 +1,9 @@
 """Message types."""
-from functools import lru_cache
-from typing import Union, Optional, Type
+from typing import Dict, Union, Optional, Type
 
 from typing_extensions import get_args
 
 from . import message_definitions as defs
-from ..constants import MessageId
 
 MessageDefinition = Union[
     defs.Acknowledgement,
@@ -117,20 +115,24 @@ MessageDefinition = Union[
 ]
 
 
-@lru_cache(maxsize=None)
-def get_definition(message_id: MessageId) -> Optional[Type[MessageDefinition]]:
+def _build_definitions_by_id() -> Dict[int, Type[MessageDefinition]]:
+    definitions: Dict[int, Type[MessageDefinition]] = {}
+    for i in get_args(MessageDefinition):
+        # If two definitions share an id, the first one listed wins.
+        definitions.setdefault(i.message_id, i)
+    return definitions
+
+
+_definitions_by_id = _build_definitions_by_id()
+
+
+def get_definition(message_id: int) -> Optional[Type[MessageDefinition]]:
     """Get the message type for a message id.
 
     Args:
-        message_id: A message id
+        message_id: A message id, either a MessageId or its raw value.
 
     Returns: The message definition for a type
 
     """
-    # Dumb linear search, but the result is memoized.
-    for i in get_args(MessageDefinition):
-        if i.message_id == message_id:
-            # get args returns Tuple[Any...]
-            return i  # type: ignore[no-any-return]
-
-    return None
+    return _definitions_by_id.get(message_id)
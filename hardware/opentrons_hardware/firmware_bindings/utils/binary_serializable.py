@@ -2,8 +2,19 @@
 
 from __future__ import annotations
 import struct
-from dataclasses import dataclass, fields, astuple
-from typing import TypeVar, Generic, Type, Optional, Dict, Any, Sequence
+from dataclasses import dataclass, fields
+from typing import (
+    TypeVar,
+    Generic,
+    Type,
+    Optional,
+    Dict,
+    Any,
+    Sequence,
+    Tuple,
+    Callable,
+    NamedTuple,
+)
 
 from opentrons_shared_data.errors.exceptions import (
     InternalMessageFormatError,
@@ -166,6 +177,18 @@ class Int8Field(IntFieldBase):
     FORMAT = "b"
 
 
+class _Codec(NamedTuple):
+    """The compiled struct and field tables of a BinarySerializable class."""
+
+    struct: struct.Struct
+    names: Tuple[str, ...]
+    """Names of all fields, in packing order."""
+    init_fields: Tuple[Tuple[int, str, Callable[[Any], Any]], ...]
+    """Position, name and builder of each field passed to the constructor."""
+    message_index: Optional[Tuple[int, Callable[[Any], Any]]]
+    """Position and builder of the message_index field, if present."""
+
+
 @dataclass
 class BinarySerializable:
     """Base class of a dataclass that can be serialized/deserialized into bytes.
@@ -185,10 +208,9 @@ class BinarySerializable:
         Returns:
             Byte buffer
         """
-        string = self._get_format_string()
-        vals = [x.value for x in astuple(self)]
+        codec = self._get_codec()
         try:
-            return struct.pack(string, *vals)
+            return codec.struct.pack(*(getattr(self, n).value for n in codec.names))
         except struct.error as e:
             raise SerializationException(e)
 
@@ -209,32 +231,58 @@ class BinarySerializable:
         Returns:
             cls
         """
+        codec = cls._get_codec()
         try:
-            format_string = cls._get_format_string()
-            size = cls.get_size()
             # ignore bytes beyond the size of message.
-            b = struct.unpack(format_string, data[:size])
-            # we have to do message index special until we update to python 3.10 since we can't make it a kw_only arg
-            # 3.10 has an updated dataclass field option that will make this go away, see payloads.py
-            args = {
-                v.name: v.type.build(b[i])
-                for i, v in enumerate(fields(cls))
-                if not (v.name == "message_index")
-            }
-            message_index = next(
-                (
-                    v.type.build(b[i])
-                    for i, v in enumerate(fields(cls))
-                    if v.name == "message_index"
-                ),
-                None,
-            )
-            ret_instance = cls(**args)
-            if message_index is not None:
-                ret_instance.message_index = message_index  # type: ignore[attr-defined]
-            return ret_instance
+            b = codec.struct.unpack_from(data)
         except struct.error as e:
             raise InvalidFieldException("Bad data for field", data, e)
+        ret_instance = cls(
+            **{name: build(b[i]) for i, name, build in codec.init_fields}
+        )
+        if codec.message_index is not None:
+            i, build = codec.message_index
+            ret_instance.message_index = build(b[i])  # type: ignore[attr-defined]
+        return ret_instance
+
+    @classmethod
+    def _get_codec(cls) -> _Codec:
+        """Get the compiled codec of this class, compiling it on first use.
+
+        The codec is stored on each class itself rather than inherited, since
+        a subclass adds fields to its parent's.
+        """
+        codec: Optional[_Codec] = cls.__dict__.get("_codec")
+        if codec is None:
+            codec = cls._compile_codec()
+            setattr(cls, "_codec", codec)
+        return codec
+
+    @classmethod
+    def _compile_codec(cls) -> _Codec:
+        dataclass_fields = fields(cls)
+        struct_codec = struct.Struct(cls._get_format_string())
+        # we have to do message index special until we update to python 3.10 since we can't make it a kw_only arg
+        # 3.10 has an updated dataclass field option that will make this go away, see payloads.py
+        init_fields = tuple(
+            (i, v.name, v.type.build)
+            for i, v in enumerate(dataclass_fields)
+            if v.name != "message_index"
+        )
+        message_index = next(
+            (
+                (i, v.type.build)
+                for i, v in enumerate(dataclass_fields)
+                if v.name == "message_index"
+            ),
+            None,
+        )
+        return _Codec(
+            struct=struct_codec,
+            names=tuple(v.name for v in dataclass_fields),
+            init_fields=init_fields,
+            message_index=message_index,
+        )
 
     @classmethod
     def _get_format_string(cls) -> str:
@@ -258,7 +306,7 @@ class BinarySerializable:
     @classmethod
     def get_size(cls) -> int:
         """Get the size of the serializable in bytes."""
-        return struct.calcsize(cls._get_format_string())
+        return cls._get_codec().struct.size
 
 
 class LittleEndianMixIn:
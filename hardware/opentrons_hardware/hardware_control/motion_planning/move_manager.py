@@ -1,7 +1,7 @@
 """Move manager."""
 import logging
 from typing import List, Tuple, Generic
-from opentrons_hardware.hardware_control.motion_planning import move_utils
+from opentrons_hardware.hardware_control.motion_planning import move_utils, vectorized
 from opentrons_hardware.hardware_control.motion_planning.types import (
     Coordinates,
     Move,
@@ -17,13 +17,18 @@ log = logging.getLogger(__name__)
 class MoveManager(Generic[AxisKey]):
     """A manager that handles a list of moves for the hardware control system."""
 
-    def __init__(self, constraints: SystemConstraints[AxisKey]) -> None:
+    def __init__(
+        self, constraints: SystemConstraints[AxisKey], vectorized: bool = False
+    ) -> None:
         """Constructor.
 
         Args:
             constraints: system contraints
+            vectorized: plan all the moves of a target list at once with array
+                math, which is faster for long target lists
         """
         self._constraints = constraints
+        self._vectorized = vectorized
         self._blend_log: List[List[Move[AxisKey]]] = []
 
     def update_constraints(self, constraints: SystemConstraints[AxisKey]) -> None:
@@ -64,6 +69,11 @@ class MoveManager(Generic[AxisKey]):
         iteration_limit: int = 10,
     ) -> Tuple[bool, List[List[Move[AxisKey]]]]:
         """Create and blend moves from targets."""
+        if self._vectorized:
+            converged, self._blend_log = vectorized.plan_motion(
+                origin, target_list, self._constraints, iteration_limit
+            )
+            return converged, self._blend_log
         self._clear_blend_log()
         to_blend = self._get_initial_moves_from_targets(origin, target_list)
         assert to_blend, "Check target list"
@@ -0,0 +1,555 @@
+"""Vectorized motion planning.
+
+This plans moves the same way MoveManager does with move_utils, but holds every
+move of a plan in (moves x axes) arrays and builds them all at once, so a long
+move list is planned in a few array passes per blending iteration instead of a
+few Python calls per move and axis. Each blending iteration builds every move
+from the moves of the previous iteration, which is what lets the moves be built
+together. Axes are still visited one at a time, in the order move_utils visits
+them, because each axis limit is checked against the speed the axes before it
+left.
+"""
+import dataclasses
+import logging
+from typing import List, Set, Tuple, TYPE_CHECKING, cast
+
+import numpy as np
+
+from opentrons_hardware.hardware_control.motion_planning import move_utils
+from opentrons_hardware.hardware_control.motion_planning.move_utils import (
+    FLOAT_THRESHOLD,
+    MINIMUM_DISPLACEMENT,
+    MINIMUM_VECTOR_COMPONENT,
+)
+from opentrons_hardware.hardware_control.motion_planning.types import (
+    AxisKey,
+    Block,
+    Coordinates,
+    CoordinateValue,
+    Move,
+    MoveTarget,
+    SystemConstraints,
+    ZeroLengthMoveError,
+)
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+log = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class _Constraints:
+    """System constraints as one array per field, in axis order."""
+
+    max_acceleration: "NDArray[np.float64]"
+    max_speed_discont: "NDArray[np.float64]"
+    max_direction_change_speed_discont: "NDArray[np.float64]"
+    max_speed: "NDArray[np.float64]"
+
+    @classmethod
+    def build(
+        cls, axes: List[AxisKey], constraints: SystemConstraints[AxisKey]
+    ) -> "_Constraints":
+        return cls(
+            **{
+                field.name: np.array(
+                    [getattr(constraints[axis], field.name) for axis in axes],
+                    dtype=np.float64,
+                )
+                for field in dataclasses.fields(cls)
+            }
+        )
+
+
+@dataclasses.dataclass
+class _Moves:
+    """A list of moves as arrays, with a row per move.
+
+    Block arrays have a column per block, in the same order as Move.blocks.
+    """
+
+    unit_vectors: "NDArray[np.float64]"
+    distances: "NDArray[np.float64]"
+    max_speeds: "NDArray[np.float64]"
+    block_distances: "NDArray[np.float64]"
+    block_initial_speeds: "NDArray[np.float64]"
+    block_accelerations: "NDArray[np.float64]"
+    block_final_speeds: "NDArray[np.float64]"
+    block_times: "NDArray[np.float64]"
+
+    def initial_speeds(self) -> "NDArray[np.float64]":
+        """Get the initial speed of each move, like Move.initial_speed."""
+        moving = self.block_distances != 0
+        first = np.argmax(moving, axis=1)
+        speeds = self.block_initial_speeds[np.arange(len(first)), first]
+        return np.where(moving.any(axis=1), speeds, np.float64(0))
+
+    def final_speeds(self) -> "NDArray[np.float64]":
+        """Get the final speed of each move, like Move.final_speed."""
+        moving = self.block_distances != 0
+        last = moving.shape[1] - 1 - np.argmax(moving[:, ::-1], axis=1)
+        speeds = self.block_final_speeds[np.arange(len(last)), last]
+        return np.where(moving.any(axis=1), speeds, np.float64(0))
+
+
+def _final_speeds(
+    initial_speeds: "NDArray[np.float64]",
+    accelerations: "NDArray[np.float64]",
+    distances: "NDArray[np.float64]",
+) -> "NDArray[np.float64]":
+    """Get block final speeds, like Block.final_speed."""
+    speeds_squared = initial_speeds**2 + accelerations * distances * 2
+    if (speeds_squared < 0).any():
+        log.warning(
+            "Block encountered negative value in final_speed "
+            f"({speeds_squared.min()}). Setting Block.final_speed to 0.0 instead."
+        )
+    return cast("NDArray[np.float64]", np.sqrt(np.maximum(speeds_squared, 0)))
+
+
+def _times(
+    initial_speeds: "NDArray[np.float64]",
+    final_speeds: "NDArray[np.float64]",
+    accelerations: "NDArray[np.float64]",
+    distances: "NDArray[np.float64]",
+) -> "NDArray[np.float64]":
+    """Get block times, like Block.time."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(
+            accelerations != 0,
+            (final_speeds - initial_speeds) / accelerations,
+            np.where(initial_speeds != 0, distances / initial_speeds, np.float64(0)),
+        )
+
+
+def _initial_moves(
+    origin: Coordinates[AxisKey, CoordinateValue],
+    target_list: List[MoveTarget[AxisKey]],
+    constraints: SystemConstraints[AxisKey],
+) -> Tuple[List[AxisKey], _Moves]:
+    """Build the moves to blend from the targets, like move_utils.targets_to_moves."""
+    all_axes: Set[AxisKey] = set()
+    for target in target_list:
+        all_axes.update(set(target.position.keys()))
+    axes = list(all_axes)
+
+    positions = np.array(
+        [[np.float64(origin.get(k, 0)) for k in axes]]
+        + [[np.float64(t.position.get(k, 0)) for k in axes] for t in target_list],
+        dtype=np.float64,
+    )
+    displacements = np.diff(positions, axis=0)
+    displacements[np.abs(displacements) < MINIMUM_DISPLACEMENT] = 0
+    distances = np.linalg.norm(displacements, axis=1)
+    for index in np.flatnonzero(distances == 0)[:1]:
+        raise ZeroLengthMoveError(
+            dict(zip(axes, positions[index])), dict(zip(axes, positions[index + 1]))
+        )
+    unit_vectors = displacements / distances[:, np.newaxis]
+    max_speeds = np.array([t.max_speed for t in target_list], dtype=np.float64)
+
+    too_small = (unit_vectors != 0) & (np.abs(unit_vectors) < MINIMUM_VECTOR_COMPONENT)
+    if too_small.any():
+        # Moves with a tiny component are rare, so split them up one at a time.
+        split_vectors: List["NDArray[np.float64]"] = []
+        split_distances: List[np.float64] = []
+        split_speeds: List[np.float64] = []
+        for vector, distance, speed, split in zip(
+            unit_vectors, distances, max_speeds, too_small.any(axis=1)
+        ):
+            pieces = (
+                move_utils.de_diagonalize_unit_vector(
+                    dict(zip(axes, vector)), distance, MINIMUM_VECTOR_COMPONENT
+                )
+                if split
+                else [(dict(zip(axes, vector)), distance)]
+            )
+            for piece_vector, piece_distance in pieces:
+                split_vectors.append(np.array([piece_vector[k] for k in axes]))
+                split_distances.append(piece_distance)
+                split_speeds.append(speed)
+        unit_vectors = np.array(split_vectors, dtype=np.float64)
+        distances = np.array(split_distances, dtype=np.float64)
+        max_speeds = np.array(split_speeds, dtype=np.float64)
+
+    # Limit each speed so no axis goes over its max speed.
+    axis_speeds = np.abs(unit_vectors * max_speeds[:, np.newaxis])
+    with np.errstate(divide="ignore"):
+        ratios = np.where(
+            axis_speeds != 0,
+            _Constraints.build(axes, constraints).max_speed / axis_speeds,
+            np.inf,
+        )
+    speeds = max_speeds * np.minimum(ratios.min(axis=1), 1)
+
+    # Each move starts out as three coasting blocks at its max speed.
+    block_distances = np.repeat((distances / 3)[:, np.newaxis], 3, axis=1)
+    block_speeds = np.repeat(speeds[:, np.newaxis], 3, axis=1)
+    block_accelerations = np.zeros_like(block_distances)
+    block_final_speeds = _final_speeds(
+        block_speeds, block_accelerations, block_distances
+    )
+    return axes, _Moves(
+        unit_vectors=unit_vectors,
+        distances=distances,
+        max_speeds=speeds,
+        block_distances=block_distances,
+        block_initial_speeds=block_speeds,
+        block_accelerations=block_accelerations,
+        block_final_speeds=block_final_speeds,
+        block_times=_times(
+            block_speeds, block_final_speeds, block_accelerations, block_distances
+        ),
+    )
+
+
+def _junction_speed_limits(
+    moves: _Moves,
+    speeds: "NDArray[np.float64]",
+    neighbor_components: "NDArray[np.float64]",
+    neighbor_speeds: "NDArray[np.float64]",
+    constraints: _Constraints,
+) -> "NDArray[np.float64]":
+    """Limit the speed of each move at a junction with its neighbor.
+
+    This is find_initial_speed when the neighbor is the previous move and
+    find_final_speed when it's the next one; the two limit speeds the same way.
+    """
+    for axis in range(moves.unit_vectors.shape[1]):
+        components = moves.unit_vectors[:, axis]
+        neighbors = neighbor_components[:, axis]
+        direction = neighbors * components
+        with np.errstate(divide="ignore", invalid="ignore"):
+            limits = np.where(
+                (neighbors == 0) | (neighbor_speeds == 0),
+                np.abs(constraints.max_speed_discont[axis] / components),
+                np.where(
+                    direction > 0,
+                    np.abs(
+                        np.maximum(
+                            np.abs(neighbor_speeds * neighbors),
+                            constraints.max_speed_discont[axis],
+                        )
+                        / components
+                    ),
+                    np.abs(
+                        constraints.max_direction_change_speed_discont[axis]
+                        / components
+                    ),
+                ),
+            )
+        moving = ~(np.abs(components * speeds) < FLOAT_THRESHOLD)
+        speeds = np.where(moving, np.minimum(limits, speeds), speeds)
+    return speeds
+
+
+def _achievable_final(
+    moves: _Moves,
+    initial_speeds: "NDArray[np.float64]",
+    final_speeds: "NDArray[np.float64]",
+    constraints: _Constraints,
+) -> "NDArray[np.float64]":
+    """Make sure final speeds are achievable, like move_utils.achievable_final."""
+    for axis in range(moves.unit_vectors.shape[1]):
+        components = moves.unit_vectors[:, axis]
+        max_final_squared = (
+            initial_speeds * components
+        ) ** 2 + 2 * constraints.max_acceleration[axis] * moves.distances
+        with np.errstate(divide="ignore", invalid="ignore"):
+            max_final = (
+                np.copysign(
+                    np.sqrt(max_final_squared) / components,
+                    final_speeds - initial_speeds,
+                )
+                + initial_speeds
+            )
+        final_speeds = np.where(
+            components != 0,
+            np.copysign(
+                np.minimum(np.abs(max_final), np.abs(final_speeds)), final_speeds
+            ),
+            final_speeds,
+        )
+    return final_speeds
+
+
+def _build_moves(moves: _Moves, constraints: _Constraints) -> _Moves:
+    """Build every move from its neighbors, like move_utils.build_move."""
+    moving = (moves.distances > FLOAT_THRESHOLD)[:, np.newaxis]
+    components = np.where(moving, moves.unit_vectors, np.float64(0))
+    no_components = np.zeros((1, components.shape[1]))
+    no_speed = np.zeros(1)
+
+    initial_speeds = _junction_speed_limits(
+        moves,
+        moves.initial_speeds(),
+        np.concatenate((no_components, components[:-1])),
+        np.concatenate((no_speed, moves.final_speeds()[:-1])),
+        constraints,
+    )
+    final_speeds = _junction_speed_limits(
+        moves,
+        moves.final_speeds(),
+        np.concatenate((components[1:], no_components)),
+        np.concatenate((moves.initial_speeds()[1:], no_speed)),
+        constraints,
+    )
+    final_speeds = _achievable_final(moves, initial_speeds, final_speeds, constraints)
+    return _build_blocks(moves, initial_speeds, final_speeds, constraints)
+
+
+def _build_blocks(
+    moves: _Moves,
+    initial_speeds: "NDArray[np.float64]",
+    final_speeds: "NDArray[np.float64]",
+    constraints: _Constraints,
+) -> _Moves:
+    """Build the blocks of every move, like move_utils.build_blocks."""
+    max_speeds = moves.max_speeds
+    for name, speeds in (("initial", initial_speeds), ("final", final_speeds)):
+        too_fast = ~(
+            (np.abs(speeds) <= max_speeds) | np.isclose(np.abs(speeds), max_speeds)
+        )
+        index = int(np.argmax(too_fast))
+        assert not too_fast[
+            index
+        ], f"{name} speed {speeds[index]} exceeds max speed {max_speeds[index]}"
+
+    unit_vectors = moves.unit_vectors
+    max_acc = np.where(unit_vectors != 0, constraints.max_acceleration, np.float64(0))
+    acc_v = np.linalg.norm(max_acc, axis=1)[:, np.newaxis] * unit_vectors
+    for axis in range(unit_vectors.shape[1]):
+        a_i = acc_v[:, axis]
+        max_acc_i = max_acc[:, axis]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scale = np.where(np.abs(a_i) > max_acc_i, max_acc_i / a_i, np.float64(1))
+        acc_v = acc_v * scale[:, np.newaxis]
+    max_acceleration = np.linalg.norm(acc_v, axis=1)
+
+    distances = moves.distances
+    initial_speed_sq = initial_speeds**2
+    final_speed_sq = final_speeds**2
+    max_achievable_speed = np.sqrt(
+        0.5 * (2 * max_acceleration * distances + initial_speed_sq + final_speed_sq)
+    )
+    max_speed_sq = np.minimum(max_achievable_speed, max_speeds) ** 2
+
+    first_distances = np.abs(max_speed_sq - initial_speed_sq) / (2 * max_acceleration)
+    first_final_speeds = _final_speeds(
+        initial_speeds, max_acceleration, first_distances
+    )
+    first_times = _times(
+        initial_speeds, first_final_speeds, max_acceleration, first_distances
+    )
+    final_distances = np.abs(max_speed_sq - final_speed_sq) / (2 * max_acceleration)
+    final_final_speeds = _final_speeds(
+        first_final_speeds, -max_acceleration, final_distances
+    )
+    final_times = _times(
+        first_final_speeds, final_final_speeds, -max_acceleration, final_distances
+    )
+
+    # As in build_blocks, trimmed moves keep the speeds and times their first and
+    # final blocks were built with and only have their distances changed.
+    trim = first_distances + final_distances > (distances + FLOAT_THRESHOLD)
+    trimmed_speed_sq = np.maximum(initial_speed_sq, final_speed_sq)
+    first_distances = np.where(
+        trim,
+        np.abs(trimmed_speed_sq - initial_speed_sq) / (2 * max_acceleration),
+        first_distances,
+    )
+    final_distances = np.where(
+        trim,
+        np.abs(trimmed_speed_sq - final_speed_sq) / (2 * max_acceleration),
+        final_distances,
+    )
+
+    coast = first_distances + final_distances < (distances - FLOAT_THRESHOLD)
+    zero = np.zeros_like(distances)
+    coast_distances = np.where(
+        coast, distances - first_distances - final_distances, zero
+    )
+    coast_speeds = np.where(coast, first_final_speeds, zero)
+    coast_final_speeds = _final_speeds(coast_speeds, zero, coast_distances)
+
+    return _Moves(
+        unit_vectors=unit_vectors,
+        distances=distances,
+        max_speeds=max_speeds,
+        block_distances=np.stack(
+            (first_distances, coast_distances, final_distances), axis=1
+        ),
+        block_initial_speeds=np.stack(
+            (initial_speeds, coast_speeds, first_final_speeds), axis=1
+        ),
+        block_accelerations=np.stack(
+            (max_acceleration, zero, -max_acceleration), axis=1
+        ),
+        block_final_speeds=np.stack(
+            (first_final_speeds, coast_final_speeds, final_final_speeds), axis=1
+        ),
+        block_times=np.stack(
+            (
+                first_times,
+                _times(coast_speeds, coast_final_speeds, zero, coast_distances),
+                final_times,
+            ),
+            axis=1,
+        ),
+    )
+
+
+def _check_less_or_close(
+    constraint: "NDArray[np.float64]", speeds: "NDArray[np.float64]"
+) -> "NDArray[np.bool_]":
+    return (np.abs(speeds) <= constraint) | np.isclose(speeds, constraint)
+
+
+def _all_blended(moves: _Moves, constraints: _Constraints) -> bool:
+    """Check if the moves are all blended, like move_utils.all_blended."""
+    if len(moves.distances) < 2:
+        return True
+    distance_sums = (
+        moves.block_distances[:, 0] + moves.block_distances[:, 1]
+    ) + moves.block_distances[:, 2]
+    if (np.abs(distance_sums - moves.distances) > FLOAT_THRESHOLD).any() or not (
+        np.isclose(distance_sums, moves.distances).all()
+    ):
+        return False
+
+    first = moves.unit_vectors[:-1]
+    second = moves.unit_vectors[1:]
+    final_speeds = moves.block_final_speeds[:-1, -1, np.newaxis] * first
+    initial_speeds = moves.block_initial_speeds[1:, 0, np.newaxis] * second
+    same_direction = (
+        (np.abs(initial_speeds - final_speeds) < FLOAT_THRESHOLD)
+        | _check_less_or_close(constraints.max_speed_discont, final_speeds)
+        | _check_less_or_close(constraints.max_speed_discont, initial_speeds)
+    )
+    direction_change = _check_less_or_close(
+        constraints.max_direction_change_speed_discont, final_speeds
+    ) | _check_less_or_close(
+        constraints.max_direction_change_speed_discont, initial_speeds
+    )
+    return bool(np.where(first * second > 0, same_direction, direction_change).all())
+
+
+def _block(
+    distance: np.float64,
+    initial_speed: np.float64,
+    acceleration: np.float64,
+    final_speed: np.float64,
+    time: np.float64,
+) -> Block:
+    # Set every field directly, since trimmed blocks keep the final speed and
+    # time they were built with.
+    block = Block.__new__(Block)
+    block.distance = distance
+    block.initial_speed = initial_speed
+    block.acceleration = acceleration
+    block.final_speed = final_speed
+    block.time = time
+    return block
+
+
+def _move(
+    unit_vector: Coordinates[AxisKey, np.float64],
+    distance: np.float64,
+    max_speed: np.float64,
+    blocks: Tuple[Block, Block, Block],
+    initial_speed: np.float64,
+    final_speed: np.float64,
+    nonzero_blocks: int,
+) -> Move[AxisKey]:
+    # Set every field directly, since the unit vectors were all checked at once.
+    move: Move[AxisKey] = Move.__new__(Move)
+    move.unit_vector = unit_vector
+    move.distance = distance
+    move.max_speed = max_speed
+    move.blocks = blocks
+    move.initial_speed = initial_speed
+    move.final_speed = final_speed
+    move.nonzero_blocks = nonzero_blocks
+    return move
+
+
+def _to_move_list(axes: List[AxisKey], moves: _Moves) -> List[Move[AxisKey]]:
+    """Turn arrays of moves back into Moves."""
+    blocks = [
+        cast(
+            Tuple[Block, Block, Block],
+            tuple(_block(*fields) for fields in zip(*move_fields)),
+        )
+        for move_fields in zip(
+            moves.block_distances,
+            moves.block_initial_speeds,
+            moves.block_accelerations,
+            moves.block_final_speeds,
+            moves.block_times,
+        )
+    ]
+    unit_vectors = [dict(zip(axes, unit_vector)) for unit_vector in moves.unit_vectors]
+    valid = np.isclose(np.linalg.norm(moves.unit_vectors, axis=1), 1.0)
+    for index in np.flatnonzero(~valid)[:1]:
+        # Let Move raise the same error it would for this unit vector.
+        Move(
+            unit_vector=unit_vectors[index],
+            distance=moves.distances[index],
+            max_speed=moves.max_speeds[index],
+            blocks=blocks[index],
+        )
+    return [
+        _move(*fields)
+        for fields in zip(
+            unit_vectors,
+            moves.distances,
+            moves.max_speeds,
+            blocks,
+            moves.initial_speeds(),
+            moves.final_speeds(),
+            (int(count) for count in np.count_nonzero(moves.block_times, axis=1)),
+        )
+    ]
+
+
+def plan_motion(
+    origin: Coordinates[AxisKey, CoordinateValue],
+    target_list: List[MoveTarget[AxisKey]],
+    constraints: SystemConstraints[AxisKey],
+    iteration_limit: int = 10,
+) -> Tuple[bool, List[List[Move[AxisKey]]]]:
+    """Create and blend moves from targets, like MoveManager.plan_motion.
+
+    Returns whether the moves converged and the moves built by each blending
+    iteration, with the dummy start and end moves around the moves of every
+    iteration that didn't converge.
+    """
+    assert target_list, "Check target list"
+    axes, moves = _initial_moves(origin, target_list, constraints)
+    axis_constraints = _Constraints.build(axes, constraints)
+    iterations: List[_Moves] = []
+    converged = False
+    for i in range(iteration_limit):
+        log.debug(f"Motion blending iteration: {i}")
+        moves = _build_moves(moves, axis_constraints)
+        iterations.append(moves)
+        if _all_blended(moves, axis_constraints):
+            converged = True
+            break
+    if not converged:
+        log.error("Could not converge!")
+
+    blend_log: List[List[Move[AxisKey]]] = []
+    for i, built in enumerate(iterations):
+        move_list = _to_move_list(axes, built)
+        if not converged or i < len(iterations) - 1:
+            move_list = [Move.build_dummy(axes)] + move_list + [Move.build_dummy(axes)]
+        blend_log.append(move_list)
+    if converged:
+        log.debug(
+            f"built {len(blend_log[-1])} moves with "
+            f"{sum(m.nonzero_blocks for m in blend_log[-1])} "
+            f"non-zero blocks after {len(blend_log)} iteration(s)"
+        )
+    return converged, blend_log
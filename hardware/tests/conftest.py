@@ -1,12 +1,12 @@
 """Pytest shared fixtures."""
-from typing import List, Tuple, Optional
+from typing import Iterable, List, Tuple, Optional
 from typing_extensions import Protocol
 
 import pytest
 from mock.mock import AsyncMock
 from opentrons_hardware.firmware_bindings import ArbitrationId, ArbitrationIdParts
 from opentrons_hardware.firmware_bindings.messages import MessageDefinition
-from opentrons_hardware.firmware_bindings import NodeId
+from opentrons_hardware.firmware_bindings import NodeId, MessageId
 
 from opentrons_hardware.drivers.can_bus import CanMessenger
 from opentrons_hardware.drivers.can_bus.can_messenger import (
@@ -28,9 +28,30 @@ class MockCanMessageNotifier:
         self,
         listener: MessageListenerCallback,
         filter: Optional[MessageListenerCallbackFilter] = None,
+        *,
+        message_ids: Optional[Iterable[MessageId]] = None,
+        originating_node_ids: Optional[Iterable[NodeId]] = None,
     ) -> None:
         """Add listener."""
-        self._listeners.append((listener, filter))
+        accepted_messages = set(message_ids) if message_ids is not None else None
+        accepted_nodes = (
+            set(originating_node_ids) if originating_node_ids is not None else None
+        )
+
+        def _filter(arbitration_id: ArbitrationId) -> bool:
+            return (
+                (
+                    accepted_messages is None
+                    or arbitration_id.parts.message_id in accepted_messages
+                )
+                and (
+                    accepted_nodes is None
+                    or arbitration_id.parts.originating_node_id in accepted_nodes
+                )
+                and (filter is None or filter(arbitration_id))
+            )
+
+        self._listeners.append((listener, _filter))
 
     def notify(self, message: MessageDefinition, arbitration_id: ArbitrationId) -> None:
         """Notify."""
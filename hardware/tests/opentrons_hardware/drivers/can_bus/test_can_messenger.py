@@ -436,6 +436,54 @@ async def test_filter_messages(
     listener.assert_not_called()
 
 
+async def test_indexed_listeners(
+    subject: CanMessenger, incoming_messages: Queue[CanMessage]
+) -> None:
+    """It should only call listeners registered for the message and node ids."""
+    for node in [NodeId.gantry_x, NodeId.gantry_y]:
+        incoming_messages.put_nowait(
+            CanMessage(
+                arbitration_id=ArbitrationId(
+                    parts=ArbitrationIdParts(
+                        message_id=MessageId.get_move_group_request,
+                        node_id=0,
+                        function_code=0,
+                        originating_node_id=node,
+                    )
+                ),
+                data=b"\x00\x00\x00\x01\x01",
+            )
+        )
+
+    by_message = Mock(spec=MessageListenerCallback)
+    by_message_and_node = Mock(spec=MessageListenerCallback)
+    other_message = Mock(spec=MessageListenerCallback)
+    removed = Mock(spec=MessageListenerCallback)
+    subject.add_listener(by_message, message_ids=[MessageId.get_move_group_request])
+    subject.add_listener(
+        by_message_and_node,
+        message_ids=[MessageId.get_move_group_request],
+        originating_node_ids=[NodeId.gantry_y],
+    )
+    subject.add_listener(other_message, message_ids=[MessageId.heartbeat_request])
+    subject.add_listener(removed, message_ids=[MessageId.get_move_group_request])
+    subject.remove_listener(removed)
+
+    subject.start()
+    while not incoming_messages.empty():
+        await asyncio.sleep(0.01)
+    await subject.stop()
+
+    assert by_message.call_count == 2
+    by_message_and_node.assert_called_once()
+    assert (
+        by_message_and_node.call_args.args[1].parts.originating_node_id
+        == NodeId.gantry_y
+    )
+    other_message.assert_not_called()
+    removed.assert_not_called()
+
+
 async def test_waitable_callback_context() -> None:
     """It should add itself and remove itself using context manager."""
     mock_messenger = Mock(spec=CanMessenger)
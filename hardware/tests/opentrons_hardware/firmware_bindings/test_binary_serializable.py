@@ -0,0 +1,66 @@
+"""BinarySerializable tests."""
+from dataclasses import dataclass
+
+import pytest
+
+from opentrons_hardware.firmware_bindings import utils
+from opentrons_hardware.firmware_bindings.messages import payloads
+
+
+@dataclass
+class _Parent(utils.BinarySerializable):
+    a: utils.UInt8Field
+    b: utils.Int16Field
+
+
+@dataclass
+class _Child(_Parent):
+    c: utils.UInt32Field
+
+
+@dataclass
+class _LittleEndian(utils.LittleEndianBinarySerializable):
+    a: utils.UInt16Field
+
+
+def test_round_trip() -> None:
+    """It should serialize and build back to the same value."""
+    obj = _Parent(a=utils.UInt8Field(0x12), b=utils.Int16Field(-2))
+    data = obj.serialize()
+    assert data == b"\x12\xff\xfe"
+    assert _Parent.build(data) == obj
+
+
+def test_subclass_codec_is_separate() -> None:
+    """A subclass should not reuse its parent's compiled codec."""
+    assert _Parent.get_size() == 3
+    assert _Child.get_size() == 7
+    obj = _Child(a=utils.UInt8Field(1), b=utils.Int16Field(2), c=utils.UInt32Field(3))
+    assert _Child.build(obj.serialize()) == obj
+
+
+def test_endianness() -> None:
+    """It should pack with the class's endianness."""
+    assert _LittleEndian(a=utils.UInt16Field(0x0102)).serialize() == b"\x02\x01"
+
+
+def test_build_ignores_extra_bytes() -> None:
+    """It should ignore bytes beyond the size of the message."""
+    assert _Parent.build(b"\x01\x00\x02\xaa\xbb") == _Parent(
+        a=utils.UInt8Field(1), b=utils.Int16Field(2)
+    )
+
+
+def test_build_short_data_raises() -> None:
+    """It should raise if there are not enough bytes for all fields."""
+    with pytest.raises(utils.InvalidFieldException):
+        _Parent.build(b"\x01\x00")
+
+
+def test_build_sets_message_index() -> None:
+    """It should set the message index of payloads."""
+    data = b"\x00\x00\x00\x07\x2a"
+    obj = payloads.GetStatusResponsePayload.build(data)
+    assert isinstance(obj, payloads.GetStatusResponsePayload)
+    assert obj.message_index == utils.UInt32Field(7)
+    assert obj.serialize() == data
@@ -1,5 +1,6 @@
 """Tests for motion planning."""
 import numpy as np
+import pytest
 from hypothesis import given, assume, strategies as st
 from hypothesis.extra import numpy as hynp
 from typing import Iterator, List, Tuple
@@ -210,3 +211,79 @@ def test_close_move_plan(
     )
 
     assert converged, f"Failed to converge: {blend_log}"
+
+
+@st.composite
+def generate_multi_target_path(
+    draw: st.DrawFn,
+) -> Tuple[Coordinates[str, np.float64], List[MoveTarget[str]]]:
+    """Generate a path through several targets, both near and far apart."""
+    origin = draw(generate_coordinates())
+    target_num = draw(st.integers(min_value=1, max_value=10))
+    target_list: List[MoveTarget[str]] = []
+    prev_coord = origin
+    while len(target_list) < target_num:
+        min_separation, max_separation = draw(
+            st.sampled_from([(0.1, 1.0), (1.0, 50.0), (1.0, 500.0)])
+        )
+        position = draw(
+            generate_coordinates_with_defined_separation(
+                prev_coord, min_separation, max_separation
+            )
+        )
+        target = MoveTarget.build(
+            position, np.float64(draw(st.floats(min_value=0.1, max_value=500)))
+        )
+        target_list.append(target)
+        prev_coord = position
+    return origin, target_list
+
+
+@given(
+    constraints=st.lists(generate_axis_constraint(), min_size=6, max_size=6),
+    path=generate_multi_target_path(),
+)
+def test_vectorized_move_plan_matches(
+    constraints: List[AxisConstraints],
+    path: Tuple[Coordinates[str, np.float64], List[MoveTarget[str]]],
+) -> None:
+    """Vectorized planning should plan the same moves as planning one at a time."""
+    origin, targets = path
+    system_constraints: SystemConstraints[str] = dict(zip(SIXAXES, constraints))
+
+    try:
+        expected = move_manager.MoveManager(constraints=system_constraints).plan_motion(
+            origin=origin, target_list=targets, iteration_limit=20
+        )
+    except AssertionError:
+        with pytest.raises(AssertionError):
+            move_manager.MoveManager(
+                constraints=system_constraints, vectorized=True
+            ).plan_motion(origin=origin, target_list=targets, iteration_limit=20)
+        return
+    converged, blend_log = move_manager.MoveManager(
+        constraints=system_constraints, vectorized=True
+    ).plan_motion(origin=origin, target_list=targets, iteration_limit=20)
+
+    assert converged == expected[0]
+    assert [len(moves) for moves in blend_log] == [len(m) for m in expected[1]]
+    for moves, expected_moves in zip(blend_log, expected[1]):
+        for move, expected_move in zip(moves, expected_moves):
+            assert move.unit_vector.keys() == expected_move.unit_vector.keys()
+            assert vectorize(move.unit_vector) == pytest.approx(
+                vectorize(expected_move.unit_vector)
+            )
+            assert [move.distance, move.max_speed] == pytest.approx(
+                [expected_move.distance, expected_move.max_speed]
+            )
+            for block, expected_block in zip(move.blocks, expected_move.blocks):
+                fields = [
+                    "distance",
+                    "initial_speed",
+                    "acceleration",
+                    "final_speed",
+                    "time",
+                ]
+                assert [getattr(block, f) for f in fields] == pytest.approx(
+                    [getattr(expected_block, f) for f in fields], abs=1e-9
+                )
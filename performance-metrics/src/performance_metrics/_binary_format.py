@@ -0,0 +1,81 @@
+"""Compact binary encoding of stored metrics rows.
+
+Each row is written as its fields in order, little endian, with no separators:
+- int fields as 8-byte signed integers
+- float fields as 8-byte doubles
+- str fields as a 2-byte length followed by that many bytes of UTF-8
+
+The headers file written next to the data file names the fields.
+"""
+
+import struct
+import typing
+
+from ._data_shapes import CSVStorageBase
+from ._types import StorableData
+
+T = typing.TypeVar("T", bound=CSVStorageBase)
+
+_INT = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+_STR_LENGTH = struct.Struct("<H")
+
+
+def _field_codecs(cls: typing.Type[CSVStorageBase]) -> typing.Tuple[str, ...]:
+    """Get the codec ("i", "f" or "s") of each field of a storage class."""
+    codecs = []
+    for field_name, field_type in typing.get_type_hints(cls).items():
+        if typing.get_origin(field_type) is typing.Literal:
+            field_type = type(typing.get_args(field_type)[0])
+        if field_type is int:
+            codecs.append("i")
+        elif field_type is float:
+            codecs.append("f")
+        elif field_type is str:
+            codecs.append("s")
+        else:
+            raise TypeError(
+                f"Field {field_name} of {cls.__name__} has unsupported type {field_type}"
+            )
+    return tuple(codecs)
+
+
+class BinaryRowCodec(typing.Generic[T]):
+    """Encodes and decodes rows of one storage class."""
+
+    def __init__(self, cls: typing.Type[T]) -> None:
+        self._cls = cls
+        self._codecs = _field_codecs(cls)
+
+    def encode(self, row: typing.Sequence[StorableData]) -> bytes:
+        """Encode a row, as returned by csv_row, into bytes."""
+        parts: typing.List[bytes] = []
+        for codec, value in zip(self._codecs, row):
+            if codec == "i":
+                parts.append(_INT.pack(value))
+            elif codec == "f":
+                parts.append(_FLOAT.pack(value))
+            else:
+                encoded = str(value).encode("utf-8")
+                parts.append(_STR_LENGTH.pack(len(encoded)))
+                parts.append(encoded)
+        return b"".join(parts)
+
+    def decode_all(self, data: bytes) -> typing.Iterator[T]:
+        """Decode every row in a buffer of encoded rows."""
+        offset = 0
+        while offset < len(data):
+            values: typing.List[StorableData] = []
+            for codec in self._codecs:
+                if codec == "i":
+                    values.append(_INT.unpack_from(data, offset)[0])
+                    offset += _INT.size
+                elif codec == "f":
+                    values.append(_FLOAT.unpack_from(data, offset)[0])
+                    offset += _FLOAT.size
+                else:
+                    (length,) = _STR_LENGTH.unpack_from(data, offset)
+                    offset += _STR_LENGTH.size
+                    values.append(data[offset : offset + length].decode("utf-8"))
+                    offset += length
+            yield typing.cast(T, self._cls.from_csv_row(values))
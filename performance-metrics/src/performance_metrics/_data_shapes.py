@@ -44,6 +44,29 @@ class RawActivityData(CSVStorageBase):
     duration: int
 
 
+@dataclasses.dataclass(frozen=True)
+class SpanData(CSVStorageBase):
+    """Represents a timed span of work, possibly nested inside another span.
+
+    Attributes:
+    - process_id (int): The id of the process the span ran in.
+    - span_id (int): The id of the span, unique within its process.
+    - parent_id (int): The id of the enclosing span, or 0 if there is none.
+    - name (str): What the span measured.
+    - category (str): The kind of work the span measured.
+    - func_start (int): The start time of the span.
+    - duration (int): The duration of the span.
+    """
+
+    process_id: int
+    span_id: int
+    parent_id: int
+    name: str
+    category: str
+    func_start: int
+    duration: int
+
+
 @dataclasses.dataclass(frozen=True)
 class ProcessResourceUsageSnapshot(CSVStorageBase):
     """Represents process resource usage data.
@@ -1,8 +1,15 @@
-"""Interface for storing performance metrics data to a CSV file."""
+"""Interface for storing performance metrics data to a file."""
 
+import atexit
+import collections
 import csv
+import dataclasses
+import io
+import threading
+import time
 import typing
 import logging
+from ._binary_format import BinaryRowCodec
 from ._data_shapes import MetricsMetadata, CSVStorageBase
 from ._logging_config import LOGGER_NAME
 
@@ -17,7 +24,7 @@ class MetricsStore(typing.Generic[T]):
     def __init__(self, metadata: MetricsMetadata) -> None:
         """Initialize the metrics store."""
         self.metadata = metadata
-        self._data_store: typing.List[T] = []
+        self._data_store: typing.Deque[T] = collections.deque()
 
     def add(self, data: T) -> None:
         """Add data to the store."""
@@ -48,3 +55,170 @@ class MetricsStore(typing.Generic[T]):
             )
             writer = csv.writer(storage_file, quoting=csv.QUOTE_ALL)
             writer.writerows(rows_to_write)
+
+    def flush(self) -> None:
+        """Write all added data to the storage file before returning."""
+        self.store()
+
+
+MetricsFileFormat = typing.Literal["csv", "binary"]
+
+
+@dataclasses.dataclass(frozen=True)
+class BufferedWriterConfig:
+    """Configuration of a BufferedMetricsStore.
+
+    Attributes:
+    - buffer_size (int): The most rows held in memory. When full, the oldest are dropped.
+    - flush_size (int): Number of buffered rows that triggers a write.
+    - flush_interval (float): Most seconds that added rows wait before they are written.
+    - max_file_size (int): Size in bytes past which the data file is rotated.
+    - backup_count (int): Number of rotated data files to keep.
+    - file_format (MetricsFileFormat): Format of the data file.
+    """
+
+    buffer_size: int = 10_000
+    flush_size: int = 1_000
+    flush_interval: float = 5.0
+    max_file_size: int = 10 * 1024 * 1024
+    backup_count: int = 5
+    file_format: MetricsFileFormat = "csv"
+
+
+class BufferedMetricsStore(MetricsStore[T]):
+    """A metrics store that writes its data from a background thread.
+
+    Adding data and calling store never touch the filesystem; they only hand
+    rows to a writer thread, so tracking adds no I/O latency to the caller.
+    The writer thread writes once flush_size rows have built up, or every
+    flush_interval seconds, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        metadata: MetricsMetadata,
+        data_type: typing.Type[T],
+        config: BufferedWriterConfig = BufferedWriterConfig(),
+    ) -> None:
+        """Initialize the metrics store."""
+        super().__init__(metadata)
+        self._config = config
+        self._data_store = collections.deque(maxlen=config.buffer_size)
+        self._binary_codec = (
+            BinaryRowCodec(data_type) if config.file_format == "binary" else None
+        )
+        self._dropped_count = 0
+        self._last_flush = time.monotonic()
+        self._flush_requested = threading.Event()
+        self._write_lock = threading.Lock()
+        self._closing = False
+        self._writer: typing.Optional[threading.Thread] = None
+
+    def add(self, data: T) -> None:
+        """Add data to the store, requesting a write if enough has built up."""
+        if len(self._data_store) == self._config.buffer_size:
+            self._dropped_count += 1
+        self._data_store.append(data)
+        self._request_flush_if_due()
+
+    def add_all(self, data: typing.Iterable[T]) -> None:
+        """Add data to the store."""
+        for item in data:
+            self.add(item)
+
+    def setup(self) -> None:
+        """Set up the data store and start the writer thread."""
+        super().setup()
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._write_forever,
+                name=f"{self.metadata.name}-writer",
+                daemon=True,
+            )
+            self._writer.start()
+            atexit.register(self.close)
+
+    def store(self) -> None:
+        """Request a write if enough data has built up or enough time has passed.
+
+        Otherwise the writer thread writes the data when it next flushes.
+        """
+        self._request_flush_if_due()
+
+    def flush(self) -> None:
+        """Write all added data to the storage file before returning."""
+        self._write_buffered()
+
+    def close(self) -> None:
+        """Write all added data and stop the writer thread."""
+        self._closing = True
+        self._flush_requested.set()
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+            atexit.unregister(self.close)
+        self._write_buffered()
+
+    def _request_flush_if_due(self) -> None:
+        if (
+            len(self._data_store) >= self._config.flush_size
+            or time.monotonic() - self._last_flush >= self._config.flush_interval
+        ):
+            self._flush_requested.set()
+
+    def _write_forever(self) -> None:
+        while not self._closing:
+            # Write whatever has been added at least every flush_interval.
+            self._flush_requested.wait(timeout=self._config.flush_interval)
+            self._flush_requested.clear()
+            try:
+                self._write_buffered()
+            except Exception:
+                logger.exception(f"Failed to write metrics for {self.metadata.name}")
+
+    def _write_buffered(self) -> None:
+        with self._write_lock:
+            self._last_flush = time.monotonic()
+            rows_to_write = []
+            while self._data_store:
+                rows_to_write.append(self._data_store.popleft().csv_row())
+            if self._dropped_count:
+                logger.warning(
+                    f"Dropped {self._dropped_count} rows of {self.metadata.name}"
+                    " because the buffer was full"
+                )
+                self._dropped_count = 0
+            if not rows_to_write:
+                return
+
+            if self._binary_codec is not None:
+                data = b"".join(self._binary_codec.encode(row) for row in rows_to_write)
+            else:
+                text = io.StringIO()
+                csv.writer(text, quoting=csv.QUOTE_ALL).writerows(rows_to_write)
+                data = text.getvalue().encode("utf-8")
+
+            self._rotate_if_needed()
+            logger.debug(
+                f"Writing {len(rows_to_write)} rows to {self.metadata.data_file_location}"
+            )
+            with open(self.metadata.data_file_location, "ab") as storage_file:
+                storage_file.write(data)
+
+    def _rotate_if_needed(self) -> None:
+        data_file = self.metadata.data_file_location
+        try:
+            if data_file.stat().st_size < self._config.max_file_size:
+                return
+        except FileNotFoundError:
+            return
+
+        logger.info(f"Rotating metrics file {data_file}")
+        for index in range(self._config.backup_count - 1, 0, -1):
+            older = data_file.with_name(f"{data_file.name}.{index}")
+            if older.exists():
+                older.replace(data_file.with_name(f"{data_file.name}.{index + 1}"))
+        if self._config.backup_count > 0:
+            data_file.replace(data_file.with_name(f"{data_file.name}.1"))
+        else:
+            data_file.unlink()
@@ -1,14 +1,18 @@
 """Module for tracking robot activity and execution duration for different operations."""
 
+import contextlib
+import contextvars
 import inspect
+import itertools
+import os
 from pathlib import Path
 
 from functools import wraps
 from time import perf_counter_ns
 import typing
 
-from ._metrics_store import MetricsStore
-from ._data_shapes import RawActivityData, MetricsMetadata
+from ._metrics_store import BufferedMetricsStore
+from ._data_shapes import RawActivityData, MetricsMetadata, SpanData
 from ._types import SupportsTracking, RobotActivityState
 from ._util import get_timing_function
 
@@ -21,6 +25,12 @@ _UnderlyingFunction = typing.Callable[
 
 _timing_function = get_timing_function()
 
+_current_span_id: contextvars.ContextVar[int] = contextvars.ContextVar(
+    "current_span_id", default=0
+)
+_span_ids = itertools.count(1)
+_untracked_span = contextlib.nullcontext()
+
 
 class RobotActivityTracker(SupportsTracking):
     """Tracks and stores robot activity and execution duration for different operations."""
@@ -28,20 +38,69 @@ class RobotActivityTracker(SupportsTracking):
     METADATA_NAME: typing.Final[
         typing.Literal["robot_activity_data"]
     ] = "robot_activity_data"
+    SPAN_METADATA_NAME: typing.Final[typing.Literal["span_data"]] = "span_data"
 
     def __init__(self, storage_location: Path, should_track: bool) -> None:
         """Initializes the RobotActivityTracker with an empty storage list."""
-        self._store = MetricsStore[RawActivityData](
+        self._store = BufferedMetricsStore[RawActivityData](
             MetricsMetadata(
                 name=self.METADATA_NAME,
                 storage_dir=storage_location,
                 headers=RawActivityData.headers(),
-            )
+            ),
+            RawActivityData,
+        )
+        self._span_store = BufferedMetricsStore[SpanData](
+            MetricsMetadata(
+                name=self.SPAN_METADATA_NAME,
+                storage_dir=storage_location,
+                headers=SpanData.headers(),
+            ),
+            SpanData,
         )
         self._should_track = should_track
 
         if self._should_track:
             self._store.setup()
+            self._span_store.setup()
+
+    def span(self, name: str, category: str) -> typing.ContextManager[None]:
+        """Time the enclosed code as a span.
+
+        Spans opened inside another span, in the same thread or asyncio task,
+        are recorded as its children. If tracking is disabled, this does nothing.
+
+        Args:
+            name: What the span measures, e.g. a command type.
+            category: The kind of work the span measures, e.g. "command".
+        """
+        if not self._should_track:
+            return _untracked_span
+        return self._tracked_span(name, category)
+
+    @contextlib.contextmanager
+    def _tracked_span(self, name: str, category: str) -> typing.Iterator[None]:
+        span_id = next(_span_ids)
+        parent_id = _current_span_id.get()
+        token = _current_span_id.set(span_id)
+        function_start_time = _timing_function()
+        duration_start_time = perf_counter_ns()
+        try:
+            yield
+        finally:
+            duration_end_time = perf_counter_ns()
+            _current_span_id.reset(token)
+            self._span_store.add(
+                SpanData(
+                    process_id=os.getpid(),
+                    span_id=span_id,
+                    parent_id=parent_id,
+                    name=name,
+                    category=category,
+                    func_start=function_start_time,
+                    duration=duration_end_time - duration_start_time,
+                )
+            )
 
     def track(
         self,
@@ -85,7 +144,8 @@ class RobotActivityTracker(SupportsTracking):
                     function_start_time = _timing_function()
                     duration_start_time = perf_counter_ns()
                     try:
-                        result = await func_to_track(*args, **kwargs)
+                        with self._tracked_span(func_to_track.__qualname__, state):
+                            result = await func_to_track(*args, **kwargs)
                     finally:
                         duration_end_time = perf_counter_ns()
 
@@ -111,7 +171,8 @@ class RobotActivityTracker(SupportsTracking):
                     duration_start_time = perf_counter_ns()
 
                     try:
-                        result = func_to_track(*args, **kwargs)
+                        with self._tracked_span(func_to_track.__qualname__, state):
+                            result = func_to_track(*args, **kwargs)
                     finally:
                         duration_end_time = perf_counter_ns()
 
@@ -130,7 +191,8 @@ class RobotActivityTracker(SupportsTracking):
         return inner_decorator
 
     def store(self) -> None:
-        """Returns the stored activity data and clears the storage list."""
+        """Hands the tracked activity data off to be written in the background."""
         if not self._should_track:
             return
         self._store.store()
+        self._span_store.store()
@@ -37,6 +37,14 @@ class SupportsTracking(typing.Protocol):
         """Decorator to track the given state for the decorated function."""
         ...
 
+    def span(self, name: str, category: str) -> typing.ContextManager[None]:
+        """Context manager to time the enclosed code as a span.
+
+        Spans opened inside another span, in the same thread or asyncio task,
+        are recorded as its children.
+        """
+        ...
+
     def store(self) -> None:
         """Store the tracked data."""
         ...
@@ -0,0 +1,102 @@
+"""Export recorded spans as a Chrome trace, viewable in Perfetto or chrome://tracing.
+
+Usage:
+    python -m performance_metrics.chrome_trace <storage dir> <output json file>
+"""
+
+import argparse
+import csv
+import json
+import typing
+from pathlib import Path
+
+from ._data_shapes import SpanData
+from ._robot_activity_tracker import RobotActivityTracker
+
+
+def read_spans(storage_dir: Path) -> typing.List[SpanData]:
+    """Read all spans stored in a directory, including rotated files."""
+    data_file = storage_dir / RobotActivityTracker.SPAN_METADATA_NAME
+    # Rotated files are numbered from newest to oldest; read oldest first.
+    files = sorted(
+        (
+            path
+            for path in data_file.parent.glob(f"{data_file.name}.*")
+            if path.suffix[1:].isdigit()
+        ),
+        key=lambda path: int(path.suffix[1:]),
+        reverse=True,
+    )
+    if data_file.exists():
+        files.append(data_file)
+
+    spans = []
+    for path in files:
+        with open(path, newline="") as storage_file:
+            for row in csv.reader(storage_file):
+                (
+                    process_id,
+                    span_id,
+                    parent_id,
+                    name,
+                    category,
+                    func_start,
+                    duration,
+                ) = row
+                spans.append(
+                    SpanData(
+                        process_id=int(process_id),
+                        span_id=int(span_id),
+                        parent_id=int(parent_id),
+                        name=name,
+                        category=category,
+                        func_start=int(func_start),
+                        duration=int(duration),
+                    )
+                )
+    return spans
+
+
+def to_chrome_trace(spans: typing.Iterable[SpanData]) -> typing.Dict[str, typing.Any]:
+    """Convert spans to the Chrome trace event format.
+
+    Each top-level span and all of its descendants are put on their own track,
+    so that concurrent spans don't overlap on screen.
+    """
+    spans = list(spans)
+    parents = {(span.process_id, span.span_id): span.parent_id for span in spans}
+
+    def _root_id(span: SpanData) -> int:
+        span_id, parent_id = span.span_id, span.parent_id
+        while parent_id != 0 and (span.process_id, parent_id) in parents:
+            span_id, parent_id = parent_id, parents[(span.process_id, parent_id)]
+        return span_id
+
+    events = [
+        {
+            "name": span.name,
+            "cat": span.category,
+            "ph": "X",
+            "ts": span.func_start / 1000,
+            "dur": span.duration / 1000,
+            "pid": span.process_id,
+            "tid": _root_id(span),
+            "args": {"span_id": span.span_id, "parent_id": span.parent_id},
+        }
+        for span in spans
+    ]
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("storage_dir", type=Path, help="Where spans were stored")
+    parser.add_argument("output", type=Path, help="The JSON file to write")
+    args = parser.parse_args()
+
+    args.output.write_text(json.dumps(to_chrome_trace(read_spans(args.storage_dir))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Shared fixtures for performance_metrics tests."""
+
+from pathlib import Path
+from typing import Callable, Iterator, List
+
+import pytest
+
+from performance_metrics._robot_activity_tracker import RobotActivityTracker
+
+MakeRobotActivityTracker = Callable[[Path, bool], RobotActivityTracker]
+
+
+@pytest.fixture
+def make_robot_activity_tracker() -> Iterator[MakeRobotActivityTracker]:
+    """Make trackers, and close their stores when the test is done."""
+    trackers: List[RobotActivityTracker] = []
+
+    def _make(storage_location: Path, should_track: bool) -> RobotActivityTracker:
+        tracker = RobotActivityTracker(storage_location, should_track)
+        trackers.append(tracker)
+        return tracker
+
+    yield _make
+    for tracker in trackers:
+        tracker._store.close()
+        tracker._span_store.close()
+
+
+@pytest.fixture
+def robot_activity_tracker(
+    make_robot_activity_tracker: MakeRobotActivityTracker, tmp_path: Path
+) -> RobotActivityTracker:
+    """Fixture to provide a fresh instance of RobotActivityTracker for each test."""
+    return make_robot_activity_tracker(tmp_path, True)
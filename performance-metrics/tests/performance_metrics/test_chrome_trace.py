@@ -0,0 +1,56 @@
+"""Tests for exporting spans as a Chrome trace."""
+
+from pathlib import Path
+
+from performance_metrics._data_shapes import SpanData
+from performance_metrics._robot_activity_tracker import RobotActivityTracker
+from performance_metrics.chrome_trace import read_spans, to_chrome_trace
+
+
+def _span(span_id: int, parent_id: int, name: str) -> SpanData:
+    return SpanData(
+        process_id=1,
+        span_id=span_id,
+        parent_id=parent_id,
+        name=name,
+        category="command",
+        func_start=span_id * 1000,
+        duration=500,
+    )
+
+
+def test_to_chrome_trace() -> None:
+    """Tests that spans become complete events on their root span's track."""
+    trace = to_chrome_trace(
+        [_span(1, 0, "run"), _span(2, 1, "aspirate"), _span(3, 2, "move")]
+    )
+
+    assert trace["traceEvents"] == [
+        {
+            "name": name,
+            "cat": "command",
+            "ph": "X",
+            "ts": span_id,
+            "dur": 0.5,
+            "pid": 1,
+            "tid": 1,
+            "args": {"span_id": span_id, "parent_id": span_id - 1},
+        }
+        for span_id, name in [(1, "run"), (2, "aspirate"), (3, "move")]
+    ]
+
+
+def test_read_spans(
+    robot_activity_tracker: RobotActivityTracker, tmp_path: Path
+) -> None:
+    """Tests reading back the spans a tracker stored."""
+    with robot_activity_tracker.span("aspirate", "command"):
+        with robot_activity_tracker.span("move", "hardware"):
+            pass
+    robot_activity_tracker._span_store.flush()
+
+    move, aspirate = read_spans(tmp_path)
+    assert (aspirate.name, aspirate.category) == ("aspirate", "command")
+    assert (move.name, move.category) == ("move", "hardware")
+    assert move.parent_id == aspirate.span_id
+    assert move.duration <= aspirate.duration
@@ -1,10 +1,18 @@
 """Tests for the metrics store."""
 
 from pathlib import Path
-from time import sleep
+from time import monotonic, sleep
+from typing import Callable, Iterator, List
 
+import pytest
+
+from performance_metrics._binary_format import BinaryRowCodec
+from performance_metrics._metrics_store import (
+    BufferedMetricsStore,
+    BufferedWriterConfig,
+)
 from performance_metrics._robot_activity_tracker import RobotActivityTracker
-from performance_metrics._data_shapes import RawActivityData
+from performance_metrics._data_shapes import MetricsMetadata, RawActivityData
 
 # Corrected times in seconds
 STARTING_TIME = 0.001
@@ -14,9 +22,8 @@ RUNNING_TIME = 0.004
 SHUTTING_DOWN_TIME = 0.005
 
 
-async def test_storing_to_file(tmp_path: Path) -> None:
+async def test_storing_to_file(robot_activity_tracker: RobotActivityTracker) -> None:
     """Tests storing the tracked data to a file."""
-    robot_activity_tracker = RobotActivityTracker(tmp_path, should_track=True)
 
     @robot_activity_tracker.track("ROBOT_STARTING_UP")
     def starting_robot() -> None:
@@ -35,6 +42,7 @@ async def test_storing_to_file(tmp_path: Path) -> None:
     analyzing_protocol()
 
     robot_activity_tracker.store()
+    robot_activity_tracker._store.flush()
 
     with open(robot_activity_tracker._store.metadata.data_file_location, "r") as file:
         lines = file.readlines()
@@ -53,3 +61,140 @@ async def test_storing_to_file(tmp_path: Path) -> None:
         headers = file.readlines()
         assert len(headers) == 1, "Header should be written to the headers file."
         assert tuple(headers[0].strip().split(",")) == RawActivityData.headers()
+
+
+MakeBufferedStore = Callable[
+    [BufferedWriterConfig], BufferedMetricsStore[RawActivityData]
+]
+
+
+@pytest.fixture
+def make_buffered_store(tmp_path: Path) -> Iterator[MakeBufferedStore]:
+    """Make buffered stores, and close them when the test is done."""
+    stores: List[BufferedMetricsStore[RawActivityData]] = []
+
+    def _make(config: BufferedWriterConfig) -> BufferedMetricsStore[RawActivityData]:
+        store = BufferedMetricsStore[RawActivityData](
+            MetricsMetadata(
+                name="test_data",
+                storage_dir=tmp_path,
+                headers=RawActivityData.headers(),
+            ),
+            RawActivityData,
+            config,
+        )
+        store.setup()
+        stores.append(store)
+        return store
+
+    yield _make
+    for store in stores:
+        store.close()
+
+
+def _activity(index: int) -> RawActivityData:
+    return RawActivityData(state="RUNNING_PROTOCOL", func_start=index, duration=index)
+
+
+def _wait_for_lines(store: BufferedMetricsStore[RawActivityData]) -> List[str]:
+    deadline = monotonic() + 5
+    while monotonic() < deadline and len(store._data_store) > 0:
+        sleep(0.01)
+    with store._write_lock:
+        return store.metadata.data_file_location.read_text().splitlines()
+
+
+def test_buffered_store_writes_in_background(
+    make_buffered_store: MakeBufferedStore,
+) -> None:
+    """Tests that enough added data is written by the writer thread."""
+    store = make_buffered_store(BufferedWriterConfig(flush_size=2))
+    store.add_all([_activity(1), _activity(2)])
+
+    assert len(_wait_for_lines(store)) == 2, "The writer thread should write the data."
+
+
+def test_buffered_store_writes_after_interval(
+    make_buffered_store: MakeBufferedStore,
+) -> None:
+    """Tests that added data is written after flush_interval, with no more adds."""
+    store = make_buffered_store(
+        BufferedWriterConfig(flush_size=100, flush_interval=0.05)
+    )
+    store.add(_activity(1))
+
+    assert len(_wait_for_lines(store)) == 1, "The writer thread should write the data."
+
+
+def test_buffered_store_store_batches_writes(
+    make_buffered_store: MakeBufferedStore,
+) -> None:
+    """Tests that store only requests a write once flush_size rows have built up."""
+    store = make_buffered_store(BufferedWriterConfig(flush_size=3, flush_interval=60))
+    store.add(_activity(1))
+    store.store()
+    store.add(_activity(2))
+    store.store()
+
+    assert not store._flush_requested.is_set()
+    assert len(store._data_store) == 2
+
+    store.add(_activity(3))
+    store.store()
+
+    assert len(_wait_for_lines(store)) == 3, "The writer thread should write the data."
+
+
+def test_buffered_store_binary_format(
+    make_buffered_store: MakeBufferedStore,
+) -> None:
+    """Tests that data written in the binary format decodes to the same data."""
+    store = make_buffered_store(BufferedWriterConfig(file_format="binary"))
+    written = [_activity(i) for i in range(10)]
+    store.add_all(written)
+    store.close()
+
+    data = store.metadata.data_file_location.read_bytes()
+    assert list(BinaryRowCodec(RawActivityData).decode_all(data)) == written
+
+
+def test_buffered_store_drops_oldest_when_full(
+    make_buffered_store: MakeBufferedStore,
+) -> None:
+    """Tests that the buffer keeps the newest data when it overflows."""
+    store = make_buffered_store(
+        BufferedWriterConfig(buffer_size=3, flush_size=100, file_format="binary"),
+    )
+    store.add_all([_activity(i) for i in range(5)])
+    store.close()
+
+    data = store.metadata.data_file_location.read_bytes()
+    assert [
+        activity.func_start
+        for activity in BinaryRowCodec(RawActivityData).decode_all(data)
+    ] == [2, 3, 4]
+
+
+def test_buffered_store_rotates_files(
+    make_buffered_store: MakeBufferedStore,
+) -> None:
+    """Tests that the data file is rotated once it reaches its maximum size."""
+    store = make_buffered_store(BufferedWriterConfig(max_file_size=1, backup_count=2))
+    for i in range(4):
+        store.add(_activity(i))
+        store.flush()
+    store.close()
+
+    data_file = store.metadata.data_file_location
+    assert data_file.read_text().startswith('"RUNNING_PROTOCOL","3"')
+    assert (
+        data_file.with_name(f"{data_file.name}.1")
+        .read_text()
+        .startswith('"RUNNING_PROTOCOL","2"')
+    )
+    assert (
+        data_file.with_name(f"{data_file.name}.2")
+        .read_text()
+        .startswith('"RUNNING_PROTOCOL","1"')
+    )
+    assert not data_file.with_name(f"{data_file.name}.3").exists()
@@ -5,7 +5,8 @@ from pathlib import Path
 import pytest
 from performance_metrics._robot_activity_tracker import RobotActivityTracker
 from time import sleep, time_ns
-from unittest.mock import patch
+from typing import Callable
+from unittest.mock import MagicMock, patch
 
 # Corrected times in seconds
 STARTING_TIME = 0.001
@@ -15,12 +16,6 @@ RUNNING_TIME = 0.004
 SHUTTING_DOWN_TIME = 0.005
 
 
-@pytest.fixture
-def robot_activity_tracker(tmp_path: Path) -> RobotActivityTracker:
-    """Fixture to provide a fresh instance of RobotActivityTracker for each test."""
-    return RobotActivityTracker(storage_location=tmp_path, should_track=True)
-
-
 async def test_robot_activity_tracker(
     robot_activity_tracker: RobotActivityTracker,
 ) -> None:
@@ -279,10 +274,14 @@ def test_sync_exception_handling_when_not_tracking(tmp_path: Path) -> None:
     "performance_metrics._util.get_timing_function",
     return_value=time_ns,
 )
-def test_using_non_linux_time_functions(tmp_path: Path) -> None:
+def test_using_non_linux_time_functions(
+    _: MagicMock,
+    make_robot_activity_tracker: Callable[[Path, bool], RobotActivityTracker],
+    tmp_path: Path,
+) -> None:
     """Tests tracking operations using non-Linux time functions."""
     file_path = tmp_path / "test_file.csv"
-    robot_activity_tracker = RobotActivityTracker(file_path, should_track=True)
+    robot_activity_tracker = make_robot_activity_tracker(file_path, True)
 
     @robot_activity_tracker.track(state="ROBOT_STARTING_UP")
     def starting_robot() -> None:
@@ -303,3 +302,56 @@ def test_using_non_linux_time_functions(tmp_path: Path) -> None:
         data.duration > 0 for data in storage
     ), "All duration times should be greater than 0."
     assert len(storage) == 2, "Both operations should be tracked."
+
+
+async def test_nested_spans(robot_activity_tracker: RobotActivityTracker) -> None:
+    """Tests that spans opened inside other spans record their parent."""
+
+    async def move() -> None:
+        with robot_activity_tracker.span("move", "hardware"):
+            await asyncio.sleep(0)
+
+    with robot_activity_tracker.span("aspirate", "command"):
+        await asyncio.gather(move(), move())
+    with robot_activity_tracker.span("dispense", "command"):
+        pass
+
+    spans = {span.name: span for span in robot_activity_tracker._span_store._data_store}
+    moves = [
+        span
+        for span in robot_activity_tracker._span_store._data_store
+        if span.name == "move"
+    ]
+    assert spans["aspirate"].parent_id == 0
+    assert spans["dispense"].parent_id == 0
+    assert len(moves) == 2
+    assert all(move.parent_id == spans["aspirate"].span_id for move in moves)
+    assert all(move.category == "hardware" for move in moves)
+
+
+def test_tracked_function_is_a_span(
+    robot_activity_tracker: RobotActivityTracker,
+) -> None:
+    """Tests that tracked functions are recorded as parents of spans inside them."""
+
+    @robot_activity_tracker.track(state="ANALYZING_PROTOCOL")
+    def analyzing_protocol() -> None:
+        with robot_activity_tracker.span("home", "command"):
+            pass
+
+    analyzing_protocol()
+
+    home, analysis = robot_activity_tracker._span_store._data_store
+    assert analysis.category == "ANALYZING_PROTOCOL"
+    assert analysis.name.endswith("analyzing_protocol")
+    assert home.parent_id == analysis.span_id
+
+
+def test_spans_not_recorded_when_not_tracking(tmp_path: Path) -> None:
+    """Tests that spans do nothing when tracking is disabled."""
+    robot_activity_tracker = RobotActivityTracker(tmp_path, should_track=False)
+
+    with robot_activity_tracker.span("home", "command"):
+        pass
+
+    assert len(robot_activity_tracker._span_store._data_store) == 0
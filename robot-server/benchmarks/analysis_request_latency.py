@@ -0,0 +1,166 @@
+"""Measure request latency while the server analyzes protocols.
+
+This starts a dev server, uploads a few long protocols at once, and keeps
+polling GET /health until their analyses complete, the way the app polls while
+protocols are being added. It's measured with analyses in the server process and
+with analyses in a pool of worker processes. See the `analysis_workers` setting.
+
+Usage:
+    python benchmarks/analysis_request_latency.py [--protocols N] [--transfers N]
+"""
+import argparse
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+import httpx
+
+_HEADERS = {"Opentrons-Version": "*"}
+
+_PROTOCOL = """\
+requirements = {{"apiLevel": "2.20", "robotType": "OT-2"}}
+
+def run(protocol):
+    tip_rack = protocol.load_labware("opentrons_96_tiprack_300ul", "4")
+    source = protocol.load_labware("nest_96_wellplate_200ul_flat", "1")
+    destination = protocol.load_labware("nest_96_wellplate_200ul_flat", "2")
+    pipette = protocol.load_instrument("p300_single_gen2", "left", tip_racks=[tip_rack])
+    pipette.pick_up_tip()
+    for index in range({transfers}):
+        pipette.transfer(
+            10, source.wells()[index % 96], destination.wells()[index % 96], new_tip="never"
+        )
+    pipette.drop_tip()
+    # Protocol {number}.
+"""
+
+
+def _start_server(
+    port: int, workers: int, directory: Path
+) -> "subprocess.Popen[bytes]":
+    env = {
+        **os.environ,
+        "OT_ROBOT_SERVER_DOT_ENV_PATH": "dev.env",
+        "OT_API_CONFIG_DIR": str(directory / "config"),
+        "OT_ROBOT_SERVER_persistence_directory": str(directory / "persistence"),
+        "OT_ROBOT_SERVER_analysis_workers": str(workers),
+    }
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "robot_server.app:app",
+            "--host",
+            "localhost",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def _wait_until_ready(client: httpx.Client) -> None:
+    deadline = time.monotonic() + 120
+    while time.monotonic() < deadline:
+        try:
+            if client.get("/health").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.5)
+    raise RuntimeError("The server didn't start.")
+
+
+def _upload(client: httpx.Client, directory: Path, number: int, transfers: int) -> str:
+    protocol_file = directory / f"protocol_{number}.py"
+    protocol_file.write_text(
+        _PROTOCOL.format(transfers=transfers, number=number), encoding="utf-8"
+    )
+    with open(protocol_file, "rb") as f:
+        response = client.post("/protocols", files=[("files", (protocol_file.name, f))])
+    response.raise_for_status()
+    return str(response.json()["data"]["id"])
+
+
+def _analyses_done(client: httpx.Client, protocol_ids: List[str]) -> bool:
+    for protocol_id in protocol_ids:
+        summaries = client.get(f"/protocols/{protocol_id}").json()["data"][
+            "analysisSummaries"
+        ]
+        if not summaries or summaries[-1]["status"] != "completed":
+            return False
+    return True
+
+
+def _measure(
+    workers: int, port: int, protocols: int, transfers: int
+) -> Tuple[List[float], float]:
+    with tempfile.TemporaryDirectory() as name:
+        directory = Path(name)
+        server = _start_server(port, workers, directory)
+        try:
+            with httpx.Client(
+                base_url=f"http://localhost:{port}", headers=_HEADERS, timeout=600
+            ) as client:
+                _wait_until_ready(client)
+                # Warm up the server, and the workers if there are any.
+                warm_up_id = _upload(client, directory, -1, 1)
+                while not _analyses_done(client, [warm_up_id]):
+                    time.sleep(0.2)
+
+                start = time.perf_counter()
+                protocol_ids = [
+                    _upload(client, directory, number, transfers)
+                    for number in range(protocols)
+                ]
+                latencies = []
+                while True:
+                    request_start = time.perf_counter()
+                    client.get("/health").raise_for_status()
+                    latencies.append(time.perf_counter() - request_start)
+                    if len(latencies) % 10 == 0 and _analyses_done(
+                        client, protocol_ids
+                    ):
+                        break
+                    time.sleep(0.05)
+                return latencies, time.perf_counter() - start
+        finally:
+            server.send_signal(signal.SIGTERM)
+            server.wait()
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--protocols", type=int, default=3)
+    parser.add_argument("--transfers", type=int, default=300)
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 3])
+    parser.add_argument("--port", type=int, default=31960)
+    args = parser.parse_args()
+
+    for workers in args.workers:
+        latencies, total = _measure(workers, args.port, args.protocols, args.transfers)
+        latencies.sort()
+        print(
+            f"{workers} analysis workers: "
+            f"{args.protocols} analyses in {total:.1f} s, "
+            f"GET /health median {statistics.median(latencies) * 1e3:.1f} ms, "
+            f"p99 {latencies[int(len(latencies) * 0.99)] * 1e3:.1f} ms, "
+            f"max {latencies[-1] * 1e3:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""Measure read latency on the run and analysis tables while a run is being saved.
+
+A writer thread repeatedly does what the server does at the end of a run: in one
+transaction, it updates the run's row and inserts all of the run's commands.
+Meanwhile, reader threads keep fetching a page of another run's commands, the way
+clients poll GET /runs/{id}/commands, and a protocol's completed analysis.
+
+This is measured with each database profile. See
+robot_server.persistence.database.DatabaseProfile.
+
+Usage:
+    python benchmarks/database_read_while_write.py [--commands N] [--seconds S]
+"""
+import argparse
+import json
+import statistics
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, get_args
+
+import sqlalchemy
+
+from robot_server.persistence.database import DatabaseProfile, sql_engine_ctx
+from robot_server.persistence.tables import (
+    ProtocolKindSQLEnum,
+    analysis_table,
+    metadata,
+    protocol_table,
+    run_command_table,
+    run_table,
+)
+
+_PAGE_LENGTH = 20
+
+
+def _command(index: int) -> str:
+    return json.dumps(
+        {
+            "id": f"command-{index}",
+            "key": f"key-{index}",
+            "commandType": "aspirate",
+            "status": "succeeded",
+            "params": {"pipetteId": "pipette", "labwareId": "plate", "volume": 10.0},
+            "result": {"position": {"x": 1.0, "y": 2.0, "z": 3.0}, "volume": 10.0},
+        }
+    )
+
+
+def _command_rows(run_id: str, count: int) -> List[Dict[str, object]]:
+    return [
+        {
+            "run_id": run_id,
+            "index_in_run": index,
+            "command_id": f"command-{index}",
+            "command": _command(index),
+            "command_intent": "protocol",
+        }
+        for index in range(count)
+    ]
+
+
+def _set_up(engine: sqlalchemy.engine.Engine, command_count: int) -> None:
+    now = datetime.now(tz=timezone.utc)
+    metadata.create_all(engine)
+    with engine.begin() as transaction:
+        transaction.execute(
+            sqlalchemy.insert(protocol_table).values(
+                id="protocol",
+                created_at=now,
+                protocol_key=None,
+                protocol_kind=ProtocolKindSQLEnum.STANDARD.value,
+            )
+        )
+        transaction.execute(
+            sqlalchemy.insert(analysis_table).values(
+                id="analysis",
+                protocol_id="protocol",
+                analyzer_version="benchmark",
+                completed_analysis=json.dumps(
+                    {"commands": [_command(i) for i in range(command_count)]}
+                ),
+            )
+        )
+        for run_id in ("finished-run", "current-run"):
+            transaction.execute(
+                sqlalchemy.insert(run_table).values(
+                    id=run_id, created_at=now, protocol_id="protocol"
+                )
+            )
+        transaction.execute(
+            sqlalchemy.insert(run_command_table),
+            _command_rows("finished-run", command_count),
+        )
+
+
+def _save_run(engine: sqlalchemy.engine.Engine, command_count: int) -> None:
+    with engine.begin() as transaction:
+        transaction.execute(
+            sqlalchemy.update(run_table)
+            .where(run_table.c.id == "current-run")
+            .values(
+                state_summary=json.dumps({"status": "succeeded"}),
+                engine_status="succeeded",
+                _updated_at=datetime.now(tz=timezone.utc),
+            )
+        )
+        transaction.execute(
+            sqlalchemy.delete(run_command_table).where(
+                run_command_table.c.run_id == "current-run"
+            )
+        )
+        transaction.execute(
+            sqlalchemy.insert(run_command_table),
+            _command_rows("current-run", command_count),
+        )
+
+
+def _read_commands(engine: sqlalchemy.engine.Engine, command_count: int) -> None:
+    cursor = (command_count // 2) - _PAGE_LENGTH
+    with engine.begin() as transaction:
+        rows = transaction.execute(
+            sqlalchemy.select(run_command_table.c.command)
+            .where(
+                run_command_table.c.run_id == "finished-run",
+                run_command_table.c.index_in_run >= cursor,
+                run_command_table.c.index_in_run < cursor + _PAGE_LENGTH,
+            )
+            .order_by(run_command_table.c.index_in_run)
+        ).all()
+    assert len(rows) == _PAGE_LENGTH
+
+
+def _read_analysis(engine: sqlalchemy.engine.Engine) -> None:
+    with engine.begin() as transaction:
+        analysis = transaction.execute(
+            sqlalchemy.select(analysis_table.c.completed_analysis).where(
+                analysis_table.c.id == "analysis"
+            )
+        ).scalar_one()
+    assert analysis
+
+
+def _measure(
+    profile: DatabaseProfile, command_count: int, seconds: float, readers: int
+) -> Dict[str, List[float]]:
+    latencies: Dict[str, List[float]] = {"commands": [], "analysis": [], "save": []}
+    with tempfile.TemporaryDirectory() as directory, sql_engine_ctx(
+        Path(directory) / "robot_server.db", profile
+    ) as engine:
+        _set_up(engine, command_count)
+        stop = threading.Event()
+
+        def _write() -> None:
+            while not stop.is_set():
+                start = time.perf_counter()
+                _save_run(engine, command_count)
+                latencies["save"].append(time.perf_counter() - start)
+
+        def _read(reader: int) -> None:
+            while not stop.is_set():
+                start = time.perf_counter()
+                if reader % 2:
+                    _read_analysis(engine)
+                    latencies["analysis"].append(time.perf_counter() - start)
+                else:
+                    _read_commands(engine, command_count)
+                    latencies["commands"].append(time.perf_counter() - start)
+
+        threads = [threading.Thread(target=_write)] + [
+            threading.Thread(target=_read, args=(reader,)) for reader in range(readers)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+    return latencies
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commands", type=int, default=2000)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--readers", type=int, default=2)
+    args = parser.parse_args()
+
+    for profile in get_args(DatabaseProfile):
+        latencies = _measure(profile, args.commands, args.seconds, args.readers)
+        print(f"{profile}:")
+        for kind, times in latencies.items():
+            times.sort()
+            print(
+                f"    {kind:<10} {len(times):>6} done, "
+                f"median {statistics.median(times) * 1e3:>8.2f} ms, "
+                f"p99 {times[int(len(times) * 0.99)] * 1e3:>8.2f} ms, "
+                f"max {times[-1] * 1e3:>8.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,7 @@ from .persistence.fastapi_dependencies import (
     start_initializing_persistence,
     clean_up_persistence,
 )
+from .protocols.dependencies import set_up_analysis_worker_pool
 from .router import router
 from .service.logging import initialize_logging
 from .service.task_runner import set_up_task_runner
@@ -72,6 +73,7 @@ async def _lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         start_initializing_persistence(
             app_state=app.state,
             persistence_directory_root=persistence_directory,
+            database_profile=settings.database_profile,
             done_callbacks=[
                 # For OT-2 light control only. The Flex status bar isn't handled here
                 # because it's currently tied to hardware and run status, not to
@@ -81,6 +83,14 @@ async def _lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         )
         exit_stack.push_async_callback(clean_up_persistence, app.state)
 
+        await exit_stack.enter_async_context(
+            set_up_analysis_worker_pool(
+                app.state,
+                workers=settings.analysis_workers,
+                memory_limit=settings.analysis_worker_memory_limit,
+            )
+        )
+
         exit_stack.enter_context(set_up_notification_client(app.state))
         initialize_pe_publisher_notifier(app.state)
 
@@ -0,0 +1,39 @@
+"""Migrate the persistence directory from schema 7 to 8.
+
+Summary of changes from schema 7:
+
+- Adds an index on run_command's run_id, index_in_run, and command_intent columns,
+  to cover queries for slices of a run's commands.
+"""
+
+from pathlib import Path
+import shutil
+
+from ..database import sql_engine_ctx
+from ..file_and_directory_names import DB_FILE
+from ..tables import schema_8
+from .._folder_migrator import Migration
+
+
+class Migration7to8(Migration):  # noqa: D101
+    def migrate(self, source_dir: Path, dest_dir: Path) -> None:
+        """Migrate the persistence directory from schema 7 to 8."""
+        # Copy over all existing directories and files to new version
+        for item in source_dir.iterdir():
+            if item.is_dir():
+                shutil.copytree(src=item, dst=dest_dir / item.name)
+            else:
+                shutil.copy(src=item, dst=dest_dir / item.name)
+
+        dest_db_file = dest_dir / DB_FILE
+
+        with sql_engine_ctx(dest_db_file) as dest_engine:
+            # create_all() skips tables that already exist, including their indexes,
+            # so add the new index to the existing table separately.
+            schema_8.metadata.create_all(dest_engine)
+            new_index = next(
+                index
+                for index in schema_8.run_command_table.indexes
+                if index.name == "ix_run_run_id_index_in_run_command_intent"
+            )
+            new_index.create(dest_engine, checkfirst=True)
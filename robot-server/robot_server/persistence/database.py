@@ -1,9 +1,10 @@
 """SQLite database initialization and utilities."""
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator
+from typing import Any, Dict, Generator
 
 import sqlalchemy
+from typing_extensions import Literal
 
 from server_utils import sql_utils
 
@@ -23,20 +24,91 @@ from server_utils import sql_utils
 sqlite_rowid = sqlalchemy.column("_ROWID_")
 
 
+DatabaseProfile = Literal["compatible", "performance"]
+"""How to tune SQLite and SQLAlchemy's connection pool for a database.
+
+* `"compatible"`: The SQLite and SQLAlchemy defaults, with a rollback journal.
+  Readers and writers lock each other out, and each use of the engine opens a new
+  connection. Migrations always use this.
+* `"performance"`: A write-ahead log (WAL), so readers don't wait for writers,
+  plus a pool of reusable connections, each with a memory map, a bigger page cache,
+  and a bigger statement cache.
+
+Both profiles work on the same database file. Opening it with one profile switches
+its journal mode, so going back to `"compatible"` only takes a restart.
+"""
+
+
+# The journal mode that each profile sets, once, when it opens the database.
+#
+# Switching the journal mode back to DELETE folds anything left in the write-ahead
+# log into the main database file, in case the database was last opened with the
+# "performance" profile. It's a no-op otherwise.
+_COMPATIBLE_JOURNAL_MODE = "DELETE"
+_PERFORMANCE_JOURNAL_MODE = "WAL"
+
+# Pragmas that the "performance" profile sets on each connection.
+_PERFORMANCE_PRAGMAS: Dict[str, Any] = {
+    # In WAL mode, NORMAL only syncs at checkpoints. A power loss can lose the
+    # last few transactions, but it can't corrupt the database.
+    "synchronous": "NORMAL",
+    "mmap_size": 64 * 1024 * 1024,
+    # Negative values are in KiB, instead of pages. This is per connection.
+    "cache_size": -8 * 1024,
+    "temp_store": "MEMORY",
+}
+
+# Connection pool settings for the "performance" profile.
+#
+# The server's endpoints and background tasks reach the database from several
+# threads, so a few readers can work alongside the writer. The pool reuses
+# connections, so their page caches and prepared statements stay warm, and when the
+# last connection closes, SQLite checkpoints the write-ahead log back into the main
+# database file.
+_PERFORMANCE_POOL_SIZE = 4
+_PERFORMANCE_MAX_OVERFLOW = 4
+_PERFORMANCE_STATEMENT_CACHE_SIZE = 256
+
+
 # todo(mm, 2024-08-07): Now that FastAPI supports a `lifespan` context manager
 # instead of separate startup/shutdown functions, we should transition to using
 # `sql_engine_ctx()` everywhere instead of using this.
-def create_sql_engine(path: Path) -> sqlalchemy.engine.Engine:
+def create_sql_engine(
+    path: Path, profile: DatabaseProfile = "compatible"
+) -> sqlalchemy.engine.Engine:
     """Return an engine for accessing the given SQLite database file.
 
     If the file does not already exist, it will be created, empty.
     You must separately set up any tables you're expecting.
+
+    See `DatabaseProfile` for what `profile` does.
     """
-    sql_engine = sqlalchemy.create_engine(sql_utils.get_connection_url(path))
+    url = sql_utils.get_connection_url(path)
+    if profile == "performance":
+        sql_engine = sqlalchemy.create_engine(
+            url,
+            poolclass=sqlalchemy.pool.QueuePool,
+            pool_size=_PERFORMANCE_POOL_SIZE,
+            max_overflow=_PERFORMANCE_MAX_OVERFLOW,
+            connect_args={
+                # Pooled connections are handed between threads, but only used by
+                # one thread at a time.
+                "check_same_thread": False,
+                "cached_statements": _PERFORMANCE_STATEMENT_CACHE_SIZE,
+            },
+        )
+        journal_mode = _PERFORMANCE_JOURNAL_MODE
+        pragmas = _PERFORMANCE_PRAGMAS
+    else:
+        sql_engine = sqlalchemy.create_engine(url)
+        journal_mode = _COMPATIBLE_JOURNAL_MODE
+        pragmas = {}
 
     try:
         sql_utils.enable_foreign_key_constraints(sql_engine)
+        sql_utils.set_pragmas(sql_engine, pragmas)
         sql_utils.fix_transactions(sql_engine)
+        sql_utils.set_journal_mode(sql_engine, journal_mode)
 
     except Exception:
         sql_engine.dispose()
@@ -46,9 +118,11 @@ def create_sql_engine(path: Path) -> sqlalchemy.engine.Engine:
 
 
 @contextmanager
-def sql_engine_ctx(path: Path) -> Generator[sqlalchemy.engine.Engine, None, None]:
+def sql_engine_ctx(
+    path: Path, profile: DatabaseProfile = "compatible"
+) -> Generator[sqlalchemy.engine.Engine, None, None]:
     """Like `create_sql_engine()`, but clean up when done."""
-    engine = create_sql_engine(path)
+    engine = create_sql_engine(path, profile)
     try:
         yield engine
     finally:
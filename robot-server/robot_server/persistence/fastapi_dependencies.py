@@ -18,7 +18,7 @@ from server_utils.fastapi_utils.app_state import (
 )
 from robot_server.errors.error_responses import ErrorDetails
 
-from .database import create_sql_engine
+from .database import DatabaseProfile, create_sql_engine
 from .file_and_directory_names import DB_FILE
 from .persistence_directory import (
     PersistenceResetter,
@@ -60,11 +60,15 @@ def start_initializing_persistence(  # noqa: C901
     app_state: AppState,
     persistence_directory_root: Optional[Path],
     done_callbacks: Iterable[Callable[[], Awaitable[None]]],
+    database_profile: DatabaseProfile = "compatible",
 ) -> None:
     """Initialize the persistence layer to get it ready for use by endpoint functions.
 
     This should be called exactly once, as part of server startup.
     It will return immediately while initialization continues in the background.
+
+    Migrations always run with the "compatible" database profile. `database_profile`
+    only applies to the database once it's been migrated.
     """
 
     async def init_root_persistence_directory() -> Path:
@@ -102,7 +106,7 @@ def start_initializing_persistence(  # noqa: C901
             prepared_subdirectory = await subdirectory_prep_task
 
             sql_engine = await to_thread.run_sync(
-                create_sql_engine, prepared_subdirectory / DB_FILE
+                create_sql_engine, prepared_subdirectory / DB_FILE, database_profile
             )
             return sql_engine
 
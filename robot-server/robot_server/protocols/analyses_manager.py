@@ -15,6 +15,10 @@ from robot_server.protocols.analysis_models import (
 )
 from robot_server.protocols.analysis_store import AnalysisStore
 from robot_server.protocols import protocol_analyzer
+from robot_server.protocols.analysis_worker_pool import (
+    AnalysisLoadError,
+    AnalysisWorkerPool,
+)
 from robot_server.protocols.protocol_store import ProtocolResource
 from robot_server.service.task_runner import TaskRunner
 import robot_server.errors.error_mappers as em
@@ -31,9 +35,15 @@ class FailedToInitializeAnalyzer(Exception):
 class AnalysesManager:
     """A Collaborator that manages and provides an interface to Protocol Analyzers."""
 
-    def __init__(self, analysis_store: AnalysisStore, task_runner: TaskRunner) -> None:
+    def __init__(
+        self,
+        analysis_store: AnalysisStore,
+        task_runner: TaskRunner,
+        worker_pool: Optional[AnalysisWorkerPool] = None,
+    ) -> None:
         self._analysis_store = analysis_store
         self._task_runner = task_runner
+        self._worker_pool = worker_pool
 
     async def initialize_analyzer(
         self,
@@ -46,6 +56,8 @@ class AnalysesManager:
 
         If an error is raised during initialization, then we abandon the analysis process
         and save the failed analysis, along with the error message, to the database.
+        With a worker pool, a worker loads the protocol and verifies the run time
+        parameters, so this process doesn't run any of the protocol.
         See `RunOrchestrator.get_run_time_parameters()` for details of which RTPs get
         saved in the analysis when such a failure occurs.
 
@@ -57,6 +69,7 @@ class AnalysesManager:
         analyzer = protocol_analyzer.create_protocol_analyzer(
             analysis_store=self._analysis_store,
             protocol_resource=protocol_resource,
+            worker_pool=self._worker_pool,
         )
         try:
             await analyzer.load_orchestrator(
@@ -64,19 +77,21 @@ class AnalysesManager:
                 run_time_param_paths=run_time_param_paths,
             )
         except Exception as error:
-            internal_error = em.map_unexpected_error(error)
+            if isinstance(error, AnalysisLoadError):
+                # The worker that loaded the protocol already recorded the error.
+                error_occurrence = error.error
+            else:
+                error_occurrence = ErrorOccurrence.from_failed(
+                    id="internal-error",
+                    createdAt=datetime_helper.utc_now(),
+                    error=em.map_unexpected_error(error),
+                )
             await self._analysis_store.save_initialization_failed_analysis(
                 protocol_id=protocol_resource.protocol_id,
                 analysis_id=analysis_id,
                 robot_type=protocol_resource.source.robot_type,
                 run_time_parameters=analyzer.get_verified_run_time_parameters(),
-                errors=[
-                    ErrorOccurrence.from_failed(
-                        id="internal-error",
-                        createdAt=datetime_helper.utc_now(),
-                        error=internal_error,
-                    )
-                ],
+                errors=[error_occurrence],
             )
             raise FailedToInitializeAnalyzer() from error
         return analyzer
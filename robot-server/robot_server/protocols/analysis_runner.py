@@ -0,0 +1,57 @@
+"""Run protocol analyses, in the server process or in an analysis worker."""
+from opentrons_shared_data.robot.types import RobotType
+
+from opentrons.protocol_engine import ErrorOccurrence
+from opentrons.protocol_runner import RunOrchestrator
+import opentrons.util.helpers as datetime_helper
+
+import robot_server.errors.error_mappers as em
+
+from .analysis_models import CompletedAnalysis
+from .analysis_store import build_completed_analysis
+
+
+async def run_analysis(
+    orchestrator: RunOrchestrator,
+    analysis_id: str,
+    robot_type: RobotType,
+) -> CompletedAnalysis:
+    """Run a loaded protocol to completion and build its analysis.
+
+    An error in the protocol makes a completed analysis with errors, as usual.
+    So does an unexpected error running it, recorded as an internal error.
+    Cancellation is not caught.
+    """
+    try:
+        result = await orchestrator.run(deck_configuration=[])
+    except Exception as error:
+        return build_completed_analysis(
+            analysis_id=analysis_id,
+            robot_type=robot_type,
+            run_time_parameters=orchestrator.get_run_time_parameters(),
+            commands=[],
+            labware=[],
+            modules=[],
+            pipettes=[],
+            errors=[
+                ErrorOccurrence.from_failed(
+                    # TODO(tz, 2-15-24): replace with a different error type
+                    #  when we are able to support different errors.
+                    id="internal-error",
+                    createdAt=datetime_helper.utc_now(),
+                    error=em.map_unexpected_error(error=error),
+                )
+            ],
+            liquids=[],
+        )
+    return build_completed_analysis(
+        analysis_id=analysis_id,
+        robot_type=robot_type,
+        run_time_parameters=result.parameters,
+        commands=result.commands,
+        labware=result.state_summary.labware,
+        modules=result.state_summary.modules,
+        pipettes=result.state_summary.pipettes,
+        errors=result.state_summary.errors,
+        liquids=result.state_summary.liquids,
+    )
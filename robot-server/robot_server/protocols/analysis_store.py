@@ -31,7 +31,11 @@ from .analysis_models import (
     AnalysisStatus,
 )
 
-from .completed_analysis_store import CompletedAnalysisStore, CompletedAnalysisResource
+from .completed_analysis_store import (
+    CompletedAnalysisStore,
+    CompletedAnalysisResource,
+    CompletedAnalysisDocument,
+)
 from .analysis_memcache import MemoryCache
 from .rtp_resources import PrimitiveParameterResource, CSVParameterResource
 
@@ -169,6 +173,28 @@ class AnalysisStore:
             liquids: See `CompletedAnalysis.liquids`.
             robot_type: See `CompletedAnalysis.robotType`.
         """
+        await self.update_from_analysis(
+            completed_analysis=build_completed_analysis(
+                analysis_id=analysis_id,
+                robot_type=robot_type,
+                run_time_parameters=run_time_parameters,
+                commands=commands,
+                labware=labware,
+                modules=modules,
+                pipettes=pipettes,
+                errors=errors,
+                liquids=liquids,
+            )
+        )
+
+    async def update_from_analysis(self, completed_analysis: CompletedAnalysis) -> None:
+        """Promote a pending analysis to completed, from its built results.
+
+        This is like `update()`, for analyses already built, like by
+        `build_completed_analysis()`. `completed_analysis.id` must point to a valid
+        pending analysis.
+        """
+        analysis_id = completed_analysis.id
         protocol_id = self._pending_store.get_protocol_id(analysis_id=analysis_id)
 
         # No protocol ID means there was no pending analysis with the given analysis ID.
@@ -176,32 +202,6 @@ class AnalysisStore:
             protocol_id is not None
         ), "Analysis ID to update must be for a valid pending analysis."
 
-        if len(errors) > 0:
-            if any(
-                code_in_error_tree(
-                    root_error=error, code=ErrorCodes.RUNTIME_PARAMETER_VALUE_REQUIRED
-                )
-                for error in errors
-            ):
-                result = AnalysisResult.PARAMETER_VALUE_REQUIRED
-            else:
-                result = AnalysisResult.NOT_OK
-        else:
-            result = AnalysisResult.OK
-
-        completed_analysis = CompletedAnalysis.construct(
-            id=analysis_id,
-            result=result,
-            robotType=robot_type,
-            status=AnalysisStatus.COMPLETED,
-            runTimeParameters=run_time_parameters,
-            commands=commands,
-            labware=labware,
-            modules=modules,
-            pipettes=pipettes,
-            errors=errors,
-            liquids=liquids,
-        )
         completed_analysis_resource = CompletedAnalysisResource(
             id=completed_analysis.id,
             protocol_id=protocol_id,
@@ -209,9 +209,11 @@ class AnalysisStore:
             completed_analysis=completed_analysis,
         )
         primitive_rtp_resources = self._extract_primitive_run_time_params(
-            completed_analysis
+            analysis_id, completed_analysis.runTimeParameters
+        )
+        csv_rtp_resources = self._extract_csv_run_time_params(
+            analysis_id, completed_analysis.runTimeParameters
         )
-        csv_rtp_resources = self._extract_csv_run_time_params(completed_analysis)
         await self._completed_store.make_room_and_add(
             completed_analysis_resource=completed_analysis_resource,
             primitive_rtp_resources=primitive_rtp_resources,
@@ -220,6 +222,49 @@ class AnalysisStore:
 
         self._pending_store.remove(analysis_id=analysis_id)
 
+    async def update_from_document(
+        self,
+        analysis_id: str,
+        run_time_parameters: List[RunTimeParameter],
+        completed_analysis_document: str,
+    ) -> None:
+        """Promote a pending analysis to completed, from its serialized results.
+
+        This is like `update()`, for analyses that were already serialized,
+        like by an analysis worker process. The document is stored as-is.
+
+        Args:
+            analysis_id: The ID of the analysis to promote.
+                Must point to a valid pending analysis.
+            run_time_parameters: The run time parameters that the analysis used.
+                Must match the document's `runTimeParameters`.
+            completed_analysis_document: A `CompletedAnalysis`, serialized to JSON,
+                like by `build_completed_analysis()` and `pydantic_to_json()`.
+        """
+        protocol_id = self._pending_store.get_protocol_id(analysis_id=analysis_id)
+
+        # No protocol ID means there was no pending analysis with the given analysis ID.
+        assert (
+            protocol_id is not None
+        ), "Analysis ID to update must be for a valid pending analysis."
+
+        await self._completed_store.make_room_and_add(
+            completed_analysis_resource=CompletedAnalysisDocument(
+                id=analysis_id,
+                protocol_id=protocol_id,
+                analyzer_version=_CURRENT_ANALYZER_VERSION,
+                completed_analysis=completed_analysis_document,
+            ),
+            primitive_rtp_resources=self._extract_primitive_run_time_params(
+                analysis_id, run_time_parameters
+            ),
+            csv_rtp_resources=self._extract_csv_run_time_params(
+                analysis_id, run_time_parameters
+            ),
+        )
+
+        self._pending_store.remove(analysis_id=analysis_id)
+
     async def save_initialization_failed_analysis(
         self,
         protocol_id: str,
@@ -327,13 +372,13 @@ class AnalysisStore:
 
     @staticmethod
     def _extract_primitive_run_time_params(
-        completed_analysis: CompletedAnalysis,
+        analysis_id: str,
+        rtp_list: List[RunTimeParameter],
     ) -> List[PrimitiveParameterResource]:
         """Extract the Primitive Run Time Parameters from analysis for saving in DB."""
-        rtp_list = completed_analysis.runTimeParameters
         return [
             PrimitiveParameterResource(
-                analysis_id=completed_analysis.id,
+                analysis_id=analysis_id,
                 parameter_variable_name=param.variableName,
                 parameter_type=param.type,
                 parameter_value=param.value,
@@ -344,13 +389,13 @@ class AnalysisStore:
 
     @staticmethod
     def _extract_csv_run_time_params(
-        completed_analysis: CompletedAnalysis,
+        analysis_id: str,
+        csv_rtp_list: List[RunTimeParameter],
     ) -> List[CSVParameterResource]:
         """Extract the Primitive Run Time Parameters from analysis for saving in DB."""
-        csv_rtp_list = completed_analysis.runTimeParameters
         return [
             CSVParameterResource(
-                analysis_id=completed_analysis.id,
+                analysis_id=analysis_id,
                 parameter_variable_name=param.variableName,
                 file_id=param.file.id if param.file else None,
             )
@@ -482,5 +527,48 @@ class _PendingAnalysisStore:
         return self._protocol_ids_by_analysis_id.get(analysis_id, None)
 
 
+def build_completed_analysis(
+    analysis_id: str,
+    robot_type: RobotType,
+    run_time_parameters: List[RunTimeParameter],
+    commands: List[Command],
+    labware: List[LoadedLabware],
+    modules: List[LoadedModule],
+    pipettes: List[LoadedPipette],
+    errors: List[ErrorOccurrence],
+    liquids: List[Liquid],
+) -> CompletedAnalysis:
+    """Build a completed analysis, inferring its result from its errors.
+
+    See `AnalysisStore.update()` for what each argument means.
+    """
+    if len(errors) > 0:
+        if any(
+            code_in_error_tree(
+                root_error=error, code=ErrorCodes.RUNTIME_PARAMETER_VALUE_REQUIRED
+            )
+            for error in errors
+        ):
+            result = AnalysisResult.PARAMETER_VALUE_REQUIRED
+        else:
+            result = AnalysisResult.NOT_OK
+    else:
+        result = AnalysisResult.OK
+
+    return CompletedAnalysis.construct(
+        id=analysis_id,
+        result=result,
+        robotType=robot_type,
+        status=AnalysisStatus.COMPLETED,
+        runTimeParameters=run_time_parameters,
+        commands=commands,
+        labware=labware,
+        modules=modules,
+        pipettes=pipettes,
+        errors=errors,
+        liquids=liquids,
+    )
+
+
 def _summarize_pending(pending_analysis: PendingAnalysis) -> AnalysisSummary:
     return AnalysisSummary(id=pending_analysis.id, status=pending_analysis.status)
@@ -0,0 +1,389 @@
+"""A pool of worker processes to run protocol analyses in.
+
+Analyses are compute-bound, and long protocols can take minutes to analyze.
+In the server process, they hold the GIL and starve the event loop, slowing down
+every other request. The pool runs them in separate processes instead. Workers
+also load protocols to verify their run time parameter values, which runs
+the protocol's parameter definitions.
+
+Workers are forked from a server process that has already imported this module,
+and with it everything analysis needs. Each worker then warms up by analyzing a
+small protocol for each robot type, which loads the definitions that almost every
+protocol uses, before it waits for requests. Workers are reused from one request
+to the next.
+"""
+import asyncio
+import logging
+import multiprocessing
+import resource
+import signal
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from multiprocessing.context import ForkServerContext
+from pathlib import Path
+from typing import List, Optional, Set, Union
+
+import anyio
+
+from opentrons.protocol_engine import ErrorOccurrence
+from opentrons.protocol_engine.types import (
+    PrimitiveRunTimeParamValuesType,
+    CSVRuntimeParamPaths,
+    RunTimeParameter,
+)
+from opentrons.protocol_reader import ProtocolReader, ProtocolSource
+from opentrons.protocol_runner import RunOrchestrator
+import opentrons.protocol_runner.create_simulating_orchestrator as simulating_runner
+from opentrons.protocol_runner.run_orchestrator import ParseMode
+from opentrons.protocol_runner.warm_up import warm_up
+import opentrons.util.helpers as datetime_helper
+
+import robot_server.errors.error_mappers as em
+from robot_server.persistence.pydantic import pydantic_to_json
+
+from .analysis_runner import run_analysis
+
+log = logging.getLogger(__name__)
+
+
+class AnalysisWorkerError(RuntimeError):
+    """Error raised when an analysis worker stops without finishing a request."""
+
+
+class AnalysisLoadError(RuntimeError):
+    """Error raised when a worker fails to load a protocol.
+
+    This happens when the protocol itself is invalid, or has invalid run time
+    parameter values, not when the worker fails.
+
+    Attributes:
+        run_time_parameters: The protocol's run time parameters, as far as they
+            were loaded.
+        error: What went wrong.
+    """
+
+    def __init__(
+        self, run_time_parameters: List[RunTimeParameter], error: ErrorOccurrence
+    ) -> None:
+        super().__init__(error.detail)
+        self.run_time_parameters = run_time_parameters
+        self.error = error
+
+
+@dataclass(frozen=True)
+class _LoadRequest:
+    protocol_source: ProtocolSource
+    run_time_param_values: Optional[PrimitiveRunTimeParamValuesType]
+    run_time_param_paths: Optional[CSVRuntimeParamPaths]
+
+
+@dataclass(frozen=True)
+class _LoadResult:
+    run_time_parameters: List[RunTimeParameter]
+    error: Optional[ErrorOccurrence]
+
+
+@dataclass(frozen=True)
+class _AnalysisRequest:
+    analysis_id: str
+    protocol_source: ProtocolSource
+    run_time_param_values: Optional[PrimitiveRunTimeParamValuesType]
+    run_time_param_paths: Optional[CSVRuntimeParamPaths]
+
+
+_Request = Union[_LoadRequest, _AnalysisRequest]
+
+
+class _Worker:
+    """A worker process and the pipe to send it requests over."""
+
+    def __init__(self, context: ForkServerContext, memory_limit: Optional[int]) -> None:
+        self._connection, worker_connection = context.Pipe()
+        self._process = context.Process(
+            target=_run_worker,
+            args=(worker_connection, memory_limit),
+            name="analysis-worker",
+            daemon=True,
+        )
+        self._process.start()
+        worker_connection.close()
+
+    def run(self, request: _Request) -> object:
+        """Send the worker a request and wait for its result.
+
+        This blocks until the request is done, so run it in a worker thread.
+        """
+        try:
+            self._connection.send(request)
+            failure: Optional[str] = self._connection.recv()
+            if failure is None:
+                result: object = self._connection.recv()
+                return result
+        except (EOFError, OSError):
+            self._process.join(timeout=1)
+            failure = f"Analysis worker exited with code {self._process.exitcode}."
+        raise AnalysisWorkerError(failure)
+
+    def kill(self) -> None:
+        """Stop the worker right away, abandoning whatever it's doing."""
+        self._process.kill()
+
+    def join(self) -> None:
+        """Wait for the worker to stop."""
+        self._process.join()
+
+
+class AnalysisWorkerPool:
+    """Worker processes to run protocol analyses in, outside the server process.
+
+    Each request waits for a free worker. If a request fails outside of the
+    protocol, or is cancelled, its worker is killed and replaced, so it can't
+    hold on to memory or keep going with an analysis nobody is waiting for.
+    """
+
+    def __init__(self, size: int, memory_limit: Optional[int] = None) -> None:
+        """Initialize the pool. Call `start()` to start its workers.
+
+        Params:
+            size: How many requests to run at once.
+            memory_limit: The most address space, in bytes, that each worker may
+                use. Analyses that need more fail with a `MemoryError`.
+        """
+        self._size = size
+        self._memory_limit = memory_limit
+        self._context = multiprocessing.get_context("forkserver")
+        self._context.set_forkserver_preload([__name__])
+        self._workers: Set[_Worker] = set()
+        self._idle_workers: "asyncio.Queue[_Worker]" = asyncio.Queue()
+        self._start_task: Optional["asyncio.Task[None]"] = None
+        self._replace_tasks: Set["asyncio.Task[None]"] = set()
+        self._closed = False
+
+    def start(self) -> None:
+        """Start the workers in the background.
+
+        The first worker also starts the server process that workers are forked
+        from, which takes a few seconds. Requests made meanwhile wait.
+        """
+        self._start_task = asyncio.get_running_loop().create_task(self._start_workers())
+
+    async def load(
+        self,
+        protocol_source: ProtocolSource,
+        run_time_param_values: Optional[PrimitiveRunTimeParamValuesType],
+        run_time_param_paths: Optional[CSVRuntimeParamPaths],
+    ) -> List[RunTimeParameter]:
+        """Load a protocol in a worker, to verify its run time parameter values.
+
+        Returns:
+            The protocol's run time parameters, with the given values set.
+
+        Raises:
+            AnalysisLoadError: The protocol failed to load, like if one of the
+                run time parameter values isn't valid.
+            AnalysisWorkerError: The worker failed outside of the protocol.
+        """
+        result = await self._run(
+            _LoadRequest(
+                protocol_source=protocol_source,
+                run_time_param_values=run_time_param_values,
+                run_time_param_paths=run_time_param_paths,
+            )
+        )
+        assert isinstance(result, _LoadResult)
+        if result.error is not None:
+            raise AnalysisLoadError(result.run_time_parameters, result.error)
+        return result.run_time_parameters
+
+    async def analyze(
+        self,
+        analysis_id: str,
+        protocol_source: ProtocolSource,
+        run_time_param_values: Optional[PrimitiveRunTimeParamValuesType],
+        run_time_param_paths: Optional[CSVRuntimeParamPaths],
+    ) -> str:
+        """Analyze a protocol in a worker.
+
+        Returns:
+            The `CompletedAnalysis`, serialized to JSON. As with analyses in the
+            server process, an error in the protocol makes a completed analysis
+            with errors, not an exception.
+
+        Raises:
+            AnalysisWorkerError: The worker failed outside of the protocol, or
+                stopped, like if the system ran out of memory and killed it.
+        """
+        document = await self._run(
+            _AnalysisRequest(
+                analysis_id=analysis_id,
+                protocol_source=protocol_source,
+                run_time_param_values=run_time_param_values,
+                run_time_param_paths=run_time_param_paths,
+            )
+        )
+        assert isinstance(document, str)
+        return document
+
+    async def close(self) -> None:
+        """Stop all the workers, abandoning any requests they're running."""
+        self._closed = True
+        tasks = list(self._replace_tasks)
+        if self._start_task is not None:
+            tasks.append(self._start_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        workers = list(self._workers)
+        self._workers.clear()
+        for worker in workers:
+            worker.kill()
+        for worker in workers:
+            await anyio.to_thread.run_sync(worker.join)
+
+    async def _run(self, request: _Request) -> object:
+        assert self._start_task is not None, "Analysis workers were not started."
+        try:
+            # Shielded so that cancelling one request doesn't stop the pool starting.
+            await asyncio.shield(self._start_task)
+        except Exception as error:
+            raise AnalysisWorkerError("Analysis workers failed to start.") from error
+
+        worker = await self._idle_workers.get()
+        try:
+            result = await anyio.to_thread.run_sync(
+                worker.run,
+                request,
+                # Cancellation orphans the worker thread, but killing the worker
+                # makes it return.
+                cancellable=True,
+            )
+        except BaseException:
+            self._replace(worker)
+            raise
+        self._idle_workers.put_nowait(worker)
+        return result
+
+    async def _start_workers(self) -> None:
+        for _ in range(self._size):
+            await self._start_worker()
+
+    async def _start_worker(self) -> None:
+        worker = await anyio.to_thread.run_sync(
+            _Worker, self._context, self._memory_limit
+        )
+        if self._closed:
+            worker.kill()
+            return
+        self._workers.add(worker)
+        self._idle_workers.put_nowait(worker)
+
+    def _replace(self, worker: _Worker) -> None:
+        """Kill a worker, and start another in the background to take its place."""
+        worker.kill()
+        self._workers.discard(worker)
+        if self._closed:
+            return
+        task = asyncio.get_running_loop().create_task(self._start_worker())
+        self._replace_tasks.add(task)
+        task.add_done_callback(self._on_replaced)
+
+    def _on_replaced(self, task: "asyncio.Task[None]") -> None:
+        self._replace_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            log.error(
+                "Failed to replace an analysis worker.", exc_info=task.exception()
+            )
+
+
+def _run_worker(connection: Connection, memory_limit: Optional[int]) -> None:
+    """Run requests sent over the connection until it's closed."""
+    # The server stops its workers itself when it shuts down.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if memory_limit is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+    warm_up(_warm_up_with)
+
+    while True:
+        try:
+            request: _Request = connection.recv()
+        except EOFError:
+            return
+        try:
+            result: object
+            if isinstance(request, _LoadRequest):
+                result = asyncio.run(_load(request))
+            else:
+                result = asyncio.run(_analyze(request))
+        except Exception as error:
+            log.exception(
+                f'Analysis worker failed on "{request.protocol_source.main_file}".'
+            )
+            connection.send(f"{type(error).__name__}: {error}")
+        else:
+            connection.send(None)
+            connection.send(result)
+
+
+async def _create_orchestrator(protocol_source: ProtocolSource) -> RunOrchestrator:
+    return await simulating_runner.create_simulating_orchestrator(
+        robot_type=protocol_source.robot_type,
+        protocol_config=protocol_source.config,
+        use_virtual_clock=True,
+    )
+
+
+async def _load(request: _LoadRequest) -> _LoadResult:
+    """Load a protocol, the way `ProtocolAnalyzer.load_orchestrator()` does."""
+    orchestrator = await _create_orchestrator(request.protocol_source)
+    try:
+        await orchestrator.load(
+            protocol_source=request.protocol_source,
+            parse_mode=ParseMode.NORMAL,
+            run_time_param_values=request.run_time_param_values,
+            run_time_param_paths=request.run_time_param_paths,
+        )
+    except Exception as error:
+        return _LoadResult(
+            run_time_parameters=orchestrator.get_run_time_parameters(),
+            error=ErrorOccurrence.from_failed(
+                id="internal-error",
+                createdAt=datetime_helper.utc_now(),
+                error=em.map_unexpected_error(error),
+            ),
+        )
+    return _LoadResult(
+        run_time_parameters=orchestrator.get_run_time_parameters(), error=None
+    )
+
+
+async def _analyze(request: _AnalysisRequest) -> str:
+    """Analyze a protocol, the way `ProtocolAnalyzer.analyze()` does."""
+    protocol_source = request.protocol_source
+    orchestrator = await _create_orchestrator(protocol_source)
+    # The server verified these run time parameter values with `_load()` first.
+    await orchestrator.load(
+        protocol_source=protocol_source,
+        parse_mode=ParseMode.NORMAL,
+        run_time_param_values=request.run_time_param_values,
+        run_time_param_paths=request.run_time_param_paths,
+    )
+    completed_analysis = await run_analysis(
+        orchestrator=orchestrator,
+        analysis_id=request.analysis_id,
+        robot_type=protocol_source.robot_type,
+    )
+    return pydantic_to_json(completed_analysis)
+
+
+async def _warm_up_with(protocol_file: Path) -> None:
+    protocol_source = await ProtocolReader().read_saved(
+        files=[protocol_file], directory=None
+    )
+    await _analyze(
+        _AnalysisRequest(
+            analysis_id="warm-up",
+            protocol_source=protocol_source,
+            run_time_param_values=None,
+            run_time_param_paths=None,
+        )
+    )
@@ -109,6 +109,30 @@ class CompletedAnalysisResource:
         )
 
 
+@dataclass
+class CompletedAnalysisDocument:
+    """A protocol analysis that's been completed and already serialized to JSON.
+
+    This is like `CompletedAnalysisResource`, for analyses that were serialized
+    elsewhere, like in an analysis worker process, so storing them doesn't have
+    to serialize them again.
+    """
+
+    id: str
+    protocol_id: str
+    analyzer_version: str
+    completed_analysis: str
+
+    async def to_sql_values(self) -> Dict[str, object]:
+        """Return this data as a dict that can be passed to a SQLALchemy insert."""
+        return {
+            "id": self.id,
+            "protocol_id": self.protocol_id,
+            "analyzer_version": self.analyzer_version,
+            "completed_analysis": self.completed_analysis,
+        }
+
+
 class CompletedAnalysisStore:
     """A SQL-persistent and memory-cached store of protocol analyses that are completed.
 
@@ -310,7 +334,9 @@ class CompletedAnalysisStore:
 
     async def make_room_and_add(
         self,
-        completed_analysis_resource: CompletedAnalysisResource,
+        completed_analysis_resource: Union[
+            CompletedAnalysisResource, CompletedAnalysisDocument
+        ],
         primitive_rtp_resources: List[PrimitiveParameterResource],
         csv_rtp_resources: List[CSVParameterResource],
     ) -> None:
@@ -318,6 +344,9 @@ class CompletedAnalysisStore:
 
         Removes the oldest analyses in store if the number of analyses exceed
         the max allowed, and then adds the new analysis.
+
+        A `CompletedAnalysisDocument` isn't added to the memory cache. It's
+        parsed and cached the first time it's read back.
         """
         analyses_ids = self.get_ids_by_protocol(completed_analysis_resource.protocol_id)
 
@@ -364,6 +393,7 @@ class CompletedAnalysisStore:
                     insert_csv_rtp_statement,
                     csv_param.to_sql_values(),
                 )
-        self._memcache.insert(
-            completed_analysis_resource.id, completed_analysis_resource
-        )
+        if isinstance(completed_analysis_resource, CompletedAnalysisResource):
+            self._memcache.insert(
+                completed_analysis_resource.id, completed_analysis_resource
+            )
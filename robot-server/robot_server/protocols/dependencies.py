@@ -2,7 +2,9 @@
 
 
 from asyncio import Lock as AsyncLock
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import AsyncGenerator, Optional
 from typing_extensions import Annotated
 
 from anyio import Path as AsyncPath
@@ -26,6 +28,7 @@ from robot_server.persistence.fastapi_dependencies import (
 from robot_server.persistence.file_and_directory_names import PROTOCOLS_DIRECTORY
 from robot_server.settings import get_settings
 from .analyses_manager import AnalysesManager
+from .analysis_worker_pool import AnalysisWorkerPool
 
 from .protocol_auto_deleter import ProtocolAutoDeleter
 from .protocol_store import (
@@ -40,6 +43,9 @@ _protocol_store_accessor = AppStateAccessor[ProtocolStore]("protocol_store")
 _analysis_store_accessor = AppStateAccessor[AnalysisStore]("analysis_store")
 
 _analyses_manager_accessor = AppStateAccessor[AnalysesManager]("analyses_manager")
+_analysis_worker_pool_accessor = AppStateAccessor[AnalysisWorkerPool](
+    "analysis_worker_pool"
+)
 _protocol_directory_init_lock = AsyncLock()
 _protocol_directory_accessor = AppStateAccessor[Path]("protocol_directory")
 
@@ -108,17 +114,53 @@ async def get_analysis_store(
     return analysis_store
 
 
+@asynccontextmanager
+async def set_up_analysis_worker_pool(
+    app_state: AppState, workers: int, memory_limit: Optional[int]
+) -> AsyncGenerator[None, None]:
+    """Set up the server's global singleton `AnalysisWorkerPool`, if it has one.
+
+    When this context manager is entered with more than 0 `workers`, the pool is
+    started in the background and stored on the given `AppState` for later access.
+    When it's exited, the pool's workers are stopped.
+    """
+    if workers == 0:
+        yield
+        return
+
+    worker_pool = AnalysisWorkerPool(size=workers, memory_limit=memory_limit)
+    worker_pool.start()
+    try:
+        _analysis_worker_pool_accessor.set_on(app_state, worker_pool)
+        yield
+    finally:
+        await worker_pool.close()
+        _analysis_worker_pool_accessor.set_on(app_state, None)
+
+
+def get_analysis_worker_pool(
+    app_state: Annotated[AppState, Depends(get_app_state)],
+) -> Optional[AnalysisWorkerPool]:
+    """Get the pool of processes to run analyses in, if analyses run outside the server."""
+    return _analysis_worker_pool_accessor.get_from(app_state)
+
+
 async def get_analyses_manager(
     app_state: Annotated[AppState, Depends(get_app_state)],
     analysis_store: Annotated[AnalysisStore, Depends(get_analysis_store)],
     task_runner: Annotated[TaskRunner, Depends(get_task_runner)],
+    worker_pool: Annotated[
+        Optional[AnalysisWorkerPool], Depends(get_analysis_worker_pool)
+    ],
 ) -> AnalysesManager:
     """Get a singleton AnalysesManager to keep track of analyzers."""
     analyses_manager = _analyses_manager_accessor.get_from(app_state)
 
     if analyses_manager is None:
         analyses_manager = AnalysesManager(
-            analysis_store=analysis_store, task_runner=task_runner
+            analysis_store=analysis_store,
+            task_runner=task_runner,
+            worker_pool=worker_pool,
         )
         _analyses_manager_accessor.set_on(app_state, analyses_manager)
 
@@ -24,6 +24,11 @@ import robot_server.errors.error_mappers as em
 
 from robot_server.protocols.protocol_store import ProtocolResource
 from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.protocols.analysis_runner import run_analysis
+from robot_server.protocols.analysis_worker_pool import (
+    AnalysisLoadError,
+    AnalysisWorkerPool,
+)
 
 log = logging.getLogger(__name__)
 
@@ -35,11 +40,20 @@ class ProtocolAnalyzer:
         self,
         analysis_store: AnalysisStore,
         protocol_resource: ProtocolResource,
+        worker_pool: Optional[AnalysisWorkerPool] = None,
     ) -> None:
-        """Initialize the analyzer and its dependencies."""
+        """Initialize the analyzer and its dependencies.
+
+        If there's a `worker_pool`, the analysis runs in one of its workers.
+        Otherwise, it runs in this process.
+        """
         self._analysis_store = analysis_store
         self._protocol_resource = protocol_resource
+        self._worker_pool = worker_pool
         self._orchestrator: Optional[RunOrchestrator] = None
+        self._run_time_parameters: Optional[List[RunTimeParameter]] = None
+        self._run_time_param_values: Optional[PrimitiveRunTimeParamValuesType] = None
+        self._run_time_param_paths: Optional[CSVRuntimeParamPaths] = None
 
     @property
     def protocol_resource(self) -> ProtocolResource:
@@ -48,8 +62,10 @@ class ProtocolAnalyzer:
 
     def get_verified_run_time_parameters(self) -> List[RunTimeParameter]:
         """Get the validated RTPs with values set by the client."""
-        assert self._orchestrator is not None
-        return self._orchestrator.get_run_time_parameters()
+        if self._orchestrator is not None:
+            return self._orchestrator.get_run_time_parameters()
+        assert self._run_time_parameters is not None
+        return self._run_time_parameters
 
     async def load_orchestrator(
         self,
@@ -58,11 +74,32 @@ class ProtocolAnalyzer:
     ) -> None:
         """Load runner with the protocol and run time parameter values.
 
-        Returns: The RunOrchestrator instance.
+        If there's a worker pool, a worker loads the protocol instead, and only
+        the run time parameters it verified are kept here.
+
+        Raises:
+            AnalysisLoadError: A worker failed to load the protocol.
         """
+        self._run_time_param_values = run_time_param_values
+        self._run_time_param_paths = run_time_param_paths
+        if self._worker_pool is not None:
+            try:
+                self._run_time_parameters = await self._worker_pool.load(
+                    protocol_source=self._protocol_resource.source,
+                    run_time_param_values=run_time_param_values,
+                    run_time_param_paths=run_time_param_paths,
+                )
+            except AnalysisLoadError as error:
+                self._run_time_parameters = error.run_time_parameters
+                raise
+            except Exception:
+                self._run_time_parameters = []
+                raise
+            return
         self._orchestrator = await simulating_runner.create_simulating_orchestrator(
             robot_type=self._protocol_resource.source.robot_type,
             protocol_config=self._protocol_resource.source.config,
+            use_virtual_clock=True,
         )
         await self._orchestrator.load(
             protocol_source=self._protocol_resource.source,
@@ -78,35 +115,68 @@ class ProtocolAnalyzer:
     ) -> None:
         """Analyze a given protocol, storing the analysis when complete.
 
-        This method should only be called once the run orchestrator is loaded.
+        This method should only be called once the protocol is loaded.
+        If it's cancelled, it stores the analysis as failed before stopping.
         """
         assert self._protocol_resource is not None
+        if self._worker_pool is not None:
+            await self._analyze_in_worker(analysis_id, self._worker_pool)
+            return
         assert self._orchestrator is not None
         try:
-            result = await self._orchestrator.run(
-                deck_configuration=[],
+            completed_analysis = await run_analysis(
+                orchestrator=self._orchestrator,
+                analysis_id=analysis_id,
+                robot_type=self._protocol_resource.source.robot_type,
             )
-        except BaseException as error:
+        except asyncio.CancelledError as error:
             await self.update_to_failed_analysis(
                 analysis_id=analysis_id,
                 protocol_robot_type=self._protocol_resource.source.robot_type,
                 error=error,
                 run_time_parameters=self._orchestrator.get_run_time_parameters(),
             )
-            return
+            raise
 
         log.info(f'Completed analysis "{analysis_id}".')
 
-        await self._analysis_store.update(
+        await self._analysis_store.update_from_analysis(
+            completed_analysis=completed_analysis
+        )
+
+    async def _analyze_in_worker(
+        self, analysis_id: str, worker_pool: AnalysisWorkerPool
+    ) -> None:
+        """Analyze the protocol in a worker, storing its pre-serialized analysis.
+
+        The worker loads the protocol again, with the same run time parameter
+        values, so the run time parameters verified here are the ones it uses.
+        """
+        run_time_parameters = self.get_verified_run_time_parameters()
+        try:
+            document = await worker_pool.analyze(
+                analysis_id=analysis_id,
+                protocol_source=self._protocol_resource.source,
+                run_time_param_values=self._run_time_param_values,
+                run_time_param_paths=self._run_time_param_paths,
+            )
+        except (Exception, asyncio.CancelledError) as error:
+            await self.update_to_failed_analysis(
+                analysis_id=analysis_id,
+                protocol_robot_type=self._protocol_resource.source.robot_type,
+                error=error,
+                run_time_parameters=run_time_parameters,
+            )
+            if isinstance(error, asyncio.CancelledError):
+                raise
+            return
+
+        log.info(f'Completed analysis "{analysis_id}" in a worker.')
+
+        await self._analysis_store.update_from_document(
             analysis_id=analysis_id,
-            robot_type=self._protocol_resource.source.robot_type,
-            run_time_parameters=result.parameters,
-            commands=result.commands,
-            labware=result.state_summary.labware,
-            modules=result.state_summary.modules,
-            pipettes=result.state_summary.pipettes,
-            errors=result.state_summary.errors,
-            liquids=result.state_summary.liquids,
+            run_time_parameters=run_time_parameters,
+            completed_analysis_document=document,
         )
 
     async def update_to_failed_analysis(
@@ -160,8 +230,11 @@ class ProtocolAnalyzer:
 def create_protocol_analyzer(
     analysis_store: AnalysisStore,
     protocol_resource: ProtocolResource,
+    worker_pool: Optional[AnalysisWorkerPool] = None,
 ) -> ProtocolAnalyzer:
     """Protocol analyzer factory function."""
     return ProtocolAnalyzer(
-        analysis_store=analysis_store, protocol_resource=protocol_resource
+        analysis_store=analysis_store,
+        protocol_resource=protocol_resource,
+        worker_pool=worker_pool,
     )
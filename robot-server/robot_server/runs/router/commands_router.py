@@ -1,8 +1,22 @@
 """Router for /runs commands endpoints."""
+import functools
+import itertools
+import json
 import textwrap
-from typing import Annotated, Final, Literal, Optional, Union
+from typing import (
+    Annotated,
+    AsyncIterator,
+    Final,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
 
+from anyio import to_thread
 from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 
 from opentrons.protocol_engine import (
     CommandPointer,
@@ -44,6 +58,9 @@ from .base_router import RunNotFound, RunStopped
 
 _DEFAULT_COMMAND_LIST_LENGTH: Final = 20
 
+# How many pre-serialized commands to encode into each chunk of a streamed response.
+_PRE_SERIALIZED_CHUNK_LENGTH: Final = 500
+
 commands_router = APIRouter()
 
 
@@ -351,8 +368,7 @@ async def get_run_commands(
 # TODO (spp, 2024-05-01): explore alternatives to returning commands as list of strings.
 #                Options: 1. JSON Lines
 #                         2. Simple de-serialized commands list w/o pydantic model conversion
-@PydanticResponse.wrap_route(
-    commands_router.get,
+@commands_router.get(
     path="/runs/{runId}/commandsAsPreSerializedList",
     summary="Get all commands of a completed run as a list of pre-serialized commands",
     description=(
@@ -366,6 +382,7 @@ async def get_run_commands(
         " `GET /runs/{runId}/commands`. For large protocols (10k+ commands), the above"
         " endpoint can take minutes to respond, whereas this one should only take a few seconds."
     ),
+    response_model=SimpleMultiBody[str],
     responses={
         status.HTTP_404_NOT_FOUND: {"model": ErrorBody[RunNotFound]},
         status.HTTP_503_SERVICE_UNAVAILABLE: {
@@ -381,9 +398,14 @@ async def get_run_commands_as_pre_serialized_list(
         description="If `true`, return all commands (protocol, setup, fixit)."
         " If `false`, only return safe commands (protocol, setup).",
     ),
-) -> PydanticResponse[SimpleMultiBody[str]]:
+) -> StreamingResponse:
     """Get all commands of a completed run as a list of pre-serialized (string encoded) commands.
 
+    The response is streamed as the commands are read from the database,
+    so long runs don't have to be held in memory all at once. The first chunk
+    is read before the response starts, so errors reading the run still get an
+    error status.
+
     Arguments:
         runId: Requested run ID, from the URL
         run_data_manager: Run data retrieval interface.
@@ -391,8 +413,12 @@ async def get_run_commands_as_pre_serialized_list(
             " If `false`, only return safe commands.
     """
     try:
-        commands = run_data_manager.get_all_commands_as_preserialized_list(
-            run_id=runId, include_fixit_commands=includeFixitCommands
+        commands = await to_thread.run_sync(
+            functools.partial(
+                run_data_manager.iter_all_commands_as_preserialized,
+                run_id=runId,
+                include_fixit_commands=includeFixitCommands,
+            )
         )
     except RunNotFoundError as e:
         raise RunNotFound.from_exc(e).as_error(status.HTTP_404_NOT_FOUND) from e
@@ -400,13 +426,39 @@ async def get_run_commands_as_pre_serialized_list(
         raise PreSerializedCommandsNotAvailable.from_exc(e).as_error(
             status.HTTP_503_SERVICE_UNAVAILABLE
         ) from e
-    return await PydanticResponse.create(
-        content=SimpleMultiBody.construct(
-            data=commands, meta=MultiBodyMeta(cursor=0, totalLength=len(commands))
-        )
+
+    first_chunk = await to_thread.run_sync(_read_chunk, commands)
+
+    return StreamingResponse(
+        _render_pre_serialized_list(commands, first_chunk),
+        media_type="application/json",
     )
 
 
+def _read_chunk(commands: Iterator[str]) -> List[str]:
+    return list(itertools.islice(commands, _PRE_SERIALIZED_CHUNK_LENGTH))
+
+
+async def _render_pre_serialized_list(
+    commands: Iterator[str], first_chunk: List[str]
+) -> AsyncIterator[bytes]:
+    """Render pre-serialized commands as a `SimpleMultiBody[str]`, a chunk at a time.
+
+    The output is the same as rendering the whole body with Pydantic. The total
+    length is only known at the end, so `meta` comes last.
+    """
+    yield b'{"data": ['
+    chunk = first_chunk
+    total_length = 0
+    while chunk:
+        separator = ", " if total_length else ""
+        yield (separator + ", ".join(json.dumps(c) for c in chunk)).encode("utf-8")
+        total_length += len(chunk)
+        chunk = await to_thread.run_sync(_read_chunk, commands)
+    meta = MultiBodyMeta(cursor=0, totalLength=total_length)
+    yield f'], "meta": {meta.json()}}}'.encode("utf-8")
+
+
 @PydanticResponse.wrap_route(
     commands_router.get,
     path="/runs/{runId}/commands/{commandId}",
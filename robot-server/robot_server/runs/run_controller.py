@@ -1,8 +1,13 @@
 """Control an active run with Actions."""
+import asyncio
+import contextlib
 import logging
 from datetime import datetime
+from functools import partial
 from typing import Optional
 from typing_extensions import assert_never
+
+from anyio import to_thread
 from opentrons.protocol_engine import ProtocolEngineError
 from opentrons_shared_data.errors.exceptions import RoboticsInteractionError
 
@@ -18,6 +23,12 @@ from robot_server.service.notifications import RunsPublisher, MaintenanceRunsPub
 
 log = logging.getLogger(__name__)
 
+_COMMAND_PERSISTENCE_INTERVAL = 1.0
+"""Seconds between writes of newly completed commands while a run executes."""
+
+_COMMAND_PERSISTENCE_BATCH_SIZE = 100
+"""Maximum number of commands to write in a single database transaction."""
+
 
 class RunActionNotAllowedError(RoboticsInteractionError):
     """Error raised when a given run action is not allowed."""
@@ -41,6 +52,7 @@ class RunController:
         self._run_store = run_store
         self._runs_publisher = runs_publisher
         self._maintenance_runs_publisher = maintenance_runs_publisher
+        self._persisted_command_count = 0
 
     def create_action(
         self,
@@ -119,13 +131,65 @@ class RunController:
     async def _run_protocol_and_insert_result(
         self, deck_configuration: DeckConfigurationType
     ) -> None:
-        result = await self._run_orchestrator_store.run(
-            deck_configuration=deck_configuration,
-        )
-        self._run_store.update_run_state(
-            run_id=self._run_id,
-            summary=result.state_summary,
-            commands=result.commands,
-            run_time_parameters=result.parameters,
+        persistence_task = asyncio.create_task(self._persist_completed_commands())
+        try:
+            result = await self._run_orchestrator_store.run(
+                deck_configuration=deck_configuration,
+            )
+        finally:
+            persistence_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await persistence_task
+
+        # Commands already streamed to the database are final,
+        # so only the tail of the run needs to be written now.
+        await to_thread.run_sync(
+            partial(
+                self._run_store.update_run_state,
+                run_id=self._run_id,
+                summary=result.state_summary,
+                commands=result.commands,
+                run_time_parameters=result.parameters,
+                persisted_command_count=self._persisted_command_count,
+            )
         )
         self._runs_publisher.publish_pre_serialized_commands_notification(self._run_id)
+
+    async def _persist_completed_commands(self) -> None:
+        """Write commands to the run store as they complete, until cancelled.
+
+        If a write fails, stop streaming; the end-of-run write will cover
+        everything that wasn't persisted.
+        """
+        while True:
+            await asyncio.sleep(_COMMAND_PERSISTENCE_INTERVAL)
+            completed_commands = (
+                self._run_orchestrator_store.get_completed_commands_from(
+                    start_index=self._persisted_command_count
+                )
+            )
+
+            for batch_start in range(
+                0, len(completed_commands), _COMMAND_PERSISTENCE_BATCH_SIZE
+            ):
+                batch = completed_commands[
+                    batch_start : batch_start + _COMMAND_PERSISTENCE_BATCH_SIZE
+                ]
+                try:
+                    await to_thread.run_sync(
+                        partial(
+                            self._run_store.insert_commands,
+                            run_id=self._run_id,
+                            commands=batch,
+                            first_index=self._persisted_command_count,
+                        )
+                    )
+                except Exception:
+                    log.warning(
+                        f'Could not persist commands of run "{self._run_id}"'
+                        " while it was running.",
+                        exc_info=True,
+                    )
+                    return
+
+                self._persisted_command_count += len(batch)
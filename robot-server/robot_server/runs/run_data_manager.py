@@ -1,6 +1,9 @@
 """Manage current and historical run data."""
 from datetime import datetime
-from typing import List, Optional, Callable, Union, Dict
+from functools import partial
+from typing import Iterator, List, Optional, Callable, Union, Dict
+
+from anyio import to_thread
 
 from opentrons_shared_data.labware.labware_definition import LabwareDefinition
 from opentrons_shared_data.errors.exceptions import InvalidStoredData, EnumeratedError
@@ -203,11 +206,14 @@ class RunDataManager:
         if prev_run_id is not None:
             # Allow clear() to propagate RunConflictError.
             prev_run_result = await self._run_orchestrator_store.clear()
-            self._run_store.update_run_state(
-                run_id=prev_run_id,
-                summary=prev_run_result.state_summary,
-                commands=prev_run_result.commands,
-                run_time_parameters=prev_run_result.parameters,
+            await to_thread.run_sync(
+                partial(
+                    self._run_store.update_run_state,
+                    run_id=prev_run_id,
+                    summary=prev_run_result.state_summary,
+                    commands=prev_run_result.commands,
+                    run_time_parameters=prev_run_result.parameters,
+                )
             )
 
         error_recovery_is_enabled = self._error_recovery_setting_store.get_is_enabled()
@@ -308,16 +314,27 @@ class RunDataManager:
         Params:
             length: If `None`, return all runs. Otherwise, return the newest n runs.
         """
-        return [
-            _build_run(
-                run_resource=run_resource,
-                state_summary=self._get_state_summary(run_resource.run_id),
-                current=run_resource.run_id
-                == self._run_orchestrator_store.current_run_id,
-                run_time_parameters=self._get_run_time_parameters(run_resource.run_id),
+        current_run_id = self._run_orchestrator_store.current_run_id
+        runs: List[Union[Run, BadRun]] = []
+        for run_resource, stored_state in self._run_store.get_all_with_state(length):
+            current = run_resource.run_id == current_run_id
+            runs.append(
+                _build_run(
+                    run_resource=run_resource,
+                    state_summary=(
+                        self._run_orchestrator_store.get_state_summary()
+                        if current
+                        else stored_state.get_state_summary()
+                    ),
+                    current=current,
+                    run_time_parameters=(
+                        self._run_orchestrator_store.get_run_time_parameters()
+                        if current
+                        else stored_state.get_run_time_parameters()
+                    ),
+                )
             )
-            for run_resource in self._run_store.get_all(length)
-        ]
+        return runs
 
     async def delete(self, run_id: str) -> None:
         """Delete a current or historical run.
@@ -370,13 +387,14 @@ class RunDataManager:
                 state_summary,
                 parameters,
             ) = await self._run_orchestrator_store.clear()
-            run_resource: Union[
-                RunResource, BadRunResource
-            ] = self._run_store.update_run_state(
-                run_id=run_id,
-                summary=state_summary,
-                commands=commands,
-                run_time_parameters=parameters,
+            run_resource: Union[RunResource, BadRunResource] = await to_thread.run_sync(
+                partial(
+                    self._run_store.update_run_state,
+                    run_id=run_id,
+                    summary=state_summary,
+                    commands=commands,
+                    run_time_parameters=parameters,
+                )
             )
             self._runs_publisher.publish_pre_serialized_commands_notification(run_id)
         else:
@@ -516,10 +534,13 @@ class RunDataManager:
 
         raise RunNotCurrentError()
 
-    def get_all_commands_as_preserialized_list(
+    def iter_all_commands_as_preserialized(
         self, run_id: str, include_fixit_commands: bool
-    ) -> List[str]:
-        """Get all commands of a run in a serialized json list."""
+    ) -> Iterator[str]:
+        """Iterate over all commands of a run as serialized json strings.
+
+        Errors are raised right away, not when iteration starts.
+        """
         if (
             run_id == self._run_orchestrator_store.current_run_id
             and not self._run_orchestrator_store.get_is_run_terminal()
@@ -527,7 +548,7 @@ class RunDataManager:
             raise PreSerializedCommandsNotAvailableError(
                 "Pre-serialized commands are only available after a run has ended."
             )
-        return self._run_store.get_all_commands_as_preserialized_list(
+        return self._run_store.iter_all_commands_as_preserialized(
             run_id, include_fixit_commands
         )
 
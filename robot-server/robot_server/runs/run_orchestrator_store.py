@@ -383,6 +383,12 @@ class RunOrchestratorStore:
         """Get a run's command by ID."""
         return self.run_orchestrator.get_command(command_id=command_id)
 
+    def get_completed_commands_from(self, start_index: int) -> List[Command]:
+        """Get the unbroken run of completed commands starting at the given index."""
+        return self.run_orchestrator.get_completed_commands_from(
+            start_index=start_index
+        )
+
     def get_status(self) -> EngineStatus:
         """Get the current execution status of the run."""
         return self.run_orchestrator.get_run_status()
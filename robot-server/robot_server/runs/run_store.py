@@ -1,13 +1,22 @@
 """Runs' on-db store."""
 import logging
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache
-from typing import Dict, List, Optional, Literal, Union
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Literal,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import sqlalchemy
-from sqlalchemy import and_
 from pydantic import ValidationError
 
 from opentrons.util.helpers import utc_now
@@ -43,6 +52,9 @@ log = logging.getLogger(__name__)
 
 _CACHE_ENTRIES = 32
 
+# How many commands to fetch at a time when iterating over all of a run's commands.
+_PRESERIALIZED_BATCH_SIZE = 1000
+
 
 @dataclass(frozen=True)
 class RunResource:
@@ -96,6 +108,43 @@ class CSVParameterRunResource:
     file_id: Optional[str]
 
 
+class StoredRunState:
+    """A run's archived state summary and run time parameters.
+
+    These are only parsed from their stored JSON the first time they're needed,
+    since listing runs doesn't need them for the current run.
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        state_summary_json: Optional[str],
+        run_time_parameters_json: Optional[str],
+    ) -> None:
+        """Initialize from the stored JSON columns of a run."""
+        self._run_id = run_id
+        self._state_summary_json = state_summary_json
+        self._run_time_parameters_json = run_time_parameters_json
+        self._state_summary: Optional[Union[StateSummary, BadStateSummary]] = None
+        self._run_time_parameters: Optional[List[RunTimeParameter]] = None
+
+    def get_state_summary(self) -> Union[StateSummary, BadStateSummary]:
+        """Get the archived run state summary, parsing it if necessary."""
+        if self._state_summary is None:
+            self._state_summary = _parse_state_summary(
+                self._run_id, self._state_summary_json
+            )
+        return self._state_summary
+
+    def get_run_time_parameters(self) -> List[RunTimeParameter]:
+        """Get the archived run time parameters, parsing them if necessary."""
+        if self._run_time_parameters is None:
+            self._run_time_parameters = _parse_run_time_parameters(
+                self._run_id, self._run_time_parameters_json
+            )
+        return self._run_time_parameters
+
+
 class CommandNotFoundError(ValueError):
     """Error raised when a given command ID is not found in the store."""
 
@@ -113,6 +162,11 @@ class RunStore:
     ) -> None:
         """Initialize a RunStore with sql engine and notification client."""
         self._sql_engine = sql_engine
+        # Keyed by run ID and when the run's state was last updated, so entries
+        # don't need to be invalidated when runs change.
+        self._stored_run_states: OrderedDict[
+            Tuple[str, Optional[datetime]], StoredRunState
+        ] = OrderedDict()
 
     def update_run_state(
         self,
@@ -120,14 +174,22 @@ class RunStore:
         summary: StateSummary,
         commands: List[Command],
         run_time_parameters: List[RunTimeParameter],
+        persisted_command_count: int = 0,
     ) -> RunResource:
         """Update the run's state summary and commands list.
 
+        Commands are serialized before the database transaction is opened,
+        and written with a single batched insert. This can take a while for long
+        runs, so callers in async code should run it in a worker thread.
+
         Args:
             run_id: The run to update
             summary: The run's equipment and status summary.
             commands: The run's commands.
             run_time_parameters: The run's run time parameters, if any.
+            persisted_command_count: How many of the run's leading commands have
+                already been stored with `insert_commands()` and have not changed
+                since. Only commands after these are rewritten.
 
         Returns:
             The run resource.
@@ -135,6 +197,12 @@ class RunStore:
         Raises:
             RunNotFoundError: Run ID was not found in the database.
         """
+        command_rows = _convert_commands_to_sql_values(
+            run_id=run_id,
+            commands=commands[persisted_command_count:],
+            first_index=persisted_command_count,
+        )
+
         update_run = (
             sqlalchemy.update(run_table)
             .where(run_table.c.id == run_id)
@@ -149,9 +217,10 @@ class RunStore:
         )
 
         delete_existing_commands = sqlalchemy.delete(run_command_table).where(
-            run_command_table.c.run_id == run_id
+            run_command_table.c.run_id == run_id,
+            run_command_table.c.index_in_run >= persisted_command_count,
         )
-        insert_command = sqlalchemy.insert(run_command_table)
+        insert_commands = sqlalchemy.insert(run_command_table)
 
         select_run_resource = sqlalchemy.select(*_run_columns).where(
             run_table.c.id == run_id
@@ -168,19 +237,8 @@ class RunStore:
 
             transaction.execute(update_run)
             transaction.execute(delete_existing_commands)
-            for command_index, command in enumerate(commands):
-                transaction.execute(
-                    insert_command,
-                    {
-                        "run_id": run_id,
-                        "index_in_run": command_index,
-                        "command_id": command.id,
-                        "command": pydantic_to_json(command),
-                        "command_intent": str(command.intent.value)
-                        if command.intent
-                        else CommandIntent.PROTOCOL,
-                    },
-                )
+            if command_rows:
+                transaction.execute(insert_commands, command_rows)
 
             run_row = transaction.execute(select_run_resource).one()
             action_rows = transaction.execute(select_actions).all()
@@ -191,6 +249,34 @@ class RunStore:
             raise maybe_run_resource.error
         return maybe_run_resource
 
+    def insert_commands(
+        self, run_id: str, commands: Sequence[Command], first_index: int
+    ) -> None:
+        """Append commands to the run's stored commands list.
+
+        This lets a run's commands be persisted incrementally. The commands must
+        already be finalized, since they will not be rewritten later unless
+        `update_run_state()` is called with a lower `persisted_command_count`.
+
+        Args:
+            run_id: The run to add commands to.
+            commands: The commands to add, in order.
+            first_index: The index in the run of the first command in `commands`.
+
+        Raises:
+            RunNotFoundError: Run ID was not found in the database.
+        """
+        command_rows = _convert_commands_to_sql_values(
+            run_id=run_id, commands=commands, first_index=first_index
+        )
+        if not command_rows:
+            return
+
+        with self._sql_engine.begin() as transaction:
+            if not self._run_exists(run_id, transaction):
+                raise RunNotFoundError(run_id=run_id)
+            transaction.execute(sqlalchemy.insert(run_command_table), command_rows)
+
     def insert_action(self, run_id: str, action: RunAction) -> None:
         """Insert a run action into the store.
 
@@ -337,28 +423,11 @@ class RunStore:
         Params:
             length: If `None`, return all runs. Otherwise, return the newest n runs.
         """
-        select_actions = sqlalchemy.select(action_table).order_by(sqlite_rowid.asc())
-        actions_by_run_id = defaultdict(list)
-
         with self._sql_engine.begin() as transaction:
-            if length is not None:
-                select_runs = (
-                    sqlalchemy.select(*_run_columns)
-                    .order_by(sqlite_rowid.desc())
-                    .limit(length)
-                )
-                # need to select the last inserted runs and return by asc order
-                runs = list(reversed(transaction.execute(select_runs).all()))
-            else:
-                select_runs = sqlalchemy.select(*_run_columns).order_by(
-                    sqlite_rowid.asc()
-                )
-                runs = transaction.execute(select_runs).all()
-
-            actions = transaction.execute(select_actions).all()
-
-        for action_row in actions:
-            actions_by_run_id[action_row.run_id].append(action_row)
+            runs = _select_runs(transaction, _run_columns, length)
+            actions_by_run_id = _select_actions_by_run_id(
+                transaction, [run_row.id for run_row in runs], length
+            )
 
         return [
             _convert_row_to_run(
@@ -368,6 +437,67 @@ class RunStore:
             for run_row in runs
         ]
 
+    def get_all_with_state(
+        self, length: Optional[int] = None
+    ) -> List[Tuple[Union[RunResource, BadRunResource], StoredRunState]]:
+        """Get known run resources along with their archived state.
+
+        This reads the runs, their actions, and whichever of their states
+        haven't already been read, all in one transaction.
+
+        Results are ordered from oldest to newest.
+
+        Params:
+            length: If `None`, return all runs. Otherwise, return the newest n runs.
+        """
+        with self._sql_engine.begin() as transaction:
+            runs = _select_runs(
+                transaction, [*_run_columns, run_table.c._updated_at], length
+            )
+            actions_by_run_id = _select_actions_by_run_id(
+                transaction, [run_row.id for run_row in runs], length
+            )
+            uncached_run_ids = [
+                run_row.id
+                for run_row in runs
+                if (run_row.id, run_row._updated_at) not in self._stored_run_states
+            ]
+            if uncached_run_ids:
+                state_rows = transaction.execute(
+                    sqlalchemy.select(
+                        run_table.c.id,
+                        run_table.c.state_summary,
+                        run_table.c.run_time_parameters,
+                    ).where(run_table.c.id.in_(uncached_run_ids))
+                ).all()
+            else:
+                state_rows = []
+
+        updated_at_by_run_id = {run_row.id: run_row._updated_at for run_row in runs}
+        for state_row in state_rows:
+            key = (state_row.id, updated_at_by_run_id[state_row.id])
+            self._stored_run_states[key] = StoredRunState(
+                run_id=state_row.id,
+                state_summary_json=state_row.state_summary,
+                run_time_parameters_json=state_row.run_time_parameters,
+            )
+
+        result = []
+        for run_row in runs:
+            key = (run_row.id, run_row._updated_at)
+            self._stored_run_states.move_to_end(key)
+            result.append(
+                (
+                    _convert_row_to_run(
+                        row=run_row, action_rows=actions_by_run_id[run_row.id]
+                    ),
+                    self._stored_run_states[key],
+                )
+            )
+        while len(self._stored_run_states) > max(_CACHE_ENTRIES, len(runs)):
+            self._stored_run_states.popitem(last=False)
+        return result
+
     @lru_cache(maxsize=_CACHE_ENTRIES)
     def get_state_summary(self, run_id: str) -> Union[StateSummary, BadStateSummary]:
         """Get the archived run state summary.
@@ -383,24 +513,7 @@ class RunStore:
         with self._sql_engine.begin() as transaction:
             row = transaction.execute(select_run_data).one()
 
-        try:
-            return (
-                json_to_pydantic(StateSummary, row.state_summary)
-                if row.state_summary is not None
-                else BadStateSummary(
-                    dataError=InvalidStoredData(
-                        message="There was no engine state data for this run."
-                    )
-                )
-            )
-        except ValidationError as e:
-            log.warning(f"Error retrieving state summary for {run_id}", exc_info=True)
-            return BadStateSummary(
-                dataError=InvalidStoredData(
-                    message="Could not load stored StateSummary",
-                    wrapping=[PythonException(e)],
-                )
-            )
+        return _parse_state_summary(run_id, row.state_summary)
 
     @lru_cache(maxsize=_CACHE_ENTRIES)
     def get_run_time_parameters(self, run_id: str) -> List[RunTimeParameter]:
@@ -417,17 +530,7 @@ class RunStore:
         with self._sql_engine.begin() as transaction:
             row = transaction.execute(select_run_data).one()
 
-        try:
-            return (
-                json_to_pydantic_list(RunTimeParameter, row.run_time_parameters)  # type: ignore[arg-type]
-                if row.run_time_parameters is not None
-                else []
-            )
-        except ValidationError:
-            log.warning(
-                f"Error retrieving run time parameters for {run_id}", exc_info=True
-            )
-            return []
+        return _parse_run_time_parameters(run_id, row.run_time_parameters)
 
     def get_commands_slice(
         self,
@@ -457,47 +560,28 @@ class RunStore:
             if not self._run_exists(run_id, transaction):
                 raise RunNotFoundError(run_id=run_id)
 
-            if include_fixit_commands:
-                select_count = sqlalchemy.select(sqlalchemy.func.count()).where(
-                    run_command_table.c.run_id == run_id
-                )
-            else:
-                select_count = sqlalchemy.select(sqlalchemy.func.count()).where(
-                    and_(
-                        run_command_table.c.run_id == run_id,
-                        run_command_table.c.command_intent != "fixit",
-                    )
-                )
+            # Both of these are answered from
+            # ix_run_run_id_index_in_run_command_intent, without reading the
+            # commands themselves until the slice is selected.
+            select_count = sqlalchemy.select(sqlalchemy.func.count()).where(
+                *_command_filters(run_id, include_fixit_commands)
+            )
             count_result: int = transaction.execute(select_count).scalar_one()
 
             actual_cursor = cursor if cursor is not None else count_result - length
             # Clamp to [0, count_result).
             actual_cursor = max(0, min(actual_cursor, count_result - 1))
-            if include_fixit_commands:
-                select_slice = (
-                    sqlalchemy.select(
-                        run_command_table.c.index_in_run, run_command_table.c.command
-                    )
-                    .where(
-                        run_command_table.c.run_id == run_id,
-                        run_command_table.c.index_in_run >= actual_cursor,
-                        run_command_table.c.index_in_run < actual_cursor + length,
-                    )
-                    .order_by(run_command_table.c.index_in_run)
+            select_slice = (
+                sqlalchemy.select(
+                    run_command_table.c.index_in_run, run_command_table.c.command
                 )
-            else:
-                select_slice = (
-                    sqlalchemy.select(
-                        run_command_table.c.index_in_run, run_command_table.c.command
-                    )
-                    .where(
-                        run_command_table.c.run_id == run_id,
-                        run_command_table.c.index_in_run >= actual_cursor,
-                        run_command_table.c.index_in_run < actual_cursor + length,
-                        run_command_table.c.command_intent != "fixit",
-                    )
-                    .order_by(run_command_table.c.index_in_run)
+                .where(
+                    *_command_filters(run_id, include_fixit_commands),
+                    run_command_table.c.index_in_run >= actual_cursor,
+                    run_command_table.c.index_in_run < actual_cursor + length,
                 )
+                .order_by(run_command_table.c.index_in_run)
+            )
             slice_result = transaction.execute(select_slice).all()
 
         sliced_commands: List[Command] = [
@@ -515,27 +599,58 @@ class RunStore:
         self, run_id: str, include_fixit_commands: bool
     ) -> List[str]:
         """Get all commands of the run as a list of strings of json command objects."""
+        return list(
+            self.iter_all_commands_as_preserialized(run_id, include_fixit_commands)
+        )
+
+    def iter_all_commands_as_preserialized(
+        self,
+        run_id: str,
+        include_fixit_commands: bool,
+        batch_size: int = _PRESERIALIZED_BATCH_SIZE,
+    ) -> Iterator[str]:
+        """Iterate over all commands of the run as strings of json command objects.
+
+        Commands are fetched `batch_size` at a time, each batch picking up after the
+        last command of the one before, so the whole run is never held in memory.
+        Each batch is read in its own short transaction, so an open iterator never
+        holds the database from writers.
+
+        Raises:
+            RunNotFoundError: The given run ID was not found. This is raised right
+                away, not when iteration starts.
+        """
         with self._sql_engine.begin() as transaction:
             if not self._run_exists(run_id, transaction):
                 raise RunNotFoundError(run_id=run_id)
-            # TODO (tz, 8-21-24): consolidate into 1 query.
-            if include_fixit_commands:
-                select_commands = (
-                    sqlalchemy.select(run_command_table.c.command)
-                    .where(run_command_table.c.run_id == run_id)
-                    .order_by(run_command_table.c.index_in_run)
+        return self._iter_preserialized_commands(
+            run_id, include_fixit_commands, batch_size
+        )
+
+    def _iter_preserialized_commands(
+        self, run_id: str, include_fixit_commands: bool, batch_size: int
+    ) -> Iterator[str]:
+        last_index: Optional[int] = None
+        while True:
+            select_batch = (
+                sqlalchemy.select(
+                    run_command_table.c.index_in_run, run_command_table.c.command
                 )
-            else:
-                select_commands = (
-                    sqlalchemy.select(run_command_table.c.command)
-                    .where(
-                        and_(run_command_table.c.run_id == run_id),
-                        run_command_table.c.command_intent != "fixit",
-                    )
-                    .order_by(run_command_table.c.index_in_run)
+                .where(*_command_filters(run_id, include_fixit_commands))
+                .order_by(run_command_table.c.index_in_run)
+                .limit(batch_size)
+            )
+            if last_index is not None:
+                select_batch = select_batch.where(
+                    run_command_table.c.index_in_run > last_index
                 )
-            commands_result = transaction.scalars(select_commands).all()
-        return commands_result
+            with self._sql_engine.begin() as transaction:
+                batch = transaction.execute(select_batch).all()
+            for row in batch:
+                yield row.command
+            if len(batch) < batch_size:
+                return
+            last_index = batch[-1].index_in_run
 
     @lru_cache(maxsize=_CACHE_ENTRIES)
     def get_command(self, run_id: str, command_id: str) -> Command:
@@ -614,10 +729,89 @@ class RunStore:
         self.get_run_time_parameters.cache_clear()
 
 
+def _command_filters(
+    run_id: str, include_fixit_commands: bool
+) -> List["sqlalchemy.sql.ColumnElement[sqlalchemy.Boolean]"]:
+    """Return the WHERE clauses that select a run's commands."""
+    filters = [run_command_table.c.run_id == run_id]
+    if not include_fixit_commands:
+        filters.append(run_command_table.c.command_intent != "fixit")
+    return filters
+
+
 # The columns that must be present in a row passed to _convert_row_to_run().
 _run_columns = [run_table.c.id, run_table.c.protocol_id, run_table.c.created_at]
 
 
+def _select_runs(
+    transaction: sqlalchemy.engine.Connection,
+    columns: Sequence["sqlalchemy.Column[Any]"],
+    length: Optional[int],
+) -> List[sqlalchemy.engine.Row]:
+    if length is not None:
+        select_runs = (
+            sqlalchemy.select(*columns).order_by(sqlite_rowid.desc()).limit(length)
+        )
+        # need to select the last inserted runs and return by asc order
+        return list(reversed(transaction.execute(select_runs).all()))
+    else:
+        select_runs = sqlalchemy.select(*columns).order_by(sqlite_rowid.asc())
+        return list(transaction.execute(select_runs).all())
+
+
+def _select_actions_by_run_id(
+    transaction: sqlalchemy.engine.Connection,
+    run_ids: List[str],
+    length: Optional[int],
+) -> Dict[str, List[sqlalchemy.engine.Row]]:
+    select_actions = sqlalchemy.select(action_table).order_by(sqlite_rowid.asc())
+    if length is not None:
+        # Only read the actions of the requested runs.
+        select_actions = select_actions.where(action_table.c.run_id.in_(run_ids))
+
+    actions_by_run_id: Dict[str, List[sqlalchemy.engine.Row]] = defaultdict(list)
+    for action_row in transaction.execute(select_actions):
+        actions_by_run_id[action_row.run_id].append(action_row)
+    return actions_by_run_id
+
+
+def _parse_state_summary(
+    run_id: str, state_summary: Optional[str]
+) -> Union[StateSummary, BadStateSummary]:
+    try:
+        return (
+            json_to_pydantic(StateSummary, state_summary)
+            if state_summary is not None
+            else BadStateSummary(
+                dataError=InvalidStoredData(
+                    message="There was no engine state data for this run."
+                )
+            )
+        )
+    except ValidationError as e:
+        log.warning(f"Error retrieving state summary for {run_id}", exc_info=True)
+        return BadStateSummary(
+            dataError=InvalidStoredData(
+                message="Could not load stored StateSummary",
+                wrapping=[PythonException(e)],
+            )
+        )
+
+
+def _parse_run_time_parameters(
+    run_id: str, run_time_parameters: Optional[str]
+) -> List[RunTimeParameter]:
+    try:
+        return (
+            json_to_pydantic_list(RunTimeParameter, run_time_parameters)  # type: ignore[arg-type]
+            if run_time_parameters is not None
+            else []
+        )
+    except ValidationError:
+        log.warning(f"Error retrieving run time parameters for {run_id}", exc_info=True)
+        return []
+
+
 def _convert_row_to_csv_rtp(
     row: sqlalchemy.engine.Row,
 ) -> CSVParameterRunResource:
@@ -700,6 +894,23 @@ def _convert_action_to_sql_values(action: RunAction, run_id: str) -> Dict[str, o
     }
 
 
+def _convert_commands_to_sql_values(
+    run_id: str, commands: Sequence[Command], first_index: int
+) -> List[Dict[str, object]]:
+    return [
+        {
+            "run_id": run_id,
+            "index_in_run": first_index + offset,
+            "command_id": command.id,
+            "command": pydantic_to_json(command),
+            "command_intent": str(command.intent.value)
+            if command.intent
+            else CommandIntent.PROTOCOL,
+        }
+        for offset, command in enumerate(commands)
+    ]
+
+
 def _convert_state_to_sql_values(
     run_id: str,
     state_summary: StateSummary,
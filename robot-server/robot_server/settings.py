@@ -111,5 +111,38 @@ class RobotServerSettings(BaseSettings):
         ),
     )
 
+    database_profile: typing_extensions.Literal["compatible", "performance"] = Field(
+        default="compatible",
+        description=(
+            "How to tune the server's SQLite database."
+            " `compatible` uses the SQLite defaults, with a rollback journal and a"
+            " new connection each time."
+            " `performance` uses a write-ahead log, so reads don't wait for writes,"
+            " and a pool of reusable connections."
+            " Either one can open a database last used with the other."
+        ),
+    )
+
+    analysis_workers: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "How many worker processes to run protocol analyses in, which is how"
+            " many analyses can run at once. Workers are started with the server and"
+            " kept running, so each one uses memory even when it's idle."
+            " If this is 0, analyses run in the server process."
+        ),
+    )
+
+    analysis_worker_memory_limit: typing.Optional[int] = Field(
+        default=None,
+        gt=0,
+        description=(
+            "The most address space, in bytes, that each analysis worker may use."
+            " An analysis that needs more fails. Only used if `analysis_workers`"
+            " is more than 0."
+        ),
+    )
+
     class Config:
         env_prefix = "OT_ROBOT_SERVER_"
@@ -0,0 +1,84 @@
+"""Tests for robot_server.persistence.database."""
+
+from pathlib import Path
+
+import pytest
+import sqlalchemy
+
+from robot_server.persistence.database import (
+    DatabaseProfile,
+    create_sql_engine,
+    sql_engine_ctx,
+)
+
+
+_metadata = sqlalchemy.MetaData()
+_table = sqlalchemy.Table(
+    "things",
+    _metadata,
+    sqlalchemy.Column("value", sqlalchemy.Integer, nullable=False),
+)
+
+
+def _journal_mode(engine: sqlalchemy.engine.Engine) -> str:
+    with engine.connect() as connection:
+        journal_mode = connection.exec_driver_sql("PRAGMA journal_mode").scalar()
+    assert isinstance(journal_mode, str)
+    return journal_mode
+
+
+@pytest.mark.parametrize(
+    ("profile", "expected_journal_mode"),
+    [("compatible", "delete"), ("performance", "wal")],
+)
+def test_journal_mode(
+    tmp_path: Path, profile: DatabaseProfile, expected_journal_mode: str
+) -> None:
+    """Each profile should put the database in its own journal mode."""
+    with sql_engine_ctx(tmp_path / "test.db", profile) as engine:
+        assert _journal_mode(engine) == expected_journal_mode
+
+
+def test_performance_profile_reads_while_writing(tmp_path: Path) -> None:
+    """Readers shouldn't wait for an open write transaction to finish."""
+    with sql_engine_ctx(tmp_path / "test.db", "performance") as engine:
+        _metadata.create_all(engine)
+        with engine.begin() as transaction:
+            transaction.execute(sqlalchemy.insert(_table).values(value=1))
+
+        with engine.begin() as write_transaction:
+            write_transaction.execute(sqlalchemy.insert(_table).values(value=2))
+            # The write isn't committed yet, so this only sees the first row.
+            with engine.begin() as read_transaction:
+                assert read_transaction.execute(
+                    sqlalchemy.select(_table.c.value)
+                ).scalars().all() == [1]
+
+        with engine.begin() as read_transaction:
+            assert read_transaction.execute(
+                sqlalchemy.select(_table.c.value)
+            ).scalars().all() == [1, 2]
+
+
+def test_switching_profiles(tmp_path: Path) -> None:
+    """A database last used with one profile should open with the other."""
+    db_file = tmp_path / "test.db"
+    with sql_engine_ctx(db_file, "performance") as engine:
+        _metadata.create_all(engine)
+        with engine.begin() as transaction:
+            transaction.execute(sqlalchemy.insert(_table).values(value=1))
+        assert (tmp_path / "test.db-wal").exists()
+
+    # Closing the last connection should fold the write-ahead log back into the
+    # database file, so the file can be copied on its own, like migrations do.
+    assert not (tmp_path / "test.db-wal").exists()
+
+    engine = create_sql_engine(db_file, "compatible")
+    try:
+        assert _journal_mode(engine) == "delete"
+        with engine.begin() as transaction:
+            assert transaction.execute(
+                sqlalchemy.select(_table.c.value)
+            ).scalars().all() == [1]
+    finally:
+        engine.dispose()
@@ -21,6 +21,10 @@ from robot_server.protocols.analysis_models import (
     AnalysisStatus,
 )
 from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.protocols.analysis_worker_pool import (
+    AnalysisLoadError,
+    AnalysisWorkerPool,
+)
 from robot_server.protocols.protocol_store import ProtocolResource
 from robot_server.service.task_runner import TaskRunner
 import robot_server.errors.error_mappers as em
@@ -90,6 +94,7 @@ async def test_initialize_analyzer(
         protocol_analyzer.create_protocol_analyzer(
             analysis_store=analysis_store,
             protocol_resource=protocol_resource,
+            worker_pool=None,
         )
     ).then_return(analyzer)
 
@@ -140,6 +145,7 @@ async def test_raises_error_and_saves_result_if_initialization_errors(
         protocol_analyzer.create_protocol_analyzer(
             analysis_store=analysis_store,
             protocol_resource=protocol_resource,
+            worker_pool=None,
         )
     ).then_return(analyzer)
     decoy.when(
@@ -176,6 +182,79 @@ async def test_raises_error_and_saves_result_if_initialization_errors(
     )
 
 
+async def test_saves_worker_error_if_initialization_errors_in_worker(
+    decoy: Decoy,
+    analysis_store: AnalysisStore,
+    task_runner: TaskRunner,
+) -> None:
+    """It should save the error that a worker loading the protocol recorded."""
+    robot_type: RobotType = "OT-3 Standard"
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        source=ProtocolSource(
+            directory=Path("/dev/null"),
+            main_file=Path("/dev/null/abc.json"),
+            config=JsonProtocolConfig(schema_version=123),
+            files=[],
+            metadata={},
+            robot_type=robot_type,
+            content_hash="abc123",
+        ),
+        protocol_key="dummy-data-111",
+        protocol_kind=ProtocolKind.STANDARD,
+    )
+    bool_parameter = BooleanParameter(
+        displayName="Foo", variableName="Bar", default=True, value=True
+    )
+    error_occurrence = ErrorOccurrence.construct(
+        id="internal-error",
+        createdAt=datetime(year=2023, month=3, day=3),
+        errorType="RuntimeParameterValueError",
+        detail="Bar must be a boolean.",
+    )
+    worker_pool = decoy.mock(cls=AnalysisWorkerPool)
+    analyzer = decoy.mock(cls=protocol_analyzer.ProtocolAnalyzer)
+    decoy.when(
+        protocol_analyzer.create_protocol_analyzer(
+            analysis_store=analysis_store,
+            protocol_resource=protocol_resource,
+            worker_pool=worker_pool,
+        )
+    ).then_return(analyzer)
+    decoy.when(
+        await analyzer.load_orchestrator(
+            run_time_param_values={"Bar": 123},
+            run_time_param_paths={},
+        )
+    ).then_raise(AnalysisLoadError([bool_parameter], error_occurrence))
+    decoy.when(analyzer.get_verified_run_time_parameters()).then_return(
+        [bool_parameter]
+    )
+    subject = AnalysesManager(
+        analysis_store=analysis_store,
+        task_runner=task_runner,
+        worker_pool=worker_pool,
+    )
+
+    with pytest.raises(FailedToInitializeAnalyzer):
+        await subject.initialize_analyzer(
+            analysis_id="analysis-id",
+            protocol_resource=protocol_resource,
+            run_time_param_values={"Bar": 123},
+            run_time_param_paths={},
+        )
+    decoy.verify(
+        await analysis_store.save_initialization_failed_analysis(
+            protocol_id="protocol-id",
+            analysis_id="analysis-id",
+            robot_type=robot_type,
+            run_time_parameters=[bool_parameter],
+            errors=[error_occurrence],
+        )
+    )
+
+
 async def test_start_analysis(
     decoy: Decoy,
     analysis_store: AnalysisStore,
@@ -44,12 +44,14 @@ from robot_server.protocols.analysis_store import (
     AnalysisStore,
     AnalysisNotFoundError,
     AnalysisIsPendingError,
+    build_completed_analysis,
     _CURRENT_ANALYZER_VERSION,
 )
 from robot_server.protocols.completed_analysis_store import (
     CompletedAnalysisStore,
     CompletedAnalysisResource,
 )
+from robot_server.persistence.pydantic import pydantic_to_json
 from robot_server.protocols.protocol_models import ProtocolKind
 from robot_server.protocols.protocol_store import (
     ProtocolStore,
@@ -319,6 +321,48 @@ async def test_update_adds_details_and_completes_analysis(
     }
 
 
+async def test_update_from_document_completes_analysis(
+    subject: AnalysisStore, protocol_store: ProtocolStore
+) -> None:
+    """It should store an already-serialized analysis as-is and mark it completed."""
+    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
+    run_time_param = mock_number_param("cool_param", 2.0)
+    completed_analysis = build_completed_analysis(
+        analysis_id="analysis-id",
+        robot_type="OT-2 Standard",
+        run_time_parameters=[run_time_param],
+        commands=[],
+        labware=[],
+        modules=[],
+        pipettes=[],
+        errors=[],
+        liquids=[],
+    )
+    document = pydantic_to_json(completed_analysis)
+
+    subject.add_pending(
+        protocol_id="protocol-id", analysis_id="analysis-id", run_time_parameters=[]
+    )
+    await subject.update_from_document(
+        analysis_id="analysis-id",
+        run_time_parameters=[run_time_param],
+        completed_analysis_document=document,
+    )
+
+    assert await subject.get_as_document("analysis-id") == document
+    assert await subject.get("analysis-id") == completed_analysis
+    assert completed_analysis.result == AnalysisResult.OK
+    assert subject.get_summaries_by_protocol("protocol-id") == [
+        AnalysisSummary(id="analysis-id", status=AnalysisStatus.COMPLETED)
+    ]
+    assert await subject.matching_rtp_values_in_analysis(
+        last_analysis_summary=AnalysisSummary(
+            id="analysis-id", status=AnalysisStatus.COMPLETED
+        ),
+        new_parameters=[run_time_param],
+    )
+
+
 async def test_update_adds_rtp_values_to_completed_store(
     decoy: Decoy, sql_engine: SQLEngine, protocol_store: ProtocolStore
 ) -> None:
@@ -0,0 +1,153 @@
+"""Tests for the AnalysisWorkerPool, with real worker processes."""
+import asyncio
+import json
+from pathlib import Path
+from typing import AsyncGenerator
+
+import pytest
+
+from opentrons.protocol_engine.types import NumberParameter
+from opentrons.protocol_reader import ProtocolReader, ProtocolSource
+
+from robot_server.protocols.analysis_worker_pool import (
+    AnalysisLoadError,
+    AnalysisWorkerPool,
+)
+
+
+_PROTOCOL = """\
+requirements = {"apiLevel": "2.20", "robotType": "OT-2"}
+
+def run(protocol):
+    tip_rack = protocol.load_labware("opentrons_96_tiprack_300ul", "1")
+    pipette = protocol.load_instrument("p300_single_gen2", "left", tip_racks=[tip_rack])
+    pipette.pick_up_tip()
+    pipette.drop_tip()
+"""
+
+_FAILING_PROTOCOL = """\
+requirements = {"apiLevel": "2.20", "robotType": "OT-2"}
+
+def run(protocol):
+    protocol.load_labware("no_such_labware", "1")
+"""
+
+
+_PARAMETERS_PROTOCOL = """\
+requirements = {"apiLevel": "2.20", "robotType": "OT-2"}
+
+def add_parameters(parameters):
+    parameters.add_int(
+        display_name="Samples",
+        variable_name="samples",
+        default=8,
+        minimum=1,
+        maximum=96,
+    )
+
+def run(protocol):
+    pass
+"""
+
+
+async def _read_protocol(directory: Path, contents: str) -> ProtocolSource:
+    directory.mkdir()
+    protocol_file = directory / "protocol.py"
+    protocol_file.write_text(contents, encoding="utf-8")
+    return await ProtocolReader().read_saved(files=[protocol_file], directory=None)
+
+
+@pytest.fixture
+async def subject() -> AsyncGenerator[AnalysisWorkerPool, None]:
+    """Return a started pool with one worker, closing it afterwards."""
+    pool = AnalysisWorkerPool(size=1)
+    pool.start()
+    try:
+        yield pool
+    finally:
+        await pool.close()
+
+
+async def test_analyze(subject: AnalysisWorkerPool, tmp_path: Path) -> None:
+    """It should analyze protocols in a worker, reporting protocol errors."""
+    protocol_source = await _read_protocol(tmp_path / "ok", _PROTOCOL)
+    failing_protocol_source = await _read_protocol(
+        tmp_path / "not-ok", _FAILING_PROTOCOL
+    )
+
+    document = json.loads(
+        await subject.analyze(
+            analysis_id="analysis-1",
+            protocol_source=protocol_source,
+            run_time_param_values=None,
+            run_time_param_paths=None,
+        )
+    )
+    assert document["id"] == "analysis-1"
+    assert document["status"] == "completed"
+    assert document["result"] == "ok"
+    assert "pickUpTip" in [command["commandType"] for command in document["commands"]]
+
+    failed_document = json.loads(
+        await subject.analyze(
+            analysis_id="analysis-2",
+            protocol_source=failing_protocol_source,
+            run_time_param_values=None,
+            run_time_param_paths=None,
+        )
+    )
+    assert failed_document["result"] == "not-ok"
+    assert len(failed_document["errors"]) == 1
+
+
+async def test_analyze_after_cancel(
+    subject: AnalysisWorkerPool, tmp_path: Path
+) -> None:
+    """It should replace a worker whose analysis was cancelled."""
+    protocol_source = await _read_protocol(tmp_path / "ok", _PROTOCOL)
+
+    cancelled = asyncio.create_task(
+        subject.analyze(
+            analysis_id="analysis-1",
+            protocol_source=protocol_source,
+            run_time_param_values=None,
+            run_time_param_paths=None,
+        )
+    )
+    await asyncio.sleep(0.1)
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+    document = json.loads(
+        await subject.analyze(
+            analysis_id="analysis-2",
+            protocol_source=protocol_source,
+            run_time_param_values=None,
+            run_time_param_paths=None,
+        )
+    )
+    assert document["result"] == "ok"
+
+
+async def test_load(subject: AnalysisWorkerPool, tmp_path: Path) -> None:
+    """It should verify run time parameter values in a worker."""
+    protocol_source = await _read_protocol(tmp_path / "ok", _PARAMETERS_PROTOCOL)
+
+    run_time_parameters = await subject.load(
+        protocol_source=protocol_source,
+        run_time_param_values={"samples": 24},
+        run_time_param_paths=None,
+    )
+    [parameter] = run_time_parameters
+    assert isinstance(parameter, NumberParameter)
+    assert (parameter.variableName, parameter.value) == ("samples", 24)
+
+    with pytest.raises(AnalysisLoadError) as error_info:
+        await subject.load(
+            protocol_source=protocol_source,
+            run_time_param_values={"samples": 200},
+            run_time_param_paths=None,
+        )
+    assert error_info.value.error.id == "internal-error"
+    assert [p.variableName for p in error_info.value.run_time_parameters] == ["samples"]
@@ -1,4 +1,5 @@
 """Tests for the ProtocolAnalyzer."""
+import asyncio
 import pytest
 from decoy import Decoy
 from datetime import datetime
@@ -27,7 +28,15 @@ from opentrons.protocol_runner.run_orchestrator import ParseMode
 
 import opentrons.util.helpers as datetime_helper
 
-from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.protocols.analysis_store import (
+    AnalysisStore,
+    build_completed_analysis,
+)
+from robot_server.protocols.analysis_worker_pool import (
+    AnalysisLoadError,
+    AnalysisWorkerError,
+    AnalysisWorkerPool,
+)
 from robot_server.protocols.protocol_models import ProtocolKind
 from robot_server.protocols.protocol_store import ProtocolResource
 from robot_server.protocols.protocol_analyzer import ProtocolAnalyzer
@@ -98,6 +107,7 @@ async def test_load_orchestrator(
         await simulating_runner.create_simulating_orchestrator(
             robot_type=robot_type,
             protocol_config=PythonProtocolConfig(api_version=APIVersion(100, 200)),
+            use_virtual_clock=True,
         )
     ).then_return(run_orchestrator)
     await subject.load_orchestrator(
@@ -170,6 +180,7 @@ async def test_analyze(
         await simulating_runner.create_simulating_orchestrator(
             robot_type=robot_type,
             protocol_config=JsonProtocolConfig(schema_version=123),
+            use_virtual_clock=True,
         )
     ).then_return(orchestrator)
     subject = ProtocolAnalyzer(
@@ -201,16 +212,18 @@ async def test_analyze(
         analysis_id="analysis-id",
     )
     decoy.verify(
-        await analysis_store.update(
-            analysis_id="analysis-id",
-            robot_type=robot_type,
-            run_time_parameters=[bool_parameter],
-            commands=[analysis_command],
-            labware=[analysis_labware],
-            modules=[],
-            pipettes=[analysis_pipette],
-            errors=[],
-            liquids=[],
+        await analysis_store.update_from_analysis(
+            completed_analysis=build_completed_analysis(
+                analysis_id="analysis-id",
+                robot_type=robot_type,
+                run_time_parameters=[bool_parameter],
+                commands=[analysis_command],
+                labware=[analysis_labware],
+                modules=[],
+                pipettes=[analysis_pipette],
+                errors=[],
+                liquids=[],
+            )
         )
     )
 
@@ -257,6 +270,7 @@ async def test_analyze_updates_pending_on_error(
         await simulating_runner.create_simulating_orchestrator(
             robot_type=robot_type,
             protocol_config=JsonProtocolConfig(schema_version=123),
+            use_virtual_clock=True,
         )
     ).then_return(orchestrator)
 
@@ -283,6 +297,300 @@ async def test_analyze_updates_pending_on_error(
         analysis_id="analysis-id",
     )
 
+    decoy.verify(
+        await analysis_store.update_from_analysis(
+            completed_analysis=build_completed_analysis(
+                analysis_id="analysis-id",
+                robot_type=robot_type,
+                run_time_parameters=[],
+                commands=[],
+                labware=[],
+                modules=[],
+                pipettes=[],
+                errors=[error_occurrence],
+                liquids=[],
+            )
+        ),
+    )
+
+
+async def test_analyze_in_worker_pool(
+    decoy: Decoy,
+    analysis_store: AnalysisStore,
+) -> None:
+    """It should load and analyze in a worker and store the document it returns."""
+    robot_type: RobotType = "OT-3 Standard"
+    protocol_source = ProtocolSource(
+        directory=Path("/dev/null"),
+        main_file=Path("/dev/null/abc.json"),
+        config=JsonProtocolConfig(schema_version=123),
+        files=[],
+        metadata={},
+        robot_type=robot_type,
+        content_hash="abc123",
+    )
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        source=protocol_source,
+        protocol_key="dummy-data-111",
+        protocol_kind=ProtocolKind.STANDARD,
+    )
+    bool_parameter = pe_types.BooleanParameter(
+        displayName="Foo", variableName="Bar", default=True, value=False
+    )
+    worker_pool = decoy.mock(cls=AnalysisWorkerPool)
+
+    decoy.when(
+        await worker_pool.load(
+            protocol_source=protocol_source,
+            run_time_param_values={"rtp_var": 123},
+            run_time_param_paths={},
+        )
+    ).then_return([bool_parameter])
+    decoy.when(
+        await worker_pool.analyze(
+            analysis_id="analysis-id",
+            protocol_source=protocol_source,
+            run_time_param_values={"rtp_var": 123},
+            run_time_param_paths={},
+        )
+    ).then_return('{"id": "analysis-id"}')
+
+    subject = ProtocolAnalyzer(
+        analysis_store=analysis_store,
+        protocol_resource=protocol_resource,
+        worker_pool=worker_pool,
+    )
+    await subject.load_orchestrator(
+        run_time_param_values={"rtp_var": 123}, run_time_param_paths={}
+    )
+    assert subject.get_verified_run_time_parameters() == [bool_parameter]
+    await subject.analyze(analysis_id="analysis-id")
+
+    decoy.verify(
+        await analysis_store.update_from_document(
+            analysis_id="analysis-id",
+            run_time_parameters=[bool_parameter],
+            completed_analysis_document='{"id": "analysis-id"}',
+        )
+    )
+    decoy.verify(
+        await simulating_runner.create_simulating_orchestrator(
+            robot_type=robot_type,
+            protocol_config=JsonProtocolConfig(schema_version=123),
+            use_virtual_clock=True,
+        ),
+        times=0,
+    )
+
+
+async def test_load_orchestrator_in_worker_pool_error(
+    decoy: Decoy,
+    analysis_store: AnalysisStore,
+) -> None:
+    """It should keep the run time parameters a worker loaded before failing."""
+    protocol_source = ProtocolSource(
+        directory=Path("/dev/null"),
+        main_file=Path("/dev/null/abc.py"),
+        config=PythonProtocolConfig(api_version=APIVersion(100, 200)),
+        files=[],
+        metadata={},
+        robot_type="OT-3 Standard",
+        content_hash="abc123",
+    )
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        source=protocol_source,
+        protocol_key="dummy-data-111",
+        protocol_kind=ProtocolKind.STANDARD,
+    )
+    bool_parameter = pe_types.BooleanParameter(
+        displayName="Foo", variableName="Bar", default=True, value=True
+    )
+    load_error = AnalysisLoadError(
+        run_time_parameters=[bool_parameter],
+        error=pe_errors.ErrorOccurrence.construct(
+            id="internal-error",
+            createdAt=datetime(year=2023, month=3, day=3),
+            errorType="RuntimeParameterValueError",
+            detail="Bar must be a boolean.",
+        ),
+    )
+    worker_pool = decoy.mock(cls=AnalysisWorkerPool)
+    decoy.when(
+        await worker_pool.load(
+            protocol_source=protocol_source,
+            run_time_param_values={"Bar": 123},
+            run_time_param_paths=None,
+        )
+    ).then_raise(load_error)
+
+    subject = ProtocolAnalyzer(
+        analysis_store=analysis_store,
+        protocol_resource=protocol_resource,
+        worker_pool=worker_pool,
+    )
+    with pytest.raises(AnalysisLoadError):
+        await subject.load_orchestrator(
+            run_time_param_values={"Bar": 123}, run_time_param_paths=None
+        )
+    assert subject.get_verified_run_time_parameters() == [bool_parameter]
+
+
+async def test_analyze_in_worker_pool_updates_pending_on_error(
+    decoy: Decoy,
+    analysis_store: AnalysisStore,
+) -> None:
+    """It should update pending analysis with an internal error if a worker fails."""
+    robot_type: RobotType = "OT-3 Standard"
+    protocol_source = ProtocolSource(
+        directory=Path("/dev/null"),
+        main_file=Path("/dev/null/abc.json"),
+        config=JsonProtocolConfig(schema_version=123),
+        files=[],
+        metadata={},
+        robot_type=robot_type,
+        content_hash="abc123",
+    )
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        source=protocol_source,
+        protocol_key="dummy-data-111",
+        protocol_kind=ProtocolKind.STANDARD,
+    )
+    raised_exception = AnalysisWorkerError("Analysis worker exited with code -9.")
+    enumerated_error = EnumeratedError(
+        code=ErrorCodes.GENERAL_ERROR,
+        message="Analysis worker exited with code -9.",
+    )
+    error_occurrence = pe_errors.ErrorOccurrence.construct(
+        id="internal-error",
+        createdAt=datetime(year=2023, month=3, day=3),
+        errorType="EnumeratedError",
+        detail="Analysis worker exited with code -9.",
+    )
+    worker_pool = decoy.mock(cls=AnalysisWorkerPool)
+
+    decoy.when(
+        await worker_pool.load(
+            protocol_source=protocol_source,
+            run_time_param_values=None,
+            run_time_param_paths=None,
+        )
+    ).then_return([])
+    decoy.when(
+        await worker_pool.analyze(
+            analysis_id="analysis-id",
+            protocol_source=protocol_source,
+            run_time_param_values=None,
+            run_time_param_paths=None,
+        )
+    ).then_raise(raised_exception)
+    decoy.when(em.map_unexpected_error(error=raised_exception)).then_return(
+        enumerated_error
+    )
+    decoy.when(datetime_helper.utc_now()).then_return(
+        datetime(year=2023, month=3, day=3)
+    )
+
+    subject = ProtocolAnalyzer(
+        analysis_store=analysis_store,
+        protocol_resource=protocol_resource,
+        worker_pool=worker_pool,
+    )
+    await subject.load_orchestrator(
+        run_time_param_values=None, run_time_param_paths=None
+    )
+    await subject.analyze(analysis_id="analysis-id")
+
+    decoy.verify(
+        await analysis_store.update(
+            analysis_id="analysis-id",
+            robot_type=robot_type,
+            run_time_parameters=[],
+            commands=[],
+            labware=[],
+            modules=[],
+            pipettes=[],
+            errors=[error_occurrence],
+            liquids=[],
+        ),
+    )
+
+
+async def test_analyze_in_worker_pool_cancelled(
+    decoy: Decoy,
+    analysis_store: AnalysisStore,
+) -> None:
+    """It should update pending analysis with an error, then stay cancelled."""
+    robot_type: RobotType = "OT-3 Standard"
+    protocol_source = ProtocolSource(
+        directory=Path("/dev/null"),
+        main_file=Path("/dev/null/abc.json"),
+        config=JsonProtocolConfig(schema_version=123),
+        files=[],
+        metadata={},
+        robot_type=robot_type,
+        content_hash="abc123",
+    )
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        source=protocol_source,
+        protocol_key="dummy-data-111",
+        protocol_kind=ProtocolKind.STANDARD,
+    )
+    cancelled = asyncio.CancelledError()
+
+    def _cancel(*args: object, **kwargs: object) -> str:
+        raise cancelled
+
+    enumerated_error = EnumeratedError(
+        code=ErrorCodes.GENERAL_ERROR,
+        message="Analysis cancelled.",
+    )
+    error_occurrence = pe_errors.ErrorOccurrence.construct(
+        id="internal-error",
+        createdAt=datetime(year=2023, month=3, day=3),
+        errorType="EnumeratedError",
+        detail="Analysis cancelled.",
+    )
+    worker_pool = decoy.mock(cls=AnalysisWorkerPool)
+
+    decoy.when(
+        await worker_pool.load(
+            protocol_source=protocol_source,
+            run_time_param_values=None,
+            run_time_param_paths=None,
+        )
+    ).then_return([])
+    decoy.when(
+        await worker_pool.analyze(
+            analysis_id="analysis-id",
+            protocol_source=protocol_source,
+            run_time_param_values=None,
+            run_time_param_paths=None,
+        )
+    ).then_do(_cancel)
+    decoy.when(em.map_unexpected_error(error=cancelled)).then_return(enumerated_error)
+    decoy.when(datetime_helper.utc_now()).then_return(
+        datetime(year=2023, month=3, day=3)
+    )
+
+    subject = ProtocolAnalyzer(
+        analysis_store=analysis_store,
+        protocol_resource=protocol_resource,
+        worker_pool=worker_pool,
+    )
+    await subject.load_orchestrator(
+        run_time_param_values=None, run_time_param_paths=None
+    )
+    with pytest.raises(asyncio.CancelledError):
+        await subject.analyze(analysis_id="analysis-id")
+
     decoy.verify(
         await analysis_store.update(
             analysis_id="analysis-id",
@@ -1,5 +1,7 @@
 """Tests for the /runs/.../commands routes."""
+import json
 import pytest
+from typing import Iterator
 
 from datetime import datetime
 from decoy import Decoy, matchers
@@ -29,6 +31,7 @@ from robot_server.runs.router.commands_router import (
     create_run_command,
     get_run_command,
     get_run_commands,
+    get_run_commands_as_pre_serialized_list,
     get_current_run_from_url,
 )
 
@@ -456,6 +459,77 @@ async def test_get_run_commands_not_found(
     assert exc_info.value.content["errors"][0]["id"] == "RunNotFound"
 
 
+async def test_get_run_commands_as_pre_serialized_list(
+    decoy: Decoy,
+    mock_run_data_manager: RunDataManager,
+) -> None:
+    """It should stream the pre-serialized commands as a JSON list."""
+    decoy.when(
+        mock_run_data_manager.iter_all_commands_as_preserialized(
+            run_id="run-id", include_fixit_commands=True
+        )
+    ).then_return(iter(['{"id": "command-1"}', '{"id": "command-2"}']))
+
+    result = await get_run_commands_as_pre_serialized_list(
+        runId="run-id",
+        run_data_manager=mock_run_data_manager,
+        includeFixitCommands=True,
+    )
+
+    body = b"".join([chunk async for chunk in result.body_iterator])  # type: ignore[misc]
+    assert json.loads(body) == {
+        "data": ['{"id": "command-1"}', '{"id": "command-2"}'],
+        "meta": {"cursor": 0, "totalLength": 2},
+    }
+    assert result.status_code == 200
+
+
+async def test_get_run_commands_as_pre_serialized_list_read_error(
+    decoy: Decoy,
+    mock_run_data_manager: RunDataManager,
+) -> None:
+    """It should raise before responding if it can't read the first commands."""
+
+    def _commands() -> Iterator[str]:
+        raise RuntimeError("oh no")
+        yield ""
+
+    decoy.when(
+        mock_run_data_manager.iter_all_commands_as_preserialized(
+            run_id="run-id", include_fixit_commands=True
+        )
+    ).then_return(_commands())
+
+    with pytest.raises(RuntimeError, match="oh no"):
+        await get_run_commands_as_pre_serialized_list(
+            runId="run-id",
+            run_data_manager=mock_run_data_manager,
+            includeFixitCommands=True,
+        )
+
+
+async def test_get_run_commands_as_pre_serialized_list_not_found(
+    decoy: Decoy,
+    mock_run_data_manager: RunDataManager,
+) -> None:
+    """It should 404 if the run is not found."""
+    decoy.when(
+        mock_run_data_manager.iter_all_commands_as_preserialized(
+            run_id="run-id", include_fixit_commands=True
+        )
+    ).then_raise(RunNotFoundError("oh no"))
+
+    with pytest.raises(ApiError) as exc_info:
+        await get_run_commands_as_pre_serialized_list(
+            runId="run-id",
+            run_data_manager=mock_run_data_manager,
+            includeFixitCommands=True,
+        )
+
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.content["errors"][0]["id"] == "RunNotFound"
+
+
 async def test_get_run_command_by_id(
     decoy: Decoy, mock_run_data_manager: RunDataManager
 ) -> None:
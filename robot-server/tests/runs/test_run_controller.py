@@ -1,4 +1,5 @@
 """Tests for RunController."""
+import asyncio
 from typing import List
 
 import pytest
@@ -19,6 +20,7 @@ from robot_server.service.task_runner import TaskRunner
 from robot_server.runs.action_models import RunAction, RunActionType
 from robot_server.runs.run_orchestrator_store import RunOrchestratorStore
 from robot_server.runs.run_store import RunStore
+from robot_server.runs import run_controller
 from robot_server.runs.run_controller import RunController, RunActionNotAllowedError
 
 
@@ -200,6 +202,7 @@ async def test_create_play_action_to_start(
             summary=engine_state_summary,
             commands=protocol_commands,
             run_time_parameters=run_time_parameters,
+            persisted_command_count=0,
         ),
         mock_runs_publisher.publish_pre_serialized_commands_notification(run_id),
         times=1,
@@ -230,6 +233,73 @@ async def test_create_play_action_to_start(
     )
 
 
+async def test_completed_commands_persisted_during_run(
+    decoy: Decoy,
+    monkeypatch: pytest.MonkeyPatch,
+    mock_run_orchestrator_store: RunOrchestratorStore,
+    mock_run_store: RunStore,
+    mock_task_runner: TaskRunner,
+    run_id: str,
+    engine_state_summary: StateSummary,
+    run_time_parameters: List[RunTimeParameter],
+    protocol_commands: List[pe_commands.Command],
+    subject: RunController,
+) -> None:
+    """It should stream completed commands to the store while the run executes."""
+    monkeypatch.setattr(run_controller, "_COMMAND_PERSISTENCE_INTERVAL", 0)
+    commands_persisted = asyncio.Event()
+
+    async def _run(deck_configuration: object) -> RunResult:
+        await commands_persisted.wait()
+        return RunResult(
+            commands=protocol_commands,
+            state_summary=engine_state_summary,
+            parameters=run_time_parameters,
+        )
+
+    def _no_new_commands(start_index: int) -> List[pe_commands.Command]:
+        commands_persisted.set()
+        return []
+
+    decoy.when(mock_run_orchestrator_store.run_was_started()).then_return(False)
+    decoy.when(
+        mock_run_orchestrator_store.get_completed_commands_from(start_index=0)
+    ).then_return(protocol_commands)
+    decoy.when(
+        mock_run_orchestrator_store.get_completed_commands_from(
+            start_index=len(protocol_commands)
+        )
+    ).then_do(_no_new_commands)
+    decoy.when(await mock_run_orchestrator_store.run(deck_configuration=[])).then_do(
+        _run
+    )
+
+    subject.create_action(
+        action_id="some-action-id",
+        action_type=RunActionType.PLAY,
+        created_at=datetime(year=2021, month=1, day=1),
+        action_payload=[],
+    )
+
+    background_task_captor = matchers.Captor()
+    decoy.verify(mock_task_runner.run(background_task_captor, deck_configuration=[]))
+
+    await background_task_captor.value(deck_configuration=[])
+
+    decoy.verify(
+        mock_run_store.insert_commands(
+            run_id=run_id, commands=protocol_commands, first_index=0
+        ),
+        mock_run_store.update_run_state(
+            run_id=run_id,
+            summary=engine_state_summary,
+            commands=protocol_commands,
+            run_time_parameters=run_time_parameters,
+            persisted_command_count=len(protocol_commands),
+        ),
+    )
+
+
 def test_create_pause_action(
     decoy: Decoy,
     mock_run_orchestrator_store: RunOrchestratorStore,
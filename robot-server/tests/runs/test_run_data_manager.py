@@ -49,6 +49,7 @@ from robot_server.runs.run_store import (
     RunResource,
     CommandNotFoundError,
     BadStateSummary,
+    StoredRunState,
 )
 from robot_server.service.notifications import RunsPublisher
 from robot_server.service.task_runner import TaskRunner
@@ -557,14 +558,19 @@ async def test_get_all_runs(
     decoy.when(mock_run_orchestrator_store.get_run_time_parameters()).then_return(
         current_run_time_parameters
     )
-    decoy.when(mock_run_store.get_state_summary("historical-run")).then_return(
+    historical_stored_state = decoy.mock(cls=StoredRunState)
+    current_stored_state = decoy.mock(cls=StoredRunState)
+    decoy.when(historical_stored_state.get_state_summary()).then_return(
         historical_run_data
     )
-    decoy.when(mock_run_store.get_run_time_parameters("historical-run")).then_return(
+    decoy.when(historical_stored_state.get_run_time_parameters()).then_return(
         historical_run_time_parameters
     )
-    decoy.when(mock_run_store.get_all(length=20)).then_return(
-        [historical_run_resource, current_run_resource]
+    decoy.when(mock_run_store.get_all_with_state(length=20)).then_return(
+        [
+            (historical_run_resource, historical_stored_state),
+            (current_run_resource, current_stored_state),
+        ]
     )
 
     result = subject.get_all(length=20)
@@ -1173,34 +1179,34 @@ def test_get_command_from_db_command_not_found(
         subject.get_command("run-id", "command-id")
 
 
-def test_get_all_commands_as_preserialized_list(
+def test_iter_all_commands_as_preserialized(
     decoy: Decoy,
     subject: RunDataManager,
     mock_run_store: RunStore,
     mock_run_orchestrator_store: RunOrchestratorStore,
 ) -> None:
-    """It should return the pre-serialized commands list."""
+    """It should return the pre-serialized commands."""
     decoy.when(mock_run_orchestrator_store.current_run_id).then_return(None)
     decoy.when(
-        mock_run_store.get_all_commands_as_preserialized_list("run-id", True)
-    ).then_return(['{"id": command-1}', '{"id": command-2}'])
-    assert subject.get_all_commands_as_preserialized_list("run-id", True) == [
+        mock_run_store.iter_all_commands_as_preserialized("run-id", True)
+    ).then_return(iter(['{"id": command-1}', '{"id": command-2}']))
+    assert list(subject.iter_all_commands_as_preserialized("run-id", True)) == [
         '{"id": command-1}',
         '{"id": command-2}',
     ]
 
 
-def test_get_all_commands_as_preserialized_list_errors_for_active_runs(
+def test_iter_all_commands_as_preserialized_errors_for_active_runs(
     decoy: Decoy,
     subject: RunDataManager,
     mock_run_store: RunStore,
     mock_run_orchestrator_store: RunOrchestratorStore,
 ) -> None:
-    """It should raise an error when fetching pre-serialized commands list while run is active."""
+    """It should raise an error when fetching pre-serialized commands while run is active."""
     decoy.when(mock_run_orchestrator_store.current_run_id).then_return("current-run-id")
     decoy.when(mock_run_orchestrator_store.get_is_run_terminal()).then_return(False)
     with pytest.raises(PreSerializedCommandsNotAvailableError):
-        subject.get_all_commands_as_preserialized_list("current-run-id", True)
+        subject.iter_all_commands_as_preserialized("current-run-id", True)
 
 
 async def test_get_current_run_labware_definition(
@@ -1,4 +1,5 @@
 """Tests for robot_server.runs.run_store."""
+import json
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Optional, Type
@@ -285,6 +286,56 @@ async def test_update_run_state(
     )
 
 
+def test_insert_commands_then_update_run_state(
+    subject: RunStore,
+    state_summary: StateSummary,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It should only rewrite commands after the already-persisted ones."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+
+    subject.insert_commands(
+        run_id="run-id", commands=protocol_commands[:2], first_index=0
+    )
+    assert subject.get_all_commands_as_preserialized_list(
+        run_id="run-id", include_fixit_commands=True
+    ) == [
+        command.json(by_alias=True, exclude_none=True)
+        for command in protocol_commands[:2]
+    ]
+
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+        run_time_parameters=[],
+        persisted_command_count=2,
+    )
+    commands_result = subject.get_commands_slice(
+        run_id="run-id",
+        length=len(protocol_commands),
+        cursor=0,
+        include_fixit_commands=True,
+    )
+
+    assert commands_result.commands == protocol_commands
+
+
+def test_insert_commands_run_not_found(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It should raise if the run does not exist."""
+    with pytest.raises(RunNotFoundError, match="run-not-found"):
+        subject.insert_commands(
+            run_id="run-not-found", commands=protocol_commands, first_index=0
+        )
+
+
 async def test_insert_and_get_csv_rtp(
     subject: RunStore,
     data_files_store: DataFilesStore,
@@ -500,6 +551,84 @@ def test_get_all_runs(
     assert result == expected_result
 
 
+def test_get_all_runs_with_state(
+    subject: RunStore,
+    state_summary: StateSummary,
+    run_time_parameters: List[pe_types.RunTimeParameter],
+) -> None:
+    """It gets the newest runs along with their archived state."""
+    action = RunAction(
+        actionType=RunActionType.PLAY,
+        createdAt=datetime(year=2022, month=2, day=2, tzinfo=timezone.utc),
+        id="action-id",
+    )
+    subject.insert(
+        run_id="run-id-1",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    subject.insert_action(run_id="run-id-1", action=action)
+    subject.insert(
+        run_id="run-id-2",
+        protocol_id=None,
+        created_at=datetime(year=2022, month=2, day=2, tzinfo=timezone.utc),
+    )
+    subject.insert(
+        run_id="run-id-3",
+        protocol_id=None,
+        created_at=datetime(year=2023, month=3, day=3, tzinfo=timezone.utc),
+    )
+    subject.update_run_state(
+        run_id="run-id-2",
+        summary=state_summary,
+        commands=[],
+        run_time_parameters=run_time_parameters,
+    )
+
+    result = subject.get_all_with_state(length=2)
+
+    assert [run_resource for run_resource, _ in result] == subject.get_all(length=2)
+    assert result[0][1].get_state_summary() == state_summary
+    assert result[0][1].get_run_time_parameters() == run_time_parameters
+    assert isinstance(result[1][1].get_state_summary(), BadStateSummary)
+    assert result[1][1].get_run_time_parameters() == []
+
+    result = subject.get_all_with_state()
+
+    assert [run_resource for run_resource, _ in result] == subject.get_all()
+    assert result[0][0].actions == [action]
+
+
+def test_get_all_runs_with_state_reuses_parsed_state(
+    subject: RunStore,
+    state_summary: StateSummary,
+) -> None:
+    """It only reads a run's archived state again once it has changed."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    subject.update_run_state(
+        run_id="run-id", summary=state_summary, commands=[], run_time_parameters=[]
+    )
+
+    [(_, first_state)] = subject.get_all_with_state()
+    [(_, second_state)] = subject.get_all_with_state()
+
+    assert second_state is first_state
+
+    updated_summary = state_summary.copy(update={"status": EngineStatus.FAILED})
+    subject.update_run_state(
+        run_id="run-id", summary=updated_summary, commands=[], run_time_parameters=[]
+    )
+
+    [(_, third_state)] = subject.get_all_with_state()
+
+    assert third_state is not first_state
+    assert third_state.get_state_summary() == updated_summary
+
+
 async def test_remove_run(
     subject: RunStore,
     mock_runs_publisher: mock.Mock,
@@ -923,3 +1052,87 @@ def test_get_all_commands_as_preserialized_list_no_fixit(
         ' "key": "command-key", "status": "succeeded", "params": {"message": "hey world"}, "result": {}, "intent": "protocol"}',
         '{"id": "pause-3", "createdAt": "2023-03-03T00:00:00", "commandType": "waitForResume", "key": "command-key", "status": "succeeded", "params": {"message": "sup world"}, "result": {}}',
     ]
+
+
+@pytest.mark.parametrize(
+    ("include_fixit_commands", "expected_ids"),
+    [
+        (True, ["pause-1", "pause-2", "pause-3", "fixit-pause-1"]),
+        (False, ["pause-1", "pause-2", "pause-3"]),
+    ],
+)
+@pytest.mark.parametrize("batch_size", [1, 2, 3, 100])
+def test_iter_all_commands_as_preserialized(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+    state_summary: StateSummary,
+    include_fixit_commands: bool,
+    expected_ids: List[str],
+    batch_size: int,
+) -> None:
+    """It should page through all of a run's commands, whatever the batch size."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+        run_time_parameters=[],
+    )
+    result = subject.iter_all_commands_as_preserialized(
+        run_id="run-id",
+        include_fixit_commands=include_fixit_commands,
+        batch_size=batch_size,
+    )
+    assert [json.loads(command)["id"] for command in result] == expected_ids
+
+
+def test_iter_all_commands_as_preserialized_allows_writes(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+    state_summary: StateSummary,
+) -> None:
+    """It should not hold the database from writers while the iterator is open."""
+    for run_id in ["run-id", "other-run-id"]:
+        subject.insert(
+            run_id=run_id,
+            protocol_id=None,
+            created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+        )
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+        run_time_parameters=[],
+    )
+    action = RunAction(
+        actionType=RunActionType.PLAY,
+        createdAt=datetime(year=2022, month=2, day=2, tzinfo=timezone.utc),
+        id="action-id",
+    )
+
+    commands = subject.iter_all_commands_as_preserialized(
+        run_id="run-id", include_fixit_commands=True, batch_size=1
+    )
+    first_command = next(commands)
+    subject.insert_action(run_id="other-run-id", action=action)
+    rest = list(commands)
+
+    assert [json.loads(c)["id"] for c in [first_command, *rest]] == [
+        "pause-1",
+        "pause-2",
+        "pause-3",
+        "fixit-pause-1",
+    ]
+    assert subject.get("other-run-id").actions == [action]
+
+
+def test_iter_all_commands_as_preserialized_run_not_found(subject: RunStore) -> None:
+    """It should raise as soon as it's called if the run doesn't exist."""
+    with pytest.raises(RunNotFoundError):
+        subject.iter_all_commands_as_preserialized(
+            run_id="not-run-id", include_fixit_commands=True
+        )
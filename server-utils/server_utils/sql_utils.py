@@ -1,7 +1,7 @@
 """Utilities for working with SQLite databases through SQLAlchemy."""
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Mapping, Union
 
 import sqlalchemy
 
@@ -43,6 +43,54 @@ def enable_foreign_key_constraints(engine: sqlalchemy.engine.Engine) -> None:
         cursor.close()
 
 
+def set_pragmas(
+    engine: sqlalchemy.engine.Engine, pragmas: Mapping[str, Union[int, str]]
+) -> None:
+    """Set SQLite PRAGMAs on every connection that the engine opens.
+
+    Most PRAGMAs only last as long as the connection that set them, so they're
+    set again whenever the engine opens a new one. For ones that are saved in the
+    database file, like `journal_mode`, use `set_journal_mode()` instead.
+
+    This should be called once per SQLAlchemy engine, shortly after creating it,
+    before doing anything substantial with it.
+
+    Params:
+        engine: A SQLAlchemy engine connected to a SQLite database.
+        pragmas: The PRAGMAs to set, in order, like `{"synchronous": "NORMAL"}`.
+    """
+    statements = [f"PRAGMA {name}={value};" for name, value in pragmas.items()]
+
+    @sqlalchemy.event.listens_for(engine, "connect")  # type: ignore[misc]
+    def on_connect(
+        # TODO(mm, 2023-08-29): Improve these type annotations when we have SQLAlchemy 2.0.
+        dbapi_connection: Any,
+        connection_record: object,
+    ) -> None:
+        cursor = dbapi_connection.cursor()
+        for statement in statements:
+            cursor.execute(statement)
+        cursor.close()
+
+
+def set_journal_mode(engine: sqlalchemy.engine.Engine, journal_mode: str) -> None:
+    """Set the database's SQLite journal mode, once.
+
+    Unlike most PRAGMAs, `journal_mode=WAL` is saved in the database file, and
+    switching out of it, like to `DELETE`, also changes the file. So this only
+    needs to run on one connection, not on every one the engine opens.
+
+    This should be called once per SQLAlchemy engine, shortly after creating it,
+    before doing anything substantial with it.
+
+    Params:
+        engine: A SQLAlchemy engine connected to a SQLite database.
+        journal_mode: The journal mode to set, like `"WAL"` or `"DELETE"`.
+    """
+    with engine.connect() as connection:
+        connection.exec_driver_sql(f"PRAGMA journal_mode={journal_mode};")
+
+
 def fix_transactions(engine: sqlalchemy.engine.Engine) -> None:
     """Make SQLite transactions behave sanely.
 
@@ -115,3 +115,30 @@ def test_fix_transaction_fixes_transactional_ddl(
         c["name"] for c in sqlalchemy.inspect(scratch_engine).get_columns("table")
     ]
     assert column_names == expected_final_column_names
+
+
+def test_set_pragmas(scratch_engine: sqlalchemy.engine.Engine) -> None:
+    """Test that PRAGMAs are set on every connection the engine opens."""
+    sql_utils.set_pragmas(scratch_engine, {"cache_size": -4096})
+
+    for _ in range(2):
+        with scratch_engine.connect() as connection:
+            assert connection.exec_driver_sql("PRAGMA cache_size").scalar() == -4096
+        # Make the next iteration open a new connection.
+        scratch_engine.dispose()
+
+
+def test_set_journal_mode(scratch_engine: sqlalchemy.engine.Engine) -> None:
+    """Test that the journal mode is saved in the database, for later connections."""
+    sql_utils.set_journal_mode(scratch_engine, "WAL")
+    scratch_engine.dispose()
+
+    with scratch_engine.connect() as connection:
+        assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+    scratch_engine.dispose()
+
+    sql_utils.set_journal_mode(scratch_engine, "DELETE")
+    scratch_engine.dispose()
+
+    with scratch_engine.connect() as connection:
+        assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "delete"
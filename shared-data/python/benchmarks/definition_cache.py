@@ -0,0 +1,101 @@
+"""Measure how long a fresh process takes to load every shared-data definition.
+
+Each scenario runs in its own interpreter, so nothing is cached in memory:
+- uncached: the on-disk definition cache is disabled
+- cold: the on-disk cache is enabled but empty, so it gets populated
+- warm: the on-disk cache is already populated
+
+Run with:
+    python -m benchmarks.definition_cache
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, Optional
+
+from opentrons_shared_data import deck, get_shared_data_root, gripper, labware, module
+from opentrons_shared_data.definition_cache import ENV_CACHE_PATH
+from opentrons_shared_data.gripper import GripperModel
+from opentrons_shared_data.pipette import load_data
+from opentrons_shared_data.pipette.types import (
+    PipetteChannelType,
+    PipetteModelType,
+    PipetteVersionType,
+)
+
+
+def load_everything() -> int:
+    """Load every definition the cache handles, and return how many there were."""
+    root = get_shared_data_root()
+    count = 0
+    for definition in sorted((root / "labware" / "definitions" / "2").glob("*/*.json")):
+        labware.load_definition(definition.parent.name, int(definition.stem))
+        count += 1
+    for definition in sorted((root / "deck" / "definitions" / "5").glob("*.json")):
+        deck.load(definition.stem, 5)
+        count += 1
+    for definition in sorted((root / "module" / "definitions" / "3").glob("*.json")):
+        module.load_definition("3", definition.stem)
+        count += 1
+    for gripper_model in GripperModel:
+        gripper.load_definition(gripper_model)
+        count += 1
+    general = root / "pipette" / "definitions" / "2" / "general"
+    for definition in sorted(general.glob("*/*/*.json")):
+        load_data.load_definition(
+            PipetteModelType(definition.parent.name),
+            PipetteChannelType[definition.parent.parent.name.upper()],
+            PipetteVersionType.convert_from_float(
+                float(definition.stem.replace("_", "."))
+            ),
+        )
+        count += 1
+    return count
+
+
+def _run_fresh_process(cache_path: Optional[str]) -> float:
+    env: Dict[str, str] = dict(os.environ)
+    env[ENV_CACHE_PATH] = cache_path or ""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "benchmarks.definition_cache", "--child"],
+        env=env,
+        check=True,
+    )
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Number of runs of each scenario"
+    )
+    args = parser.parse_args()
+
+    if args.child:
+        start = time.perf_counter()
+        count = load_everything()
+        print(f"  loaded {count} definitions in {time.perf_counter() - start:.3f}s")
+        return
+
+    for _ in range(args.repeat):
+        print("uncached:")
+        uncached = _run_fresh_process(None)
+        with tempfile.TemporaryDirectory() as cache_path:
+            print("cold:")
+            cold = _run_fresh_process(cache_path)
+            print("warm:")
+            warm = _run_fresh_process(cache_path)
+        print(
+            f"process total: uncached {uncached:.3f}s, "
+            f"cold {cold:.3f}s, warm {warm:.3f}s\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ from typing_extensions import Final
 import json
 
 from .. import get_shared_data_root, load_shared_data
+from ..definition_cache import load_cached
 
 if TYPE_CHECKING:
     from .types import (
@@ -56,8 +57,12 @@ def load(name: str, version: "DeckSchemaVersion3") -> "DeckDefinitionV3":
 
 
 def load(name: str, version: int = DEFAULT_DECK_DEFINITION_VERSION) -> "DeckDefinition":
-    return json.loads(  # type: ignore[no-any-return]
-        load_shared_data(f"deck/definitions/{version}/{name}.json")
+    path = f"deck/definitions/{version}/{name}.json"
+    return load_cached(
+        "deck",
+        f"{version}/{name}",
+        [path],
+        lambda: cast("DeckDefinition", json.loads(load_shared_data(path))),
     )
 
 
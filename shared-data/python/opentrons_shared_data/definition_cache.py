@@ -0,0 +1,153 @@
+"""A cache of loaded and validated shared-data definitions.
+
+Loading a definition means reading its JSON, parsing it, and often validating
+it into a pydantic model, which adds up when a process loads dozens of them at
+startup. Definitions loaded through :py:func:`load_cached` are kept in two
+places:
+
+- an in-process LRU shared by all definition types, so loading the same
+  definition again only costs an unpickle
+- an on-disk cache of pickled results, keyed by a hash of the source files'
+  contents, so a new process can skip parsing and validation entirely
+
+The on-disk cache is stored in ``OT_SHARED_DATA_CACHE_PATH`` if that
+environment variable is set (set it to an empty string to disable the on-disk
+cache), or else in the user cache directory. It is disabled by default for
+development installs, where the definition models can change without the
+package version changing.
+"""
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Optional, Sequence, Tuple, TypeVar, Union
+
+import pydantic
+
+from ._version import version
+from .load import get_shared_data_root
+
+log = logging.getLogger(__name__)
+
+ENV_CACHE_PATH = "OT_SHARED_DATA_CACHE_PATH"
+
+# Bump this whenever the layout of cached data changes in a way that the
+# package version doesn't capture.
+_CACHE_FORMAT_VERSION = 1
+_LRU_SIZE = 256
+_MISSING_SOURCE = b"\0missing\0"
+
+_T = TypeVar("_T")
+
+_lru: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+_lru_lock = threading.Lock()
+_disk_cache_disabled = False
+
+
+def _cache_header() -> bytes:
+    return (
+        f"{_CACHE_FORMAT_VERSION}:{version}:{sys.version_info[0]}.{sys.version_info[1]}"
+        f":{pydantic.VERSION}"
+    ).encode()
+
+
+def get_cache_path() -> Optional[Path]:
+    """Get the directory of the on-disk cache, or None if it is disabled."""
+    override = os.environ.get(ENV_CACHE_PATH)
+    if override is not None:
+        return Path(override) if override else None
+    if _disk_cache_disabled or "dev" in version:
+        return None
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "opentrons-shared-data"
+
+
+def clear() -> None:
+    """Clear the in-process cache. The on-disk cache is left alone."""
+    with _lru_lock:
+        _lru.clear()
+
+
+def _digest(kind: str, key: str, sources: Sequence[Path]) -> str:
+    hasher = hashlib.blake2b(_cache_header(), digest_size=20)
+    hasher.update(f"\0{kind}\0{key}\0".encode())
+    for source in sources:
+        try:
+            hasher.update(source.read_bytes())
+        except FileNotFoundError:
+            hasher.update(_MISSING_SOURCE)
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+def _write_to_disk(path: Path, data: bytes) -> None:
+    global _disk_cache_disabled
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+    except OSError as e:
+        log.info("Disabling on-disk definition cache: %s", e)
+        _disk_cache_disabled = True
+        temp_path.unlink(missing_ok=True)
+
+
+def _load(
+    kind: str, key: str, sources: Sequence[Path], build: Callable[[], _T]
+) -> Tuple[_T, bytes]:
+    cache_path = get_cache_path()
+    entry_path = None
+    if cache_path is not None:
+        entry_path = cache_path / kind / f"{_digest(kind, key, sources)}.pickle"
+        try:
+            data = entry_path.read_bytes()
+            return pickle.loads(data), data
+        except FileNotFoundError:
+            pass
+        except Exception:
+            log.warning("Discarding unreadable cached %s definition %s", kind, key)
+
+    result = build()
+    data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+    if entry_path is not None:
+        _write_to_disk(entry_path, data)
+    return result, data
+
+
+def load_cached(
+    kind: str,
+    key: str,
+    sources: Sequence[Union[str, Path]],
+    build: Callable[[], _T],
+) -> _T:
+    """Load a definition through the cache.
+
+    :param kind: The type of definition, like ``"labware"``.
+    :param key: What identifies this definition among others of its kind.
+    :param sources: The files the definition is built from, either absolute or
+                    relative to the shared data root. These may not exist, if
+                    ``build`` can handle that.
+    :param build: Loads and validates the definition when it isn't cached.
+                  Anything it raises is passed on and nothing is cached.
+    :returns: A fresh copy of the definition, which the caller may modify.
+    """
+    lru_key = (kind, key)
+    with _lru_lock:
+        data = _lru.get(lru_key)
+        if data is not None:
+            _lru.move_to_end(lru_key)
+    if data is not None:
+        return pickle.loads(data)  # type: ignore[no-any-return]
+
+    root = get_shared_data_root()
+    result, data = _load(kind, key, [root / source for source in sources], build)
+    with _lru_lock:
+        _lru[lru_key] = data
+        if len(_lru) > _LRU_SIZE:
+            _lru.popitem(last=False)
+    return result
@@ -5,6 +5,7 @@ import json
 from pathlib import Path
 
 from .. import load_shared_data
+from ..definition_cache import load_cached
 from .gripper_definition import (
     GripperDefinition,
     GripperSchema,
@@ -45,7 +46,12 @@ def load_definition(
     """Load gripper definition based on schema version and gripper model."""
     try:
         path = Path("gripper") / "definitions" / f"{version}" / f"{model.value}.json"
-        return GripperDefinition.parse_obj(json.loads(load_shared_data(path)))
+        return load_cached(
+            "gripper",
+            f"{version}/{model.value}",
+            [path],
+            lambda: GripperDefinition.parse_obj(json.loads(load_shared_data(path))),
+        )
     except FileNotFoundError:
         raise InvalidGripperDefinition(
             f"Gripper model {model} definition in schema version {version} does not exist."
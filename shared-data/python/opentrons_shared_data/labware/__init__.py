@@ -5,6 +5,7 @@ import json
 from typing import Any, Dict, NewType, TYPE_CHECKING
 
 from .. import load_shared_data
+from ..definition_cache import load_cached
 
 if TYPE_CHECKING:
     from .types import LabwareDefinition
@@ -13,8 +14,12 @@ Schema = NewType("Schema", Dict[str, Any])
 
 
 def load_definition(loadname: str, version: int) -> "LabwareDefinition":
-    return json.loads(
-        load_shared_data(f"labware/definitions/2/{loadname}/{version}.json")
+    path = f"labware/definitions/2/{loadname}/{version}.json"
+    return load_cached(
+        "labware",
+        f"{loadname}/{version}",
+        [path],
+        lambda: json.loads(load_shared_data(path)),
     )
 
 
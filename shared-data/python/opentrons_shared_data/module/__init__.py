@@ -3,6 +3,7 @@ import json
 from pathlib import Path
 from typing import Union, cast, overload
 
+from ..definition_cache import load_cached
 from ..load import load_shared_data
 from .types import (
     SchemaVersions,
@@ -88,7 +89,11 @@ def load_definition(
     else:
         path = Path(f"module/definitions/{version}/{model_or_loadname}.json")
         try:
-            data = load_shared_data(path)
+            return load_cached(
+                "module",
+                f"{version}/{model_or_loadname}",
+                [path],
+                lambda: cast(ModuleDefinitionV3, json.loads(load_shared_data(path))),
+            )
         except FileNotFoundError:
             raise ModuleNotFoundError(version, model_or_loadname)
-        return cast(ModuleDefinitionV3, json.loads(data))
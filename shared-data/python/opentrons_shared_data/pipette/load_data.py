@@ -7,6 +7,7 @@ from typing_extensions import Literal
 from functools import lru_cache
 
 from .. import load_shared_data, get_shared_data_root
+from ..definition_cache import load_cached
 
 from .pipette_definition import (
     PipetteConfigurations,
@@ -30,6 +31,27 @@ LoadedConfiguration = Dict[str, Union[str, Dict[str, Any]]]
 LOG = getLogger(__name__)
 
 
+def _get_configuration_path(
+    config_type: Literal["general", "geometry", "liquid"],
+    channels: PipetteChannelType,
+    model: PipetteModelType,
+    version: PipetteVersionType,
+    liquid_class: Optional[LiquidClasses] = None,
+) -> Path:
+    config_dir = (
+        get_shared_data_root()
+        / "pipette"
+        / "definitions"
+        / "2"
+        / config_type
+        / channels.name.lower()
+        / model.value
+    )
+    if liquid_class:
+        config_dir = config_dir / liquid_class.name
+    return config_dir / f"{version.major}_{version.minor}.json"
+
+
 def _get_configuration_dictionary(
     config_type: Literal["general", "geometry", "liquid"],
     channels: PipetteChannelType,
@@ -37,29 +59,9 @@ def _get_configuration_dictionary(
     version: PipetteVersionType,
     liquid_class: Optional[LiquidClasses] = None,
 ) -> LoadedConfiguration:
-    if liquid_class:
-        config_path = (
-            get_shared_data_root()
-            / "pipette"
-            / "definitions"
-            / "2"
-            / config_type
-            / channels.name.lower()
-            / model.value
-            / liquid_class.name
-            / f"{version.major}_{version.minor}.json"
-        )
-    else:
-        config_path = (
-            get_shared_data_root()
-            / "pipette"
-            / "definitions"
-            / "2"
-            / config_type
-            / channels.name.lower()
-            / model.value
-            / f"{version.major}_{version.minor}.json"
-        )
+    config_path = _get_configuration_path(
+        config_type, channels, model, version, liquid_class
+    )
     return json.loads(load_shared_data(config_path))
 
 
@@ -257,6 +259,28 @@ def load_definition(
     ):
         raise KeyError("Pipette version not found.")
 
+    return load_cached(
+        "pipette",
+        f"{channels.name}/{model.value}/{version.major}_{version.minor}",
+        [
+            _get_configuration_path("geometry", channels, model, version),
+            _get_configuration_path("general", channels, model, version),
+            *(
+                _get_configuration_path(
+                    "liquid", channels, model, version, liquid_class
+                )
+                for liquid_class in LiquidClasses
+            ),
+        ],
+        lambda: _build_definition(model, channels, version),
+    )
+
+
+def _build_definition(
+    model: PipetteModelType,
+    channels: PipetteChannelType,
+    version: PipetteVersionType,
+) -> PipetteConfigurations:
     geometry_dict = _geometry(channels, model, version)
     physical_dict = _physical(channels, model, version)
     liquid_dict = _liquid(channels, model, version)
@@ -0,0 +1,120 @@
+"""Tests for the shared definition cache."""
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+from opentrons_shared_data import definition_cache, labware
+from opentrons_shared_data.definition_cache import ENV_CACHE_PATH, load_cached
+
+
+@pytest.fixture(autouse=True)
+def cache_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    path = tmp_path / "cache"
+    monkeypatch.setenv(ENV_CACHE_PATH, str(path))
+    definition_cache.clear()
+    yield path
+    definition_cache.clear()
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> Path:
+    path = tmp_path / "definition.json"
+    path.write_text(json.dumps({"value": 1}))
+    return path
+
+
+def _counting_loader(source: Path, calls: List[Path]) -> Any:
+    def _build() -> Dict[str, Any]:
+        calls.append(source)
+        return json.loads(source.read_text())  # type: ignore[no-any-return]
+
+    return _build
+
+
+def test_returns_fresh_copies(source: Path) -> None:
+    calls: List[Path] = []
+    build = _counting_loader(source, calls)
+
+    first = load_cached("test", "key", [source], build)
+    first["value"] = 2
+    second = load_cached("test", "key", [source], build)
+
+    assert second == {"value": 1}
+    assert len(calls) == 1
+
+
+def test_reuses_on_disk_cache(source: Path, cache_path: Path) -> None:
+    calls: List[Path] = []
+    build = _counting_loader(source, calls)
+
+    load_cached("test", "key", [source], build)
+    definition_cache.clear()
+    assert load_cached("test", "key", [source], build) == {"value": 1}
+
+    assert len(calls) == 1
+    assert len(list((cache_path / "test").iterdir())) == 1
+
+
+def test_rebuilds_when_source_changes(source: Path) -> None:
+    calls: List[Path] = []
+    build = _counting_loader(source, calls)
+
+    load_cached("test", "key", [source], build)
+    source.write_text(json.dumps({"value": 3}))
+    definition_cache.clear()
+
+    assert load_cached("test", "key", [source], build) == {"value": 3}
+    assert len(calls) == 2
+
+
+def test_rebuilds_corrupt_entries(source: Path, cache_path: Path) -> None:
+    calls: List[Path] = []
+    build = _counting_loader(source, calls)
+
+    load_cached("test", "key", [source], build)
+    for entry in (cache_path / "test").iterdir():
+        entry.write_bytes(b"not a pickle")
+    definition_cache.clear()
+
+    assert load_cached("test", "key", [source], build) == {"value": 1}
+    assert len(calls) == 2
+
+
+def test_build_errors_are_not_cached(tmp_path: Path, cache_path: Path) -> None:
+    missing = tmp_path / "missing.json"
+    calls: List[Path] = []
+    build = _counting_loader(missing, calls)
+
+    for _ in range(2):
+        with pytest.raises(FileNotFoundError):
+            load_cached("test", "key", [missing], build)
+
+    assert len(calls) == 2
+    assert not cache_path.exists()
+
+
+def test_disabled_on_disk_cache(
+    source: Path, cache_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(ENV_CACHE_PATH, "")
+    calls: List[Path] = []
+    build = _counting_loader(source, calls)
+
+    load_cached("test", "key", [source], build)
+    definition_cache.clear()
+    load_cached("test", "key", [source], build)
+
+    assert len(calls) == 2
+    assert not cache_path.exists()
+
+
+def test_labware_definitions_are_cached(cache_path: Path) -> None:
+    first = labware.load_definition("opentrons_96_tiprack_300ul", 1)
+    definition_cache.clear()
+    second = labware.load_definition("opentrons_96_tiprack_300ul", 1)
+
+    assert first == second
+    assert first is not second
+    assert len(list((cache_path / "labware").iterdir())) == 1
@@ -0,0 +1,104 @@
+"""Compare the time to unzip and hash a synthetic system update.
+
+The update zip holds a rootfs of random data and its hash, like a real
+update. It's validated three ways:
+- unzipping in 1 KiB chunks and then hashing the unzipped rootfs again, the
+  way validation used to work
+- unzipping and hashing in one pass
+- unzipping and hashing in one pass, then hashing the unzipped rootfs again
+  through a memory map
+
+Usage:
+    python benchmarks/update_validation.py [--size-mb N] [--repeat R]
+"""
+import argparse
+import binascii
+import hashlib
+import os
+import statistics
+import tempfile
+import time
+import zipfile
+from typing import Callable, Dict, List
+
+from otupdate.common import file_actions
+
+_FILES = ["rootfs.ext4", "rootfs.ext4.hash"]
+
+
+def _make_update(directory: str, size_mb: int) -> str:
+    rootfs = os.urandom(1024 * 1024) * size_mb
+    update_path = os.path.join(directory, "system-update.zip")
+    with zipfile.ZipFile(update_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("rootfs.ext4", rootfs)
+        zf.writestr(
+            "rootfs.ext4.hash", binascii.hexlify(hashlib.sha256(rootfs).digest())
+        )
+    return update_path
+
+
+def _two_pass(update_path: str) -> bytes:
+    paths, sizes = file_actions.unzip_update(
+        update_path, lambda _: None, _FILES, _FILES
+    )
+    rootfs = paths["rootfs.ext4"]
+    assert rootfs
+    return file_actions.hash_file(
+        rootfs, lambda _: None, file_size=sizes["rootfs.ext4"]
+    )
+
+
+def _one_pass(update_path: str) -> bytes:
+    _, _, hashes = file_actions.unzip_and_hash_update(
+        update_path, lambda _: None, _FILES, _FILES, hash_files=["rootfs.ext4"]
+    )
+    return hashes["rootfs.ext4"]
+
+
+def _one_pass_with_mmap_verify(update_path: str) -> bytes:
+    paths, _, hashes = file_actions.unzip_and_hash_update(
+        update_path, lambda _: None, _FILES, _FILES, hash_files=["rootfs.ext4"]
+    )
+    rootfs = paths["rootfs.ext4"]
+    assert rootfs
+    verified = file_actions.hash_file(
+        rootfs,
+        lambda _: None,
+        chunk_size=file_actions.STREAM_CHUNK_SIZE,
+        use_mmap=True,
+    )
+    assert verified == hashes["rootfs.ext4"]
+    return verified
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=256)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    methods: Dict[str, Callable[[str], bytes]] = {
+        "unzip, then hash": _two_pass,
+        "fused": _one_pass,
+        "fused, then mmap verify": _one_pass_with_mmap_verify,
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        update_path = _make_update(directory, args.size_mb)
+        with zipfile.ZipFile(update_path) as zf:
+            expected_hash = zf.read("rootfs.ext4.hash")
+
+        times: Dict[str, List[float]] = {name: [] for name in methods}
+        for _ in range(args.repeat):
+            for name, method in methods.items():
+                start = time.perf_counter()
+                assert method(update_path) == expected_hash
+                times[name].append(time.perf_counter() - start)
+
+    for name, method_times in times.items():
+        median = statistics.median(method_times)
+        print(f"{name:<25} {median:.3f}s ({args.size_mb / median:.0f} MB/s of rootfs)")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ import binascii
 import hashlib
 import json
 import logging
+import mmap
 import os
 import subprocess
 from typing import Callable, Sequence, Mapping, Optional, Tuple, List, Dict
@@ -15,6 +16,11 @@ import zipfile
 
 LOG = logging.getLogger(__name__)
 
+# Update images are hundreds of megabytes, and reading, hashing and writing
+# them in small chunks is slow on the robot's eMMC. This is a multiple of
+# the page size, so writes stay aligned.
+STREAM_CHUNK_SIZE = 1024 * 1024
+
 
 class FileMissing(ValueError):
     def __init__(self, message: str) -> None:
@@ -117,37 +123,72 @@ def unzip_update(
     :return: Two dictionaries, the first mapping file names to paths and the
              second mapping file names to sizes
 
+    :raises FileMissing: If a mandatory file is missing
+    """
+    file_paths, file_sizes, _ = unzip_and_hash_update(
+        filepath,
+        progress_callback,
+        acceptable_files,
+        mandatory_files,
+        chunk_size=chunk_size,
+    )
+    return file_paths, file_sizes
+
+
+def unzip_and_hash_update(
+    filepath: str,
+    progress_callback: Callable[[float], None],
+    acceptable_files: Sequence[str],
+    mandatory_files: Sequence[str],
+    hash_files: Sequence[str] = (),
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    algo: str = "sha256",
+) -> Tuple[Mapping[str, Optional[str]], Mapping[str, int], Mapping[str, bytes]]:
+    """Unzip an update file, hashing some of its files as they're unzipped
+
+    This works like :py:func:`unzip_update`, but each file in ``hash_files``
+    is hashed from the same chunks that are written out, so that the whole
+    update is only read once. ``progress_callback`` covers both unzipping
+    and hashing.
+
+    :param filepath: The path zipfile to unzip. The contents will be in its
+                     directory
+    :param progress_callback: A callable taking a number between 0 and 1 that
+                              will be called periodically to check progress.
+                              This is for user display; it may not reach 1.0
+                              exactly.
+    :param acceptable_files: A list of files to unzip if found. Others will be
+                             ignored.
+    :param mandatory_files: A list of files to raise an error about if they're
+                            not in the zip.
+    :param hash_files: A list of files to hash as they're unzipped.
+    :param chunk_size: The size of the chunks to read, hash and write.
+    :param algo: The algorithm to hash with. Can be anything used by
+                 :py:mod:`hashlib`
+    :return: Three dictionaries, mapping file names to paths, to sizes, and
+             to their hashes as ascii hex. Only files in ``hash_files`` that
+             were found are in the last one.
+
     :raises FileMissing: If a mandatory file is missing
     """
     assert chunk_size
-    total_size = 0
     written_size = 0
-    to_unzip: List[zipfile.ZipInfo] = []
     file_paths: Dict[str, Optional[str]] = {fn: None for fn in acceptable_files}
     file_sizes: Dict[str, int] = {fn: 0 for fn in acceptable_files}
+    file_hashes: Dict[str, bytes] = {}
     LOG.info(f"Unzipping {filepath}")
     with zipfile.ZipFile(filepath, "r") as zf:
-        files = zf.infolist()
-        remaining_filenames = [fn for fn in acceptable_files]
-        for fi in files:
-            if fi.filename in acceptable_files:
-                to_unzip.append(fi)
-                total_size += fi.file_size
-                remaining_filenames.remove(fi.filename)
-                LOG.debug(f"Found {fi.filename} ({fi.file_size}B)")
-            else:
-                LOG.debug(f"Ignoring {fi.filename}")
-
-        for name in remaining_filenames:
-            if name in mandatory_files:
-                raise FileMissing(f"File {name} missing from zip")
-
+        to_unzip = _find_files_to_unzip(zf, acceptable_files, mandatory_files)
+        total_size = sum(fi.file_size for fi in to_unzip)
         for fi in to_unzip:
             uncomp_path = os.path.join(os.path.dirname(filepath), fi.filename)
+            hasher = hashlib.new(algo) if fi.filename in hash_files else None
             with zf.open(fi) as zipped, open(uncomp_path, "wb") as unzipped:
                 LOG.debug(f"Beginning unzip of {fi.filename} to {uncomp_path}")
                 while True:
                     chunk = zipped.read(chunk_size)
+                    if hasher:
+                        hasher.update(chunk)
                     unzipped.write(chunk)
                     written_size += len(chunk)
                     progress_callback(written_size / total_size)
@@ -155,6 +196,8 @@ def unzip_update(
                         break
                 file_paths[fi.filename] = uncomp_path
                 file_sizes[fi.filename] = fi.file_size
+                if hasher:
+                    file_hashes[fi.filename] = binascii.hexlify(hasher.digest())
                 LOG.debug(f"Unzipped {fi.filename} to {uncomp_path}")
     LOG.info(
         f"Unzipped {filepath}, results: \n\t"
@@ -162,7 +205,28 @@ def unzip_update(
             [f"{k}: {file_paths[k]} ({file_sizes[k]}B)" for k in file_paths.keys()]
         )
     )
-    return file_paths, file_sizes
+    return file_paths, file_sizes, file_hashes
+
+
+def _find_files_to_unzip(
+    zf: zipfile.ZipFile,
+    acceptable_files: Sequence[str],
+    mandatory_files: Sequence[str],
+) -> List[zipfile.ZipInfo]:
+    to_unzip: List[zipfile.ZipInfo] = []
+    remaining_filenames = [fn for fn in acceptable_files]
+    for fi in zf.infolist():
+        if fi.filename in acceptable_files:
+            to_unzip.append(fi)
+            remaining_filenames.remove(fi.filename)
+            LOG.debug(f"Found {fi.filename} ({fi.file_size}B)")
+        else:
+            LOG.debug(f"Ignoring {fi.filename}")
+
+    for name in remaining_filenames:
+        if name in mandatory_files:
+            raise FileMissing(f"File {name} missing from zip")
+    return to_unzip
 
 
 def hash_file(
@@ -171,6 +235,7 @@ def hash_file(
     chunk_size: int = 1024,
     file_size: Optional[int] = None,
     algo: str = "sha256",
+    use_mmap: bool = False,
 ) -> bytes:
     """
     Hash a file and return the hash, providing progress callbacks
@@ -185,6 +250,9 @@ def hash_file(
                       calculated internally.
     :param algo: The algorithm to use. Can be anything used by
                  :py:mod:`hashlib`
+    :param use_mmap: If True, hash the file through a memory map instead of
+                     reading it, which avoids copying it chunk by chunk. Use a
+                     large ``chunk_size`` with this.
     :returns: The output has ascii hex
     """
     hasher = hashlib.new(algo)
@@ -195,6 +263,16 @@ def hash_file(
         if not file_size:
             file_size = to_hash.seek(0, 2)
             to_hash.seek(0)
+        if use_mmap and os.fstat(to_hash.fileno()).st_size:
+            with mmap.mmap(
+                to_hash.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mapped, memoryview(mapped) as view:
+                while have_read < len(view):
+                    with view[have_read : have_read + chunk_size] as mapped_chunk:
+                        hasher.update(mapped_chunk)
+                        have_read += len(mapped_chunk)
+                    progress_callback(have_read / file_size)
+            return binascii.hexlify(hasher.digest())
         while True:
             chunk = to_hash.read(chunk_size)
             hasher.update(chunk)
@@ -7,15 +7,14 @@ import tempfile
 from otupdate.common.constants import MODEL_OT3
 from otupdate.common.file_actions import (
     InvalidRobotType,
-    unzip_update,
-    hash_file,
+    unzip_and_hash_update,
     HashMismatch,
     InvalidPKGName,
     verify_signature,
     load_version_file,
 )
 from otupdate.common.update_actions import UpdateActionsInterface, Partition
-from typing import Any, Callable, Generator, Optional, Tuple
+from typing import Callable, Generator, Optional, Tuple
 import enum
 import subprocess
 
@@ -185,16 +184,17 @@ class OT3UpdateActions(UpdateActionsInterface):
             LOG.error(msg)
             raise InvalidPKGName(msg)
 
-        def zip_callback(progress: Any) -> None:
-            progress_callback(progress / 2.0)
-
         required = [ROOTFS_NAME, ROOTFS_HASH_NAME]
         if cert_path:
             required.append(ROOTFS_SIG_NAME)
-        files, sizes = unzip_update(filepath, zip_callback, UPDATE_FILES, required)
-
-        def hash_callback(progress: Any) -> None:
-            progress_callback(progress / 2.0 + 0.5)
+        # Hash the rootfs while it's unzipped, rather than reading it again
+        files, _, hashes = unzip_and_hash_update(
+            filepath,
+            progress_callback,
+            UPDATE_FILES,
+            required,
+            hash_files=[ROOTFS_NAME],
+        )
 
         version_file = str(files.get("VERSION.json"))
         version_dict = load_version_file(version_file)
@@ -206,7 +206,7 @@ class OT3UpdateActions(UpdateActionsInterface):
 
         rootfs = files.get(ROOTFS_NAME)
         assert rootfs
-        rootfs_hash = hash_file(rootfs, hash_callback, file_size=sizes[ROOTFS_NAME])
+        rootfs_hash = hashes[ROOTFS_NAME]
         hashfile = files.get(ROOTFS_HASH_NAME)
         assert hashfile
         packaged_hash = b""
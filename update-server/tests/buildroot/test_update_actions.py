@@ -24,19 +24,17 @@ def test_validate_hash_only(downloaded_update_file):
         cb,
         None,
     )
-    # We should have a callback call for
-    # - the unzips (see test_unzip for calculation)
+    # We should have a callback call for each chunk unzipped, which the
+    # rootfs is hashed from as it's unzipped
     with zipfile.ZipFile(downloaded_update_file) as zf:
         rootfs_size = zf.getinfo(update_actions.ROOTFS_NAME).file_size
-        rootfs_calls = rootfs_size // 1024
-        if rootfs_calls * 1024 != rootfs_size:
+        rootfs_calls = rootfs_size // file_actions.STREAM_CHUNK_SIZE
+        if rootfs_calls * file_actions.STREAM_CHUNK_SIZE != rootfs_size:
             rootfs_calls += 1
     # only adding 1 extra call because we don’t have a signature file
     calls = rootfs_calls + 1
-
-    # - the hashes, one for each chunk, the same chunks as unzip
-    calls += rootfs_calls
     assert cb.call_count == calls
+    assert cb.call_args_list[-1] == mock.call(1.0)
 
 
 def test_validate(downloaded_update_file, testing_cert):
@@ -48,18 +46,16 @@ def test_validate(downloaded_update_file, testing_cert):
         cb,
         cert_path,
     )
-    # We should have a callback call for
-    # - the unzips (see test_unzip for calculation)
+    # We should have a callback call for each chunk unzipped, which the
+    # rootfs is hashed from as it's unzipped
     with zipfile.ZipFile(downloaded_update_file) as zf:
         rootfs_size = zf.getinfo(update_actions.ROOTFS_NAME).file_size
-        rootfs_calls = rootfs_size // 1024
-        if rootfs_calls * 1024 != rootfs_size:
+        rootfs_calls = rootfs_size // file_actions.STREAM_CHUNK_SIZE
+        if rootfs_calls * file_actions.STREAM_CHUNK_SIZE != rootfs_size:
             rootfs_calls += 1
     calls = rootfs_calls + 2
-
-    # - the hashes, one for each chunk, the same chunks as unzip
-    calls += rootfs_calls
     assert cb.call_count == calls
+    assert cb.call_args_list[-1] == mock.call(1.0)
 
 
 @pytest.mark.bad_hash
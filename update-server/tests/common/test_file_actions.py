@@ -32,6 +32,28 @@ def test_unzip(downloaded_update_file):
     assert cb.call_count == calls
 
 
+def test_unzip_and_hash(downloaded_update_file):
+    cb = mock.Mock()
+    paths, sizes, hashes = file_actions.unzip_and_hash_update(
+        downloaded_update_file,
+        cb,
+        UPDATE_FILES,
+        UPDATE_FILES,
+        hash_files=["rootfs.ext4"],
+    )
+    assert sorted(list(paths.keys())) == sorted(UPDATE_FILES)
+    with zipfile.ZipFile(downloaded_update_file) as zf:
+        for filename, size in sizes.items():
+            assert zf.getinfo(filename).file_size == size
+        for filename, path in paths.items():
+            assert zf.read(filename) == open(path, "rb").read()
+        assert list(hashes.keys()) == ["rootfs.ext4"]
+        assert hashes["rootfs.ext4"] == zf.read("rootfs.ext4.hash")
+    # one chunk per file, since they're all smaller than the default chunk
+    assert cb.call_count == 3
+    assert cb.call_args_list[-1] == mock.call(1.0)
+
+
 @pytest.mark.exclude_rootfs_ext4
 def test_unzip_requires_rootfs(downloaded_update_file):
     cb = mock.Mock()
@@ -79,6 +101,21 @@ def test_hash(extracted_update_file):
     cb.assert_called()
 
 
+def test_hash_mmap(extracted_update_file):
+    cb = mock.Mock()
+    hash_output = file_actions.hash_file(
+        os.path.join(extracted_update_file, "rootfs.ext4"),
+        cb,
+        chunk_size=4096,
+        use_mmap=True,
+    )
+    assert (
+        hash_output
+        == open(os.path.join(extracted_update_file, "rootfs.ext4.hash"), "rb").read()
+    )
+    assert cb.call_args_list[-1] == mock.call(1.0)
+
+
 def test_verify_signature_ok(extracted_update_file, testing_cert):
     file_actions.verify_signature(
         os.path.join(extracted_update_file, "rootfs.ext4.hash"),
@@ -0,0 +1,191 @@
+"""Measure relay throughput and latency without USB hardware.
+
+A pty stands in for the USB serial gadget, with its other end playing the USB
+host, and a local TCP server stands in for the internal server. Both relay
+modes are measured:
+- thread: ot3usb.listener.listen, with the serial worker thread
+- epoll: ot3usb.relay.Relay
+
+Serial writes normally go out in small paced packets for the sake of desktop
+serial drivers; that limit is raised here so the relays themselves are measured.
+
+Usage:
+    python benchmarks/relay_throughput.py [--megabytes N] [--round-trips N]
+"""
+import argparse
+import os
+import pty
+import socket
+import statistics
+import threading
+import time
+import tty
+from typing import Any, Callable, Optional
+
+import serial  # type: ignore[import-untyped]
+
+from ot3usb import listener, relay, tcp_conn
+from ot3usb.serial_thread import create_worker_thread
+
+_PACKET_LIMIT = 1024 * 1024
+_CHUNK = 64 * 1024
+
+
+class _FakeMonitor:
+    """A USB connection monitor whose host is always connected."""
+
+    def __init__(self) -> None:
+        self._read_fd, self._write_fd = os.pipe()
+
+    def fileno(self) -> int:
+        return self._read_fd
+
+    def host_connected(self) -> bool:
+        return True
+
+    def read_message(self) -> None:
+        pass
+
+    def update_state(self) -> None:
+        pass
+
+    def close(self) -> None:
+        os.close(self._read_fd)
+        os.close(self._write_fd)
+
+
+class _Harness:
+    """A pty, a TCP server, and a relay running between them."""
+
+    def __init__(self, mode: str) -> None:
+        self.host, gadget = pty.openpty()
+        tty.setraw(self.host)
+        tty.setraw(gadget)
+        self._serial = serial.Serial(port=os.ttyname(gadget))
+        os.close(gadget)
+
+        listening = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listening.bind(("127.0.0.1", 0))
+        listening.listen(1)
+        self._tcp = tcp_conn.TCPConnection()
+        self._tcp.connect(*listening.getsockname())
+        self.server, _ = listening.accept()
+        listening.close()
+
+        self._monitor = _FakeMonitor()
+        self._running = True
+        if mode == "epoll":
+            data_relay = relay.Relay(packet_limit=_PACKET_LIMIT)
+            self._close_relay: Optional[Callable[[], None]] = data_relay.close
+
+            def _listen() -> Any:
+                return data_relay.listen(
+                    self._monitor, None, self._serial, self._tcp  # type: ignore[arg-type]
+                )
+
+        else:
+            worker, queue = create_worker_thread(packet_limit=_PACKET_LIMIT)
+            worker.daemon = True
+            worker.start()
+            self._close_relay = None
+
+            def _listen() -> Any:
+                return listener.listen(
+                    self._monitor, None, self._serial, self._tcp, queue  # type: ignore[arg-type]
+                )
+
+        def _run() -> None:
+            while self._running:
+                _listen()
+
+        self._thread = threading.Thread(target=_run, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._running = False
+        self._thread.join()
+        if self._close_relay:
+            self._close_relay()
+        self._tcp.disconnect()
+        self.server.close()
+        self._serial.close()
+        self._monitor.close()
+        os.close(self.host)
+
+
+def _host_to_server(harness: _Harness, size: int) -> float:
+    data = os.urandom(_CHUNK)
+
+    def _write() -> None:
+        written = 0
+        while written < size:
+            written += os.write(harness.host, data[: min(_CHUNK, size - written)])
+
+    start = time.perf_counter()
+    writer = threading.Thread(target=_write)
+    writer.start()
+    received = 0
+    while received < size:
+        received += len(harness.server.recv(_CHUNK))
+    writer.join()
+    return time.perf_counter() - start
+
+
+def _server_to_host(harness: _Harness, size: int) -> float:
+    data = os.urandom(_CHUNK)
+
+    def _write() -> None:
+        sent = 0
+        while sent < size:
+            sent += harness.server.send(data[: min(_CHUNK, size - sent)])
+
+    start = time.perf_counter()
+    writer = threading.Thread(target=_write)
+    writer.start()
+    received = 0
+    while received < size:
+        received += len(os.read(harness.host, _CHUNK))
+    writer.join()
+    return time.perf_counter() - start
+
+
+def _round_trip(harness: _Harness) -> float:
+    message = b"x" * 32
+    start = time.perf_counter()
+    os.write(harness.host, message)
+    received = 0
+    while received < len(message):
+        received += len(harness.server.recv(_CHUNK))
+    harness.server.sendall(message)
+    received = 0
+    while received < len(message):
+        received += len(os.read(harness.host, _CHUNK))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--megabytes", type=int, default=16)
+    parser.add_argument("--round-trips", type=int, default=200)
+    args = parser.parse_args()
+    size = args.megabytes * 1024 * 1024
+
+    for mode in ("thread", "epoll"):
+        harness = _Harness(mode)
+        try:
+            upload = _host_to_server(harness, size)
+            download = _server_to_host(harness, size)
+            round_trips = [_round_trip(harness) for _ in range(args.round_trips)]
+        finally:
+            harness.close()
+        print(
+            f"{mode:<8} host->server {args.megabytes / upload:>7.1f} MB/s  "
+            f"server->host {args.megabytes / download:>7.1f} MB/s  "
+            f"round trip median {statistics.median(round_trips) * 1e6:>7.0f} us, "
+            f"max {max(round_trips) * 1e6:>7.0f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
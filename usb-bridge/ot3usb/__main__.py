@@ -2,9 +2,11 @@
 import asyncio
 import logging
 import time
-from typing import NoReturn
+from typing import NoReturn, Optional
 
-from . import cli, usb_config, usb_monitor, tcp_conn, listener
+import serial  # type: ignore[import-untyped]
+
+from . import cli, usb_config, usb_monitor, tcp_conn, listener, relay
 from .default_config import get_gadget_config, PHY_NAME
 
 from .serial_thread import create_worker_thread
@@ -57,17 +59,40 @@ async def main() -> NoReturn:
 
     monitor.begin()
 
-    thread, queue = create_worker_thread()
-
-    thread.start()
-
     if monitor.host_connected():
         LOG.debug("USB connected on startup")
         ser = listener.update_ser_handle(config, ser, True, tcp)
 
+    if args.relay_mode == "epoll":
+        _relay_with_epoll(monitor, config, ser, tcp)
+    _relay_with_worker_thread(monitor, config, ser, tcp)
+
+
+def _relay_with_worker_thread(
+    monitor: usb_monitor.USBConnectionMonitor,
+    config: usb_config.SerialGadget,
+    ser: Optional[serial.Serial],
+    tcp: tcp_conn.TCPConnection,
+) -> NoReturn:
+    thread, queue = create_worker_thread()
+
+    thread.start()
+
     while True:
         ser = listener.listen(monitor, config, ser, tcp, queue)
 
 
+def _relay_with_epoll(
+    monitor: usb_monitor.USBConnectionMonitor,
+    config: usb_config.SerialGadget,
+    ser: Optional[serial.Serial],
+    tcp: tcp_conn.TCPConnection,
+) -> NoReturn:
+    data_relay = relay.Relay()
+
+    while True:
+        ser = data_relay.listen(monitor, config, ser, tcp)
+
+
 if __name__ == "__main__":
     asyncio.run(main())
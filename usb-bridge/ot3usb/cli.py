@@ -13,4 +13,12 @@ def build_root_parser() -> argparse.ArgumentParser:
         help="Log level",
         default="info",
     )
+    parser.add_argument(
+        "--relay-mode",
+        dest="relay_mode",
+        choices=["thread", "epoll"],
+        help="How to relay data: through a serial worker thread, or with an "
+        "epoll loop that reads and writes through fixed buffers",
+        default="thread",
+    )
     return parser
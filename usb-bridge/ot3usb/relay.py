@@ -0,0 +1,252 @@
+"""Relay data between the serial port and the TCP connection with epoll.
+
+This is an alternative to :py:func:`ot3usb.listener.listen` and the serial
+worker thread. Instead of handing every read to a queue, data is read straight
+into a fixed-size buffer for each direction and written out from there, as much
+as the other side will take at once. When a buffer fills up, its source isn't
+read from until the buffer drains, so a slow reader pushes back on the writer
+instead of data piling up in memory.
+"""
+
+import logging
+import os
+import selectors
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import serial  # type: ignore[import-untyped]
+
+from . import usb_config, usb_monitor, tcp_conn
+from .listener import POLL_TIMEOUT, check_monitor, update_ser_handle
+from .serial_thread import DEFAULT_PACKET_LIMIT
+
+LOG = logging.getLogger(__name__)
+
+RELAY_BUFFER_SIZE = 16 * 1024
+
+# The serial worker thread waits this long between packets when it can't write
+# everything at once; the relay keeps the same pacing.
+SERIAL_WRITE_INTERVAL = 0.01
+
+
+class RelayBuffer:
+    """A fixed-size buffer of data waiting to be written to one side of the relay."""
+
+    def __init__(self, size: int) -> None:
+        self._data = bytearray(size)
+        self._view = memoryview(self._data)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        """Get the number of bytes waiting to be written."""
+        return self._end - self._start
+
+    def full(self) -> bool:
+        """Whether there's no room to read more data into the buffer."""
+        return len(self) == len(self._data)
+
+    def free_space(self) -> memoryview:
+        """Get the free space at the end of the buffer, to read data into."""
+        if self._start and self._end == len(self._data):
+            # Move the pending data to the front to make room behind it
+            pending = len(self)
+            self._data[:pending] = self._view[self._start : self._end]
+            self._start, self._end = 0, pending
+        return self._view[self._end :]
+
+    def filled(self, count: int) -> None:
+        """Mark some of the free space as filled with data."""
+        self._end += count
+
+    def pending(self, limit: Optional[int] = None) -> memoryview:
+        """Get the data waiting to be written, or up to limit bytes of it."""
+        end = self._end if limit is None else min(self._end, self._start + limit)
+        return self._view[self._start : end]
+
+    def consumed(self, count: int) -> None:
+        """Mark some of the pending data as written."""
+        self._start += count
+        if self._start == self._end:
+            self._start = self._end = 0
+
+    def clear(self) -> None:
+        """Drop all pending data."""
+        self._start = self._end = 0
+
+
+class Relay:
+    """Relays data between the serial port and the TCP connection."""
+
+    def __init__(
+        self,
+        buffer_size: int = RELAY_BUFFER_SIZE,
+        packet_limit: Optional[int] = DEFAULT_PACKET_LIMIT,
+    ) -> None:
+        """Create a relay.
+
+        Args:
+            buffer_size: The size of the buffer for each direction.
+
+            packet_limit: The most to write to the serial port before waiting
+            SERIAL_WRITE_INTERVAL to write more. See
+            :py:func:`ot3usb.serial_thread.create_worker_thread`. If None,
+            serial writes aren't limited.
+        """
+        self._selector = selectors.DefaultSelector()
+        self._registered: Dict[str, Tuple[Any, int, int]] = {}
+        self._to_tcp = RelayBuffer(buffer_size)
+        self._to_serial = RelayBuffer(buffer_size)
+        self._packet_limit = packet_limit
+        self._next_serial_write = 0.0
+        self._packet_written = 0
+        self._next_monitor_poll = 0.0
+
+    def close(self) -> None:
+        """Close the relay's selector."""
+        self._selector.close()
+
+    def _register(self, role: str, fileobj: Any, events: int) -> None:
+        """Make sure the selector is watching one file for the given events.
+
+        Files are tracked by identity as well as file number, since the TCP
+        socket and the serial handle are replaced when they reconnect and
+        their numbers can be reused.
+        """
+        fd = fileobj.fileno() if fileobj is not None and events else -1
+        current = self._registered.get(role)
+        if current is not None and (current[0] is not fileobj or current[1] != fd):
+            self._selector.unregister(current[1])
+            del self._registered[role]
+            current = None
+        if fd < 0:
+            return
+        if current is None:
+            self._selector.register(fd, events, role)
+        elif current[2] != events:
+            self._selector.modify(fd, events, role)
+        self._registered[role] = (fileobj, fd, events)
+
+    def _update_registrations(
+        self,
+        monitor: usb_monitor.USBConnectionMonitor,
+        ser: Optional[serial.Serial],
+        tcp: tcp_conn.TCPConnection,
+        now: float,
+    ) -> None:
+        serial_events = 0
+        tcp_events = 0
+        if ser is not None:
+            if not self._to_tcp.full():
+                serial_events |= selectors.EVENT_READ
+            if len(self._to_serial) and now >= self._next_serial_write:
+                serial_events |= selectors.EVENT_WRITE
+            if not self._to_serial.full():
+                tcp_events |= selectors.EVENT_READ
+            if len(self._to_tcp):
+                tcp_events |= selectors.EVENT_WRITE
+        self._register("monitor", monitor, selectors.EVENT_READ)
+        self._register("serial", ser, serial_events)
+        self._register("tcp", tcp.sock, tcp_events)
+
+    def _timeout(self, now: float) -> float:
+        timeout = self._next_monitor_poll - now
+        if len(self._to_serial) and self._next_serial_write > now:
+            timeout = min(timeout, self._next_serial_write - now)
+        return max(timeout, 0.0)
+
+    def _read_serial(self, ser: serial.Serial) -> None:
+        try:
+            read = os.readv(ser.fileno(), [self._to_tcp.free_space()])
+        except BlockingIOError:
+            return
+        self._to_tcp.filled(read)
+
+    def _write_serial(self, ser: serial.Serial, now: float) -> None:
+        if not len(self._to_serial) or now < self._next_serial_write:
+            return
+        limit = (
+            None
+            if self._packet_limit is None
+            else self._packet_limit - self._packet_written
+        )
+        try:
+            written = os.write(ser.fileno(), self._to_serial.pending(limit))
+        except BlockingIOError:
+            written = 0
+        self._to_serial.consumed(written)
+        if not len(self._to_serial):
+            self._packet_written = 0
+        elif self._packet_limit is not None:
+            self._packet_written += written
+            if self._packet_written >= self._packet_limit:
+                self._packet_written = 0
+                self._next_serial_write = now + SERIAL_WRITE_INTERVAL
+
+    def _relay(
+        self,
+        ser: serial.Serial,
+        tcp: tcp_conn.TCPConnection,
+        ready: Dict[str, int],
+        now: float,
+    ) -> None:
+        """Read whatever is ready, then write as much as possible."""
+        if ready.get("serial", 0) & selectors.EVENT_READ:
+            self._read_serial(ser)
+        if ready.get("tcp", 0) & selectors.EVENT_READ:
+            self._to_serial.filled(tcp.recv_into(self._to_serial.free_space()))
+        # Write without waiting to be told the other side is writable, since
+        # it usually is; only wait for it when a write comes up short.
+        if len(self._to_tcp):
+            self._to_tcp.consumed(tcp.send_nonblocking(self._to_tcp.pending()))
+        self._write_serial(ser, now)
+
+    def listen(
+        self,
+        monitor: usb_monitor.USBConnectionMonitor,
+        config: usb_config.SerialGadget,
+        ser: Optional[serial.Serial],
+        tcp: tcp_conn.TCPConnection,
+    ) -> Optional[serial.Serial]:
+        """Process any available incoming data.
+
+        This is the relay's counterpart to :py:func:`ot3usb.listener.listen`,
+        and should be called in a loop the same way.
+
+        Args:
+            monitor: The USB connection monitor
+
+            config: Serial gadget configuration
+
+            ser: Handle for the serial port
+
+            tcp: Handle for the socket connection to the internal server
+        """
+        now = time.monotonic()
+        self._update_registrations(monitor, ser, tcp, now)
+        ready: Dict[str, int] = {}
+        for key, events in self._selector.select(self._timeout(now)):
+            ready[key.data] = events
+        now = time.monotonic()
+
+        if "monitor" in ready or now >= self._next_monitor_poll:
+            # Read a new udev messages
+            self._next_monitor_poll = now + POLL_TIMEOUT
+            check_monitor(monitor, "monitor" in ready)
+            new_ser = update_ser_handle(config, ser, monitor.host_connected(), tcp)
+            if new_ser is not ser:
+                self._to_tcp.clear()
+                self._to_serial.clear()
+            # ALWAYS exit early if we had a change in udev messages
+            return new_ser
+        if ser is None:
+            return ser
+        try:
+            self._relay(ser, tcp, ready, now)
+        except OSError:
+            LOG.debug("Got an OSError when disconnecting")
+            monitor.update_state()
+            ser = update_ser_handle(config, ser, monitor.host_connected(), tcp)
+            self._to_tcp.clear()
+            self._to_serial.clear()
+        return ser
@@ -57,6 +57,11 @@ class TCPConnection:
             self._sock = None
             LOG.debug("Shut down socket")
 
+    @property
+    def sock(self) -> Optional[socket.socket]:
+        """The open socket, if any. This changes whenever it reconnects."""
+        return self._sock
+
     def connected(self) -> bool:
         """Check if the connection is active."""
         return self.fileno() != -1
@@ -92,3 +97,47 @@ class TCPConnection:
         sent = self._sock.send(data)
         LOG.debug(f"Sent [{sent}] bytes")
         return sent == len(data)
+
+    def recv_into(self, buffer: memoryview) -> int:
+        """Read available data into a buffer without blocking.
+
+        Args:
+            buffer: Where to read the data to. At most this many bytes are read.
+
+        Returns the number of bytes read, which is 0 if none were available.
+        """
+        if not self._sock or not len(buffer):
+            return 0
+        try:
+            ret = self._sock.recv_into(buffer, 0, socket.MSG_DONTWAIT)
+        except BlockingIOError:
+            return 0
+        except OSError as err:
+            LOG.debug(f"Receive failed: {err}")
+            ret = 0
+        if ret == 0:
+            # The socket connection died! Just reconnect to the server.
+            self._reconnect()
+        LOG.debug(f"Received [{ret}] bytes")
+        return ret
+
+    def send_nonblocking(self, data: memoryview) -> int:
+        """Send as much of some data as the socket can take without blocking.
+
+        Args:
+            data: raw data array to send over the socket.
+
+        Returns the number of bytes sent.
+        """
+        if not self._sock:
+            return 0
+        try:
+            sent = self._sock.send(data, socket.MSG_DONTWAIT)
+        except BlockingIOError:
+            return 0
+        except OSError as err:
+            LOG.debug(f"Send failed: {err}")
+            self._reconnect()
+            return 0
+        LOG.debug(f"Sent [{sent}] bytes")
+        return sent
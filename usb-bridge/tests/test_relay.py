@@ -0,0 +1,173 @@
+"""Tests for the epoll relay."""
+
+import os
+import pty
+import socket
+import tty
+from typing import Iterator, Tuple
+
+import mock
+import pytest
+
+from ot3usb import usb_config, usb_monitor
+from ot3usb.relay import Relay, RelayBuffer
+from ot3usb.tcp_conn import TCPConnection
+
+
+class FakeSerial:
+    """Stands in for a serial.Serial, backed by one end of a pty."""
+
+    def __init__(self, fd: int) -> None:
+        self._fd = fd
+
+    def fileno(self) -> int:
+        return self._fd
+
+
+@pytest.fixture
+def pty_pair() -> Iterator[Tuple[int, int]]:
+    """A raw pty, as (host end, serial end)."""
+    host, gadget = pty.openpty()
+    tty.setraw(host)
+    tty.setraw(gadget)
+    os.set_blocking(host, False)
+    os.set_blocking(gadget, False)
+    yield host, gadget
+    os.close(host)
+    os.close(gadget)
+
+
+@pytest.fixture
+def socket_pair() -> Iterator[Tuple[TCPConnection, socket.socket]]:
+    """A TCPConnection and the socket at the server end of it."""
+    ours, theirs = socket.socketpair()
+    theirs.setblocking(False)
+    tcp = TCPConnection()
+    tcp._sock = ours
+    yield tcp, theirs
+    ours.close()
+    theirs.close()
+
+
+@pytest.fixture
+def monitor() -> Iterator[mock.MagicMock]:
+    read_fd, write_fd = os.pipe()
+    monitor = mock.MagicMock(usb_monitor.USBConnectionMonitor)
+    monitor.fileno.return_value = read_fd
+    monitor.host_connected.return_value = True
+    yield monitor
+    os.close(read_fd)
+    os.close(write_fd)
+
+
+def _read_all(fd: int) -> bytes:
+    try:
+        return os.read(fd, 4096)
+    except BlockingIOError:
+        return b""
+
+
+def test_relay_buffer() -> None:
+    subject = RelayBuffer(8)
+    assert len(subject) == 0
+    assert len(subject.free_space()) == 8
+
+    subject.free_space()[:6] = b"abcdef"
+    subject.filled(6)
+    assert subject.pending().tobytes() == b"abcdef"
+    assert subject.pending(4).tobytes() == b"abcd"
+
+    subject.consumed(4)
+    subject.free_space()[:2] = b"gh"
+    subject.filled(2)
+    assert not subject.full()
+    # The pending data is moved to the front to make room
+    assert len(subject.free_space()) == 4
+    assert subject.pending().tobytes() == b"efgh"
+
+    subject.free_space()[:4] = b"ijkl"
+    subject.filled(4)
+    assert subject.full()
+    assert subject.pending().tobytes() == b"efghijkl"
+
+    subject.consumed(8)
+    assert len(subject) == 0
+    assert len(subject.free_space()) == 8
+
+
+def test_relay(
+    pty_pair: Tuple[int, int],
+    socket_pair: Tuple[TCPConnection, socket.socket],
+    monitor: mock.MagicMock,
+) -> None:
+    host, gadget = pty_pair
+    tcp, server = socket_pair
+    ser = FakeSerial(gadget)
+    config = mock.MagicMock(usb_config.SerialGadget)
+    subject = Relay(packet_limit=None)
+
+    # The first call checks the monitor
+    assert subject.listen(monitor, config, ser, tcp) is ser
+    monitor.update_state.assert_called_once()
+
+    os.write(host, b"from the host")
+    received = b""
+    for _ in range(10):
+        assert subject.listen(monitor, config, ser, tcp) is ser
+        received += server.recv(4096)
+        if received == b"from the host":
+            break
+    assert received == b"from the host"
+
+    server.send(b"from the server")
+    received = b""
+    for _ in range(10):
+        assert subject.listen(monitor, config, ser, tcp) is ser
+        received += _read_all(host)
+        if received == b"from the server":
+            break
+    assert received == b"from the server"
+    subject.close()
+
+
+def test_relay_paces_serial_writes(
+    pty_pair: Tuple[int, int],
+    socket_pair: Tuple[TCPConnection, socket.socket],
+    monitor: mock.MagicMock,
+) -> None:
+    host, gadget = pty_pair
+    tcp, server = socket_pair
+    ser = FakeSerial(gadget)
+    config = mock.MagicMock(usb_config.SerialGadget)
+    subject = Relay(packet_limit=4)
+    subject.listen(monitor, config, ser, tcp)
+
+    server.send(b"abcdefghij")
+    subject.listen(monitor, config, ser, tcp)
+    assert _read_all(host) == b"abcd"
+
+    received = b""
+    for _ in range(10):
+        subject.listen(monitor, config, ser, tcp)
+        received += _read_all(host)
+        if received == b"efghij":
+            break
+    assert received == b"efghij"
+    subject.close()
+
+
+def test_relay_host_disconnected(
+    pty_pair: Tuple[int, int],
+    socket_pair: Tuple[TCPConnection, socket.socket],
+    monitor: mock.MagicMock,
+) -> None:
+    _, gadget = pty_pair
+    tcp, _ = socket_pair
+    ser = FakeSerial(gadget)
+    config = mock.MagicMock(usb_config.SerialGadget)
+    subject = Relay()
+
+    monitor.host_connected.return_value = False
+    assert subject.listen(monitor, config, ser, tcp) is None
+    assert not tcp.connected()
+    subject.close()
@@ -119,3 +119,57 @@ def test_send_fail(
     assert not subject_disconnected.send(SEND_DATA)
 
     socket_driver.send.assert_not_called()
+
+
+def test_recv_into(
+    subject_connected: TCPConnection,
+    socket_driver: mock.Mock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    subject = subject_connected
+    buffer = memoryview(bytearray(16))
+    socket_driver.recv_into.return_value = len(RECV_RET)
+    reconnect_mock = mock.MagicMock(TCPConnection._reconnect)
+    monkeypatch.setattr(subject, "_reconnect", reconnect_mock)
+
+    assert subject.recv_into(buffer) == len(RECV_RET)
+    socket_driver.recv_into.assert_called_once_with(buffer, 0, socket.MSG_DONTWAIT)
+
+    # Nothing available to read
+    socket_driver.recv_into.side_effect = BlockingIOError()
+    assert subject.recv_into(buffer) == 0
+    reconnect_mock.assert_not_called()
+
+    # Nowhere to read to
+    socket_driver.reset_mock()
+    assert subject.recv_into(buffer[:0]) == 0
+    socket_driver.recv_into.assert_not_called()
+
+    # The connection closed
+    socket_driver.recv_into.side_effect = None
+    socket_driver.recv_into.return_value = 0
+    assert subject.recv_into(buffer) == 0
+    reconnect_mock.assert_called_once()
+
+
+def test_send_nonblocking(
+    subject_connected: TCPConnection,
+    socket_driver: mock.Mock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    subject = subject_connected
+    data = memoryview(SEND_DATA)
+    socket_driver.send.return_value = 4
+    reconnect_mock = mock.MagicMock(TCPConnection._reconnect)
+    monkeypatch.setattr(subject, "_reconnect", reconnect_mock)
+
+    assert subject.send_nonblocking(data) == 4
+    socket_driver.send.assert_called_once_with(data, socket.MSG_DONTWAIT)
+
+    socket_driver.send.side_effect = BlockingIOError()
+    assert subject.send_nonblocking(data) == 0
+    reconnect_mock.assert_not_called()
+
+    socket_driver.send.side_effect = BrokenPipeError()
+    assert subject.send_nonblocking(data) == 0
+    reconnect_mock.assert_called_once()